@@ -0,0 +1,56 @@
+"""Add parse tracking to nas_files and title versions to video_files
+
+Revision ID: 003
+Revises: 002
+Create Date: 2026-10-19
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "003"
+down_revision: Union[str, None] = "002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # nas_files: CatalogBuilder 파싱 결과
+    op.add_column(
+        "nas_files",
+        sa.Column("parse_status", sa.String(20), nullable=False, server_default="pending"),
+        schema="pokervod",
+    )
+    op.add_column(
+        "nas_files",
+        sa.Column("parsed_metadata", sa.JSON(), nullable=True),
+        schema="pokervod",
+    )
+    op.add_column(
+        "nas_files",
+        sa.Column("match_confidence", sa.Float(), nullable=True),
+        schema="pokervod",
+    )
+
+    # video_files: 제목 생성 버전 (NULL = 재생성 대상)
+    op.add_column(
+        "video_files",
+        sa.Column("parser_version", sa.Integer(), nullable=True),
+        schema="pokervod",
+    )
+    op.add_column(
+        "video_files",
+        sa.Column("title_template_version", sa.Integer(), nullable=True),
+        schema="pokervod",
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("video_files", "title_template_version", schema="pokervod")
+    op.drop_column("video_files", "parser_version", schema="pokervod")
+    op.drop_column("nas_files", "match_confidence", schema="pokervod")
+    op.drop_column("nas_files", "parsed_metadata", schema="pokervod")
+    op.drop_column("nas_files", "parse_status", schema="pokervod")
@@ -0,0 +1,120 @@
+"""Add normalized path columns with pattern/trigram indexes for DB-side matching
+
+Revision ID: 004
+Revises: 003
+Create Date: 2026-10-19
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "004"
+down_revision: Union[str, None] = "003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BACKFILL_BATCH_SIZE = 5000
+
+
+def _normalize_sql(column: str) -> str:
+    """PathNormalizer.normalize와 동일한 SQL 식.
+
+    UNC/smb/file 프리픽스 제거 → 백슬래시를 슬래시로 → 소문자 →
+    연속 슬래시 정리 → 끝 슬래시 제거
+    """
+    expr = f"regexp_replace({column}, '" + r"^\\\\[^\\]+\\[^\\]+\\" + "', '')"
+    expr = f"regexp_replace({expr}, '^smb://[^/]+/[^/]+/', '')"
+    expr = f"regexp_replace({expr}, '^file://[^/]+/[^/]+/', '')"
+    expr = f"lower(replace({expr}, '" + "\\" + "', '/'))"
+    expr = f"regexp_replace({expr}, '/{{2,}}', '/', 'g')"
+    return f"rtrim({expr}, '/')"
+
+
+def _backfill(table: str, source: str, target: str) -> None:
+    """배치 단위 backfill (한 번에 BACKFILL_BATCH_SIZE 행)."""
+    conn = op.get_bind()
+    statement = sa.text(
+        f"UPDATE pokervod.{table} SET {target} = {_normalize_sql(source)} "
+        f"WHERE id IN ("
+        f"SELECT id FROM pokervod.{table} "
+        f"WHERE {target} IS NULL AND {source} IS NOT NULL "
+        f"LIMIT :batch_size)"
+    )
+    while True:
+        result = conn.execute(statement, {"batch_size": BACKFILL_BATCH_SIZE})
+        if not result.rowcount:
+            break
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    op.add_column(
+        "nas_files",
+        sa.Column("normalized_path", sa.String(1000), nullable=True),
+        schema="pokervod",
+    )
+    op.add_column(
+        "hand_clips",
+        sa.Column("normalized_folder_link", sa.String(1000), nullable=True),
+        schema="pokervod",
+    )
+
+    # 인덱스 생성 전에 backfill (인덱스 유지 비용 없이)
+    _backfill("nas_files", "file_path", "normalized_path")
+    _backfill("hand_clips", "nas_folder_link", "normalized_folder_link")
+
+    op.create_index(
+        "ix_nas_files_normalized_path_pattern",
+        "nas_files",
+        ["normalized_path"],
+        schema="pokervod",
+        postgresql_ops={"normalized_path": "text_pattern_ops"},
+    )
+    op.create_index(
+        "ix_nas_files_normalized_path_trgm",
+        "nas_files",
+        ["normalized_path"],
+        schema="pokervod",
+        postgresql_using="gin",
+        postgresql_ops={"normalized_path": "gin_trgm_ops"},
+    )
+    op.create_index(
+        "ix_hand_clips_normalized_folder_link_pattern",
+        "hand_clips",
+        ["normalized_folder_link"],
+        schema="pokervod",
+        postgresql_ops={"normalized_folder_link": "text_pattern_ops"},
+    )
+    op.create_index(
+        "ix_hand_clips_normalized_folder_link_trgm",
+        "hand_clips",
+        ["normalized_folder_link"],
+        schema="pokervod",
+        postgresql_using="gin",
+        postgresql_ops={"normalized_folder_link": "gin_trgm_ops"},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_hand_clips_normalized_folder_link_trgm",
+        table_name="hand_clips",
+        schema="pokervod",
+    )
+    op.drop_index(
+        "ix_hand_clips_normalized_folder_link_pattern",
+        table_name="hand_clips",
+        schema="pokervod",
+    )
+    op.drop_index(
+        "ix_nas_files_normalized_path_trgm", table_name="nas_files", schema="pokervod"
+    )
+    op.drop_index(
+        "ix_nas_files_normalized_path_pattern", table_name="nas_files", schema="pokervod"
+    )
+    op.drop_column("hand_clips", "normalized_folder_link", schema="pokervod")
+    op.drop_column("nas_files", "normalized_path", schema="pokervod")
@@ -0,0 +1,84 @@
+"""Add per-clip path match state and NAS inventory generation for incremental matching
+
+Revision ID: 005
+Revises: 004
+Create Date: 2026-10-19
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "005"
+down_revision: Union[str, None] = "004"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 기존 파일은 NULL로 두어 첫 증분 매칭 실행에서 세대 1로 묶음
+    op.add_column(
+        "nas_files",
+        sa.Column("inventory_generation", sa.Integer(), nullable=True),
+        schema="pokervod",
+    )
+    op.create_index(
+        "ix_nas_files_inventory_generation",
+        "nas_files",
+        ["inventory_generation"],
+        schema="pokervod",
+    )
+
+    # 기존 클립은 pending으로 시작 (첫 실행에서 전체 매칭)
+    op.add_column(
+        "hand_clips",
+        sa.Column(
+            "path_match_status",
+            sa.String(20),
+            nullable=False,
+            server_default="pending",
+        ),
+        schema="pokervod",
+    )
+    op.add_column(
+        "hand_clips",
+        sa.Column(
+            "path_match_nas_file_id",
+            sa.UUID(),
+            sa.ForeignKey("pokervod.nas_files.id", ondelete="SET NULL"),
+            nullable=True,
+        ),
+        schema="pokervod",
+    )
+    op.add_column(
+        "hand_clips",
+        sa.Column("path_match_confidence", sa.Float(), nullable=True),
+        schema="pokervod",
+    )
+    op.add_column(
+        "hand_clips",
+        sa.Column("path_match_generation", sa.Integer(), nullable=True),
+        schema="pokervod",
+    )
+    op.create_index(
+        "ix_hand_clips_path_match_status",
+        "hand_clips",
+        ["path_match_status"],
+        schema="pokervod",
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_hand_clips_path_match_status", table_name="hand_clips", schema="pokervod"
+    )
+    op.drop_column("hand_clips", "path_match_generation", schema="pokervod")
+    op.drop_column("hand_clips", "path_match_confidence", schema="pokervod")
+    op.drop_column("hand_clips", "path_match_nas_file_id", schema="pokervod")
+    op.drop_column("hand_clips", "path_match_status", schema="pokervod")
+    op.drop_index(
+        "ix_nas_files_inventory_generation", table_name="nas_files", schema="pokervod"
+    )
+    op.drop_column("nas_files", "inventory_generation", schema="pokervod")
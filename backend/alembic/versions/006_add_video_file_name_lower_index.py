@@ -0,0 +1,32 @@
+"""Add lower(file_name) functional index on video_files for sheet_file_name linkage
+
+Revision ID: 006
+Revises: 005
+Create Date: 2026-10-19
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "006"
+down_revision: Union[str, None] = "005"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_video_files_file_name_lower",
+        "video_files",
+        [sa.text("lower(file_name)")],
+        schema="pokervod",
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_video_files_file_name_lower", table_name="video_files", schema="pokervod"
+    )
@@ -0,0 +1,51 @@
+"""Add catalog_build_runs for chunked, resumable catalog builds
+
+Revision ID: 007
+Revises: 006
+Create Date: 2026-10-19
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "007"
+down_revision: Union[str, None] = "006"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "catalog_build_runs",
+        sa.Column("id", sa.UUID(), nullable=False),
+        sa.Column("status", sa.String(20), nullable=False),
+        sa.Column("skip_linked", sa.Boolean(), nullable=False),
+        sa.Column("last_nas_file_id", sa.UUID(), nullable=True),
+        sa.Column("chunks_committed", sa.Integer(), nullable=False),
+        sa.Column("stats", sa.JSON(), nullable=True),
+        sa.Column("error_messages", sa.JSON(), nullable=True),
+        sa.Column("completed_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        sa.Column("deleted_at", sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+        schema="pokervod",
+    )
+    op.create_index(
+        "ix_catalog_build_runs_status",
+        "catalog_build_runs",
+        ["status"],
+        schema="pokervod",
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_catalog_build_runs_status",
+        table_name="catalog_build_runs",
+        schema="pokervod",
+    )
+    op.drop_table("catalog_build_runs", schema="pokervod")
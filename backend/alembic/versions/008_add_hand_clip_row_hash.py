@@ -0,0 +1,30 @@
+"""Add per-row content hash to hand_clips for detecting edited sheet rows
+
+Revision ID: 008
+Revises: 007
+Create Date: 2026-10-19
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "008"
+down_revision: Union[str, None] = "007"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 기존 클립은 NULL로 두어 다음 동기화에서 한 번 갱신되며 해시가 채워짐
+    op.add_column(
+        "hand_clips",
+        sa.Column("sheet_row_hash", sa.String(64), nullable=True),
+        schema="pokervod",
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("hand_clips", "sheet_row_hash", schema="pokervod")
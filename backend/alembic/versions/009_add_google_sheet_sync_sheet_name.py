@@ -0,0 +1,52 @@
+"""Track google_sheet_sync progress per tab
+
+Revision ID: 009
+Revises: 008
+Create Date: 2026-10-19
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "009"
+down_revision: Union[str, None] = "008"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 기존 레코드는 NULL로 두고, 탭 단위 첫 동기화에서 해당 탭 레코드로 이어 씀
+    op.add_column(
+        "google_sheet_sync",
+        sa.Column("sheet_name", sa.String(100), nullable=True),
+        schema="pokervod",
+    )
+    op.drop_constraint(
+        "uq_google_sheet_sync_sheet_entity",
+        "google_sheet_sync",
+        schema="pokervod",
+    )
+    op.create_unique_constraint(
+        "uq_google_sheet_sync_sheet_entity_tab",
+        "google_sheet_sync",
+        ["sheet_id", "entity_type", "sheet_name"],
+        schema="pokervod",
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint(
+        "uq_google_sheet_sync_sheet_entity_tab",
+        "google_sheet_sync",
+        schema="pokervod",
+    )
+    op.create_unique_constraint(
+        "uq_google_sheet_sync_sheet_entity",
+        "google_sheet_sync",
+        ["sheet_id", "entity_type"],
+        schema="pokervod",
+    )
+    op.drop_column("google_sheet_sync", "sheet_name", schema="pokervod")
@@ -0,0 +1,36 @@
+"""Add change probe values (grid row count, tail hash) to google_sheet_sync
+
+Revision ID: 010
+Revises: 009
+Create Date: 2026-10-19
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "010"
+down_revision: Union[str, None] = "009"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # NULL이면 기준값 없음 → 첫 probe 동기화에서 채움
+    op.add_column(
+        "google_sheet_sync",
+        sa.Column("probe_row_count", sa.Integer(), nullable=True),
+        schema="pokervod",
+    )
+    op.add_column(
+        "google_sheet_sync",
+        sa.Column("probe_tail_hash", sa.String(64), nullable=True),
+        schema="pokervod",
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("google_sheet_sync", "probe_tail_hash", schema="pokervod")
+    op.drop_column("google_sheet_sync", "probe_row_count", schema="pokervod")
@@ -0,0 +1,50 @@
+"""Link cross-sheet duplicate hand_clips to a canonical clip
+
+Revision ID: 011
+Revises: 010
+Create Date: 2026-10-19
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "011"
+down_revision: Union[str, None] = "010"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # NULL이면 대표 클립 (중복 검사는 HandClipDeduplicator 실행 시 채움)
+    op.add_column(
+        "hand_clips",
+        sa.Column(
+            "duplicate_of_id",
+            sa.UUID(),
+            sa.ForeignKey("pokervod.hand_clips.id", ondelete="SET NULL"),
+            nullable=True,
+        ),
+        schema="pokervod",
+    )
+    op.add_column(
+        "hand_clips",
+        sa.Column("duplicate_score", sa.Float(), nullable=True),
+        schema="pokervod",
+    )
+    op.create_index(
+        "ix_hand_clips_duplicate_of_id",
+        "hand_clips",
+        ["duplicate_of_id"],
+        schema="pokervod",
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_hand_clips_duplicate_of_id", table_name="hand_clips", schema="pokervod"
+    )
+    op.drop_column("hand_clips", "duplicate_score", schema="pokervod")
+    op.drop_column("hand_clips", "duplicate_of_id", schema="pokervod")
@@ -0,0 +1,113 @@
+"""Add parsed timecode seconds to hand_clips with a per-video range index
+
+Revision ID: 012
+Revises: 011
+Create Date: 2026-10-19
+
+"""
+import re
+from typing import Optional, Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "012"
+down_revision: Union[str, None] = "011"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BACKFILL_BATCH_SIZE = 5000
+
+_TIMECODE_PART = re.compile(r"^\d+(?:\.\d+)?$")
+
+
+def _timecode_seconds(timecode: Optional[str]) -> Optional[int]:
+    """RowMapper.timecode_seconds와 동일 (마이그레이션 시점 코드에 의존하지 않도록 복사)."""
+    if not timecode:
+        return None
+    parts = timecode.strip().replace(";", ":").split(":")
+    if len(parts) == 4:
+        parts = parts[:3]
+    if len(parts) > 3 or not all(_TIMECODE_PART.match(p) for p in parts):
+        return None
+    seconds = 0.0
+    for part in parts:
+        seconds = seconds * 60 + float(part)
+    return int(seconds)
+
+
+def _backfill() -> None:
+    """id 키셋 순서로 BACKFILL_BATCH_SIZE 행씩 파싱 → executemany UPDATE."""
+    conn = op.get_bind()
+
+    def select_batch(after_id: bool) -> sa.TextClause:
+        return sa.text(
+            "SELECT id, timecode, timecode_end FROM pokervod.hand_clips "
+            "WHERE (timecode IS NOT NULL OR timecode_end IS NOT NULL) "
+            + ("AND id > :last_id " if after_id else "")
+            + "ORDER BY id LIMIT :batch_size"
+        )
+
+    update_row = sa.text(
+        "UPDATE pokervod.hand_clips "
+        "SET timecode_seconds = :timecode_seconds, "
+        "timecode_end_seconds = :timecode_end_seconds "
+        "WHERE id = :id"
+    )
+    last_id = None
+    while True:
+        rows = conn.execute(
+            select_batch(last_id is not None),
+            {"last_id": last_id, "batch_size": BACKFILL_BATCH_SIZE},
+        ).all()
+        if not rows:
+            break
+        updates = [
+            {
+                "id": row.id,
+                "timecode_seconds": _timecode_seconds(row.timecode),
+                "timecode_end_seconds": _timecode_seconds(row.timecode_end),
+            }
+            for row in rows
+        ]
+        updates = [
+            u for u in updates
+            if u["timecode_seconds"] is not None or u["timecode_end_seconds"] is not None
+        ]
+        if updates:
+            conn.execute(update_row, updates)
+        last_id = rows[-1].id
+
+
+def upgrade() -> None:
+    op.add_column(
+        "hand_clips",
+        sa.Column("timecode_seconds", sa.Integer(), nullable=True),
+        schema="pokervod",
+    )
+    op.add_column(
+        "hand_clips",
+        sa.Column("timecode_end_seconds", sa.Integer(), nullable=True),
+        schema="pokervod",
+    )
+
+    # 인덱스 생성 전에 backfill (인덱스 유지 비용 없이)
+    _backfill()
+
+    op.create_index(
+        "ix_hand_clips_video_file_id_timecode_seconds",
+        "hand_clips",
+        ["video_file_id", "timecode_seconds", "id"],
+        schema="pokervod",
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_hand_clips_video_file_id_timecode_seconds",
+        table_name="hand_clips",
+        schema="pokervod",
+    )
+    op.drop_column("hand_clips", "timecode_end_seconds", schema="pokervod")
+    op.drop_column("hand_clips", "timecode_seconds", schema="pokervod")
@@ -0,0 +1,101 @@
+"""Create catalog_items (with unpublished_reason for NAS-driven unpublish/republish)
+
+catalog_items was previously only created by Base.metadata.create_all.
+Databases that already have the table only get the new unpublished_reason column.
+
+Revision ID: 013
+Revises: 012
+Create Date: 2026-10-19
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "013"
+down_revision: Union[str, None] = "012"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEXES = (
+    ("ix_pokervod_catalog_items_project_code", ["project_code"], False),
+    ("ix_pokervod_catalog_items_year", ["year"], False),
+    ("ix_pokervod_catalog_items_video_file_id", ["video_file_id"], True),
+)
+
+
+def _create_table() -> None:
+    op.create_table(
+        "catalog_items",
+        sa.Column("id", sa.UUID(), nullable=False),
+        sa.Column("display_title", sa.String(500), nullable=False),
+        sa.Column("catalog_title", sa.String(300), nullable=True),
+        sa.Column("description", sa.Text(), nullable=True),
+        sa.Column("thumbnail_url", sa.String(500), nullable=True),
+        sa.Column("duration_seconds", sa.Integer(), nullable=True),
+        sa.Column("project_code", sa.String(20), nullable=False),
+        sa.Column("category", sa.String(50), nullable=True),
+        sa.Column("content_type", sa.String(20), nullable=True),
+        sa.Column("tags", sa.JSON(), nullable=True),
+        sa.Column("year", sa.Integer(), nullable=True),
+        sa.Column("event_number", sa.Integer(), nullable=True),
+        sa.Column("episode_number", sa.Integer(), nullable=True),
+        sa.Column("day_number", sa.Integer(), nullable=True),
+        sa.Column("featured_rank", sa.Integer(), nullable=True),
+        sa.Column("top10_rank", sa.Integer(), nullable=True),
+        sa.Column("extra_metadata", sa.JSON(), nullable=True),
+        sa.Column("is_published", sa.Boolean(), nullable=False),
+        sa.Column("is_featured", sa.Boolean(), nullable=False),
+        sa.Column("unpublished_reason", sa.String(50), nullable=True),
+        sa.Column("video_file_id", sa.UUID(), nullable=False),
+        sa.Column("episode_id", sa.UUID(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        sa.Column("deleted_at", sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint("id", name="pk_catalog_items"),
+        sa.ForeignKeyConstraint(
+            ["video_file_id"],
+            ["pokervod.video_files.id"],
+            name="fk_catalog_items_video_file_id_video_files",
+            ondelete="CASCADE",
+        ),
+        sa.ForeignKeyConstraint(
+            ["episode_id"],
+            ["pokervod.episodes.id"],
+            name="fk_catalog_items_episode_id_episodes",
+            ondelete="SET NULL",
+        ),
+        schema="pokervod",
+    )
+    for name, columns, unique in INDEXES:
+        op.create_index(name, "catalog_items", columns, unique=unique, schema="pokervod")
+
+
+def upgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+    if not inspector.has_table("catalog_items", schema="pokervod"):
+        _create_table()
+        return
+
+    # create_all로 만들어진 기존 테이블: 컬럼만 추가
+    columns = {c["name"] for c in inspector.get_columns("catalog_items", schema="pokervod")}
+    if "unpublished_reason" in columns:
+        return
+    op.add_column(
+        "catalog_items",
+        sa.Column("unpublished_reason", sa.String(50), nullable=True),
+        schema="pokervod",
+    )
+    # NAS 삭제로 숨겨진 VideoFile의 비공개 아이템은 NAS 삭제 사유로 간주
+    op.execute(
+        "UPDATE pokervod.catalog_items SET unpublished_reason = 'nas_removed' "
+        "WHERE is_published = false AND video_file_id IN ("
+        "SELECT id FROM pokervod.video_files WHERE hidden_reason = 'nas_removed')"
+    )
+
+
+def downgrade() -> None:
+    # 기존 테이블이었는지 알 수 없으므로 이 리비전이 추가한 컬럼만 제거
+    op.drop_column("catalog_items", "unpublished_reason", schema="pokervod")
@@ -0,0 +1,87 @@
+"""CatalogBuilderService 빌드 벤치마크.
+
+SQLite 파일 DB에 합성 WSOP NAS 파일을 넣고 build_catalog_from_nas 전체 시간을 측정합니다.
+
+    cd backend
+    python -m scripts.bench_catalog_build --sizes 5000 50000
+"""
+
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+import uuid
+
+from sqlalchemy import event, insert
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from src.models import Base, NASFile
+from src.models.nas_file import FileCategory
+from src.services.catalog import CatalogBuilderService
+
+ARCHIVE = "\\\\10.10.100.122\\docker\\GGPNAs\\ARCHIVE\\WSOP\\WSOP Bracelet Event"
+
+
+def synthetic_files(n: int) -> list[dict]:
+    """연도 10개 × 이벤트 90개에 분산된 WSOP 파일 (이벤트당 여러 파일)."""
+    rows = []
+    for i in range(n):
+        year = 2015 + i % 10
+        event_number = (i // 10) % 90 + 1
+        name = f"{i % 99:02d}-wsop-{year}-be-ev-{event_number:02d}-25k-nlh-ft-{i:06d}.mp4"
+        rows.append(
+            {
+                "id": uuid.uuid4(),
+                "file_path": f"{ARCHIVE}\\{year}\\{name}",
+                "file_name": name,
+                "file_extension": ".mp4",
+                "file_category": FileCategory.VIDEO,
+            }
+        )
+    return rows
+
+
+async def bench(n: int) -> tuple[float, dict]:
+    path = os.path.join(tempfile.mkdtemp(), "bench.db")
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{path}",
+        execution_options={"schema_translate_map": {"pokervod": None}},
+    )
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def _fast_writes(dbapi_conn, _):
+        dbapi_conn.execute("PRAGMA synchronous=OFF")
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+        await conn.execute(insert(NASFile), synthetic_files(n))
+
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+    async with session_factory() as session:
+        start = time.perf_counter()
+        stats = await CatalogBuilderService(session).build_catalog_from_nas(limit=n)
+        elapsed = time.perf_counter() - start
+
+    await engine.dispose()
+    return elapsed, {
+        "video_files": stats.video_files_created,
+        "events": stats.events_created,
+        "episodes": stats.episodes_created,
+        "errors": stats.errors,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[5000, 50000])
+    args = parser.parse_args()
+
+    print(f"{'files':>8} {'seconds':>9} {'files/s':>9}  created")
+    for n in args.sizes:
+        seconds, created = asyncio.run(bench(n))
+        print(f"{n:>8,} {seconds:>9.2f} {n / seconds:>9,.0f}  {created}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,166 @@
+"""시트 간 HandClip 중복 판정 벤치마크 (블로킹 키 + 쌍 점수).
+
+합성 METADATA_ARCHIVE 클립 중 40%를 잡음(제목 단어 누락, 타임코드 ±3초, 영상 미연결)과 함께
+ICONIK_METADATA에 복제해 메모리 판정 처리량과 정밀도/재현율을 측정합니다.
+--db-max 이하 크기는 SQLite 파일 DB에서 HandClipDeduplicator.run 전체 시간도 측정합니다.
+
+    cd backend
+    python -m scripts.bench_clip_dedup --clips 100000 200000 --db-max 200000
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import tempfile
+import time
+from uuid import uuid4
+
+from sqlalchemy import event, insert
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from src.models import Base
+from src.models.hand_clip import HandClip, hand_clip_players
+from src.models.player import Player
+from src.services.sheets_sync import ClipDeduplicator, ClipRecord, DedupStats, HandClipDeduplicator
+
+DUPLICATE_RATE = 0.4
+VIDEOS = 2000
+PLAYERS = 1000
+WORDS = ["bluff", "cooler", "hero", "call", "river", "set", "flush", "straight",
+         "fold", "shove", "quads", "trips", "slowroll", "backdoor", "epic", "sick"]
+
+
+def synthetic_clips(n: int, seed: int = 7) -> tuple[list[dict], set[tuple]]:
+    """(클립 행 목록, 정답 중복 쌍 {(archive_id, iconik_id)})."""
+    rng = random.Random(seed)
+    videos = [uuid4() for _ in range(VIDEOS)]
+    players = [uuid4() for _ in range(PLAYERS)]
+    clips: list[dict] = []
+    truth: set[tuple] = set()
+    row = 0
+    while len(clips) < n:
+        words = rng.sample(WORDS, 3) + [f"hand{row}"]
+        clip = {
+            "id": uuid4(),
+            "sheet_source": "METADATA_ARCHIVE",
+            "sheet_row_number": row + 2,
+            "title": " ".join(words),
+            "timecode": rng.randrange(6 * 3600),
+            "video_file_id": videos[row % VIDEOS],
+            "player_ids": rng.sample(players, 2),
+        }
+        clips.append(clip)
+        if len(clips) < n and rng.random() < DUPLICATE_RATE:
+            dropped = words[rng.randrange(3)]
+            copy = dict(
+                clip,
+                id=uuid4(),
+                sheet_source="ICONIK_METADATA",
+                sheet_row_number=row + 2,
+                title=" ".join(w for w in words if w != dropped),
+                timecode=max(0, clip["timecode"] + rng.randint(-3, 3)),
+                video_file_id=None if rng.random() < 0.5 else clip["video_file_id"],
+            )
+            clips.append(copy)
+            truth.add((clip["id"], copy["id"]))
+        row += 1
+    for clip in clips:
+        t = clip["timecode"]
+        clip["timecode"] = f"{t // 3600:02d}:{t // 60 % 60:02d}:{t % 60:02d}"
+    return clips, truth
+
+
+def records(clips: list[dict]) -> list[ClipRecord]:
+    return [
+        ClipRecord.create(
+            c["id"], c["sheet_source"], c["sheet_row_number"], c["title"], c["timecode"],
+            c["video_file_id"], c["player_ids"],
+        )
+        for c in clips
+    ]
+
+
+def bench_memory(clips: list[dict], truth: set[tuple]) -> None:
+    start = time.perf_counter()
+    recs = records(clips)
+    build = time.perf_counter() - start
+
+    stats = DedupStats()
+    start = time.perf_counter()
+    groups = ClipDeduplicator().find_duplicates(recs, stats)
+    elapsed = time.perf_counter() - start
+
+    found = {(g.canonical_id, dup) for g in groups for dup in g.duplicates}
+    hits = len(found & truth)
+    precision = hits / len(found) if found else 1.0
+    recall = hits / len(truth) if truth else 1.0
+    n = len(clips)
+    print(
+        f"{n:>8,} {'memory':>7} {build + elapsed:>8.2f} {n / (build + elapsed):>9,.0f} "
+        f"{stats.candidate_pairs:>10,} {n * (n - 1) // 2:>16,} {precision:>6.3f} {recall:>6.3f}"
+    )
+
+
+async def bench_db(clips: list[dict]) -> float:
+    path = os.path.join(tempfile.mkdtemp(), "bench.db")
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{path}",
+        execution_options={"schema_translate_map": {"pokervod": None}},
+    )
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def _fast_writes(dbapi_conn, _):
+        dbapi_conn.execute("PRAGMA synchronous=OFF")
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+        player_ids = {p for c in clips for p in c["player_ids"]}
+        await conn.execute(
+            insert(Player), [{"id": p, "name": f"Player {i}"} for i, p in enumerate(player_ids)]
+        )
+        for offset in range(0, len(clips), 5000):
+            chunk = clips[offset:offset + 5000]
+            await conn.execute(
+                insert(HandClip),
+                [
+                    {k: c[k] for k in ("id", "sheet_source", "sheet_row_number", "title",
+                                       "timecode")}
+                    for c in chunk
+                ],
+            )
+            await conn.execute(
+                insert(hand_clip_players),
+                [{"hand_clip_id": c["id"], "player_id": p} for c in chunk for p in c["player_ids"]],
+            )
+
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+    async with session_factory() as session:
+        start = time.perf_counter()
+        await HandClipDeduplicator(session).run()
+        elapsed = time.perf_counter() - start
+
+    await engine.dispose()
+    return elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--clips", type=int, nargs="+", default=[100000, 200000])
+    parser.add_argument("--db-max", type=int, default=100000)
+    args = parser.parse_args()
+
+    print(
+        f"{'clips':>8} {'mode':>7} {'seconds':>8} {'clips/s':>9} "
+        f"{'candidates':>10} {'all pairs':>16} {'prec':>6} {'recall':>6}"
+    )
+    for n in args.clips:
+        clips, truth = synthetic_clips(n)
+        bench_memory(clips, truth)
+        if n <= args.db_max:
+            seconds = asyncio.run(bench_db(clips))
+            print(f"{n:>8,} {'db':>7} {seconds:>8.2f} {n / seconds:>9,.0f}")
+
+
+if __name__ == "__main__":
+    main()
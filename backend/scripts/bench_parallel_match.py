@@ -0,0 +1,78 @@
+"""ShardedPathMatcher 워커 수별 매칭 벤치마크.
+
+합성 NAS 인덱스와 합성 클립 링크로 단일 프로세스 매칭과 프로세스 풀 매칭
+(인덱스 직렬화 + 워커 로드 포함)의 경과 시간을 비교합니다.
+
+    cd backend
+    python -m scripts.bench_parallel_match --files 200000 --clips 200000 --workers 1 2 4 8
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import time
+import uuid
+
+from scripts.bench_path_index import synthetic_paths
+from src.services.matching import IndexedFile, PathMatcher, PathNormalizer, ShardedPathMatcher
+
+
+def synthetic_links(paths: list[str], n: int, seed: int = 7) -> list[tuple[uuid.UUID, str]]:
+    """정확(폴더)/부분(상위 폴더)/퍼지(다른 루트)/실패 링크를 고르게 섞은 클립."""
+    rng = random.Random(seed)
+    links = []
+    for i in range(n):
+        folder = PathNormalizer.extract_folder_path(rng.choice(paths))
+        kind = i % 4
+        if kind == 0:
+            link = folder
+        elif kind == 1:
+            link = folder.rsplit("/", 2)[0]
+        elif kind == 2:
+            link = "backup/" + "/".join(folder.split("/")[-3:])
+        else:
+            link = f"unknown/{i}/clip"
+        links.append((uuid.uuid4(), link))
+    return links
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--files", type=int, default=200_000)
+    parser.add_argument("--clips", type=int, default=200_000)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--shard-size", type=int, default=5000)
+    args = parser.parse_args()
+
+    paths = list(synthetic_paths(args.files))
+    matcher = PathMatcher(session=None)
+    matcher.add_to_index(IndexedFile(uuid.uuid4(), p, None) for p in paths)
+    links = synthetic_links(paths, args.clips)
+
+    print(f"cpus={os.cpu_count()} files={args.files:,} clips={args.clips:,}")
+    print(f"{'mode':>12} {'seconds':>9} {'clips/s':>10} {'matched %':>10}")
+
+    start = time.perf_counter()
+    matched = sum(matcher.match_path(link).match_type != "none" for _, link in links)
+    elapsed = time.perf_counter() - start
+    print(
+        f"{'in-process':>12} {elapsed:>9.2f} {args.clips / elapsed:>10,.0f} "
+        f"{matched / args.clips * 100:>10.1f}"
+    )
+
+    for workers in args.workers:
+        sharded = ShardedPathMatcher(
+            matcher, workers=workers, shard_size=args.shard_size
+        )
+        start = time.perf_counter()
+        _, stats = asyncio.run(sharded.match_links(links))
+        elapsed = time.perf_counter() - start
+        print(
+            f"{f'{workers} workers':>12} {elapsed:>9.2f} {args.clips / elapsed:>10,.0f} "
+            f"{stats.match_rate:>10.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
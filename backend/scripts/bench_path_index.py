@@ -0,0 +1,133 @@
+"""PathMatcher NAS 인덱스 구축 벤치마크.
+
+합성 NAS 경로로 인덱스 구축 시간과 메모리(tracemalloc peak)를 측정합니다.
+
+    cd backend
+    python -m scripts.bench_path_index --sizes 100000 1000000
+    python -m scripts.bench_path_index --sizes 100000 --db   # SQLite 스트리밍 포함
+"""
+
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+import tracemalloc
+import uuid
+from typing import Iterator
+
+from src.services.matching import IndexedFile, PathMatcher
+
+PROJECTS = ["WSOP", "HCL", "GGMillions", "MPP", "PAD", "GOG 최종"]
+FILES_PER_FOLDER = 10
+
+
+def synthetic_paths(n: int) -> Iterator[str]:
+    """프로젝트/연도/이벤트/Day 구조의 합성 파일 경로.
+
+    실제 NAS 스캔 결과(nas_scan_result.json)와 비슷하게 폴더당 약 10개 파일입니다.
+    """
+    for i in range(n):
+        folder = i // FILES_PER_FOLDER
+        day = folder % 8
+        event = (folder // 8) % 500
+        year = 2015 + (folder // 4000) % 10
+        project = PROJECTS[(folder // 40000) % len(PROJECTS)]
+        yield (
+            f"\\\\10.10.100.122\\docker\\GGPNAs\\ARCHIVE\\{project}\\{year}\\"
+            f"Event {event:03d}\\Day {day}\\{project.lower()}-{year}-ev{event:03d}-"
+            f"d{day}-{i:07d}.mp4"
+        )
+
+
+def _peak_mib(fn) -> float:
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak / 2**20
+
+
+def bench_index(n: int) -> tuple[float, float]:
+    """메모리 내 인덱스 구축 (DB I/O 제외). Returns (초, MiB).
+
+    시간은 tracemalloc 없이, 메모리는 별도 실행에서 측정합니다.
+    """
+    files = [
+        IndexedFile(uuid.uuid4(), path, None) for path in synthetic_paths(n)
+    ]
+
+    start = time.perf_counter()
+    PathMatcher(session=None).add_to_index(files)
+    elapsed = time.perf_counter() - start
+
+    mib = _peak_mib(lambda: PathMatcher(session=None).add_to_index(files))
+    return elapsed, mib
+
+
+async def bench_db(n: int) -> tuple[float, float]:
+    """SQLite 파일 DB에서 스트리밍 구축 (DB I/O 포함). Returns (초, MiB)."""
+    from sqlalchemy import event, insert
+    from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+    from src.models import Base, NASFile
+
+    path = os.path.join(tempfile.mkdtemp(), "bench.db")
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{path}",
+        execution_options={"schema_translate_map": {"pokervod": None}},
+    )
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def _fast_writes(dbapi_conn, _):
+        dbapi_conn.execute("PRAGMA synchronous=OFF")
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+        batch: list[dict] = []
+        for file_path in synthetic_paths(n):
+            batch.append(
+                {
+                    "id": uuid.uuid4(),
+                    "file_path": file_path,
+                    "file_name": file_path.rsplit("\\", 1)[-1],
+                }
+            )
+            if len(batch) >= 20000:
+                await conn.execute(insert(NASFile), batch)
+                batch.clear()
+        if batch:
+            await conn.execute(insert(NASFile), batch)
+
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+    async with session_factory() as session:
+        start = time.perf_counter()
+        await PathMatcher(session).build_nas_index()
+        elapsed = time.perf_counter() - start
+
+        tracemalloc.start()
+        await PathMatcher(session).build_nas_index()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    await engine.dispose()
+    return elapsed, peak / 2**20
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100_000, 1_000_000])
+    parser.add_argument("--db", action="store_true", help="SQLite 스트리밍 구축도 측정")
+    args = parser.parse_args()
+
+    print(f"{'files':>10} {'mode':>8} {'seconds':>9} {'peak MiB':>9}")
+    for n in args.sizes:
+        seconds, mib = bench_index(n)
+        print(f"{n:>10,} {'memory':>8} {seconds:>9.2f} {mib:>9.1f}")
+        if args.db:
+            seconds, mib = asyncio.run(bench_db(n))
+            print(f"{n:>10,} {'sqlite':>8} {seconds:>9.2f} {mib:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""시트 행 저장 벤치마크 (행별 저장 vs bulk UPSERT).
+
+SQLite 파일 DB에 합성 METADATA_ARCHIVE 행을 1,000행 배치로 저장하는 시간을 측정합니다.
+
+    cd backend
+    python -m scripts.bench_sheet_ingest --rows 2000 20000 --per-row-max 2000
+"""
+
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from src.models import Base
+from src.services.sheets_sync import SheetsDataMapper
+
+BATCH_SIZE = 1000
+PLAYERS = [f"Player {i}" for i in range(300)]
+TAGS = ["bluff", "cooler", "hero call", "river", "set", "laugh", "backdoor", "epic"]
+
+
+def synthetic_rows(n: int) -> list[list]:
+    """선수 2명, 태그 2개가 붙은 METADATA_ARCHIVE 행."""
+    rows = []
+    for i in range(n):
+        players = f"{PLAYERS[i % 300]}, {PLAYERS[(i * 7 + 1) % 300]}"
+        tags = f"{TAGS[i % 8]}, {TAGS[(i + 3) % 8]}"
+        link = f"\\\\nas\\share\\ARCHIVE\\WSOP\\{2015 + i % 10}\\Event {i % 90}"
+        rows.append(
+            [f"{i // 3600:02d}:{i // 60 % 60:02d}:{i % 60:02d}", "", f"Hand {i}", link,
+             "A", players, tags, "", f"clip_{i}.mp4", "125000"]
+        )
+    return rows
+
+
+async def bench(n: int, bulk: bool) -> float:
+    path = os.path.join(tempfile.mkdtemp(), "bench.db")
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{path}",
+        execution_options={"schema_translate_map": {"pokervod": None}},
+    )
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def _fast_writes(dbapi_conn, _):
+        dbapi_conn.execute("PRAGMA synchronous=OFF")
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    rows = synthetic_rows(n)
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+    async with session_factory() as session:
+        mapper = SheetsDataMapper(session)
+        start = time.perf_counter()
+        for offset in range(0, n, BATCH_SIZE):
+            batch = rows[offset:offset + BATCH_SIZE]
+            if bulk:
+                await mapper.sync_rows_bulk(batch, offset + 1)
+            else:
+                await mapper.sync_archive_rows(batch, offset + 1)
+            await session.commit()
+        elapsed = time.perf_counter() - start
+
+    await engine.dispose()
+    return elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, nargs="+", default=[2000, 20000])
+    parser.add_argument("--per-row-max", type=int, default=2000)
+    args = parser.parse_args()
+
+    print(f"{'rows':>8} {'mode':>8} {'seconds':>9} {'rows/s':>9}")
+    for n in args.rows:
+        modes = [False, True] if n <= args.per_row_max else [True]
+        for bulk in modes:
+            seconds = asyncio.run(bench(n, bulk))
+            mode = "bulk" if bulk else "per-row"
+            print(f"{n:>8,} {mode:>8} {seconds:>9.2f} {n / seconds:>9,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -7,6 +7,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from ...database import get_db
 from ...services.catalog import (
+    CatalogItemService,
     EpisodeService,
     EventService,
     ProjectService,
@@ -49,6 +50,13 @@ async def get_episode_service(
     yield EpisodeService(session)
 
 
+async def get_catalog_item_service(
+    session: AsyncSession = Depends(get_db),
+) -> AsyncGenerator[CatalogItemService, None]:
+    """Get catalog item service dependency."""
+    yield CatalogItemService(session)
+
+
 async def get_hand_clip_service(
     session: AsyncSession = Depends(get_db),
 ) -> AsyncGenerator[HandClipService, None]:
@@ -97,6 +105,7 @@ ProjectServiceDep = Annotated[ProjectService, Depends(get_project_service)]
 SeasonServiceDep = Annotated[SeasonService, Depends(get_season_service)]
 EventServiceDep = Annotated[EventService, Depends(get_event_service)]
 EpisodeServiceDep = Annotated[EpisodeService, Depends(get_episode_service)]
+CatalogItemServiceDep = Annotated[CatalogItemService, Depends(get_catalog_item_service)]
 HandClipServiceDep = Annotated[HandClipService, Depends(get_hand_clip_service)]
 TagServiceDep = Annotated[TagService, Depends(get_tag_service)]
 PlayerServiceDep = Annotated[PlayerService, Depends(get_player_service)]
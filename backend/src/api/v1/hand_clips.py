@@ -5,6 +5,7 @@ from uuid import UUID
 from fastapi import APIRouter, HTTPException, Query, status
 from pydantic import BaseModel
 
+from ...services.sheets_sync.row_mapper import RowMapper
 from .deps import HandClipServiceDep
 from .schemas import HandClipCreate, HandClipResponse, HandClipUpdate
 
@@ -104,6 +105,50 @@ async def get_by_player(
     return [HandClipResponse.model_validate(c) for c in clips]
 
 
+@router.get("/by-video/{video_file_id}/timeline", response_model=list[HandClipResponse])
+async def get_video_timeline(
+    video_file_id: UUID,
+    service: HandClipServiceDep,
+    skip: int = 0,
+    limit: int = Query(100, ge=1, le=1000),
+) -> list[HandClipResponse]:
+    """Get hand clips of a video file ordered by timecode."""
+    clips = await service.get_timeline(video_file_id, skip=skip, limit=limit)
+    return [HandClipResponse.model_validate(c) for c in clips]
+
+
+@router.get("/by-video/{video_file_id}/range", response_model=list[HandClipResponse])
+async def get_video_range(
+    video_file_id: UUID,
+    service: HandClipServiceDep,
+    start: str = Query(..., description="Range start (HH:MM:SS, MM:SS or seconds)"),
+    end: str = Query(..., description="Range end (HH:MM:SS, MM:SS or seconds)"),
+    skip: int = 0,
+    limit: int = Query(100, ge=1, le=1000),
+) -> list[HandClipResponse]:
+    """Get hand clips of a video file starting between start and end (inclusive)."""
+    start_seconds = RowMapper.timecode_seconds(start)
+    end_seconds = RowMapper.timecode_seconds(end)
+    if start_seconds is None or end_seconds is None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid timecode range: {start} - {end}",
+        )
+    if start_seconds > end_seconds:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Range start must not be after range end",
+        )
+    clips = await service.get_timeline(
+        video_file_id,
+        start_seconds=start_seconds,
+        end_seconds=end_seconds,
+        skip=skip,
+        limit=limit,
+    )
+    return [HandClipResponse.model_validate(c) for c in clips]
+
+
 @router.get("/linkage-stats", response_model=HandClipLinkageStatsResponse)
 async def get_handclip_linkage_stats(
     service: HandClipServiceDep,
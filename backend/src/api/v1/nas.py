@@ -548,9 +548,11 @@ class SyncStatsResponse(BaseModel):
     files_created: int
     files_updated: int
     files_skipped: int
+    files_excluded: int = 0
     errors: int
     total_size_bytes: int
     duration_seconds: float
+    exclusion_hits: dict[str, int] = {}
 
 
 class SyncRequest(BaseModel):
@@ -631,9 +633,11 @@ async def sync_nas_to_db(
             files_created=stats.files_created,
             files_updated=stats.files_updated,
             files_skipped=stats.files_skipped,
+            files_excluded=stats.files_excluded,
             errors=stats.errors,
             total_size_bytes=stats.total_size_bytes,
             duration_seconds=stats.duration_seconds,
+            exclusion_hits=stats.exclusion_hits,
         )
 
     except Exception as e:
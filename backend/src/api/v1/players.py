@@ -5,12 +5,25 @@ from uuid import UUID
 
 from fastapi import APIRouter, HTTPException, Query, status
 
+from ...orchestrator.event_bus import get_event_bus
+from ...orchestrator.events import Event, EventType
 from .deps import PlayerServiceDep
 from .schemas import PlayerCreate, PlayerResponse, PlayerUpdate, PlayerWithCountResponse
 
 router = APIRouter()
 
 
+async def _emit_player_changed(player_id: UUID, action: str) -> None:
+    """Player 변경 알림 (선수/태그 해석 캐시 무효화)."""
+    await get_event_bus().emit(
+        Event(
+            type=EventType.PLAYER_CHANGED,
+            payload={"player_id": str(player_id), "action": action},
+            source_block="E",
+        )
+    )
+
+
 @router.get("", response_model=list[PlayerResponse])
 async def list_players(
     service: PlayerServiceDep,
@@ -130,6 +143,7 @@ async def update_player(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Player {player_id} not found",
         )
+    await _emit_player_changed(player_id, "updated")
     return PlayerResponse.model_validate(player)
 
 
@@ -166,3 +180,4 @@ async def delete_player(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Player {player_id} not found",
         )
+    await _emit_player_changed(player_id, "deleted")
@@ -6,10 +6,11 @@ Provides data quality monitoring endpoints for:
 - Orphan record management
 """
 
+from datetime import datetime
 from typing import Any, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Query
+from fastapi import APIRouter, BackgroundTasks, HTTPException, Query
 from pydantic import BaseModel
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -362,11 +363,18 @@ class BuildCatalogRequest(BaseModel):
 
     limit: int = 10000
     skip_linked: bool = True
+    chunk_size: int = 1000
+    resume: bool = False  # 중단된 마지막 빌드의 커서부터 재개
+    # project_code별 동시 빌드 수 (None이면 CATALOG_BUILD_CONCURRENCY)
+    concurrency: Optional[int] = None
 
 
 class BuildCatalogResponse(BaseModel):
     """Build catalog result."""
 
+    run_id: Optional[UUID] = None
+    chunks_committed: int = 0
+    resumed: bool = False
     nas_files_processed: int
     projects_created: int
     seasons_created: int
@@ -375,6 +383,9 @@ class BuildCatalogResponse(BaseModel):
     video_files_created: int
     links_created: int
     skipped: int
+    excluded: int = 0
+    exclusion_hits: dict[str, int] = {}
+    partitions: dict[str, dict[str, int]] = {}  # 병렬 빌드 시 프로젝트별 통계
     errors: int
     error_messages: list[str]
 
@@ -390,17 +401,39 @@ async def build_catalog_from_nas(
     - Project, Season, Event, Episode 계층 구조 생성
     - VideoFile 생성 및 NASFile과 연결
 
+    chunk_size개씩 커밋하며 진행 상황을 저장하므로 중단되면 resume=true로
+    이어서 빌드할 수 있습니다 (진행 상황: GET /build-catalog/status).
+
+    concurrency > 1이면 project_code별 파티션을 별도 세션에서 동시에 빌드합니다
+    (재개 커서는 저장하지 않음).
+
     이 API는 대시보드에서 '카탈로그 빌드' 버튼으로 실행됩니다.
     """
-    from ...services.catalog import CatalogBuilderService
-
-    service = CatalogBuilderService(db)
-    stats = await service.build_catalog_from_nas(
-        limit=request.limit,
-        skip_linked=request.skip_linked,
-    )
+    from ...config import get_settings
+    from ...database import async_session_factory
+    from ...services.catalog import CatalogBuilderService, ParallelCatalogBuilder
+
+    concurrency = request.concurrency or get_settings().catalog.build_concurrency
+    if concurrency > 1 and not request.resume:
+        builder = ParallelCatalogBuilder(
+            async_session_factory,
+            max_concurrency=concurrency,
+            chunk_size=request.chunk_size,
+        )
+        stats = await builder.build(limit=request.limit, skip_linked=request.skip_linked)
+    else:
+        service = CatalogBuilderService(db)
+        stats = await service.build_catalog_from_nas(
+            limit=request.limit,
+            skip_linked=request.skip_linked,
+            chunk_size=request.chunk_size,
+            resume=request.resume,
+        )
 
     return BuildCatalogResponse(
+        run_id=stats.run_id,
+        chunks_committed=stats.chunks_committed,
+        resumed=stats.resumed,
         nas_files_processed=stats.nas_files_processed,
         projects_created=stats.projects_created,
         seasons_created=stats.seasons_created,
@@ -409,86 +442,131 @@ async def build_catalog_from_nas(
         video_files_created=stats.video_files_created,
         links_created=stats.links_created,
         skipped=stats.skipped,
+        excluded=stats.excluded,
+        exclusion_hits=stats.exclusion_hits,
+        partitions=stats.partitions,
         errors=stats.errors,
         error_messages=stats.error_messages[:20],
     )
 
 
+class BuildCatalogStatusResponse(BaseModel):
+    """Catalog build run progress."""
+
+    run_id: UUID
+    status: str  # running, paused, completed
+    skip_linked: bool
+    last_nas_file_id: Optional[UUID] = None
+    chunks_committed: int
+    stats: dict[str, int] = {}
+    error_messages: list[str] = []
+    created_at: datetime
+    updated_at: datetime
+    completed_at: Optional[datetime] = None
+
+
+@router.get("/build-catalog/status", response_model=BuildCatalogStatusResponse)
+async def get_build_catalog_status(
+    db: AsyncSession = Depends(get_db),
+) -> BuildCatalogStatusResponse:
+    """마지막 카탈로그 빌드의 진행 상황 (청크마다 갱신)."""
+    from ...models.catalog_build_run import CatalogBuildRun
+
+    run = (
+        await db.execute(
+            select(CatalogBuildRun).order_by(CatalogBuildRun.created_at.desc()).limit(1)
+        )
+    ).scalar_one_or_none()
+    if run is None:
+        raise HTTPException(status_code=404, detail="No catalog build runs")
+
+    return BuildCatalogStatusResponse(
+        run_id=run.id,
+        status=run.status,
+        skip_linked=run.skip_linked,
+        last_nas_file_id=run.last_nas_file_id,
+        chunks_committed=run.chunks_committed,
+        stats=run.stats or {},
+        error_messages=(run.error_messages or [])[-20:],
+        created_at=run.created_at,
+        updated_at=run.updated_at,
+        completed_at=run.completed_at,
+    )
+
+
 # ==================== Title Regeneration Endpoints ====================
 
 
 class RegenerateTitlesResponse(BaseModel):
-    """Title regeneration result."""
+    """Title regeneration job status."""
 
-    total_files: int
+    job_id: str
+    status: str  # pending, running, completed, failed
+    total_candidates: int
+    processed: int
     updated: int
-    skipped: int
+    skipped: int  # 제목 변경 없음 (버전만 갱신)
     errors: int
+    catalog_items_updated: int
+    chunks_committed: int
+    progress_percent: float
     samples: list[dict[str, str]]  # Sample of regenerated titles
+    error_message: Optional[str] = None
+
+
+def _regeneration_response(progress) -> RegenerateTitlesResponse:
+    """RegenerationProgress → 응답 변환."""
+    return RegenerateTitlesResponse(
+        job_id=progress.job_id,
+        status=progress.status,
+        total_candidates=progress.total_candidates,
+        processed=progress.processed,
+        updated=progress.updated,
+        skipped=progress.unchanged,
+        errors=progress.errors,
+        catalog_items_updated=progress.catalog_items_updated,
+        chunks_committed=progress.chunks_committed,
+        progress_percent=round(progress.progress_percent, 1),
+        samples=progress.samples,
+        error_message=progress.error_message,
+    )
 
 
 @router.post("/regenerate-titles", response_model=RegenerateTitlesResponse)
 async def regenerate_titles(
-    limit: int = Query(10000, ge=1, le=50000),
-    db: AsyncSession = Depends(get_db),
+    background_tasks: BackgroundTasks,
+    chunk_size: int = Query(500, ge=50, le=5000),
+    force: bool = Query(False, description="버전과 무관하게 전체 재생성"),
 ) -> RegenerateTitlesResponse:
-    """기존 VideoFile의 display_title, catalog_title을 재생성합니다.
+    """VideoFile/CatalogItem 제목 재생성 작업을 백그라운드로 시작합니다.
 
-    모든 VideoFile을 다시 파싱하여 제목을 업데이트합니다.
+    파서 버전 또는 제목 템플릿 버전이 바뀐 VideoFile만 keyset 페이지네이션으로
+    처리하며, 청크마다 bulk UPDATE 후 커밋합니다.
+    진행 상황은 `GET /quality/regenerate-titles/{job_id}`로 조회합니다.
     """
-    from ...services.file_parser import ParserFactory, TitleGenerator
-    from ...models.video_file import VideoFile
-
-    title_generator = TitleGenerator()
-    updated = 0
-    skipped = 0
-    errors = 0
-    samples: list[dict[str, str]] = []
-
-    # VideoFile 조회
-    result = await db.execute(
-        select(VideoFile).limit(limit)
+    from ...database import async_session_factory
+    from ...services.catalog import create_regeneration_job, run_regeneration_job
+
+    progress = create_regeneration_job()
+    background_tasks.add_task(
+        run_regeneration_job,
+        progress,
+        async_session_factory,
+        chunk_size=chunk_size,
+        force=force,
     )
-    video_files = result.scalars().all()
+    return _regeneration_response(progress)
 
-    for vf in video_files:
-        try:
-            # 파일명 파싱
-            parser = ParserFactory.get_parser(vf.file_name, vf.file_path)
-            metadata = parser.parse(vf.file_name, vf.file_path)
-
-            # 제목 생성
-            display_title, catalog_title = title_generator.generate(metadata)
-
-            # 업데이트 (변경된 경우만)
-            if vf.display_title != display_title or vf.catalog_title != catalog_title:
-                vf.display_title = display_title
-                vf.catalog_title = catalog_title
-                updated += 1
-
-                # 샘플 저장 (처음 10개)
-                if len(samples) < 10:
-                    samples.append({
-                        "file_name": vf.file_name,
-                        "display_title": display_title,
-                        "catalog_title": catalog_title,
-                        "parser": metadata.parser_used,
-                    })
-            else:
-                skipped += 1
-
-        except Exception as e:
-            errors += 1
-
-    await db.commit()
 
-    return RegenerateTitlesResponse(
-        total_files=len(video_files),
-        updated=updated,
-        skipped=skipped,
-        errors=errors,
-        samples=samples,
-    )
+@router.get("/regenerate-titles/{job_id}", response_model=RegenerateTitlesResponse)
+async def get_regenerate_titles_status(job_id: str) -> RegenerateTitlesResponse:
+    """제목 재생성 작업 진행 상황 조회."""
+    from ...services.catalog import get_regeneration_job
+
+    progress = get_regeneration_job(job_id)
+    if progress is None:
+        raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
+    return _regeneration_response(progress)
 
 
 # ==================== Validation API Endpoints (PRD 15.4) ====================
@@ -575,6 +653,7 @@ class PathMatchSample(BaseModel):
     matched_file_path: Optional[str]
     match_type: str
     confidence: float
+    nearest_candidates: list[str] = []  # 매칭 실패 시 근접 후보 ("경로 (일치 세그먼트 수)")
 
 
 class PathMatchValidationResponse(BaseModel):
@@ -587,40 +666,91 @@ class PathMatchValidationResponse(BaseModel):
     exact_matches: int
     partial_matches: int
     fuzzy_matches: int
+    skipped: int = 0
+    # 증분 매칭: limit 때문에 이번에 처리하지 못한 클립 수
+    remaining: int = 0
+    inventory_generation: Optional[int] = None
     samples: list[PathMatchSample]
+    unmatched_samples: list[PathMatchSample] = []
 
 
 @router.get("/validate/path-match", response_model=PathMatchValidationResponse)
 async def validate_path_match(
     limit: int = Query(1000, ge=1, le=10000),
+    source: str = Query("memory", pattern="^(memory|database)$"),
     db: AsyncSession = Depends(get_db),
 ) -> PathMatchValidationResponse:
-    """NAS ↔ Sheets 경로 매칭 검증 (PRD 15.4.2).
+    """NAS ↔ Sheets 경로 매칭 검증 (PRD 15.4.2, 읽기 전용).
 
     HandClip.nas_folder_link ↔ NASFile.file_path 매칭 결과:
     - 매칭률
     - 매칭 유형별 통계
     - 샘플 데이터
+
+    source=database: normalized_path 인덱스로 DB에서 매칭 (인메모리 인덱스 없음)
+    MATCHING_PATH_MATCH_WORKERS > 1: 프로세스 풀에서 샤드 매칭
+    """
+    from ...config import get_settings
+    from ...services.matching import (
+        DatabasePathMatcher,
+        PathMatcher,
+        ShardedPathMatcher,
+    )
+
+    config = get_settings().matching
+    if source == "database":
+        results, stats = await DatabasePathMatcher(db).match_all_clips(limit=limit)
+    else:
+        matcher = PathMatcher(db)
+        await matcher.build_nas_index()
+        if config.path_match_workers > 1:
+            results, stats = await ShardedPathMatcher(
+                matcher,
+                workers=config.path_match_workers,
+                shard_size=config.path_match_shard_size,
+            ).match_all_clips(limit=limit)
+        else:
+            results, stats = await matcher.match_all_clips(limit=limit)
+    return _path_match_response(results, stats)
+
+
+@router.post(
+    "/validate/path-match/incremental", response_model=PathMatchValidationResponse
+)
+async def match_paths_incremental(
+    limit: int = Query(1000, ge=1, le=10000),
+    db: AsyncSession = Depends(get_db),
+) -> PathMatchValidationResponse:
+    """신규/변경/미매칭 클립만 경로 매칭하고 매칭 상태 저장.
+
+    매칭 상태를 기록하고 NAS 인벤토리 세대를 확정하므로 POST로만 실행합니다.
     """
     from ...services.matching import PathMatcher
 
-    matcher = PathMatcher(db)
-    await matcher.build_nas_index(limit=50000)
+    results, stats = await PathMatcher(db).match_incremental(limit=limit)
+    return _path_match_response(results, stats)
 
-    results, stats = await matcher.match_all_clips(limit=limit)
 
-    samples: list[PathMatchSample] = []
-    for r in results[:20]:  # 샘플 20개
-        samples.append(
-            PathMatchSample(
-                hand_clip_id=str(r.hand_clip_id),
-                nas_folder_link=r.nas_folder_link,
-                matched_file_path=r.matched_file_path,
-                match_type=r.match_type,
-                confidence=r.confidence,
-            )
+def _path_match_response(results, stats) -> PathMatchValidationResponse:
+    """매칭 결과/통계 → 응답 (샘플 20개, 미매칭 샘플 20개)."""
+
+    def to_sample(r) -> PathMatchSample:
+        return PathMatchSample(
+            hand_clip_id=str(r.hand_clip_id),
+            nas_folder_link=r.nas_folder_link,
+            matched_file_path=r.matched_file_path,
+            match_type=r.match_type,
+            confidence=r.confidence,
+            nearest_candidates=[
+                f"{path} ({segments})" for path, segments in r.nearest_candidates
+            ],
         )
 
+    samples = [to_sample(r) for r in results[:20]]  # 샘플 20개
+    unmatched_samples = [
+        to_sample(r) for r in results if r.match_type == "none"
+    ][:20]
+
     return PathMatchValidationResponse(
         total_clips=stats.total_clips,
         matched=stats.matched,
@@ -629,7 +759,11 @@ async def validate_path_match(
         exact_matches=stats.exact_matches,
         partial_matches=stats.partial_matches,
         fuzzy_matches=stats.fuzzy_matches,
+        skipped=stats.skipped,
+        remaining=stats.remaining,
+        inventory_generation=stats.inventory_generation,
         samples=samples,
+        unmatched_samples=unmatched_samples,
     )
 
 
@@ -644,6 +778,7 @@ class ApplyMatchResponse(BaseModel):
 
     applied: int
     skipped: int
+    applied_by_type: dict[str, int] = {}
 
 
 @router.post("/validate/apply-matches", response_model=ApplyMatchResponse)
@@ -658,16 +793,159 @@ async def apply_path_matches(
     from ...services.matching import PathMatcher
 
     matcher = PathMatcher(db)
-    await matcher.build_nas_index(limit=50000)
+    await matcher.build_nas_index()
 
     results, stats = await matcher.match_all_clips(limit=10000)
-    applied = await matcher.apply_matches(results, min_confidence=request.min_confidence)
+    applied_by_type = await matcher.apply_matches(
+        results, min_confidence=request.min_confidence
+    )
+    applied = sum(applied_by_type.values())
 
     skipped = stats.total_clips - applied
 
     return ApplyMatchResponse(
         applied=applied,
         skipped=skipped,
+        applied_by_type=applied_by_type,
+    )
+
+
+class TitleLinkResponse(BaseModel):
+    """제목 기반 연결 결과."""
+
+    video_files_indexed: int
+    total_clips: int
+    linked: int
+    linked_by_file_name: int
+    linked_by_title: int
+    unmatched: int
+    dry_run: bool
+    samples: list[dict]
+
+
+@router.post("/validate/link-titles", response_model=TitleLinkResponse)
+async def link_titles(
+    file_name_threshold: Optional[float] = Query(None, ge=0.0, le=1.0),
+    title_threshold: Optional[float] = Query(None, ge=0.0, le=1.0),
+    limit: Optional[int] = Query(None, ge=1),
+    dry_run: bool = Query(False),
+    db: AsyncSession = Depends(get_db),
+) -> TitleLinkResponse:
+    """제목 기반 HandClip ↔ VideoFile 연결.
+
+    video_file_id가 없는 HandClip의 sheet_file_name(파일명) 또는 title(표시 제목)을
+    TF-IDF/MinHash 인덱스로 검색하여 임계값 이상이면 연결합니다.
+    임계값 미지정 시 설정값(MATCHING_*)을 사용합니다.
+    """
+    from ...services.matching import TitleLinker
+
+    linker = TitleLinker(
+        db,
+        file_name_threshold=file_name_threshold,
+        title_threshold=title_threshold,
+    )
+    stats = await linker.link_clips(limit=limit, dry_run=dry_run)
+
+    return TitleLinkResponse(
+        video_files_indexed=stats.video_files_indexed,
+        total_clips=stats.total_clips,
+        linked=stats.linked,
+        linked_by_file_name=stats.linked_by_file_name,
+        linked_by_title=stats.linked_by_title,
+        unmatched=stats.unmatched,
+        dry_run=dry_run,
+        samples=stats.samples,
+    )
+
+
+class FileNameLinkResponse(BaseModel):
+    """파일명 기반 연결 결과."""
+
+    total_clips: int
+    linked: int
+    linked_exact: int
+    linked_case_insensitive: int
+    linked_extension_insensitive: int
+    linked_by_folder_link: int
+    ambiguous: int
+    unmatched: int
+    dry_run: bool
+    samples: list[dict]
+
+
+@router.post("/validate/link-file-names", response_model=FileNameLinkResponse)
+async def link_file_names(
+    limit: Optional[int] = Query(None, ge=1),
+    dry_run: bool = Query(False),
+    db: AsyncSession = Depends(get_db),
+) -> FileNameLinkResponse:
+    """sheet_file_name 기반 HandClip ↔ VideoFile 직접 연결.
+
+    lower(file_name) 인덱스로 정확 → 대소문자 무시 → 확장자 무시 순으로 찾고,
+    동명 파일이 여러 개면 nas_folder_link로 후보를 좁힙니다.
+    """
+    from ...services.matching import FileNameLinker
+
+    stats = await FileNameLinker(db).link_clips(limit=limit, dry_run=dry_run)
+
+    return FileNameLinkResponse(
+        total_clips=stats.total_clips,
+        linked=stats.linked,
+        linked_exact=stats.linked_exact,
+        linked_case_insensitive=stats.linked_case_insensitive,
+        linked_extension_insensitive=stats.linked_extension_insensitive,
+        linked_by_folder_link=stats.linked_by_folder_link,
+        ambiguous=stats.ambiguous,
+        unmatched=stats.unmatched,
+        dry_run=dry_run,
+        samples=stats.samples,
+    )
+
+
+class ClipDedupResponse(BaseModel):
+    """시트 간 중복 클립 연결 결과."""
+
+    total_clips: int
+    candidate_pairs: int
+    groups: int
+    duplicates: int
+    video_conflicts: int
+    linked: int
+    unlinked: int
+    rescored: int
+    elapsed_seconds: float
+    dry_run: bool
+    samples: list[dict]
+
+
+@router.post("/validate/dedup-clips", response_model=ClipDedupResponse)
+async def dedup_clips(
+    threshold: Optional[float] = Query(None, ge=0.0, le=1.0),
+    dry_run: bool = Query(False),
+    db: AsyncSession = Depends(get_db),
+) -> ClipDedupResponse:
+    """METADATA_ARCHIVE ↔ ICONIK_METADATA 중복 HandClip 연결.
+
+    블로킹 키(제목, 타임코드, 선수, 영상)를 공유하는 쌍만 점수를 계산하고,
+    임계값 이상이면 duplicate_of_id로 대표 클립에 연결합니다.
+    임계값 미지정 시 설정값(DEDUP_THRESHOLD)을 사용합니다.
+    """
+    from ...services.sheets_sync import HandClipDeduplicator
+
+    stats = await HandClipDeduplicator(db, threshold=threshold).run(dry_run=dry_run)
+
+    return ClipDedupResponse(
+        total_clips=stats.total_clips,
+        candidate_pairs=stats.candidate_pairs,
+        groups=stats.groups,
+        duplicates=stats.duplicates,
+        video_conflicts=stats.video_conflicts,
+        linked=stats.linked,
+        unlinked=stats.unlinked,
+        rescored=stats.rescored,
+        elapsed_seconds=round(stats.elapsed_seconds, 3),
+        dry_run=dry_run,
+        samples=stats.samples,
     )
 
 
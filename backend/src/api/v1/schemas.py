@@ -219,6 +219,8 @@ class HandClipResponse(HandClipBase, BaseSchema):
     video_file_id: Optional[UUID] = None
     sheet_source: Optional[str] = None
     sheet_row_number: Optional[int] = None
+    timecode_seconds: Optional[int] = None
+    timecode_end_seconds: Optional[int] = None
     created_at: datetime
     updated_at: datetime
 
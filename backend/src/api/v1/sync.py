@@ -9,6 +9,7 @@ from uuid import UUID
 from fastapi import APIRouter, HTTPException, status
 from pydantic import BaseModel
 
+from ...services.sheets_sync import get_quota_manager
 from .deps import SheetsSyncServiceDep
 
 router = APIRouter()
@@ -69,6 +70,12 @@ async def get_sync_summary(
     return await service.get_sync_summary()
 
 
+@router.get("/quota", response_model=dict)
+async def get_sheets_quota() -> dict[str, Any]:
+    """Get Google Sheets API quota usage (shared by all sheets clients)."""
+    return get_quota_manager().metrics()
+
+
 @router.get("/records", response_model=list[SyncStatusResponse])
 async def list_sync_records(
     service: SheetsSyncServiceDep,
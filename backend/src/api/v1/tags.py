@@ -4,12 +4,25 @@ from uuid import UUID
 
 from fastapi import APIRouter, HTTPException, Query, status
 
+from ...orchestrator.event_bus import get_event_bus
+from ...orchestrator.events import Event, EventType
 from .deps import TagServiceDep
 from .schemas import TagCreate, TagResponse, TagUpdate, TagWithCountResponse
 
 router = APIRouter()
 
 
+async def _emit_tag_changed(tag_id: UUID, action: str) -> None:
+    """Tag 변경 알림 (선수/태그 해석 캐시 무효화)."""
+    await get_event_bus().emit(
+        Event(
+            type=EventType.TAG_CHANGED,
+            payload={"tag_id": str(tag_id), "action": action},
+            source_block="E",
+        )
+    )
+
+
 @router.get("", response_model=list[TagResponse])
 async def list_tags(
     service: TagServiceDep,
@@ -106,6 +119,7 @@ async def update_tag(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Tag {tag_id} not found",
         )
+    await _emit_tag_changed(tag_id, "updated")
     return TagResponse.model_validate(tag)
 
 
@@ -121,6 +135,7 @@ async def delete_tag(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Tag {tag_id} not found",
         )
+    await _emit_tag_changed(tag_id, "deleted")
 
 
 @router.post("/seed", response_model=list[TagResponse])
@@ -22,6 +22,68 @@ class NASConfig(BaseSettings):
         env_prefix = "NAS_"
 
 
+class MatchingConfig(BaseSettings):
+    """NAS ↔ Sheets 매칭 설정."""
+
+    # HandClip.sheet_file_name ↔ VideoFile.file_name 최소 유사도
+    title_file_name_threshold: float = 0.8
+    # HandClip.title ↔ VideoFile.display_title 최소 유사도
+    title_threshold: float = 0.6
+    title_top_k: int = 3
+    # 경로 매칭 프로세스 풀 (1이면 단일 프로세스)
+    path_match_workers: int = 1
+    path_match_shard_size: int = 5000
+
+    class Config:
+        env_prefix = "MATCHING_"
+
+
+class CatalogConfig(BaseSettings):
+    """카탈로그 에이전트 설정."""
+
+    # NAS_FILE_* 이벤트 구독 (증분 카탈로그 빌드)
+    event_driven: bool = True
+    # 이벤트 버스트를 한 번의 빌드로 묶는 대기 시간
+    event_window_seconds: float = 2.0
+    # project_code별 동시 빌드 수 (1이면 단일 세션 청크 빌드)
+    build_concurrency: int = 1
+
+    class Config:
+        env_prefix = "CATALOG_"
+
+
+class SheetsConfig(BaseSettings):
+    """Google Sheets API 호출 설정 (쿼터/재시도/페이지 크기)."""
+
+    # 분당 요청 한도 (Sheets API 기본 쿼터: 사용자당 분당 60회)
+    read_requests_per_minute: int = 60
+    write_requests_per_minute: int = 60
+    # 429/5xx 재시도 (지터를 준 지수 백오프)
+    max_retries: int = 5
+    backoff_base_seconds: float = 1.0
+    backoff_max_seconds: float = 32.0
+    # 페이지 크기 자동 조정 (page_size/batch_size를 지정하지 않은 동기화)
+    target_latency_seconds: float = 2.0
+    # 요청당 행 수 상한 (하한은 기본 크기 × QuotaManager.MIN_SCALE)
+    max_page_size: int = 5000
+
+    class Config:
+        env_prefix = "SHEETS_"
+
+
+class DedupConfig(BaseSettings):
+    """시트 간 HandClip 중복 판정 설정 (HandClipDeduplicator)."""
+
+    # 중복으로 볼 최소 쌍 점수
+    threshold: float = 0.8
+    timecode_tolerance_seconds: int = 5
+    # 이보다 큰 블록(흔한 제목 등)은 쌍 비교 생략
+    max_block_size: int = 200
+
+    class Config:
+        env_prefix = "DEDUP_"
+
+
 class Settings(BaseSettings):
     """Application Settings."""
 
@@ -35,6 +97,18 @@ class Settings(BaseSettings):
     # NAS
     nas: NASConfig = NASConfig()
 
+    # Matching
+    matching: MatchingConfig = MatchingConfig()
+
+    # Catalog
+    catalog: CatalogConfig = CatalogConfig()
+
+    # Google Sheets
+    sheets: SheetsConfig = SheetsConfig()
+
+    # HandClip 중복 판정
+    dedup: DedupConfig = DedupConfig()
+
     # App
     debug: bool = False
     log_level: str = "INFO"
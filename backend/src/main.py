@@ -10,7 +10,9 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from .api.v1 import api_router
+from .config import get_settings
 from .database import close_db, init_db
+from .services.catalog import CatalogAgent
 
 
 @asynccontextmanager
@@ -18,8 +20,15 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     """Application lifespan handler."""
     # Startup
     await init_db()
+    catalog_settings = get_settings().catalog
+    catalog_agent = None
+    if catalog_settings.event_driven:
+        catalog_agent = CatalogAgent(window_seconds=catalog_settings.event_window_seconds)
+        await catalog_agent.initialize()
     yield
     # Shutdown
+    if catalog_agent is not None:
+        await catalog_agent.close()
     await close_db()
 
 
@@ -1,17 +1,25 @@
-"""ORM Models for PokerVOD - 11 Models."""
+"""ORM Models for PokerVOD - 12 Models."""
 
 from .base import Base, TimestampMixin, UUIDMixin
+from .catalog_build_run import BuildRunStatus, CatalogBuildRun
+from .catalog_item import CatalogCategory, CatalogItem, ContentType
 from .episode import Episode, EpisodeType, TableType
 from .event import Event, EventType, GameType
 from .google_sheet_sync import GoogleSheetSync, SheetId, SyncStatus
-from .hand_clip import HandClip, HandGrade, hand_clip_players, hand_clip_tags
-from .nas_file import FileCategory, NASFile
+from .hand_clip import (
+    HandClip,
+    HandGrade,
+    PathMatchStatus,
+    hand_clip_players,
+    hand_clip_tags,
+)
+from .nas_file import FileCategory, NASFile, ParseStatus
 from .nas_folder import NASFolder
 from .player import Player
 from .project import Project, ProjectCode
 from .season import Season, SubCategory
 from .tag import EmotionTag, PokerPlayTag, Tag, TagCategory
-from .video_file import VersionType, VideoFile
+from .video_file import HiddenReason, VersionType, VideoFile
 
 __all__ = [
     # Base
@@ -29,15 +37,23 @@ __all__ = [
     "Episode",
     "EpisodeType",
     "TableType",
+    "CatalogItem",
+    "CatalogCategory",
+    "ContentType",
+    "CatalogBuildRun",
+    "BuildRunStatus",
     # File Models (Block A - NAS)
     "VideoFile",
+    "HiddenReason",
     "VersionType",
     "NASFolder",
     "NASFile",
     "FileCategory",
+    "ParseStatus",
     # Analysis Models (Block C - Hand Analysis)
     "HandClip",
     "HandGrade",
+    "PathMatchStatus",
     "hand_clip_tags",
     "hand_clip_players",
     "Tag",
@@ -0,0 +1,46 @@
+"""CatalogBuildRun model - 블럭 B (Catalog Agent)."""
+
+from datetime import datetime
+from typing import Optional
+from uuid import UUID, uuid4
+
+from sqlalchemy import JSON, DateTime, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .base import Base, TimestampMixin
+
+
+class CatalogBuildRun(Base, TimestampMixin):
+    """카탈로그 빌드 실행 기록 (청크 단위 커서, 중단 시 재개용)."""
+
+    __tablename__ = "catalog_build_runs"
+    __table_args__ = {"schema": "pokervod"}
+
+    id: Mapped[UUID] = mapped_column(primary_key=True, default=uuid4)
+    status: Mapped[str] = mapped_column(String(20), default="running", index=True)
+    skip_linked: Mapped[bool] = mapped_column(default=True)
+
+    # keyset 커서: 마지막으로 커밋된 청크의 최대 NASFile.id
+    last_nas_file_id: Mapped[Optional[UUID]] = mapped_column(default=None)
+    chunks_committed: Mapped[int] = mapped_column(default=0)
+
+    # BuildStats 카운터 및 최근 오류 메시지 (상한 있음)
+    stats: Mapped[Optional[dict]] = mapped_column(JSON, default=None)
+    error_messages: Mapped[Optional[list]] = mapped_column(JSON, default=None)
+
+    completed_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True), default=None
+    )
+
+    def __repr__(self) -> str:
+        return f"<CatalogBuildRun(status={self.status}, chunks={self.chunks_committed})>"
+
+
+# 빌드 실행 상태
+class BuildRunStatus:
+    RUNNING = "running"  # 진행 중 또는 비정상 종료 (재개 가능)
+    PAUSED = "paused"  # limit 도달, 남은 파일 있음 (재개 가능)
+    COMPLETED = "completed"
+    SUPERSEDED = "superseded"  # 이후 빌드가 시작되어 닫힘 (재개하지 않음)
+
+    RESUMABLE = (RUNNING, PAUSED)
@@ -59,6 +59,8 @@ class CatalogItem(Base, TimestampMixin):
     # 상태
     is_published: Mapped[bool] = mapped_column(default=True)
     is_featured: Mapped[bool] = mapped_column(default=False)
+    # 자동 비공개 사유 (HiddenReason) - 같은 사유로 비공개된 아이템만 자동 재공개
+    unpublished_reason: Mapped[Optional[str]] = mapped_column(String(50), default=None)
 
     # 원본 참조
     video_file_id: Mapped[UUID] = mapped_column(
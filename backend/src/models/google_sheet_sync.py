@@ -15,13 +15,15 @@ class GoogleSheetSync(Base, TimestampMixin):
 
     __tablename__ = "google_sheet_sync"
     __table_args__ = (
-        UniqueConstraint("sheet_id", "entity_type"),
+        UniqueConstraint("sheet_id", "entity_type", "sheet_name"),
         {"schema": "pokervod"},
     )
 
     id: Mapped[UUID] = mapped_column(primary_key=True, default=uuid4)
     sheet_id: Mapped[str] = mapped_column(String(100), index=True)
     entity_type: Mapped[str] = mapped_column(String(50))
+    # 탭 이름 (NULL이면 탭 구분 없는 기존 레코드)
+    sheet_name: Mapped[Optional[str]] = mapped_column(String(100), default=None)
     last_row_synced: Mapped[int] = mapped_column(default=0)
     last_synced_at: Mapped[Optional[datetime]] = mapped_column(
         DateTime(timezone=True), default=None
@@ -29,6 +31,10 @@ class GoogleSheetSync(Base, TimestampMixin):
     sync_status: Mapped[str] = mapped_column(String(20), default="idle")
     error_message: Mapped[Optional[str]] = mapped_column(String(500), default=None)
 
+    # 변경 probe 기준값 (마지막 동기화 시점의 그리드 행 수, 마지막 N행 해시)
+    probe_row_count: Mapped[Optional[int]] = mapped_column(default=None)
+    probe_tail_hash: Mapped[Optional[str]] = mapped_column(String(64), default=None)
+
     def __repr__(self) -> str:
         return f"<GoogleSheetSync(sheet={self.sheet_id}, entity={self.entity_type})>"
 
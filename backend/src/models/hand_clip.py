@@ -3,8 +3,17 @@
 from typing import TYPE_CHECKING, Optional
 from uuid import UUID, uuid4
 
-from sqlalchemy import Column, ForeignKey, String, Table, Text, UniqueConstraint
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy import (
+    Column,
+    Float,
+    ForeignKey,
+    Index,
+    String,
+    Table,
+    Text,
+    UniqueConstraint,
+)
+from sqlalchemy.orm import Mapped, mapped_column, relationship, validates
 
 from .base import Base, TimestampMixin
 
@@ -18,16 +27,26 @@ if TYPE_CHECKING:
 hand_clip_tags = Table(
     "hand_clip_tags",
     Base.metadata,
-    Column("hand_clip_id", ForeignKey("pokervod.hand_clips.id", ondelete="CASCADE")),
-    Column("tag_id", ForeignKey("pokervod.tags.id", ondelete="CASCADE")),
+    Column(
+        "hand_clip_id",
+        ForeignKey("pokervod.hand_clips.id", ondelete="CASCADE"),
+        primary_key=True,
+    ),
+    Column("tag_id", ForeignKey("pokervod.tags.id", ondelete="CASCADE"), primary_key=True),
     schema="pokervod",
 )
 
 hand_clip_players = Table(
     "hand_clip_players",
     Base.metadata,
-    Column("hand_clip_id", ForeignKey("pokervod.hand_clips.id", ondelete="CASCADE")),
-    Column("player_id", ForeignKey("pokervod.players.id", ondelete="CASCADE")),
+    Column(
+        "hand_clip_id",
+        ForeignKey("pokervod.hand_clips.id", ondelete="CASCADE"),
+        primary_key=True,
+    ),
+    Column(
+        "player_id", ForeignKey("pokervod.players.id", ondelete="CASCADE"), primary_key=True
+    ),
     schema="pokervod",
 )
 
@@ -38,6 +57,24 @@ class HandClip(Base, TimestampMixin):
     __tablename__ = "hand_clips"
     __table_args__ = (
         UniqueConstraint("sheet_source", "sheet_row_number"),
+        Index(
+            "ix_hand_clips_normalized_folder_link_pattern",
+            "normalized_folder_link",
+            postgresql_ops={"normalized_folder_link": "text_pattern_ops"},
+        ),
+        Index(
+            "ix_hand_clips_normalized_folder_link_trgm",
+            "normalized_folder_link",
+            postgresql_using="gin",
+            postgresql_ops={"normalized_folder_link": "gin_trgm_ops"},
+        ),
+        # 영상별 타임코드 구간 조회 / 타임라인 정렬
+        Index(
+            "ix_hand_clips_video_file_id_timecode_seconds",
+            "video_file_id",
+            "timecode_seconds",
+            "id",
+        ),
         {"schema": "pokervod"},
     )
 
@@ -54,15 +91,42 @@ class HandClip(Base, TimestampMixin):
     # Sheet tracking
     sheet_source: Mapped[Optional[str]] = mapped_column(String(50), default=None)
     sheet_row_number: Mapped[Optional[int]] = mapped_column(default=None)
+    # 원본 시트 행 내용 해시 (RowMapper.row_hash) - 편집된 행만 갱신
+    sheet_row_hash: Mapped[Optional[str]] = mapped_column(String(64), default=None)
+    # 다른 시트의 같은 핸드 (HandClipDeduplicator) - 대표 클립 id와 쌍 점수
+    duplicate_of_id: Mapped[Optional[UUID]] = mapped_column(
+        ForeignKey("pokervod.hand_clips.id", ondelete="SET NULL"),
+        default=None,
+        index=True,
+    )
+    duplicate_score: Mapped[Optional[float]] = mapped_column(Float, default=None)
 
     # NAS 매칭용 (Sheets의 "Nas Folder Link" 컬럼)
     nas_folder_link: Mapped[Optional[str]] = mapped_column(String(1000), default=None)
+    # PathNormalizer.normalize(nas_folder_link) - DB 측 경로 매칭용
+    normalized_folder_link: Mapped[Optional[str]] = mapped_column(
+        String(1000), default=None
+    )
     sheet_file_name: Mapped[Optional[str]] = mapped_column(String(500), default=None)
 
+    # 경로 매칭 상태 (증분 매칭용, PathMatchStatus)
+    path_match_status: Mapped[str] = mapped_column(
+        String(20), default="pending", index=True
+    )
+    path_match_nas_file_id: Mapped[Optional[UUID]] = mapped_column(
+        ForeignKey("pokervod.nas_files.id", ondelete="SET NULL"), default=None
+    )
+    path_match_confidence: Mapped[Optional[float]] = mapped_column(Float, default=None)
+    # 매칭 시점의 NASFile.inventory_generation
+    path_match_generation: Mapped[Optional[int]] = mapped_column(default=None)
+
     # Content
     title: Mapped[Optional[str]] = mapped_column(String(500), default=None)
     timecode: Mapped[Optional[str]] = mapped_column(String(20), default=None)
     timecode_end: Mapped[Optional[str]] = mapped_column(String(20), default=None)
+    # RowMapper.timecode_seconds(timecode / timecode_end) - 해석할 수 없으면 NULL
+    timecode_seconds: Mapped[Optional[int]] = mapped_column(default=None)
+    timecode_end_seconds: Mapped[Optional[int]] = mapped_column(default=None)
     duration_seconds: Mapped[Optional[int]] = mapped_column(default=None)
     notes: Mapped[Optional[str]] = mapped_column(Text, default=None)
 
@@ -84,6 +148,26 @@ class HandClip(Base, TimestampMixin):
         secondary=hand_clip_players, back_populates="hand_clips"
     )
 
+    @validates("nas_folder_link")
+    def _sync_normalized_folder_link(
+        self, key: str, value: Optional[str]
+    ) -> Optional[str]:
+        from ..services.matching.path_matcher import PathNormalizer
+
+        normalized = PathNormalizer.normalize(value) if value else None
+        if normalized != self.normalized_folder_link:
+            # 링크가 바뀌면 다음 증분 매칭에서 다시 매칭
+            self.path_match_status = PathMatchStatus.PENDING
+        self.normalized_folder_link = normalized
+        return value
+
+    @validates("timecode", "timecode_end")
+    def _sync_timecode_seconds(self, key: str, value: Optional[str]) -> Optional[str]:
+        from ..services.sheets_sync.row_mapper import RowMapper
+
+        setattr(self, f"{key}_seconds", RowMapper.timecode_seconds(value))
+        return value
+
     def __repr__(self) -> str:
         return f"<HandClip(title={self.title}, grade={self.hand_grade})>"
 
@@ -93,3 +177,14 @@ class HandGrade:
     ONE_STAR = "★"
     TWO_STAR = "★★"
     THREE_STAR = "★★★"
+
+
+# 경로 매칭 상태
+class PathMatchStatus:
+    PENDING = "pending"
+    EXACT = "exact"
+    PARTIAL = "partial"
+    FUZZY = "fuzzy"
+    NONE = "none"
+
+    MATCHED = (EXACT, PARTIAL, FUZZY)
@@ -4,8 +4,8 @@ from datetime import datetime
 from typing import TYPE_CHECKING, Optional
 from uuid import UUID, uuid4
 
-from sqlalchemy import BigInteger, DateTime, ForeignKey, String
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy import JSON, BigInteger, DateTime, Float, ForeignKey, Index, String
+from sqlalchemy.orm import Mapped, mapped_column, relationship, validates
 
 from .base import Base, TimestampMixin
 
@@ -18,10 +18,27 @@ class NASFile(Base, TimestampMixin):
     """NAS 파일 인벤토리."""
 
     __tablename__ = "nas_files"
-    __table_args__ = {"schema": "pokervod"}
+    __table_args__ = (
+        # 정확/접두사 일치 (LIKE 'prefix%', ~>=~ / ~<~)
+        Index(
+            "ix_nas_files_normalized_path_pattern",
+            "normalized_path",
+            postgresql_ops={"normalized_path": "text_pattern_ops"},
+        ),
+        # 퍼지 일치 (pg_trgm)
+        Index(
+            "ix_nas_files_normalized_path_trgm",
+            "normalized_path",
+            postgresql_using="gin",
+            postgresql_ops={"normalized_path": "gin_trgm_ops"},
+        ),
+        {"schema": "pokervod"},
+    )
 
     id: Mapped[UUID] = mapped_column(primary_key=True, default=uuid4)
     file_path: Mapped[str] = mapped_column(String(1000), unique=True, index=True)
+    # PathNormalizer.normalize(file_path) - DB 측 경로 매칭용
+    normalized_path: Mapped[Optional[str]] = mapped_column(String(1000), default=None)
     file_name: Mapped[str] = mapped_column(String(500))
     file_size_bytes: Mapped[int] = mapped_column(BigInteger, default=0)
     file_extension: Mapped[Optional[str]] = mapped_column(String(20), default=None)
@@ -35,6 +52,16 @@ class NASFile(Base, TimestampMixin):
     is_excluded: Mapped[bool] = mapped_column(default=False)
     exclude_reason: Mapped[Optional[str]] = mapped_column(String(100), default=None)
 
+    # Parsing (CatalogBuilder)
+    parse_status: Mapped[str] = mapped_column(String(20), default="pending")
+    parsed_metadata: Mapped[Optional[dict]] = mapped_column(JSON, default=None)
+    match_confidence: Mapped[Optional[float]] = mapped_column(Float, default=None)
+
+    # 경로 매칭 인벤토리 세대 (None: 아직 매칭 실행에 포함되지 않은 신규 파일)
+    inventory_generation: Mapped[Optional[int]] = mapped_column(
+        default=None, index=True
+    )
+
     # Foreign keys
     video_file_id: Mapped[Optional[UUID]] = mapped_column(
         ForeignKey("pokervod.video_files.id", ondelete="SET NULL"), default=None
@@ -47,6 +74,13 @@ class NASFile(Base, TimestampMixin):
     video_file: Mapped[Optional["VideoFile"]] = relationship(back_populates="nas_file")
     folder: Mapped[Optional["NASFolder"]] = relationship(back_populates="files")
 
+    @validates("file_path")
+    def _sync_normalized_path(self, key: str, value: str) -> str:
+        from ..services.matching.path_matcher import PathNormalizer
+
+        self.normalized_path = PathNormalizer.normalize(value) if value else None
+        return value
+
     def __repr__(self) -> str:
         return f"<NASFile(name={self.file_name})>"
 
@@ -58,3 +92,11 @@ class FileCategory:
     SYSTEM = "system"
     ARCHIVE = "archive"
     OTHER = "other"
+
+
+# 파싱 상태
+class ParseStatus:
+    PENDING = "pending"
+    PARSED = "parsed"
+    MATCHED = "matched"
+    FAILED = "failed"
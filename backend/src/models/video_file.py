@@ -4,7 +4,7 @@ from datetime import datetime
 from typing import TYPE_CHECKING, Optional
 from uuid import UUID, uuid4
 
-from sqlalchemy import BigInteger, DateTime, ForeignKey, String
+from sqlalchemy import BigInteger, DateTime, ForeignKey, Index, String, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from .base import Base, TimestampMixin
@@ -49,6 +49,9 @@ class VideoFile(Base, TimestampMixin):
     content_type: Mapped[Optional[str]] = mapped_column(String(20), default=None)
     catalog_title: Mapped[Optional[str]] = mapped_column(String(300), default=None)
     is_catalog_item: Mapped[bool] = mapped_column(default=False)
+    # 제목 생성 시점의 파서/템플릿 버전 (재생성 대상 판별용)
+    parser_version: Mapped[Optional[int]] = mapped_column(default=None)
+    title_template_version: Mapped[Optional[int]] = mapped_column(default=None)
 
     # Filtering
     is_hidden: Mapped[bool] = mapped_column(default=False)
@@ -64,6 +67,15 @@ class VideoFile(Base, TimestampMixin):
         return f"<VideoFile(name={self.file_name})>"
 
 
+# 대소문자 무시 파일명 조회 (HandClip.sheet_file_name 연결)
+Index("ix_video_files_file_name_lower", func.lower(VideoFile.file_name))
+
+
+# 숨김 사유
+class HiddenReason:
+    NAS_REMOVED = "nas_removed"  # NAS에서 원본 파일 삭제
+
+
 # 버전 타입
 class VersionType:
     CLEAN = "clean"
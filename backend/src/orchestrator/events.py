@@ -30,6 +30,8 @@ class EventType(str, Enum):
     HAND_CLIP_UPDATED = "hand.clip.updated"
     HAND_CLIP_TAGGED = "hand.clip.tagged"
     PLAYER_LINKED = "hand.player.linked"
+    PLAYER_CHANGED = "hand.player.changed"
+    TAG_CHANGED = "hand.tag.changed"
 
     # Sheets 동기화 관련 (블럭 D)
     SHEETS_SYNC_REQUESTED = "sheets.sync.requested"
@@ -7,7 +7,17 @@ from .project_service import ProjectService
 from .season_service import SeasonService
 from .event_service import EventService
 from .episode_service import EpisodeService
-from .catalog_builder_service import CatalogBuilderService
+from .catalog_builder_service import BuildStats, CatalogBuilderService
+from .catalog_agent import CatalogAgent
+from .parallel_builder import ParallelCatalogBuilder
+from .catalog_item_service import CatalogItemService
+from .title_regeneration_service import (
+    RegenerationProgress,
+    TitleRegenerationService,
+    create_regeneration_job,
+    get_regeneration_job,
+    run_regeneration_job,
+)
 
 __all__ = [
     "ProjectService",
@@ -15,4 +25,13 @@ __all__ = [
     "EventService",
     "EpisodeService",
     "CatalogBuilderService",
+    "BuildStats",
+    "CatalogAgent",
+    "ParallelCatalogBuilder",
+    "CatalogItemService",
+    "TitleRegenerationService",
+    "RegenerationProgress",
+    "create_regeneration_job",
+    "get_regeneration_job",
+    "run_regeneration_job",
 ]
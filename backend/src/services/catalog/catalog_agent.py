@@ -0,0 +1,152 @@
+"""Catalog Agent - 블럭 B (NAS 변경 이벤트 기반 증분 카탈로그 빌드).
+
+NAS 동기화가 발행하는 NAS_FILE_ADDED/CHANGED/REMOVED 이벤트를 구독하고,
+window_seconds 동안 모인 이벤트를 한 번의 CatalogBuilderService.apply_nas_changes
+호출로 묶어 영향받은 VideoFile/CatalogItem만 생성·갱신·비공개 처리합니다.
+"""
+
+import asyncio
+import logging
+from typing import Callable, Optional
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ...database import async_session_factory
+from ...orchestrator.base_agent import BaseAgent
+from ...orchestrator.event_bus import EventBus
+from ...orchestrator.events import Event, EventType
+from .catalog_builder_service import BuildStats, CatalogBuilderService
+
+logger = logging.getLogger(__name__)
+
+NAS_FILE_EVENTS = (
+    EventType.NAS_FILE_ADDED,
+    EventType.NAS_FILE_CHANGED,
+    EventType.NAS_FILE_REMOVED,
+)
+
+
+class CatalogAgent(BaseAgent):
+    """NAS 변경 이벤트를 묶어 증분 카탈로그 빌드를 실행하는 에이전트."""
+
+    block_id = "B"
+
+    # 같은 변경분의 최대 반영 시도 횟수 (초과하면 failed_ids로 옮기고 재시도하지 않음)
+    MAX_ATTEMPTS = 3
+
+    def __init__(
+        self,
+        session_factory: Callable[[], AsyncSession] = async_session_factory,
+        event_bus: Optional[EventBus] = None,
+        *,
+        window_seconds: float = 2.0,
+    ) -> None:
+        self.session_factory = session_factory
+        self.window_seconds = window_seconds
+        self._pending_files: set[UUID] = set()
+        self._pending_removed_videos: set[UUID] = set()
+        self._attempts: dict[UUID, int] = {}
+        # MAX_ATTEMPTS번 반영에 실패한 NASFile/VideoFile ID
+        self.failed_ids: set[UUID] = set()
+        self._flush_task: Optional[asyncio.Task] = None
+        self._flush_lock = asyncio.Lock()
+        self._last_error: Optional[str] = None
+        super().__init__(event_bus=event_bus)
+
+    def _register_handlers(self) -> None:
+        for event_type in NAS_FILE_EVENTS:
+            self.event_bus.subscribe(event_type, self.handle_nas_event)
+
+    async def initialize(self) -> None:
+        logger.info(
+            f"Catalog agent listening for NAS file events "
+            f"(window {self.window_seconds}s)"
+        )
+
+    async def health_check(self) -> bool:
+        return self._last_error is None
+
+    async def close(self) -> None:
+        """구독 해제 후 대기 중인 변경분 반영."""
+        for event_type in NAS_FILE_EVENTS:
+            self.event_bus.unsubscribe(event_type, self.handle_nas_event)
+        if self._flush_task is not None and not self._flush_task.done():
+            self._flush_task.cancel()
+        await self.flush()
+
+    @property
+    def pending_count(self) -> int:
+        return len(self._pending_files) + len(self._pending_removed_videos)
+
+    async def handle_nas_event(self, event: Event) -> None:
+        """이벤트 ID를 대기 목록에 모으고 윈도우 종료 시 빌드 예약."""
+        if event.type == EventType.NAS_FILE_REMOVED:
+            self._pending_removed_videos.update(
+                UUID(i) for i in event.payload.get("video_file_ids", [])
+            )
+        else:
+            self._pending_files.update(
+                UUID(i) for i in event.payload.get("nas_file_ids", [])
+            )
+
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_after_window())
+
+    async def _flush_after_window(self) -> None:
+        # 빌드 중 도착한 이벤트는 다음 윈도우에서 처리
+        while self.pending_count:
+            await asyncio.sleep(self.window_seconds)
+            try:
+                await self.flush()
+            except Exception as e:
+                self._last_error = str(e)
+                await self.on_error(e, {"pending": self.pending_count})
+                return
+
+    async def flush(self) -> Optional[BuildStats]:
+        """대기 중인 변경분을 한 번의 증분 빌드로 반영."""
+        async with self._flush_lock:
+            if not self.pending_count:
+                return None
+            nas_file_ids = list(self._pending_files)
+            removed_video_ids = list(self._pending_removed_videos)
+            self._pending_files.clear()
+            self._pending_removed_videos.clear()
+
+            try:
+                async with self.session_factory() as session:
+                    stats = await CatalogBuilderService(session).apply_nas_changes(
+                        nas_file_ids=nas_file_ids,
+                        removed_video_file_ids=removed_video_ids,
+                    )
+            except Exception:
+                self._requeue(self._pending_files, nas_file_ids)
+                self._requeue(self._pending_removed_videos, removed_video_ids)
+                raise
+            self._last_error = None
+            for i in (*nas_file_ids, *removed_video_ids):
+                self._attempts.pop(i, None)
+
+        logger.info(
+            f"Incremental catalog build: {len(nas_file_ids)} changed files, "
+            f"{stats.video_files_created} video files created, "
+            f"{stats.video_files_unpublished} unpublished"
+        )
+        await self.emit(
+            EventType.CATALOG_UPDATED,
+            {"nas_files": len(nas_file_ids), **stats.counters()},
+        )
+        return stats
+
+    def _requeue(self, pending: set[UUID], ids: list[UUID]) -> None:
+        """실패한 변경분을 다음 이벤트 윈도우에서 재시도 (MAX_ATTEMPTS회 실패 시 제외)."""
+        for i in ids:
+            attempts = self._attempts.get(i, 0) + 1
+            if attempts < self.MAX_ATTEMPTS:
+                self._attempts[i] = attempts
+                pending.add(i)
+            else:
+                self._attempts.pop(i, None)
+                self.failed_ids.add(i)
+                logger.error(f"Giving up on catalog change {i} after {attempts} attempts")
@@ -4,41 +4,53 @@ NAS 파일 파싱 결과를 기반으로 Project → Season → Event → Episod
 엔티티를 자동 생성하고 연결합니다.
 """
 
-from dataclasses import dataclass
-from typing import Optional
-from uuid import UUID
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from decimal import Decimal
+from typing import Any, ClassVar, Iterable, Optional, Sequence
+from uuid import UUID, uuid4
 
+from sqlalchemy import insert, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
-
-from decimal import Decimal
 
+from ...models.catalog_build_run import BuildRunStatus, CatalogBuildRun
+from ...models.catalog_item import CatalogItem
+from ...models.episode import Episode
+from ...models.event import Event
+from ...models.nas_file import FileCategory, NASFile, ParseStatus
 from ...models.project import Project
 from ...models.season import Season
-from ...models.event import Event
-from ...models.episode import Episode
-from ...models.video_file import VideoFile
-from ...models.nas_file import NASFile, FileCategory, ParseStatus
-from ...models.catalog_item import CatalogItem
-from ..file_parser import ParserFactory, ParsedMetadata, TitleGenerator
-import json
+from ...models.video_file import HiddenReason, VideoFile
+from ..file_parser import ParsedMetadata, ParserFactory, TitleGenerator
+from ..nas_inventory.exclusion_rules import get_exclusion_matcher
 
-
-# 카탈로그 빌드 시 제외할 경로 패턴
-EXCLUDED_PATHS = [
-    "/Clips/",
-    "\\Clips\\",
-    "Clips/",
-    "/Player Emotion",
-    "\\Player Emotion",
-    "Player Emotion/",
-]
+logger = logging.getLogger(__name__)
 
 
 @dataclass
 class BuildStats:
     """카탈로그 빌드 통계."""
 
+    # 보관할 최대 오류 메시지 수 (errors 카운트는 계속 증가)
+    MAX_ERROR_MESSAGES: ClassVar[int] = 100
+    COUNTERS: ClassVar[tuple[str, ...]] = (
+        "nas_files_processed",
+        "projects_created",
+        "seasons_created",
+        "events_created",
+        "episodes_created",
+        "video_files_created",
+        "catalog_items_created",
+        "links_created",
+        "video_files_updated",
+        "video_files_unpublished",
+        "video_files_republished",
+        "skipped",
+        "excluded",
+        "errors",
+    )
+
     nas_files_processed: int = 0
     projects_created: int = 0
     seasons_created: int = 0
@@ -47,61 +59,461 @@ class BuildStats:
     video_files_created: int = 0
     catalog_items_created: int = 0
     links_created: int = 0
+    # 증분 빌드 (NAS 변경 이벤트)
+    video_files_updated: int = 0
+    video_files_unpublished: int = 0
+    video_files_republished: int = 0
     skipped: int = 0
+    excluded: int = 0
     errors: int = 0
     error_messages: list[str] = None
+    exclusion_hits: dict[str, int] = None
+    # 청크 빌드 (CatalogBuildRun)
+    run_id: Optional[UUID] = None
+    chunks_committed: int = 0
+    resumed: bool = False
+    # 프로젝트별 병렬 빌드: project_code → 카운터
+    partitions: dict[str, dict[str, int]] = None
 
     def __post_init__(self):
         if self.error_messages is None:
             self.error_messages = []
+        if self.exclusion_hits is None:
+            self.exclusion_hits = {}
+        if self.partitions is None:
+            self.partitions = {}
+
+    def add_error(self, message: str) -> None:
+        """오류 기록 (메시지는 최근 MAX_ERROR_MESSAGES개만 보관)."""
+        self.errors += 1
+        self.error_messages.append(message)
+        if len(self.error_messages) > self.MAX_ERROR_MESSAGES:
+            del self.error_messages[: -self.MAX_ERROR_MESSAGES]
+
+    def merge(self, other: "BuildStats") -> None:
+        """다른 빌드(청크/파티션) 통계를 합산."""
+        for name in self.COUNTERS:
+            setattr(self, name, getattr(self, name) + getattr(other, name))
+        self.error_messages.extend(other.error_messages)
+        del self.error_messages[: -self.MAX_ERROR_MESSAGES]
+        for rule, hits in other.exclusion_hits.items():
+            self.exclusion_hits[rule] = self.exclusion_hits.get(rule, 0) + hits
+        self.chunks_committed += other.chunks_committed
+        self.partitions.update(other.partitions)
+
+    def counters(self) -> dict[str, int]:
+        """카운터 필드 (CatalogBuildRun.stats 저장용)."""
+        return {name: getattr(self, name) for name in self.COUNTERS}
+
+
+@dataclass
+class _BuildPlan:
+    """프리페치한 기존 엔티티 키 맵과 일괄 삽입할 신규 행."""
+
+    projects: dict[str, UUID] = field(default_factory=dict)  # code → id
+    seasons: dict[tuple[UUID, int], UUID] = field(default_factory=dict)
+    events: dict[tuple[UUID, int], UUID] = field(default_factory=dict)
+    # (event_id, episode_number, day_number) → id
+    episodes: dict[tuple[UUID, int, Optional[int]], UUID] = field(default_factory=dict)
+    # (event_id, episode_number) → id (day_number 미지정 조회용)
+    episodes_any_day: dict[tuple[UUID, int], UUID] = field(default_factory=dict)
+    # file_path → (video_file_id, episode_id)
+    video_files: dict[str, tuple[UUID, Optional[UUID]]] = field(default_factory=dict)
+    cataloged: set[UUID] = field(default_factory=set)  # CatalogItem이 있는 video_file_id
+
+    new_projects: list[dict] = field(default_factory=list)
+    new_seasons: list[dict] = field(default_factory=list)
+    new_events: list[dict] = field(default_factory=list)
+    new_episodes: list[dict] = field(default_factory=list)
+    new_video_files: list[dict] = field(default_factory=list)
+    new_catalog_items: list[dict] = field(default_factory=list)
+
+    excluded_files: list[dict] = field(default_factory=list)
+    matched_files: list[dict] = field(default_factory=list)  # 기존 VideoFile에 연결
+    parsed_files: list[dict] = field(default_factory=list)  # 새 VideoFile에 연결
 
 
 class CatalogBuilderService:
-    """NAS 파일에서 카탈로그 엔티티를 자동 생성하는 서비스."""
+    """NAS 파일에서 카탈로그 엔티티를 자동 생성하는 서비스.
+
+    빌드는 단계별로 진행됩니다.
+    1. 대상 NASFile 컬럼 조회 및 전체 파싱
+    2. 영향받는 키의 기존 Project/Season/Event/Episode/VideoFile/CatalogItem 프리페치
+    3. 누락 엔티티를 메모리에서 계산 (UUID는 클라이언트에서 생성)
+    4. 계층 순서대로 레벨별 bulk INSERT, NASFile bulk UPDATE
+    """
+
+    # IN 목록 청크 크기
+    PREFETCH_CHUNK_SIZE = 1000
 
     def __init__(self, session: AsyncSession) -> None:
         self.session = session
         self.title_generator = TitleGenerator()
-        self._project_cache: dict[str, Project] = {}
-        self._season_cache: dict[tuple[UUID, int], Season] = {}
-        self._event_cache: dict[tuple[UUID, int], Event] = {}
+        self._exclusion = get_exclusion_matcher()
 
     async def build_catalog_from_nas(
         self,
         *,
         limit: int = 10000,
         skip_linked: bool = True,
+        chunk_size: int = 1000,
+        resume: bool = False,
     ) -> BuildStats:
         """NAS 파일에서 카탈로그 엔티티를 자동 생성합니다.
 
+        NASFile.id keyset 페이지네이션으로 chunk_size개씩 빌드하고 청크마다
+        커밋하며 CatalogBuildRun에 커서와 진행 통계를 저장합니다.
+
         Args:
-            limit: 처리할 최대 파일 수
+            limit: 이번 실행에서 처리할 최대 파일 수
             skip_linked: 이미 VideoFile에 연결된 파일은 스킵
+            chunk_size: 청크(커밋) 단위 파일 수
+            resume: True면 중단된 마지막 빌드의 커서부터 재개
 
         Returns:
             빌드 통계
         """
         stats = BuildStats()
 
-        # 비디오 파일 조회
-        query = (
-            select(NASFile)
-            .where(NASFile.file_category == FileCategory.VIDEO)
+        run = await self._latest_resumable_run() if resume else None
+        if run is not None:
+            # 저장된 누적 통계에 이어서 집계
+            stats = BuildStats(**(run.stats or {}))
+            stats.error_messages = list(run.error_messages or [])
+            stats.chunks_committed = run.chunks_committed
+            stats.resumed = True
+            skip_linked = run.skip_linked
+        else:
+            run = CatalogBuildRun(skip_linked=skip_linked, stats={}, error_messages=[])
+            self.session.add(run)
+            await self.session.flush()
+        # 이 실행 외의 미완료 실행은 다시 재개되지 않도록 닫음
+        await self._supersede_open_runs(run.id)
+        await self.session.commit()
+        stats.run_id = run.id
+        cursor = run.last_nas_file_id
+
+        processed = 0
+        exhausted = False
+        while processed < limit:
+            nas_files = await self.fetch_candidates(
+                cursor, min(chunk_size, limit - processed), skip_linked
+            )
+            if not nas_files:
+                exhausted = True
+                break
+
+            chunk_stats = BuildStats()
+            try:
+                await self._build_chunk(nas_files, chunk_stats)
+                await self.session.commit()
+            except Exception as e:
+                await self.session.rollback()
+                logger.warning(f"Catalog chunk failed, retrying per file: {e}")
+                chunk_stats = await self._build_files_individually(nas_files)
+
+            cursor = nas_files[-1].id
+            processed += len(nas_files)
+            chunk_stats.chunks_committed = 1
+            stats.merge(chunk_stats)
+            await self._checkpoint(run.id, stats, cursor, BuildRunStatus.RUNNING)
+            logger.info(
+                f"Catalog build {run.id}: chunk {stats.chunks_committed} committed, "
+                f"{stats.nas_files_processed} files, {stats.errors} errors"
+            )
+
+        status = BuildRunStatus.COMPLETED if exhausted else BuildRunStatus.PAUSED
+        await self._checkpoint(run.id, stats, cursor, status)
+        return stats
+
+    async def build_nas_files(
+        self, nas_file_ids: Sequence[UUID], *, chunk_size: int = 1000
+    ) -> BuildStats:
+        """지정한 NASFile만 chunk_size개씩 빌드하고 청크마다 커밋.
+
+        Args:
+            nas_file_ids: 빌드할 NASFile ID (비디오/미제외 파일만 대상)
+            chunk_size: 청크(커밋) 단위 파일 수
+
+        Returns:
+            빌드 통계
+        """
+        stats = BuildStats()
+        ids = list(nas_file_ids)
+        for start in range(0, len(ids), chunk_size):
+            query = self._nas_file_query().where(
+                NASFile.id.in_(ids[start:start + chunk_size])
+            )
+            nas_files = (await self.session.execute(query)).all()
+            if not nas_files:
+                continue
+
+            chunk_stats = BuildStats()
+            try:
+                await self._build_chunk(nas_files, chunk_stats)
+                await self.session.commit()
+            except Exception as e:
+                await self.session.rollback()
+                logger.warning(f"Catalog chunk failed, retrying per file: {e}")
+                chunk_stats = await self._build_files_individually(nas_files)
+            chunk_stats.chunks_committed = 1
+            stats.merge(chunk_stats)
+        return stats
+
+    async def _latest_resumable_run(self) -> Optional[CatalogBuildRun]:
+        """가장 최근 빌드 실행이 재개 가능(RUNNING/PAUSED)하면 그 실행.
+
+        더 최근 실행이 완료된 경우 이전 미완료 실행은 재개하지 않습니다.
+        """
+        result = await self.session.execute(
+            select(CatalogBuildRun).order_by(CatalogBuildRun.created_at.desc()).limit(1)
+        )
+        run = result.scalar_one_or_none()
+        if run is None or run.status not in BuildRunStatus.RESUMABLE:
+            return None
+        return run
+
+    async def _supersede_open_runs(self, current_run_id: UUID) -> None:
+        """현재 실행 외의 RUNNING/PAUSED 실행을 SUPERSEDED로 닫음 (커밋 없음)."""
+        await self.session.execute(
+            update(CatalogBuildRun)
+            .where(CatalogBuildRun.status.in_(BuildRunStatus.RESUMABLE))
+            .where(CatalogBuildRun.id != current_run_id)
+            .values(status=BuildRunStatus.SUPERSEDED)
+            .execution_options(synchronize_session=False)
         )
+
+    async def fetch_candidates(
+        self, cursor: Optional[UUID], size: int, skip_linked: bool
+    ) -> Sequence[Any]:
+        """커서 이후의 빌드 대상 비디오 NASFile (id 순)."""
+        query = self._nas_file_query().order_by(NASFile.id).limit(size)
         if skip_linked:
             query = query.where(NASFile.video_file_id == None)  # noqa: E711
+        if cursor is not None:
+            query = query.where(NASFile.id > cursor)
+        return (await self.session.execute(query)).all()
+
+    @staticmethod
+    def _nas_file_query():
+        """빌드 대상 비디오 NASFile 조회 (ORM 인스턴스 대신 필요한 컬럼만)."""
+        return (
+            select(
+                NASFile.id,
+                NASFile.file_path,
+                NASFile.file_name,
+                NASFile.file_size_bytes,
+                NASFile.file_extension,
+                NASFile.file_mtime,
+                NASFile.video_file_id,
+            )
+            .where(NASFile.file_category == FileCategory.VIDEO)
+            .where(NASFile.is_excluded == False)  # noqa: E712
+        )
+
+    async def apply_nas_changes(
+        self,
+        *,
+        nas_file_ids: Sequence[UUID] = (),
+        removed_video_file_ids: Sequence[UUID] = (),
+    ) -> BuildStats:
+        """NAS 변경분만 카탈로그에 반영 (NAS_FILE_* 이벤트 처리용).
+
+        - 삭제된 NAS 파일의 VideoFile은 숨기고 공개 중인 CatalogItem은 비공개 처리
+        - 추가/변경된 파일 중 미연결 파일은 빌드, 연결된 파일은 VideoFile 크기/mtime 갱신
+          (빌드 실패 시 파일 단위로 재시도하고 실패 파일은 오류로 기록)
+        - NAS에 다시 나타난 파일의 VideoFile과, 삭제로 비공개됐던 CatalogItem만 재공개
+
+        Args:
+            nas_file_ids: 추가/변경된 NASFile ID
+            removed_video_file_ids: 삭제된 NASFile에 연결되어 있던 VideoFile ID
+
+        Returns:
+            빌드 통계
+        """
+        stats = BuildStats()
+
+        for chunk in self._chunks(set(removed_video_file_ids)):
+            result = await self.session.execute(
+                update(VideoFile)
+                .where(VideoFile.id.in_(chunk))
+                .where(VideoFile.is_hidden == False)  # noqa: E712
+                .values(is_hidden=True, hidden_reason=HiddenReason.NAS_REMOVED)
+                .execution_options(synchronize_session=False)
+            )
+            stats.video_files_unpublished += result.rowcount or 0
+            await self.session.execute(
+                update(CatalogItem)
+                .where(CatalogItem.video_file_id.in_(chunk))
+                .where(CatalogItem.is_published == True)  # noqa: E712
+                .values(is_published=False, unpublished_reason=HiddenReason.NAS_REMOVED)
+                .execution_options(synchronize_session=False)
+            )
+        # 이후 빌드가 실패해 롤백돼도 삭제 반영은 유지
+        await self.session.commit()
+
+        rows: list[Any] = []
+        for chunk in self._chunks(set(nas_file_ids)):
+            query = self._nas_file_query().where(NASFile.id.in_(chunk))
+            rows.extend((await self.session.execute(query)).all())
+
+        unlinked = [row for row in rows if row.video_file_id is None]
+        linked = [row for row in rows if row.video_file_id is not None]
+
+        self._exclusion.reset_hits()
+        if unlinked:
+            chunk_stats = BuildStats()
+            try:
+                await self._build_chunk(unlinked, chunk_stats)
+                await self.session.commit()
+            except Exception as e:
+                await self.session.rollback()
+                logger.warning(f"Incremental catalog build failed, retrying per file: {e}")
+                chunk_stats = await self._build_files_individually(unlinked)
+            stats.merge(chunk_stats)
+
+        if linked:
+            await self.session.execute(
+                update(VideoFile),
+                [
+                    {
+                        "id": row.video_file_id,
+                        "file_size_bytes": row.file_size_bytes,
+                        "file_mtime": row.file_mtime,
+                    }
+                    for row in linked
+                ],
+            )
+            stats.video_files_updated += len(linked)
+
+        # 삭제 후 다시 추가된 파일 (기존 VideoFile에 재연결된 경우 포함)
+        video_ids = await self._linked_video_ids([row.id for row in rows])
+        for chunk in self._chunks(video_ids):
+            result = await self.session.execute(
+                update(VideoFile)
+                .where(VideoFile.id.in_(chunk))
+                .where(VideoFile.hidden_reason == HiddenReason.NAS_REMOVED)
+                .values(is_hidden=False, hidden_reason=None)
+                .returning(VideoFile.id)
+                .execution_options(synchronize_session=False)
+            )
+            restored = list(result.scalars())
+            stats.video_files_republished += len(restored)
+            if restored:
+                await self.session.execute(
+                    update(CatalogItem)
+                    .where(CatalogItem.video_file_id.in_(restored))
+                    .where(CatalogItem.unpublished_reason == HiddenReason.NAS_REMOVED)
+                    .values(is_published=True, unpublished_reason=None)
+                    .execution_options(synchronize_session=False)
+                )
+
+        await self.session.commit()
+        return stats
+
+    async def _linked_video_ids(self, nas_file_ids: list[UUID]) -> list[UUID]:
+        """NASFile ID 목록의 현재 연결 VideoFile ID."""
+        video_ids: list[UUID] = []
+        for chunk in self._chunks(nas_file_ids):
+            result = await self.session.execute(
+                select(NASFile.video_file_id)
+                .where(NASFile.id.in_(chunk))
+                .where(NASFile.video_file_id != None)  # noqa: E711
+            )
+            video_ids.extend(result.scalars())
+        return video_ids
+
+    async def _checkpoint(
+        self,
+        run_id: UUID,
+        stats: BuildStats,
+        cursor: Optional[UUID],
+        status: str,
+    ) -> None:
+        """커서/진행 통계 저장 후 커밋."""
+        values: dict[str, Any] = {
+            "status": status,
+            "last_nas_file_id": cursor,
+            "chunks_committed": stats.chunks_committed,
+            "stats": stats.counters(),
+            "error_messages": stats.error_messages,
+        }
+        if status == BuildRunStatus.COMPLETED:
+            values["completed_at"] = datetime.now(timezone.utc)
+        await self.session.execute(
+            update(CatalogBuildRun).where(CatalogBuildRun.id == run_id).values(**values)
+        )
+        await self.session.commit()
+
+    async def _build_files_individually(self, nas_files: Sequence[Any]) -> BuildStats:
+        """실패한 청크를 파일 단위로 재빌드 (파일마다 커밋, 실패 파일만 오류 기록)."""
+        stats = BuildStats()
+        for nas_file in nas_files:
+            file_stats = BuildStats()
+            try:
+                await self._build_chunk([nas_file], file_stats)
+                await self.session.commit()
+            except Exception as e:
+                await self.session.rollback()
+                file_stats = BuildStats(nas_files_processed=1)
+                file_stats.add_error(f"{nas_file.file_name}: {str(e)}")
+            stats.merge(file_stats)
+        return stats
+
+    async def _build_chunk(self, nas_files: Sequence[Any], stats: BuildStats) -> None:
+        """청크 하나 빌드 (파싱 → 프리페치 → 계획 → bulk INSERT/UPDATE, 커밋 없음)."""
+        plan = _BuildPlan()
+        self._exclusion.reset_hits()
+        parsed = self._parse_files(nas_files, plan, stats)
 
-        query = query.limit(limit)
-        result = await self.session.execute(query)
-        nas_files = result.scalars().all()
+        # 기존 엔티티 프리페치
+        await self._prefetch(parsed, plan)
 
+        # 누락 엔티티 계산
+        for nas_file, metadata in parsed:
+            try:
+                self._plan_file(nas_file, metadata, plan, stats)
+            except Exception as e:
+                stats.add_error(f"{nas_file.file_name}: {str(e)}")
+
+        # 레벨별 bulk INSERT → NASFile bulk UPDATE
+        for model, rows in (
+            (Project, plan.new_projects),
+            (Season, plan.new_seasons),
+            (Event, plan.new_events),
+            (Episode, plan.new_episodes),
+            (VideoFile, plan.new_video_files),
+            (CatalogItem, plan.new_catalog_items),
+        ):
+            if rows:
+                await self.session.execute(insert(model), rows)
+
+        for rows in (plan.excluded_files, plan.matched_files, plan.parsed_files):
+            if rows:
+                await self.session.execute(update(NASFile), rows)
+
+        stats.exclusion_hits = self._exclusion.hit_counts()
+
+    def _parse_files(
+        self, nas_files: Sequence[Any], plan: _BuildPlan, stats: BuildStats
+    ) -> list[tuple[Any, ParsedMetadata]]:
+        """제외 규칙 확인 및 파일명 파싱 (DB 접근 없음)."""
+        parsed: list[tuple[Any, ParsedMetadata]] = []
         for nas_file in nas_files:
             stats.nas_files_processed += 1
 
             try:
-                # 제외 경로 확인
-                if self._is_excluded_path(nas_file.file_path):
-                    stats.skipped += 1
+                # 제외 규칙 확인 (NAS 동기화 이전에 저장된 파일 대비)
+                rule = self._exclusion.match_path(nas_file.file_path)
+                if rule:
+                    plan.excluded_files.append(
+                        {
+                            "id": nas_file.id,
+                            "is_excluded": True,
+                            "exclude_reason": rule.reason,
+                        }
+                    )
+                    stats.excluded += 1
                     continue
 
                 # 파일명 파싱
@@ -112,304 +524,258 @@ class CatalogBuilderService:
                     stats.skipped += 1
                     continue
 
-                # Project 생성 또는 조회
-                project = await self._get_or_create_project(metadata, stats)
-                if not project:
-                    stats.errors += 1
-                    continue
-
-                # Season 생성 또는 조회
-                season = await self._get_or_create_season(project.id, metadata, stats)
-                if not season:
-                    stats.errors += 1
-                    continue
-
-                # Event 생성 또는 조회
-                event = await self._get_or_create_event(season.id, metadata, stats)
-                if not event:
-                    stats.errors += 1
-                    continue
+                parsed.append((nas_file, metadata))
 
-                # Episode 생성 또는 조회
-                episode = await self._get_or_create_episode(event.id, metadata, stats)
-                if not episode:
-                    stats.errors += 1
-                    continue
+            except Exception as e:
+                stats.add_error(f"{nas_file.file_name}: {str(e)}")
+
+        return parsed
+
+    def _chunks(self, values: Iterable[Any]) -> Iterable[list[Any]]:
+        items = list(values)
+        for start in range(0, len(items), self.PREFETCH_CHUNK_SIZE):
+            yield items[start:start + self.PREFETCH_CHUNK_SIZE]
+
+    async def _prefetch(
+        self, parsed: list[tuple[Any, ParsedMetadata]], plan: _BuildPlan
+    ) -> None:
+        """파싱 결과가 참조하는 기존 엔티티를 계층별로 일괄 조회."""
+        if not parsed:
+            return
+
+        codes = {metadata.project_code for _, metadata in parsed}
+        years = {metadata.year or 2024 for _, metadata in parsed}
+        event_numbers = {metadata.event_number or 1 for _, metadata in parsed}
+        episode_numbers = {metadata.episode_number or 1 for _, metadata in parsed}
+
+        for chunk in self._chunks(codes):
+            rows = await self.session.execute(
+                select(Project.id, Project.code).where(Project.code.in_(chunk))
+            )
+            plan.projects.update({row.code: row.id for row in rows})
 
-                # VideoFile 생성 및 NASFile 연결
-                video_file = await self._create_video_file(
-                    nas_file, episode.id, metadata, stats
+        for chunk in self._chunks(plan.projects.values()):
+            rows = await self.session.execute(
+                select(Season.id, Season.project_id, Season.year)
+                .where(Season.project_id.in_(chunk))
+                .where(Season.year.in_(years))
+            )
+            for row in rows:
+                plan.seasons.setdefault((row.project_id, row.year), row.id)
+
+        for chunk in self._chunks(plan.seasons.values()):
+            rows = await self.session.execute(
+                select(Event.id, Event.season_id, Event.event_number)
+                .where(Event.season_id.in_(chunk))
+                .where(Event.event_number.in_(event_numbers))
+            )
+            for row in rows:
+                plan.events.setdefault((row.season_id, row.event_number), row.id)
+
+        for chunk in self._chunks(plan.events.values()):
+            rows = await self.session.execute(
+                select(
+                    Episode.id,
+                    Episode.event_id,
+                    Episode.episode_number,
+                    Episode.day_number,
+                )
+                .where(Episode.event_id.in_(chunk))
+                .where(Episode.episode_number.in_(episode_numbers))
+            )
+            for row in rows:
+                plan.episodes.setdefault(
+                    (row.event_id, row.episode_number, row.day_number), row.id
+                )
+                plan.episodes_any_day.setdefault(
+                    (row.event_id, row.episode_number), row.id
                 )
-                if video_file:
-                    # NASFile → VideoFile 연결
-                    nas_file.video_file_id = video_file.id
-                    stats.links_created += 1
-
-            except Exception as e:
-                stats.errors += 1
-                stats.error_messages.append(f"{nas_file.file_name}: {str(e)}")
 
-        # 커밋
-        await self.session.commit()
+        for chunk in self._chunks(nas_file.file_path for nas_file, _ in parsed):
+            rows = await self.session.execute(
+                select(VideoFile.id, VideoFile.file_path, VideoFile.episode_id).where(
+                    VideoFile.file_path.in_(chunk)
+                )
+            )
+            plan.video_files.update(
+                {row.file_path: (row.id, row.episode_id) for row in rows}
+            )
 
-        return stats
+        existing_ids = [video_id for video_id, _ in plan.video_files.values()]
+        for chunk in self._chunks(existing_ids):
+            rows = await self.session.execute(
+                select(CatalogItem.video_file_id).where(
+                    CatalogItem.video_file_id.in_(chunk)
+                )
+            )
+            plan.cataloged.update(rows.scalars())
 
-    async def _get_or_create_project(
-        self, metadata: ParsedMetadata, stats: BuildStats
-    ) -> Optional[Project]:
-        """프로젝트 조회 또는 생성."""
+    def _plan_file(
+        self,
+        nas_file: Any,
+        metadata: ParsedMetadata,
+        plan: _BuildPlan,
+        stats: BuildStats,
+    ) -> None:
+        """파일 하나의 계층 엔티티를 찾거나 신규 행으로 계획하고 NASFile 연결."""
+        # Project
         code = metadata.project_code
-
-        # 캐시 확인
-        if code in self._project_cache:
-            return self._project_cache[code]
-
-        # DB 조회
-        result = await self.session.execute(
-            select(Project).where(Project.code == code)
-        )
-        project = result.scalar_one_or_none()
-
-        if not project:
-            # 새 프로젝트 생성
-            project = Project(
-                code=code,
-                name=self._get_project_name(code),
-                description=f"Auto-generated from NAS files",
+        project_id = plan.projects.get(code)
+        if project_id is None:
+            project_id = uuid4()
+            plan.new_projects.append(
+                {
+                    "id": project_id,
+                    "code": code,
+                    "name": self._get_project_name(code),
+                    "description": "Auto-generated from NAS files",
+                }
             )
-            self.session.add(project)
-            await self.session.flush()
+            plan.projects[code] = project_id
             stats.projects_created += 1
 
-        self._project_cache[code] = project
-        return project
-
-    async def _get_or_create_season(
-        self, project_id: UUID, metadata: ParsedMetadata, stats: BuildStats
-    ) -> Optional[Season]:
-        """시즌 조회 또는 생성."""
+        # Season
         year = metadata.year or 2024
-        cache_key = (project_id, year)
-
-        # 캐시 확인
-        if cache_key in self._season_cache:
-            return self._season_cache[cache_key]
-
-        # DB 조회
-        result = await self.session.execute(
-            select(Season)
-            .where(Season.project_id == project_id)
-            .where(Season.year == year)
-        )
-        season = result.scalar_one_or_none()
-
-        if not season:
-            # 새 시즌 생성
-            season = Season(
-                project_id=project_id,
-                year=year,
-                name=f"{year} Season",
-                location=metadata.venue or metadata.location,
+        season_id = plan.seasons.get((project_id, year))
+        if season_id is None:
+            season_id = uuid4()
+            plan.new_seasons.append(
+                {
+                    "id": season_id,
+                    "project_id": project_id,
+                    "year": year,
+                    "name": f"{year} Season",
+                    "location": metadata.venue or metadata.location,
+                }
             )
-            self.session.add(season)
-            await self.session.flush()
+            plan.seasons[(project_id, year)] = season_id
             stats.seasons_created += 1
 
-        self._season_cache[cache_key] = season
-        return season
-
-    async def _get_or_create_event(
-        self, season_id: UUID, metadata: ParsedMetadata, stats: BuildStats
-    ) -> Optional[Event]:
-        """이벤트 조회 또는 생성."""
+        # Event
         event_num = metadata.event_number or 1
-        cache_key = (season_id, event_num)
-
-        # 캐시 확인
-        if cache_key in self._event_cache:
-            return self._event_cache[cache_key]
-
-        # DB 조회
-        result = await self.session.execute(
-            select(Event)
-            .where(Event.season_id == season_id)
-            .where(Event.event_number == event_num)
-        )
-        event = result.scalar_one_or_none()
-
-        if not event:
-            # 새 이벤트 생성
-            event_name = metadata.event_name or f"Event #{event_num}"
-
-            # buy_in 변환 (문자열 → Decimal)
-            buy_in_decimal = None
-            if metadata.buy_in:
-                buy_in_decimal = self._parse_buy_in(metadata.buy_in)
-
-            event = Event(
-                season_id=season_id,
-                event_number=event_num,
-                name=event_name,
-                name_short=metadata.event_name_short,
-                event_type=metadata.event_type,
-                game_type=metadata.game_type,
-                buy_in=buy_in_decimal,
+        event_id = plan.events.get((season_id, event_num))
+        if event_id is None:
+            event_id = uuid4()
+            plan.new_events.append(
+                {
+                    "id": event_id,
+                    "season_id": season_id,
+                    "event_number": event_num,
+                    "name": metadata.event_name or f"Event #{event_num}",
+                    "name_short": metadata.event_name_short,
+                    "event_type": metadata.event_type,
+                    "game_type": metadata.game_type,
+                    # buy_in 변환 (문자열 → Decimal)
+                    "buy_in": self._parse_buy_in(metadata.buy_in)
+                    if metadata.buy_in
+                    else None,
+                }
             )
-            self.session.add(event)
-            await self.session.flush()
+            plan.events[(season_id, event_num)] = event_id
             stats.events_created += 1
 
-        self._event_cache[cache_key] = event
-        return event
-
-    async def _get_or_create_episode(
-        self, event_id: UUID, metadata: ParsedMetadata, stats: BuildStats
-    ) -> Optional[Episode]:
-        """에피소드 조회 또는 생성."""
+        # Episode (이벤트 + 에피소드 번호 + 데이 번호로 매칭)
         ep_num = metadata.episode_number or 1
         day_num = metadata.day_number
-
-        # DB 조회 (이벤트 + 에피소드 번호 + 데이 번호로 매칭)
-        query = (
-            select(Episode)
-            .where(Episode.event_id == event_id)
-            .where(Episode.episode_number == ep_num)
-        )
         if day_num:
-            query = query.where(Episode.day_number == day_num)
-
-        result = await self.session.execute(query)
-        episode = result.scalar_one_or_none()
-
-        if not episode:
-            # 새 에피소드 생성
+            episode_id = plan.episodes.get((event_id, ep_num, day_num))
+        else:
+            episode_id = plan.episodes_any_day.get((event_id, ep_num))
+        if episode_id is None:
+            episode_id = uuid4()
             title = metadata.display_title or f"Episode {ep_num}"
             if day_num:
                 title = f"Day {day_num} - {title}"
-
-            episode = Episode(
-                event_id=event_id,
-                episode_number=ep_num,
-                day_number=day_num,
-                part_number=metadata.part_number,
-                title=title,
-                episode_type=metadata.episode_type,
-                table_type=metadata.table_type,
+            plan.new_episodes.append(
+                {
+                    "id": episode_id,
+                    "event_id": event_id,
+                    "episode_number": ep_num,
+                    "day_number": day_num,
+                    "part_number": metadata.part_number,
+                    "title": title,
+                    "episode_type": metadata.episode_type,
+                    "table_type": metadata.table_type,
+                }
             )
-            self.session.add(episode)
-            await self.session.flush()
+            plan.episodes[(event_id, ep_num, day_num)] = episode_id
+            plan.episodes_any_day.setdefault((event_id, ep_num), episode_id)
             stats.episodes_created += 1
 
-        return episode
-
-    async def _create_video_file(
-        self,
-        nas_file: NASFile,
-        episode_id: UUID,
-        metadata: ParsedMetadata,
-        stats: BuildStats,
-    ) -> Optional[VideoFile]:
-        """VideoFile 생성 및 CatalogItem 자동 생성."""
-        # 이미 같은 경로로 VideoFile이 있는지 확인
-        result = await self.session.execute(
-            select(VideoFile).where(VideoFile.file_path == nas_file.file_path)
-        )
-        existing = result.scalar_one_or_none()
-
+        # VideoFile 생성 및 NASFile 연결
+        display_title, catalog_title = self.title_generator.generate(metadata)
+        existing = plan.video_files.get(nas_file.file_path)
         if existing:
             # 이미 존재하면 NASFile만 연결
-            nas_file.video_file_id = existing.id
-            # NASFile 파싱 상태 업데이트
-            nas_file.parse_status = ParseStatus.MATCHED
-            nas_file.match_confidence = 1.0
-
-            # 기존 VideoFile에 대해서도 CatalogItem 생성 (없으면)
-            display_title, catalog_title = self.title_generator.generate(metadata)
-            await self._create_catalog_item(
-                existing, existing.episode_id, metadata, display_title, catalog_title, stats
+            video_file_id, video_episode_id = existing
+            plan.matched_files.append(
+                {
+                    "id": nas_file.id,
+                    "video_file_id": video_file_id,
+                    "parse_status": ParseStatus.MATCHED,
+                    "match_confidence": 1.0,
+                }
             )
-            return existing
-
-        # 제목 생성
-        display_title, catalog_title = self.title_generator.generate(metadata)
-
-        # 새 VideoFile 생성
-        video_file = VideoFile(
-            episode_id=episode_id,
-            file_path=nas_file.file_path,
-            file_name=nas_file.file_name,
-            file_size_bytes=nas_file.file_size_bytes,
-            file_format=nas_file.file_extension,
-            file_mtime=nas_file.file_mtime,
-            display_title=display_title,
-            catalog_title=catalog_title,
-            content_type=metadata.content_type,
-            version_type=metadata.version_type,
-            is_catalog_item=True,
-            scan_status="parsed",
-        )
-        self.session.add(video_file)
-        await self.session.flush()
-        stats.video_files_created += 1
-
-        # NASFile 파싱 메타데이터 저장
-        nas_file.parsed_metadata = self._metadata_to_dict(metadata)
-        nas_file.parse_status = ParseStatus.PARSED
-        nas_file.match_confidence = metadata.confidence or 0.8
-
-        # CatalogItem 자동 생성
-        catalog_item = await self._create_catalog_item(
-            video_file, episode_id, metadata, display_title, catalog_title, stats
-        )
-
-        return video_file
-
-    async def _create_catalog_item(
-        self,
-        video_file: VideoFile,
-        episode_id: UUID,
-        metadata: ParsedMetadata,
-        display_title: str,
-        catalog_title: str,
-        stats: BuildStats,
-    ) -> Optional[CatalogItem]:
-        """CatalogItem 생성 (Netflix UI용 플랫 카탈로그)."""
-        # 이미 해당 VideoFile에 대한 CatalogItem이 있는지 확인
-        result = await self.session.execute(
-            select(CatalogItem).where(CatalogItem.video_file_id == video_file.id)
-        )
-        existing = result.scalar_one_or_none()
-
-        if existing:
-            return existing
-
-        # 태그 생성
-        tags = self._generate_tags(metadata)
-
-        # CatalogItem 생성
-        catalog_item = CatalogItem(
-            video_file_id=video_file.id,
-            episode_id=episode_id,
-            display_title=display_title,
-            catalog_title=catalog_title,
-            project_code=metadata.project_code or "UNKNOWN",
-            category=self._get_category(metadata),
-            content_type=metadata.content_type,
-            tags=tags,
-            year=metadata.year,
-            event_number=metadata.event_number,
-            episode_number=metadata.episode_number,
-            day_number=metadata.day_number,
-            duration_seconds=None,  # VideoFile에서 추후 업데이트
-            extra_metadata=self._build_extra_metadata(metadata),
-            is_published=True,
-            is_featured=False,
-        )
-        self.session.add(catalog_item)
-        await self.session.flush()
-        stats.catalog_items_created += 1
-
-        return catalog_item
+        else:
+            video_file_id, video_episode_id = uuid4(), episode_id
+            plan.new_video_files.append(
+                {
+                    "id": video_file_id,
+                    "episode_id": episode_id,
+                    "file_path": nas_file.file_path,
+                    "file_name": nas_file.file_name,
+                    "file_size_bytes": nas_file.file_size_bytes,
+                    "file_format": nas_file.file_extension,
+                    "file_mtime": nas_file.file_mtime,
+                    "display_title": display_title,
+                    "catalog_title": catalog_title,
+                    "content_type": metadata.content_type,
+                    "version_type": metadata.version_type,
+                    "is_catalog_item": True,
+                    "scan_status": "parsed",
+                    "parser_version": ParserFactory.PARSER_VERSION,
+                    "title_template_version": TitleGenerator.TEMPLATE_VERSION,
+                }
+            )
+            plan.video_files[nas_file.file_path] = (video_file_id, episode_id)
+            stats.video_files_created += 1
+
+            # NASFile 파싱 메타데이터 저장
+            plan.parsed_files.append(
+                {
+                    "id": nas_file.id,
+                    "video_file_id": video_file_id,
+                    "parsed_metadata": self._metadata_to_dict(metadata),
+                    "parse_status": ParseStatus.PARSED,
+                    "match_confidence": metadata.confidence or 0.8,
+                }
+            )
+        stats.links_created += 1
+
+        # CatalogItem 자동 생성 (Netflix UI용 플랫 카탈로그, VideoFile당 1개)
+        if video_file_id not in plan.cataloged:
+            plan.new_catalog_items.append(
+                {
+                    "video_file_id": video_file_id,
+                    "episode_id": video_episode_id,
+                    "display_title": display_title,
+                    "catalog_title": catalog_title,
+                    "project_code": metadata.project_code or "UNKNOWN",
+                    "category": self._get_category(metadata),
+                    "content_type": metadata.content_type,
+                    "tags": self._generate_tags(metadata),
+                    "year": metadata.year,
+                    "event_number": metadata.event_number,
+                    "episode_number": metadata.episode_number,
+                    "day_number": metadata.day_number,
+                    "duration_seconds": None,  # VideoFile에서 추후 업데이트
+                    "extra_metadata": self._build_extra_metadata(metadata),
+                    "is_published": True,
+                    "is_featured": False,
+                }
+            )
+            plan.cataloged.add(video_file_id)
+            stats.catalog_items_created += 1
 
     def _metadata_to_dict(self, metadata: ParsedMetadata) -> dict:
         """ParsedMetadata를 dict로 변환 (JSONB 저장용)."""
@@ -533,16 +899,3 @@ class CatalogBuilderService:
                 return Decimal(buy_in_str)
         except Exception:
             return None
-
-    def _is_excluded_path(self, file_path: str) -> bool:
-        """제외 경로 여부 확인.
-
-        Clips, Player Emotion 등 카탈로그에 포함하지 않을 폴더 경로 확인.
-        """
-        if not file_path:
-            return False
-
-        for pattern in EXCLUDED_PATHS:
-            if pattern in file_path:
-                return True
-        return False
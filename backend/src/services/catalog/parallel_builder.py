@@ -0,0 +1,114 @@
+"""Parallel Catalog Builder - project_code별 파티션 동시 빌드.
+
+프로젝트는 Project 행 아래로 공유하는 엔티티가 없으므로, 빌드 대상 NASFile을
+파싱된 project_code로 나누고 파티션마다 별도 세션(커넥션)에서 동시에 빌드합니다.
+제외/파싱 불가 파일은 빈 코드("") 파티션에서 함께 처리됩니다.
+"""
+
+import asyncio
+import logging
+import time
+from collections import defaultdict
+from typing import Callable, Optional
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..file_parser import ParserFactory
+from ..nas_inventory.exclusion_rules import get_exclusion_matcher
+from .catalog_builder_service import BuildStats, CatalogBuilderService
+
+logger = logging.getLogger(__name__)
+
+
+class ParallelCatalogBuilder:
+    """project_code 파티션을 세션별로 동시에 빌드.
+
+    Usage:
+        builder = ParallelCatalogBuilder(async_session_factory, max_concurrency=4)
+        stats = await builder.build(limit=50000)
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], AsyncSession],
+        *,
+        max_concurrency: int = 4,
+        chunk_size: int = 1000,
+    ) -> None:
+        self.session_factory = session_factory
+        self.max_concurrency = max(1, max_concurrency)
+        self.chunk_size = chunk_size
+        self._exclusion = get_exclusion_matcher()
+
+    def partition_key(self, file_name: str, file_path: str) -> str:
+        """파일의 빌드 파티션 (project_code, 제외/파싱 불가는 "")."""
+        if self._exclusion.match_path(file_path):
+            return ""
+        try:
+            metadata = ParserFactory.parse(file_name, file_path)
+        except Exception:
+            return ""
+        code = metadata.project_code
+        return code if code and code != "UNKNOWN" else ""
+
+    async def partition(
+        self, *, limit: int = 10000, skip_linked: bool = True
+    ) -> dict[str, list[UUID]]:
+        """빌드 대상 NASFile을 keyset으로 조회해 project_code별로 분류."""
+        partitions: dict[str, list[UUID]] = defaultdict(list)
+        async with self.session_factory() as session:
+            service = CatalogBuilderService(session)
+            cursor: Optional[UUID] = None
+            fetched = 0
+            while fetched < limit:
+                rows = await service.fetch_candidates(
+                    cursor, min(self.chunk_size, limit - fetched), skip_linked
+                )
+                if not rows:
+                    break
+                for row in rows:
+                    partitions[self.partition_key(row.file_name, row.file_path)].append(
+                        row.id
+                    )
+                cursor = rows[-1].id
+                fetched += len(rows)
+        return dict(partitions)
+
+    async def build(self, *, limit: int = 10000, skip_linked: bool = True) -> BuildStats:
+        """파티션별 빌드를 max_concurrency개까지 동시에 실행하고 통계 병합.
+
+        Args:
+            limit: 처리할 최대 파일 수
+            skip_linked: 이미 VideoFile에 연결된 파일은 스킵
+
+        Returns:
+            병합된 빌드 통계 (partitions에 프로젝트별 카운터)
+        """
+        partitions = await self.partition(limit=limit, skip_linked=skip_linked)
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def build_partition(code: str, ids: list[UUID]) -> BuildStats:
+            async with semaphore:
+                start = time.perf_counter()
+                async with self.session_factory() as session:
+                    stats = await CatalogBuilderService(session).build_nas_files(
+                        ids, chunk_size=self.chunk_size
+                    )
+                logger.info(
+                    f"Catalog partition {code or '-'}: {len(ids)} files "
+                    f"in {time.perf_counter() - start:.1f}s"
+                )
+                stats.partitions = {code or "-": stats.counters()}
+                return stats
+
+        # 큰 파티션부터 시작해 마지막에 긴 파티션 하나만 남는 상황을 줄임
+        ordered = sorted(partitions.items(), key=lambda item: len(item[1]), reverse=True)
+        results = await asyncio.gather(
+            *(build_partition(code, ids) for code, ids in ordered)
+        )
+
+        merged = BuildStats()
+        for stats in results:
+            merged.merge(stats)
+        return merged
@@ -0,0 +1,269 @@
+"""Title Regeneration Service - VideoFile/CatalogItem 제목 증분 재생성.
+
+파서 버전 또는 제목 템플릿 버전이 바뀐 VideoFile만 keyset 페이지네이션으로
+스트리밍하면서 제목을 다시 생성하고, 청크 단위 bulk UPDATE + 커밋으로 반영합니다.
+"""
+
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Optional
+from uuid import UUID, uuid4
+
+from sqlalchemy import bindparam, func, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from ...models.catalog_item import CatalogItem
+from ...models.video_file import VideoFile
+from ..file_parser import ParserFactory, TitleGenerator
+
+logger = logging.getLogger(__name__)
+
+
+class JobStatus:
+    PENDING = "pending"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
+@dataclass
+class RegenerationProgress:
+    """제목 재생성 작업 진행 상황."""
+
+    job_id: str = field(default_factory=lambda: str(uuid4()))
+    status: str = JobStatus.PENDING
+    total_candidates: int = 0
+    processed: int = 0
+    updated: int = 0
+    unchanged: int = 0
+    errors: int = 0
+    catalog_items_updated: int = 0
+    chunks_committed: int = 0
+    samples: list[dict[str, str]] = field(default_factory=list)
+    error_message: Optional[str] = None
+    started_at: Optional[datetime] = None
+    completed_at: Optional[datetime] = None
+
+    @property
+    def progress_percent(self) -> float:
+        """진행률 (%)."""
+        if self.total_candidates == 0:
+            return 100.0 if self.status == JobStatus.COMPLETED else 0.0
+        return min(self.processed / self.total_candidates * 100, 100.0)
+
+
+class TitleRegenerationService:
+    """버전이 바뀐 VideoFile 제목만 청크 단위로 재생성하는 서비스."""
+
+    MAX_SAMPLES = 10
+
+    def __init__(self, session: AsyncSession, *, chunk_size: int = 500) -> None:
+        self.session = session
+        self.chunk_size = chunk_size
+        self.title_generator = TitleGenerator()
+        self.parser_version = ParserFactory.PARSER_VERSION
+        self.template_version = TitleGenerator.TEMPLATE_VERSION
+
+    def _stale_condition(self):
+        """재생성 대상 조건 (버전 미기록 또는 현재 버전과 다름)."""
+        return or_(
+            VideoFile.parser_version.is_(None),
+            VideoFile.parser_version != self.parser_version,
+            VideoFile.title_template_version.is_(None),
+            VideoFile.title_template_version != self.template_version,
+        )
+
+    async def count_stale(self, *, force: bool = False) -> int:
+        """재생성 대상 VideoFile 수."""
+        query = select(func.count()).select_from(VideoFile)
+        if not force:
+            query = query.where(self._stale_condition())
+        result = await self.session.execute(query)
+        return result.scalar() or 0
+
+    async def run(
+        self,
+        progress: Optional[RegenerationProgress] = None,
+        *,
+        force: bool = False,
+    ) -> RegenerationProgress:
+        """재생성 실행.
+
+        Args:
+            progress: 진행 상황을 기록할 객체 (없으면 새로 생성)
+            force: True면 버전과 무관하게 모든 VideoFile 재생성
+
+        Returns:
+            최종 진행 상황
+        """
+        progress = progress or RegenerationProgress()
+        progress.status = JobStatus.RUNNING
+        progress.started_at = datetime.now(timezone.utc)
+        progress.total_candidates = await self.count_stale(force=force)
+
+        last_id: Optional[UUID] = None
+        while True:
+            query = select(
+                VideoFile.id,
+                VideoFile.file_name,
+                VideoFile.file_path,
+                VideoFile.display_title,
+                VideoFile.catalog_title,
+            )
+            if not force:
+                query = query.where(self._stale_condition())
+            if last_id is not None:
+                query = query.where(VideoFile.id > last_id)
+            query = query.order_by(VideoFile.id).limit(self.chunk_size)
+
+            rows = (await self.session.execute(query)).all()
+            if not rows:
+                break
+
+            await self._process_chunk(rows, progress)
+            await self.session.commit()
+            progress.chunks_committed += 1
+            last_id = rows[-1].id
+
+            logger.info(
+                f"Title regeneration {progress.job_id[:8]}: "
+                f"{progress.processed}/{progress.total_candidates} "
+                f"({progress.updated} updated)"
+            )
+
+        progress.status = JobStatus.COMPLETED
+        progress.completed_at = datetime.now(timezone.utc)
+        return progress
+
+    async def _process_chunk(
+        self, rows: list[Any], progress: RegenerationProgress
+    ) -> None:
+        """청크 하나를 파싱하고 bulk UPDATE로 반영."""
+        video_updates: list[dict[str, Any]] = []
+        catalog_updates: list[dict[str, Any]] = []
+
+        for row in rows:
+            progress.processed += 1
+            try:
+                metadata = ParserFactory.parse(row.file_name, row.file_path or "")
+                display_title, catalog_title = self.title_generator.generate(metadata)
+            except Exception as e:
+                # 버전을 기록하지 않아 다음 실행에서 재시도
+                progress.errors += 1
+                logger.warning(f"Title regeneration failed for {row.file_name}: {e}")
+                continue
+
+            changed = (
+                display_title != row.display_title
+                or catalog_title != row.catalog_title
+            )
+            video_updates.append(
+                {
+                    "id": row.id,
+                    "display_title": display_title,
+                    "catalog_title": catalog_title,
+                    "parser_version": self.parser_version,
+                    "title_template_version": self.template_version,
+                }
+            )
+
+            if not changed:
+                progress.unchanged += 1
+                continue
+
+            progress.updated += 1
+            catalog_updates.append(
+                {
+                    "b_video_file_id": row.id,
+                    "b_display_title": display_title,
+                    "b_catalog_title": catalog_title,
+                }
+            )
+            if len(progress.samples) < self.MAX_SAMPLES:
+                progress.samples.append(
+                    {
+                        "file_name": row.file_name,
+                        "display_title": display_title or "",
+                        "catalog_title": catalog_title or "",
+                        "parser": metadata.parser_used,
+                    }
+                )
+
+        # VideoFile: ORM bulk UPDATE by primary key (executemany)
+        await self.session.execute(update(VideoFile), video_updates)
+
+        if catalog_updates:
+            progress.catalog_items_updated += await self._mirror_catalog_items(
+                catalog_updates
+            )
+
+    async def _mirror_catalog_items(self, params: list[dict[str, Any]]) -> int:
+        """변경된 제목을 CatalogItem에 반영 (video_file_id 기준)."""
+        ids = [p["b_video_file_id"] for p in params]
+        result = await self.session.execute(
+            select(CatalogItem.video_file_id).where(CatalogItem.video_file_id.in_(ids))
+        )
+        existing = set(result.scalars().all())
+        params = [p for p in params if p["b_video_file_id"] in existing]
+        if not params:
+            return 0
+
+        table = CatalogItem.__table__
+        await self.session.execute(
+            update(table)
+            .where(table.c.video_file_id == bindparam("b_video_file_id"))
+            .values(
+                display_title=bindparam("b_display_title"),
+                catalog_title=bindparam("b_catalog_title"),
+            ),
+            params,
+        )
+        return len(params)
+
+
+# ==================== Background Job ====================
+
+# 실행 중/완료된 재생성 작업 (job_id → 진행 상황)
+_REGENERATION_JOBS: dict[str, RegenerationProgress] = {}
+_MAX_JOB_HISTORY = 20
+
+
+def create_regeneration_job() -> RegenerationProgress:
+    """새 재생성 작업 등록."""
+    progress = RegenerationProgress()
+    _REGENERATION_JOBS[progress.job_id] = progress
+
+    # 오래된 작업 기록 정리
+    while len(_REGENERATION_JOBS) > _MAX_JOB_HISTORY:
+        oldest = next(iter(_REGENERATION_JOBS))
+        if _REGENERATION_JOBS[oldest].status == JobStatus.RUNNING:
+            break
+        del _REGENERATION_JOBS[oldest]
+
+    return progress
+
+
+def get_regeneration_job(job_id: str) -> Optional[RegenerationProgress]:
+    """재생성 작업 진행 상황 조회."""
+    return _REGENERATION_JOBS.get(job_id)
+
+
+async def run_regeneration_job(
+    progress: RegenerationProgress,
+    session_factory: async_sessionmaker,
+    *,
+    chunk_size: int = 500,
+    force: bool = False,
+) -> None:
+    """백그라운드 작업 진입점 (요청과 분리된 세션 사용)."""
+    async with session_factory() as session:
+        service = TitleRegenerationService(session, chunk_size=chunk_size)
+        try:
+            await service.run(progress, force=force)
+        except Exception as e:
+            await session.rollback()
+            progress.status = JobStatus.FAILED
+            progress.error_message = str(e)
+            progress.completed_at = datetime.now(timezone.utc)
+            logger.error(f"Title regeneration {progress.job_id[:8]} failed: {e}")
@@ -19,6 +19,9 @@ class ParserFactory:
     7개 전문 파서 + 1개 범용 파서를 관리합니다.
     """
 
+    # 파서 규칙 버전 - 파싱 결과가 달라지는 변경 시 증가 (제목 재생성 트리거)
+    PARSER_VERSION = 1
+
     # 파서 우선순위 순서
     _parsers: list[BaseParser] = [
         WSOPBraceletParser(),
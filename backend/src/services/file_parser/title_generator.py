@@ -10,6 +10,9 @@ from .base_parser import ParsedMetadata
 class TitleGenerator:
     """ParsedMetadata에서 display_title, catalog_title 생성."""
 
+    # 제목 템플릿 버전 - 생성 규칙 변경 시 증가 (제목 재생성 트리거)
+    TEMPLATE_VERSION = 1
+
     PROJECT_NAMES = {
         "WSOP": "WSOP",
         "WSOP_BRACELET": "WSOP",
@@ -47,7 +47,7 @@ class HandClipService(BaseService[HandClip]):
         result = await self.session.execute(
             select(HandClip)
             .where(HandClip.episode_id == episode_id)
-            .order_by(HandClip.timecode)
+            .order_by(HandClip.timecode_seconds.nulls_last(), HandClip.id)
             .offset(skip)
             .limit(limit)
         )
@@ -61,10 +61,30 @@ class HandClipService(BaseService[HandClip]):
         limit: int = 100,
     ) -> Sequence[HandClip]:
         """Get all hand clips for a video file."""
+        return await self.get_timeline(video_file_id, skip=skip, limit=limit)
+
+    async def get_timeline(
+        self,
+        video_file_id: UUID,
+        *,
+        start_seconds: Optional[int] = None,
+        end_seconds: Optional[int] = None,
+        skip: int = 0,
+        limit: int = 100,
+    ) -> Sequence[HandClip]:
+        """Get hand clips of a video file ordered by timecode.
+
+        With start_seconds/end_seconds, only clips starting within the range
+        (inclusive) are returned. Clips without a parsable timecode come last
+        and are excluded from range queries.
+        """
+        query = select(HandClip).where(HandClip.video_file_id == video_file_id)
+        if start_seconds is not None:
+            query = query.where(HandClip.timecode_seconds >= start_seconds)
+        if end_seconds is not None:
+            query = query.where(HandClip.timecode_seconds <= end_seconds)
         result = await self.session.execute(
-            select(HandClip)
-            .where(HandClip.video_file_id == video_file_id)
-            .order_by(HandClip.timecode)
+            query.order_by(HandClip.timecode_seconds.nulls_last(), HandClip.id)
             .offset(skip)
             .limit(limit)
         )
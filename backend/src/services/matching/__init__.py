@@ -3,18 +3,40 @@
 경로와 제목 기반의 NAS ↔ Sheets 데이터 매칭을 제공합니다.
 """
 
+from .db_path_matcher import DatabasePathMatcher
+from .file_name_linker import FileNameLinker, FileNameLinkStats, NameCandidate
+from .parallel_matcher import ShardedPathMatcher
+from .path_index import PathTrie, SuffixCandidate, SuffixIndex
 from .path_matcher import (
+    IndexedFile,
     MatchResult,
     MatchStats,
     PathMatcher,
     PathNormalizer,
     TitleMatcher,
 )
+from .title_index import MinHasher, TitleIndex, TitleMatch, tokenize
+from .title_linker import TitleLinker, TitleLinkStats
 
 __all__ = [
+    "DatabasePathMatcher",
+    "FileNameLinker",
+    "FileNameLinkStats",
+    "IndexedFile",
     "MatchResult",
     "MatchStats",
+    "MinHasher",
+    "NameCandidate",
     "PathMatcher",
     "PathNormalizer",
+    "PathTrie",
+    "ShardedPathMatcher",
+    "SuffixCandidate",
+    "SuffixIndex",
+    "TitleIndex",
+    "TitleLinker",
+    "TitleLinkStats",
+    "TitleMatch",
     "TitleMatcher",
+    "tokenize",
 ]
@@ -0,0 +1,190 @@
+"""Database Path Matcher - DB 측 NAS ↔ Sheets 경로 매칭.
+
+HandClip.normalized_folder_link와 NASFile.normalized_path 인덱스를 사용해
+NAS 인벤토리를 메모리로 읽지 않고 집합 기반 SQL로 매칭합니다.
+
+- 정확/하위 경로: btree(text_pattern_ops) 범위 조회
+- 퍼지: pg_trgm 유사도 (PostgreSQL 전용)
+"""
+
+from typing import Iterable, Optional, Sequence
+from uuid import UUID
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
+
+from ...models.hand_clip import HandClip
+from ...models.nas_file import NASFile
+from .path_matcher import MatchResult, MatchStats
+
+
+class DatabasePathMatcher:
+    """normalized_path 인덱스 기반 경로 매칭 서비스.
+
+    PathMatcher와 같은 MatchResult/MatchStats를 반환합니다.
+    """
+
+    # IN 목록 청크 크기
+    CHUNK_SIZE = 1000
+
+    def __init__(self, session: AsyncSession) -> None:
+        self.session = session
+
+    @property
+    def is_postgresql(self) -> bool:
+        return self.session.get_bind().dialect.name == "postgresql"
+
+    def _descendant_condition(self, column, prefix):
+        """column이 prefix 폴더 하위 경로인지 ('/' 다음 문자는 '0')."""
+        lower = prefix + "/"
+        upper = prefix + "0"
+        if self.is_postgresql:
+            # text_pattern_ops 인덱스를 타는 연산자
+            return column.op("~>=~")(lower) & column.op("~<~")(upper)
+        return (column >= lower) & (column < upper)
+
+    async def match_all_clips(
+        self,
+        *,
+        limit: Optional[int] = None,
+        clip_ids: Optional[Sequence[UUID]] = None,
+    ) -> tuple[list[MatchResult], MatchStats]:
+        """nas_folder_link가 있는 HandClip 매칭 (단일 집합 쿼리 + 퍼지 보완).
+
+        Args:
+            limit: 처리할 최대 클립 수
+            clip_ids: 지정 시 해당 클립만 매칭
+
+        Returns:
+            (매칭 결과 리스트, 통계)
+        """
+        link = HandClip.normalized_folder_link
+        exact_file = aliased(NASFile)
+        child_file = aliased(NASFile)
+
+        exact_id = (
+            select(exact_file.id)
+            .where(exact_file.normalized_path == link)
+            .limit(1)
+            .scalar_subquery()
+        )
+        descendant_id = (
+            select(child_file.id)
+            .where(self._descendant_condition(child_file.normalized_path, link))
+            .order_by(child_file.normalized_path)
+            .limit(1)
+            .scalar_subquery()
+        )
+
+        query = (
+            select(
+                HandClip.id,
+                HandClip.nas_folder_link,
+                link,
+                exact_id.label("exact_id"),
+                descendant_id.label("descendant_id"),
+            )
+            .where(link != None)  # noqa: E711
+            .order_by(HandClip.id)
+        )
+        if clip_ids is not None:
+            query = query.where(HandClip.id.in_(clip_ids))
+        if limit is not None:
+            query = query.limit(limit)
+
+        rows = (await self.session.execute(query)).all()
+
+        matched_ids: dict[UUID, UUID] = {}  # clip_id → nas_file_id
+        unmatched: list[UUID] = []
+        for row in rows:
+            nas_file_id = row.exact_id or row.descendant_id
+            if nas_file_id:
+                matched_ids[row.id] = nas_file_id
+            else:
+                unmatched.append(row.id)
+
+        fuzzy_ids: dict[UUID, UUID] = {}
+        if unmatched and self.is_postgresql:
+            fuzzy_ids = await self._match_fuzzy(unmatched)
+
+        paths = await self._load_paths(
+            set(matched_ids.values()) | set(fuzzy_ids.values())
+        )
+
+        results: list[MatchResult] = []
+        stats = MatchStats(total_clips=len(rows))
+        for row in rows:
+            result = MatchResult(hand_clip_id=row.id, nas_folder_link=row.nas_folder_link)
+            nas_file_id = matched_ids.get(row.id) or fuzzy_ids.get(row.id)
+
+            if nas_file_id and nas_file_id in paths:
+                file_path, normalized_path = paths[nas_file_id]
+                result.matched_nas_file_id = nas_file_id
+                result.matched_file_path = file_path
+
+                if row.id in fuzzy_ids:
+                    result.match_type, result.confidence = "fuzzy", 0.5
+                    stats.fuzzy_matches += 1
+                elif self._is_direct(row.normalized_folder_link, normalized_path):
+                    result.match_type, result.confidence = "exact", 1.0
+                    stats.exact_matches += 1
+                else:
+                    result.match_type, result.confidence = "partial", 0.8
+                    stats.partial_matches += 1
+                stats.matched += 1
+            else:
+                stats.unmatched += 1
+
+            results.append(result)
+
+        if stats.total_clips > 0:
+            stats.match_rate = stats.matched / stats.total_clips * 100
+
+        return results, stats
+
+    @staticmethod
+    def _is_direct(link: str, normalized_path: str) -> bool:
+        """파일 경로 자체이거나 링크 폴더의 바로 아래 파일인지."""
+        if normalized_path == link:
+            return True
+        remainder = normalized_path[len(link) + 1:]
+        return "/" not in remainder
+
+    async def _match_fuzzy(self, clip_ids: list[UUID]) -> dict[UUID, UUID]:
+        """pg_trgm 유사도 기반 퍼지 매칭 (GIN 인덱스 사용)."""
+        link = HandClip.normalized_folder_link
+        candidate = aliased(NASFile)
+        best_id = (
+            select(candidate.id)
+            .where(candidate.normalized_path.op("%")(link))
+            .order_by(func.similarity(candidate.normalized_path, link).desc())
+            .limit(1)
+            .scalar_subquery()
+        )
+
+        matched: dict[UUID, UUID] = {}
+        for chunk in self._chunks(clip_ids):
+            rows = await self.session.execute(
+                select(HandClip.id, best_id.label("nas_file_id")).where(
+                    HandClip.id.in_(chunk)
+                )
+            )
+            matched.update({r.id: r.nas_file_id for r in rows if r.nas_file_id})
+        return matched
+
+    async def _load_paths(self, ids: set[UUID]) -> dict[UUID, tuple[str, str]]:
+        """NASFile id → (file_path, normalized_path)."""
+        paths: dict[UUID, tuple[str, str]] = {}
+        for chunk in self._chunks(list(ids)):
+            rows = await self.session.execute(
+                select(NASFile.id, NASFile.file_path, NASFile.normalized_path).where(
+                    NASFile.id.in_(chunk)
+                )
+            )
+            paths.update({r.id: (r.file_path, r.normalized_path) for r in rows})
+        return paths
+
+    def _chunks(self, items: list) -> Iterable[list]:
+        for start in range(0, len(items), self.CHUNK_SIZE):
+            yield items[start:start + self.CHUNK_SIZE]
@@ -0,0 +1,253 @@
+"""File Name Linker - sheet_file_name 기반 HandClip ↔ VideoFile 직접 연결.
+
+HandClip.sheet_file_name을 VideoFile.file_name과 lower(file_name) 함수 인덱스로
+배치 조회하여 정확 → 대소문자 무시 → 확장자 무시 순으로 연결합니다.
+같은 이름의 파일이 여러 개일 때만 nas_folder_link 경로로 후보를 좁힙니다.
+"""
+
+import logging
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Any, NamedTuple, Optional, Sequence
+from uuid import UUID
+
+from sqlalchemy import func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ...models.hand_clip import HandClip
+from ...models.video_file import VideoFile
+from .path_matcher import PathNormalizer
+from .title_index import VIDEO_EXTENSION_PATTERN
+
+logger = logging.getLogger(__name__)
+
+# 확장자 무시 조회 시 시도하는 동영상 확장자
+VIDEO_EXTENSIONS = ("mp4", "mkv", "avi", "mov", "wmv", "flv", "webm", "m4v", "mxf")
+
+
+class NameCandidate(NamedTuple):
+    """파일명이 일치하는 VideoFile 후보."""
+
+    id: UUID
+    file_name: str
+    file_path: str
+
+
+@dataclass
+class FileNameLinkStats:
+    """파일명 연결 통계."""
+
+    total_clips: int = 0
+    linked_exact: int = 0
+    linked_case_insensitive: int = 0
+    linked_extension_insensitive: int = 0
+    linked_by_folder_link: int = 0  # 동명 파일 중 폴더 링크로 선택
+    ambiguous: int = 0
+    unmatched: int = 0
+    samples: list[dict[str, Any]] = field(default_factory=list)
+
+    @property
+    def linked(self) -> int:
+        return (
+            self.linked_exact
+            + self.linked_case_insensitive
+            + self.linked_extension_insensitive
+            + self.linked_by_folder_link
+        )
+
+
+class FileNameLinker:
+    """HandClip.sheet_file_name → VideoFile 연결 서비스."""
+
+    MAX_SAMPLES = 20
+    # lower(file_name) IN 목록 청크 크기
+    LOOKUP_CHUNK_SIZE = 2000
+
+    def __init__(self, session: AsyncSession, *, batch_size: int = 1000) -> None:
+        self.session = session
+        self.batch_size = batch_size
+
+    @staticmethod
+    def name_stem(file_name: str) -> str:
+        """소문자 + 동영상 확장자 제거."""
+        return VIDEO_EXTENSION_PATTERN.sub("", file_name.strip().lower())
+
+    @classmethod
+    def lookup_keys(cls, file_name: str) -> set[str]:
+        """lower(file_name) 조회 키 (원래 이름, 확장자 없는 이름, 확장자 변형)."""
+        stem = cls.name_stem(file_name)
+        keys = {file_name.strip().lower(), stem}
+        keys.update(f"{stem}.{ext}" for ext in VIDEO_EXTENSIONS)
+        return keys
+
+    async def lookup(self, file_names: Sequence[str]) -> dict[str, list[NameCandidate]]:
+        """파일명 목록을 lower(file_name) 인덱스로 일괄 조회.
+
+        Returns:
+            name_stem → 후보 VideoFile 목록
+        """
+        keys: set[str] = set()
+        for name in file_names:
+            keys.update(self.lookup_keys(name))
+
+        by_stem: dict[str, list[NameCandidate]] = defaultdict(list)
+        key_list = sorted(keys)
+        for start in range(0, len(key_list), self.LOOKUP_CHUNK_SIZE):
+            rows = await self.session.execute(
+                select(VideoFile.id, VideoFile.file_name, VideoFile.file_path).where(
+                    func.lower(VideoFile.file_name).in_(
+                        key_list[start:start + self.LOOKUP_CHUNK_SIZE]
+                    )
+                )
+            )
+            for row in rows:
+                by_stem[self.name_stem(row.file_name)].append(NameCandidate(*row))
+        return by_stem
+
+    def resolve(
+        self,
+        sheet_file_name: str,
+        nas_folder_link: Optional[str],
+        by_stem: dict[str, list[NameCandidate]],
+    ) -> tuple[str, Optional[NameCandidate]]:
+        """HandClip 하나의 VideoFile 결정.
+
+        Returns:
+            (연결 유형, 후보) - 유형은 exact, case_insensitive, extension_insensitive,
+            folder_link, ambiguous, none
+        """
+        name = sheet_file_name.strip()
+        candidates = by_stem.get(self.name_stem(name), [])
+        stages = (
+            ("exact", lambda c: c.file_name == name),
+            ("case_insensitive", lambda c: c.file_name.lower() == name.lower()),
+            ("extension_insensitive", lambda c: True),
+        )
+        for link_type, accept in stages:
+            pool = [c for c in candidates if accept(c)]
+            if len(pool) == 1:
+                return link_type, pool[0]
+            if pool:
+                chosen = self._disambiguate(pool, nas_folder_link)
+                if chosen is None:
+                    return "ambiguous", None
+                return "folder_link", chosen
+        return "none", None
+
+    @staticmethod
+    def _disambiguate(
+        pool: list[NameCandidate], nas_folder_link: Optional[str]
+    ) -> Optional[NameCandidate]:
+        """동명 후보 중 nas_folder_link와 경로가 맞는 후보 하나."""
+        if not nas_folder_link:
+            return None
+        link = PathNormalizer.normalize(nas_folder_link)
+
+        # 폴더 링크 하위 (또는 파일 링크 자체)
+        paths = {c.id: PathNormalizer.normalize(c.file_path) for c in pool}
+        inside = [
+            c for c in pool if paths[c.id] == link or paths[c.id].startswith(link + "/")
+        ]
+        if len(inside) == 1:
+            return inside[0]
+
+        # 경로 매처 퍼지 단계와 같은 기준: 뒤쪽 폴더 세그먼트 일치 수가 유일하게 최대
+        link_parts = link.split("/")
+        scored = []
+        for c in inside or pool:
+            folder_parts = paths[c.id].split("/")[:-1]
+            matched = 0
+            for a, b in zip(reversed(link_parts), reversed(folder_parts)):
+                if a != b:
+                    break
+                matched += 1
+            scored.append((matched, c))
+        scored.sort(key=lambda item: item[0], reverse=True)
+        if scored[0][0] > 0 and (len(scored) == 1 or scored[0][0] > scored[1][0]):
+            return scored[0][1]
+        return None
+
+    async def link_clips(
+        self,
+        *,
+        limit: Optional[int] = None,
+        dry_run: bool = False,
+    ) -> FileNameLinkStats:
+        """video_file_id가 없는 HandClip을 sheet_file_name으로 연결.
+
+        keyset 페이지네이션으로 배치 조회 → 파일명 일괄 조회 → bulk UPDATE → 커밋합니다.
+
+        Args:
+            limit: 처리할 최대 클립 수 (None이면 전체)
+            dry_run: True면 DB를 변경하지 않고 통계만 계산
+
+        Returns:
+            연결 통계
+        """
+        stats = FileNameLinkStats()
+
+        last_id: Optional[UUID] = None
+        while limit is None or stats.total_clips < limit:
+            batch_size = self.batch_size
+            if limit is not None:
+                batch_size = min(batch_size, limit - stats.total_clips)
+
+            query = (
+                select(HandClip.id, HandClip.sheet_file_name, HandClip.nas_folder_link)
+                .where(HandClip.video_file_id == None)  # noqa: E711
+                .where(HandClip.sheet_file_name != None)  # noqa: E711
+                .order_by(HandClip.id)
+                .limit(batch_size)
+            )
+            if last_id is not None:
+                query = query.where(HandClip.id > last_id)
+
+            rows = (await self.session.execute(query)).all()
+            if not rows:
+                break
+            last_id = rows[-1].id
+
+            by_stem = await self.lookup([row.sheet_file_name for row in rows])
+
+            updates: list[dict[str, Any]] = []
+            for row in rows:
+                stats.total_clips += 1
+                link_type, candidate = self.resolve(
+                    row.sheet_file_name, row.nas_folder_link, by_stem
+                )
+                if candidate is None:
+                    if link_type == "ambiguous":
+                        stats.ambiguous += 1
+                    else:
+                        stats.unmatched += 1
+                    continue
+
+                if link_type == "exact":
+                    stats.linked_exact += 1
+                elif link_type == "case_insensitive":
+                    stats.linked_case_insensitive += 1
+                elif link_type == "extension_insensitive":
+                    stats.linked_extension_insensitive += 1
+                else:
+                    stats.linked_by_folder_link += 1
+                updates.append({"id": row.id, "video_file_id": candidate.id})
+
+                if len(stats.samples) < self.MAX_SAMPLES:
+                    stats.samples.append(
+                        {
+                            "hand_clip_id": str(row.id),
+                            "sheet_file_name": row.sheet_file_name,
+                            "matched": candidate.file_name,
+                            "link_type": link_type,
+                        }
+                    )
+
+            if updates and not dry_run:
+                await self.session.execute(update(HandClip), updates)
+                await self.session.commit()
+
+        logger.info(
+            f"File name linking: {stats.linked}/{stats.total_clips} clips linked, "
+            f"{stats.ambiguous} ambiguous"
+        )
+        return stats
@@ -0,0 +1,177 @@
+"""Sharded Path Matcher - 프로세스 풀 기반 대용량 경로 매칭.
+
+NAS 인덱스는 메인 프로세스에서 한 번 구축해 파일로 직렬화하고, 워커는 DB 조회와
+재구축 없이 파일을 역직렬화해 각자 사본을 갖습니다 (메모리는 워커 수만큼 필요).
+클립은 샤드 단위로 워커에 분배되며 매칭은 이벤트 루프 밖에서 실행됩니다.
+"""
+
+import asyncio
+import multiprocessing
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional, Sequence
+from uuid import UUID
+
+from sqlalchemy import select
+
+from ...models.hand_clip import HandClip
+from .path_matcher import MatchResult, MatchStats, PathMatcher
+
+# 워커 프로세스별 매처 (_init_worker에서 설정)
+_worker_matcher: Optional[PathMatcher] = None
+
+
+def _init_worker(index_path: str) -> None:
+    global _worker_matcher
+    _worker_matcher = PathMatcher.load_index(index_path)
+
+
+def _match_shard(links: Sequence[str]) -> list[tuple]:
+    """워커에서 샤드 매칭.
+
+    프로세스 간 전송 비용을 줄이기 위해 MatchResult/UUID 대신 기본 타입 튜플
+    (match_type, confidence, nas_file_id bytes, file_path, nearest_candidates)로 반환합니다.
+    """
+    rows = []
+    for link in links:
+        result = _worker_matcher.match_path(link)
+        rows.append(
+            (
+                result.match_type,
+                result.confidence,
+                result.matched_nas_file_id.bytes if result.matched_nas_file_id else None,
+                result.matched_file_path,
+                result.nearest_candidates,
+            )
+        )
+    return rows
+
+
+class ShardedPathMatcher:
+    """PathMatcher 인덱스 파일을 워커마다 로드하는 프로세스 풀 매칭.
+
+    Usage:
+        matcher = PathMatcher(session)
+        await matcher.build_nas_index()
+        sharded = ShardedPathMatcher(matcher, workers=4)
+        results, stats = await sharded.match_all_clips()
+    """
+
+    def __init__(
+        self,
+        matcher: PathMatcher,
+        *,
+        workers: int = 4,
+        shard_size: int = 5000,
+        start_method: str = "spawn",
+    ) -> None:
+        """
+        Args:
+            matcher: NAS 인덱스를 구축한 (또는 구축할) PathMatcher
+            workers: 워커 프로세스 수
+            shard_size: 워커에 한 번에 넘기는 클립 수
+            start_method: multiprocessing 시작 방식 (비동기 DB 스레드와의 fork 충돌 방지로 spawn)
+        """
+        self.matcher = matcher
+        self.workers = workers
+        self.shard_size = shard_size
+        self.start_method = start_method
+
+    async def match_all_clips(
+        self, limit: Optional[int] = None
+    ) -> tuple[list[MatchResult], MatchStats]:
+        """nas_folder_link가 있는 모든 HandClip을 샤드로 나눠 매칭.
+
+        Args:
+            limit: 처리할 최대 클립 수 (None이면 전체)
+
+        Returns:
+            (매칭 결과 리스트, 통계)
+        """
+        if not self.matcher.indexed_paths:
+            await self.matcher.build_nas_index()
+
+        query = (
+            select(HandClip.id, HandClip.nas_folder_link)
+            .where(HandClip.nas_folder_link != None)  # noqa: E711
+            .order_by(HandClip.id)
+            .execution_options(yield_per=PathMatcher.INDEX_BATCH_SIZE)
+        )
+        if limit is not None:
+            query = query.limit(limit)
+
+        links: list[tuple[UUID, str]] = []
+        result = await self.matcher.session.stream(query)
+        async for partition in result.partitions():
+            links.extend(tuple(row) for row in partition)
+
+        return await self.match_links(links)
+
+    async def match_links(
+        self, links: Sequence[tuple[UUID, str]]
+    ) -> tuple[list[MatchResult], MatchStats]:
+        """(clip_id, nas_folder_link) 목록을 워커 풀에서 매칭.
+
+        Args:
+            links: 매칭할 클립 링크
+
+        Returns:
+            (입력 순서대로의 매칭 결과, 통계)
+        """
+        loop = asyncio.get_running_loop()
+        shards = [
+            links[start:start + self.shard_size]
+            for start in range(0, len(links), self.shard_size)
+        ]
+
+        shard_results: list[list[tuple]] = []
+        if shards:
+            with tempfile.TemporaryDirectory() as tmp:
+                index_path = os.path.join(tmp, "nas_index.pkl")
+                await loop.run_in_executor(None, self.matcher.dump_index, index_path)
+
+                with ProcessPoolExecutor(
+                    max_workers=min(self.workers, len(shards)),
+                    mp_context=multiprocessing.get_context(self.start_method),
+                    initializer=_init_worker,
+                    initargs=(index_path,),
+                ) as pool:
+                    shard_results = await asyncio.gather(
+                        *(
+                            loop.run_in_executor(
+                                pool, _match_shard, [link for _, link in shard]
+                            )
+                            for shard in shards
+                        )
+                    )
+
+        results: list[MatchResult] = []
+        stats = MatchStats(total_clips=len(links))
+        for shard, rows in zip(shards, shard_results):
+            for (clip_id, link), row in zip(shard, rows):
+                match_type, confidence, file_id, file_path, nearest = row
+                match_result = MatchResult(
+                    hand_clip_id=clip_id,
+                    nas_folder_link=link,
+                    matched_nas_file_id=UUID(bytes=file_id) if file_id else None,
+                    matched_file_path=file_path,
+                    match_type=match_type,
+                    confidence=confidence,
+                    nearest_candidates=nearest,
+                )
+                results.append(match_result)
+                if match_result.match_type == "exact":
+                    stats.exact_matches += 1
+                elif match_result.match_type == "partial":
+                    stats.partial_matches += 1
+                elif match_result.match_type == "fuzzy":
+                    stats.fuzzy_matches += 1
+                else:
+                    stats.unmatched += 1
+
+        stats.matched = stats.total_clips - stats.unmatched
+        if stats.total_clips > 0:
+            stats.match_rate = stats.matched / stats.total_clips * 100
+
+        return results, stats
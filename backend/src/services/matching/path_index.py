@@ -0,0 +1,208 @@
+"""Path Index - 정규화 경로 세그먼트 기반 인덱스.
+
+PathMatcher의 부분 일치/퍼지 단계를 전체 캐시 순회 대신 경로 깊이에 비례하는
+조회로 처리하기 위한 자료구조입니다.
+"""
+
+from dataclasses import dataclass
+from typing import Generic, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class _TrieNode(Generic[T]):
+    __slots__ = ("children", "value", "first")
+
+    def __init__(self) -> None:
+        self.children: dict[str, "_TrieNode[T]"] = {}
+        self.value: Optional[T] = None  # 이 경로에 등록된 항목
+        self.first: Optional[T] = None  # 서브트리에 처음 등록된 항목
+
+
+class PathTrie(Generic[T]):
+    """'/' 세그먼트 단위 경로 트라이.
+
+    모든 조회는 O(경로 깊이)입니다.
+
+    Usage:
+        trie = PathTrie()
+        trie.insert("wsop/2024/day1.mp4", nas_file)
+        trie.first_descendant("wsop/2024")      # 폴더 아래 첫 항목
+        trie.longest_prefix("wsop/2024/x/y.mp4")  # 가장 깊은 상위 경로 항목
+    """
+
+    def __init__(self) -> None:
+        self._root: _TrieNode[T] = _TrieNode()
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    @staticmethod
+    def _segments(path: str) -> list[str]:
+        return path.split("/") if path else []
+
+    def insert(self, path: str, value: T, *, overwrite: bool = False) -> None:
+        """경로에 항목 등록.
+
+        Args:
+            path: 정규화된 경로
+            value: 등록할 항목
+            overwrite: 이미 등록된 경로의 항목을 덮어쓸지 여부
+        """
+        node = self._root
+        if node.first is None:
+            node.first = value
+        for segment in self._segments(path):
+            child = node.children.get(segment)
+            if child is None:
+                child = _TrieNode()
+                node.children[segment] = child
+            node = child
+            if node.first is None:
+                node.first = value
+
+        if node.value is None:
+            self._size += 1
+            node.value = value
+        elif overwrite:
+            node.value = value
+
+    def _find(self, path: str) -> Optional[_TrieNode[T]]:
+        node = self._root
+        for segment in self._segments(path):
+            node = node.children.get(segment)
+            if node is None:
+                return None
+        return node
+
+    def get(self, path: str) -> Optional[T]:
+        """정확히 일치하는 경로의 항목."""
+        node = self._find(path)
+        return node.value if node else None
+
+    def first_descendant(self, path: str) -> Optional[T]:
+        """경로 자신 또는 하위 경로에 처음 등록된 항목."""
+        node = self._find(path)
+        return node.first if node else None
+
+    def longest_prefix(self, path: str) -> tuple[Optional[T], int]:
+        """항목이 등록된 가장 깊은 상위 경로(자신 포함).
+
+        Returns:
+            (항목, 일치한 세그먼트 수) - 없으면 (None, 0)
+        """
+        node = self._root
+        best: Optional[T] = node.value
+        best_depth = 0
+        for depth, segment in enumerate(self._segments(path), start=1):
+            node = node.children.get(segment)
+            if node is None:
+                break
+            if node.value is not None:
+                best, best_depth = node.value, depth
+        return best, best_depth
+
+    def clear(self) -> None:
+        """인덱스 초기화."""
+        self._root = _TrieNode()
+        self._size = 0
+
+
+@dataclass
+class SuffixCandidate(Generic[T]):
+    """접미 세그먼트 조회 후보."""
+
+    path: str
+    value: T
+    matched_segments: int
+
+
+class _SuffixNode(Generic[T]):
+    __slots__ = ("children", "entries")
+
+    def __init__(self) -> None:
+        self.children: dict[str, "_SuffixNode[T]"] = {}
+        self.entries: list[tuple[str, T]] = []  # 이 접미사로 끝나는 경로 (등록 순)
+
+
+class SuffixIndex(Generic[T]):
+    """뒤쪽 세그먼트부터 역순으로 색인하는 접미사 인덱스.
+
+    노드마다 해당 접미사로 끝나는 경로를 최대 max_per_node개 보관하며,
+    조회는 O(경로 깊이)이고 후보는 일치 세그먼트 수 내림차순으로 정렬됩니다.
+
+    Usage:
+        index = SuffixIndex()
+        index.insert("nas/wsop/2024/day1", nas_file)
+        index.lookup("other/wsop/2024/day1", min_segments=3)
+    """
+
+    def __init__(self, max_per_node: int = 4) -> None:
+        self.max_per_node = max_per_node
+        self._root: _SuffixNode[T] = _SuffixNode()
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def insert(self, path: str, value: T) -> None:
+        """경로의 모든 접미사에 항목 등록."""
+        if not path:
+            return
+        node = self._root
+        for segment in reversed(path.split("/")):
+            child = node.children.get(segment)
+            if child is None:
+                child = _SuffixNode()
+                node.children[segment] = child
+            node = child
+            if len(node.entries) < self.max_per_node:
+                node.entries.append((path, value))
+        self._size += 1
+
+    def lookup(
+        self,
+        path: str,
+        *,
+        min_segments: int = 1,
+        limit: int = 5,
+    ) -> list[SuffixCandidate[T]]:
+        """뒤쪽 세그먼트가 가장 많이 일치하는 후보 조회.
+
+        Args:
+            path: 정규화된 경로
+            min_segments: 후보로 인정할 최소 일치 세그먼트 수
+            limit: 최대 후보 수
+
+        Returns:
+            일치 세그먼트 수 내림차순 후보 목록
+        """
+        if not path or limit <= 0:
+            return []
+
+        # 깊이별 노드 (깊이 = 일치한 뒤쪽 세그먼트 수)
+        nodes: list[_SuffixNode[T]] = []
+        node = self._root
+        for segment in reversed(path.split("/")):
+            node = node.children.get(segment)
+            if node is None:
+                break
+            nodes.append(node)
+
+        candidates: list[SuffixCandidate[T]] = []
+        seen: set[str] = set()
+        for depth in range(len(nodes), max(min_segments, 1) - 1, -1):
+            for entry_path, value in nodes[depth - 1].entries:
+                if entry_path in seen:
+                    continue
+                seen.add(entry_path)
+                candidates.append(SuffixCandidate(entry_path, value, depth))
+                if len(candidates) >= limit:
+                    return candidates
+        return candidates
+
+    def clear(self) -> None:
+        """인덱스 초기화."""
+        self._root = _SuffixNode()
+        self._size = 0
@@ -3,16 +3,38 @@
 Google Sheets의 "Nas Folder Link" 경로와 NASFile.file_path를 매칭합니다.
 """
 
+import pickle
 import re
-from dataclasses import dataclass
-from typing import Optional, Sequence
+from dataclasses import dataclass, field
+from typing import Any, Iterable, NamedTuple, Optional, Sequence
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import (
+    Column,
+    MetaData,
+    Table,
+    Uuid,
+    and_,
+    func,
+    insert,
+    or_,
+    select,
+    update,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from ...models.hand_clip import HandClip
+from ...models.hand_clip import HandClip, PathMatchStatus
 from ...models.nas_file import NASFile
+from .path_index import PathTrie, SuffixCandidate, SuffixIndex
+from .title_index import TitleIndex
+
+
+class IndexedFile(NamedTuple):
+    """인덱스에 보관하는 NASFile 요약 (ORM 인스턴스 대신 컬럼 튜플)."""
+
+    id: UUID
+    file_path: str
+    video_file_id: Optional[UUID]
 
 
 @dataclass
@@ -25,6 +47,8 @@ class MatchResult:
     matched_file_path: Optional[str] = None
     match_type: str = "none"  # exact, partial, fuzzy, none
     confidence: float = 0.0
+    # 매칭 실패 시 가장 가까운 후보 (정규화 경로, 일치한 뒤쪽 세그먼트 수)
+    nearest_candidates: list[tuple[str, int]] = field(default_factory=list)
 
 
 @dataclass
@@ -38,6 +62,11 @@ class MatchStats:
     exact_matches: int = 0
     partial_matches: int = 0
     fuzzy_matches: int = 0
+    # 증분 매칭: 변경이 없어 건너뛴 클립 수, limit에 걸려 다음 실행으로 미룬 클립 수,
+    # 매칭 기준 인벤토리 세대
+    skipped: int = 0
+    remaining: int = 0
+    inventory_generation: Optional[int] = None
 
 
 class PathNormalizer:
@@ -125,36 +154,135 @@ class PathNormalizer:
 class PathMatcher:
     """NAS ↔ Sheets 경로 매칭 서비스."""
 
+    # 퍼지 매칭에 필요한 뒤쪽 세그먼트 수 (경로가 더 짧으면 전체)
+    FUZZY_SEGMENTS = 3
+    # 매칭 실패 진단용 후보 수
+    MAX_NEAREST_CANDIDATES = 3
+
     def __init__(self, session: AsyncSession) -> None:
         self.session = session
-        self._nas_cache: dict[str, NASFile] = {}  # normalized_path → NASFile
-
-    async def build_nas_index(self, limit: int = 50000) -> int:
+        self._nas_cache: dict[str, IndexedFile] = {}  # normalized_path → IndexedFile
+        # 부분/퍼지 인덱스는 폴더 경로만 보관 (파일 수가 아닌 폴더 수에 비례)
+        self._path_trie: PathTrie[IndexedFile] = PathTrie()  # 부분 일치용
+        self._suffix_index: SuffixIndex[IndexedFile] = SuffixIndex()  # 퍼지 매칭용
+        self._suffix_folders: set[str] = set()  # 접미사 인덱스에 등록된 폴더
+        # 파일명 → 정규화 파일 경로 (퍼지용, 상한 없이 모든 파일; 문자열은 _nas_cache 키 공유)
+        self._name_index: dict[str, list[str]] = {}
+
+    # 인덱스 구축 시 서버 측 커서 배치 크기
+    INDEX_BATCH_SIZE = 5000
+
+    @property
+    def indexed_paths(self) -> int:
+        """인덱스에 등록된 정규화 경로 수 (파일 + 폴더, 0이면 미구축)."""
+        return len(self._nas_cache)
+
+    async def build_nas_index(self, limit: Optional[int] = None) -> int:
         """NAS 파일 인덱스 구축.
 
+        (id, file_path, video_file_id) 컬럼만 서버 측 커서로 스트리밍하여
+        ORM 인스턴스 없이 인덱싱합니다.
+
         Args:
-            limit: 최대 파일 수
+            limit: 최대 파일 수 (None이면 전체)
 
         Returns:
             인덱싱된 파일 수
         """
-        result = await self.session.execute(
-            select(NASFile).limit(limit)
-        )
-        nas_files = result.scalars().all()
-
+        query = select(
+            NASFile.id, NASFile.file_path, NASFile.video_file_id
+        ).execution_options(yield_per=self.INDEX_BATCH_SIZE)
+        if limit is not None:
+            query = query.limit(limit)
+
+        self.clear_index()
+        count = 0
+        result = await self.session.stream(query)
+        async for partition in result.partitions():
+            count += self.add_to_index(IndexedFile(*row) for row in partition)
+
+        return count
+
+    def clear_index(self) -> None:
+        """인덱스 초기화."""
         self._nas_cache.clear()
-        for nas_file in nas_files:
+        self._path_trie.clear()
+        self._suffix_index.clear()
+        self._suffix_folders.clear()
+        self._name_index.clear()
+
+    def add_to_index(self, files: Iterable[IndexedFile]) -> int:
+        """파일을 정확/부분/퍼지 인덱스에 한 번에 등록.
+
+        Args:
+            files: 인덱싱할 파일
+
+        Returns:
+            등록한 파일 수
+        """
+        count = 0
+        for entry in files:
+            count += 1
             # 파일 경로로 인덱싱
-            normalized = PathNormalizer.normalize(nas_file.file_path)
-            self._nas_cache[normalized] = nas_file
+            normalized = PathNormalizer.normalize(entry.file_path)
+            self._nas_cache[normalized] = entry
+
+            last_slash = normalized.rfind("/")
+            name = normalized[last_slash + 1:]
+            self._name_index.setdefault(name, []).append(normalized)
+
+            folder_path = normalized[:last_slash] if last_slash > 0 else normalized
 
             # 폴더 경로로도 인덱싱 (폴더 매칭용)
-            folder_path = PathNormalizer.extract_folder_path(nas_file.file_path)
             if folder_path not in self._nas_cache:
-                self._nas_cache[folder_path] = nas_file
+                self._nas_cache[folder_path] = entry
+                self._path_trie.insert(folder_path, entry)
+
+            # 상위 폴더 전체를 접미사 인덱스에 등록 (경로 중간 일치용)
+            ancestor = folder_path
+            while (
+                ancestor
+                and ancestor != normalized
+                and ancestor not in self._suffix_folders
+            ):
+                self._suffix_folders.add(ancestor)
+                self._suffix_index.insert(ancestor, entry)
+                slash = ancestor.rfind("/")
+                ancestor = ancestor[:slash] if slash > 0 else ""
+
+        return count
+
+    def dump_index(self, path: str) -> None:
+        """구축된 인덱스를 파일로 직렬화 (워커 프로세스가 재구축 없이 로드).
 
-        return len(nas_files)
+        Args:
+            path: 저장할 파일 경로
+        """
+        state = (self._nas_cache, self._path_trie, self._suffix_index, self._name_index)
+        with open(path, "wb") as f:
+            pickle.dump(state, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @classmethod
+    def load_index(cls, path: str) -> "PathMatcher":
+        """dump_index 파일로 세션 없는 매처 생성 (match_path 전용).
+
+        파일 전체를 역직렬화하므로 워커마다 인덱스 사본을 메모리에 갖습니다.
+
+        Args:
+            path: dump_index로 저장한 파일 경로
+
+        Returns:
+            인덱스가 채워진 PathMatcher
+        """
+        matcher = cls(session=None)
+        with open(path, "rb") as f:
+            (
+                matcher._nas_cache,
+                matcher._path_trie,
+                matcher._suffix_index,
+                matcher._name_index,
+            ) = pickle.load(f)
+        return matcher
 
     def match_path(self, nas_folder_link: str) -> Optional[MatchResult]:
         """단일 경로 매칭.
@@ -182,42 +310,93 @@ class PathMatcher:
                 confidence=1.0,
             )
 
-        # 2. 부분 일치 (경로 접두사)
-        for cached_path, nas_file in self._nas_cache.items():
-            if cached_path.startswith(normalized) or normalized.startswith(cached_path):
+        # 2. 부분 일치 (경로 트라이, O(경로 깊이))
+        #    링크 폴더 하위 파일 우선, 없으면 가장 깊은 상위 경로
+        nas_file = self._path_trie.first_descendant(normalized)
+        if nas_file is None:
+            nas_file, _ = self._path_trie.longest_prefix(normalized)
+        if nas_file is not None:
+            return MatchResult(
+                hand_clip_id=None,
+                nas_folder_link=nas_folder_link,
+                matched_nas_file_id=nas_file.id,
+                matched_file_path=nas_file.file_path,
+                match_type="partial",
+                confidence=0.8,
+            )
+
+        # 3. 퍼지 매칭 (접미사 인덱스, 뒤쪽 세그먼트 일치 수 순)
+        path_parts = normalized.split("/")
+        if len(path_parts) >= 2:
+            required = min(len(path_parts), self.FUZZY_SEGMENTS)
+            candidates = self._suffix_candidates(
+                path_parts, min_segments=required, limit=1
+            )
+            if candidates:
+                nas_file = candidates[0].value
                 return MatchResult(
                     hand_clip_id=None,
                     nas_folder_link=nas_folder_link,
                     matched_nas_file_id=nas_file.id,
                     matched_file_path=nas_file.file_path,
-                    match_type="partial",
-                    confidence=0.8,
+                    match_type="fuzzy",
+                    confidence=0.5,
                 )
 
-        # 3. 퍼지 매칭 (마지막 2-3개 폴더명 비교)
-        path_parts = normalized.split("/")
-        if len(path_parts) >= 2:
-            last_parts = "/".join(path_parts[-3:])  # 마지막 3개 세그먼트
-
-            for cached_path, nas_file in self._nas_cache.items():
-                if last_parts in cached_path:
-                    return MatchResult(
-                        hand_clip_id=None,
-                        nas_folder_link=nas_folder_link,
-                        matched_nas_file_id=nas_file.id,
-                        matched_file_path=nas_file.file_path,
-                        match_type="fuzzy",
-                        confidence=0.5,
-                    )
-
-        # 4. 매칭 실패
+        # 4. 매칭 실패 (진단용 근접 후보 포함)
         return MatchResult(
             hand_clip_id=None,
             nas_folder_link=nas_folder_link,
             match_type="none",
             confidence=0.0,
+            nearest_candidates=self.nearest_candidates(normalized),
+        )
+
+    def _suffix_candidates(
+        self,
+        path_parts: list[str],
+        *,
+        min_segments: int = 1,
+        limit: int = 5,
+    ) -> list[SuffixCandidate[IndexedFile]]:
+        """뒤쪽 세그먼트 일치 수 내림차순 후보 (폴더 접미사 + 파일명)."""
+        candidates = self._suffix_index.lookup(
+            "/".join(path_parts), min_segments=min_segments, limit=limit
         )
 
+        # 파일: 파일명으로 찾은 뒤 상위 폴더 세그먼트를 뒤에서부터 비교
+        for path in self._name_index.get(path_parts[-1], ()):
+            matched = 0
+            for a, b in zip(reversed(path_parts), reversed(path.split("/"))):
+                if a != b:
+                    break
+                matched += 1
+            if matched >= min_segments:
+                candidates.append(SuffixCandidate(path, self._nas_cache[path], matched))
+
+        candidates.sort(key=lambda c: c.matched_segments, reverse=True)
+        return candidates[:limit]
+
+    def nearest_candidates(self, normalized_path: str) -> list[tuple[str, int]]:
+        """뒤쪽 세그먼트가 가장 많이 일치하는 NAS 경로 후보.
+
+        Args:
+            normalized_path: 정규화된 경로
+
+        Returns:
+            (정규화 경로, 일치 세그먼트 수) 리스트
+        """
+        path_parts = normalized_path.split("/")
+        candidates = self._suffix_candidates(
+            path_parts, limit=self.MAX_NEAREST_CANDIDATES
+        )
+        # 파일 링크인데 같은 파일명이 없으면 상위 폴더 기준 후보
+        if not candidates and len(path_parts) >= 2:
+            candidates = self._suffix_candidates(
+                path_parts[:-1], limit=self.MAX_NEAREST_CANDIDATES
+            )
+        return [(c.path, c.matched_segments) for c in candidates]
+
     async def match_all_clips(self, limit: int = 10000) -> tuple[list[MatchResult], MatchStats]:
         """모든 HandClip의 nas_folder_link 매칭.
 
@@ -265,45 +444,232 @@ class PathMatcher:
 
         return results, stats
 
+    async def seal_inventory_generation(self) -> int:
+        """세대가 없는 신규 NASFile을 새 인벤토리 세대로 묶음.
+
+        Returns:
+            현재(최신) 인벤토리 세대
+        """
+        current = (
+            await self.session.execute(
+                select(func.coalesce(func.max(NASFile.inventory_generation), 0))
+            )
+        ).scalar_one()
+
+        result = await self.session.execute(
+            update(NASFile)
+            .where(NASFile.inventory_generation == None)  # noqa: E711
+            .values(inventory_generation=current + 1)
+            .execution_options(synchronize_session=False)
+        )
+        return current + 1 if result.rowcount else current
+
+    async def match_incremental(
+        self, limit: int = 10000
+    ) -> tuple[list[MatchResult], MatchStats]:
+        """변경분만 매칭하고 클립별 매칭 상태를 저장.
+
+        - 신규/링크 변경 클립 (pending) 및 매칭 파일이 삭제된 클립: 전체 인덱스로 매칭
+        - 매칭 실패 클립: 마지막 매칭 이후 세대의 NAS 파일로만 재시도
+        - 그 외 (매칭 완료, 신규 파일 없음): 건너뜀
+
+        Args:
+            limit: 처리할 최대 클립 수
+
+        Returns:
+            (처리한 클립의 매칭 결과, 통계)
+        """
+        generation = await self.seal_inventory_generation()
+
+        has_link = HandClip.normalized_folder_link != None  # noqa: E711
+        needs_full = or_(
+            HandClip.path_match_status == PathMatchStatus.PENDING,
+            and_(
+                HandClip.path_match_status.in_(PathMatchStatus.MATCHED),
+                HandClip.path_match_nas_file_id == None,  # noqa: E711
+            ),
+        )
+        needs_retry = and_(
+            HandClip.path_match_status == PathMatchStatus.NONE,
+            func.coalesce(HandClip.path_match_generation, 0) < generation,
+        )
+
+        rows = (
+            await self.session.execute(
+                select(
+                    HandClip.id,
+                    HandClip.nas_folder_link,
+                    HandClip.path_match_status,
+                    HandClip.path_match_generation,
+                )
+                .where(has_link, or_(needs_full, needs_retry))
+                .order_by(HandClip.id)
+                .limit(limit)
+            )
+        ).all()
+
+        counts = (
+            await self.session.execute(
+                select(
+                    func.count(),
+                    func.count().filter(or_(needs_full, needs_retry)),
+                )
+                .select_from(HandClip)
+                .where(has_link)
+            )
+        ).one()
+        total_linked, outstanding = counts[0], counts[1]
+
+        pending = [r for r in rows if r.path_match_status != PathMatchStatus.NONE]
+        retry = [r for r in rows if r.path_match_status == PathMatchStatus.NONE]
+
+        if pending and not self._nas_cache:
+            await self.build_nas_index()
+
+        delta: Optional[PathMatcher] = None
+        if retry:
+            since = min(r.path_match_generation or 0 for r in retry)
+            delta = PathMatcher(self.session)
+            result = await self.session.stream(
+                select(NASFile.id, NASFile.file_path, NASFile.video_file_id)
+                .where(NASFile.inventory_generation > since)
+                .execution_options(yield_per=self.INDEX_BATCH_SIZE)
+            )
+            async for partition in result.partitions():
+                delta.add_to_index(IndexedFile(*row) for row in partition)
+
+        results: list[MatchResult] = []
+        stats = MatchStats(
+            total_clips=len(rows),
+            skipped=total_linked - outstanding,
+            remaining=outstanding - len(rows),
+            inventory_generation=generation,
+        )
+        for row in rows:
+            matcher = delta if row.path_match_status == PathMatchStatus.NONE else self
+            match_result = matcher.match_path(row.nas_folder_link)
+            match_result.hand_clip_id = row.id
+            results.append(match_result)
+
+            if match_result.match_type == "exact":
+                stats.exact_matches += 1
+            elif match_result.match_type == "partial":
+                stats.partial_matches += 1
+            elif match_result.match_type == "fuzzy":
+                stats.fuzzy_matches += 1
+            else:
+                stats.unmatched += 1
+        stats.matched = stats.total_clips - stats.unmatched
+        if stats.total_clips > 0:
+            stats.match_rate = stats.matched / stats.total_clips * 100
+
+        if results:
+            await self.session.execute(
+                update(HandClip),
+                [
+                    {
+                        "id": r.hand_clip_id,
+                        "path_match_status": r.match_type,
+                        "path_match_nas_file_id": r.matched_nas_file_id,
+                        "path_match_confidence": r.confidence,
+                        "path_match_generation": generation,
+                    }
+                    for r in results
+                ],
+            )
+        await self.session.commit()
+
+        return results, stats
+
     async def apply_matches(
         self,
         results: list[MatchResult],
         min_confidence: float = 0.8,
-    ) -> int:
-        """매칭 결과를 HandClip에 적용 (video_file_id 연결).
+    ) -> dict[str, int]:
+        """매칭 결과를 HandClip에 일괄 적용 (video_file_id 연결).
+
+        매칭 목록을 임시 테이블에 적재한 뒤 nas_files와 조인하는 단일 UPDATE로
+        적용합니다. 이미 video_file_id가 있는 클립은 덮어쓰지 않습니다.
 
         Args:
             results: 매칭 결과 리스트
             min_confidence: 최소 신뢰도 (이상만 적용)
 
         Returns:
-            적용된 수
+            매칭 유형별 적용 수 (exact, partial, fuzzy)
         """
-        applied = 0
-
-        for match in results:
-            if match.confidence < min_confidence:
-                continue
-            if not match.matched_nas_file_id:
-                continue
-
-            # NASFile의 video_file_id 가져오기
-            nas_file = await self.session.get(NASFile, match.matched_nas_file_id)
-            if not nas_file or not nas_file.video_file_id:
-                continue
-
-            # HandClip 업데이트
-            clip = await self.session.get(HandClip, match.hand_clip_id)
-            if clip and not clip.video_file_id:
-                clip.video_file_id = nas_file.video_file_id
-                applied += 1
+        applied = {"exact": 0, "partial": 0, "fuzzy": 0}
+        candidates = {
+            match.hand_clip_id: match
+            for match in results
+            if match.hand_clip_id
+            and match.matched_nas_file_id
+            and match.confidence >= min_confidence
+        }
+        if not candidates:
+            return applied
+
+        staging = Table(
+            "apply_matches_staging",
+            MetaData(),
+            Column("hand_clip_id", Uuid, primary_key=True),
+            Column("nas_file_id", Uuid, nullable=False),
+            prefixes=["TEMPORARY"],
+        )
+        clips = HandClip.__table__
+        files = NASFile.__table__
+
+        conn = await self.session.connection()
+        await conn.run_sync(staging.create)
+        await conn.execute(
+            insert(staging),
+            [
+                {"hand_clip_id": clip_id, "nas_file_id": match.matched_nas_file_id}
+                for clip_id, match in candidates.items()
+            ],
+        )
+        updated = await conn.execute(
+            update(clips)
+            .values(video_file_id=files.c.video_file_id)
+            .where(
+                clips.c.id == staging.c.hand_clip_id,
+                files.c.id == staging.c.nas_file_id,
+                files.c.video_file_id != None,  # noqa: E711
+                clips.c.video_file_id == None,  # noqa: E711
+            )
+            .returning(clips.c.id)
+        )
+        for clip_id in updated.scalars():
+            match_type = candidates[clip_id].match_type
+            applied[match_type] = applied.get(match_type, 0) + 1
+        await conn.run_sync(staging.drop)
 
         await self.session.commit()
         return applied
 
 
 class TitleMatcher:
-    """제목 기반 매칭 (NAS 파일명 ↔ Sheets 제목)."""
+    """제목 기반 매칭 (NAS 파일명 ↔ Sheets 제목).
+
+    calculate_similarity는 두 제목의 쌍 비교용입니다. 다수 제목을 매칭할 때는
+    build_index로 TitleIndex를 만들어 top-k 검색을 사용합니다.
+    """
+
+    @staticmethod
+    def build_index(items: Iterable[tuple[Any, Optional[str]]]) -> TitleIndex:
+        """(키, 제목) 목록으로 검색 인덱스 구축.
+
+        Args:
+            items: (키, 제목) 튜플
+
+        Returns:
+            구축된 TitleIndex
+        """
+        index: TitleIndex = TitleIndex()
+        for key, title in items:
+            index.add(key, title)
+        index.build()
+        return index
 
     @staticmethod
     def normalize_title(title: str) -> str:
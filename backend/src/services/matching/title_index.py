@@ -0,0 +1,277 @@
+"""Title Index - 제목 유사도 검색 엔진.
+
+토큰 역색인 + TF-IDF 코사인 점수 + MinHash LSH 후보 생성으로
+제목 묶음의 top-k 매칭을 전체 쌍 비교 없이 (대략 선형 시간에) 계산합니다.
+"""
+
+import hashlib
+import heapq
+import math
+import re
+from collections import Counter, defaultdict
+from dataclasses import dataclass
+from typing import Generic, Iterable, Optional, Sequence, TypeVar
+
+T = TypeVar("T")
+
+# 영문/숫자/한글 토큰
+TOKEN_PATTERN = re.compile(r"[0-9a-z가-힣]+")
+
+# 파일명 끝의 동영상 확장자
+VIDEO_EXTENSION_PATTERN = re.compile(r"\.(mp4|mkv|avi|mov|wmv|flv|webm|m4v|mxf)$")
+
+# MinHash 해시 공간 (메르센 소수)
+_MERSENNE_PRIME = (1 << 61) - 1
+
+
+def tokenize(text: Optional[str]) -> list[str]:
+    """제목/파일명을 토큰 목록으로 분리.
+
+    소문자 변환, 동영상 확장자 제거 후 영문/숫자/한글 연속 구간을 토큰으로 사용합니다.
+    ('-', '_', '.' 등은 구분자)
+    """
+    if not text:
+        return []
+    text = VIDEO_EXTENSION_PATTERN.sub("", text.strip().lower())
+    return TOKEN_PATTERN.findall(text)
+
+
+@dataclass
+class TitleMatch(Generic[T]):
+    """제목 검색 결과."""
+
+    key: T
+    text: str
+    score: float  # TF-IDF 코사인 유사도 (0.0 ~ 1.0)
+
+
+class MinHasher:
+    """토큰 집합 MinHash 서명 생성기.
+
+    토큰별 순열 해시값을 캐시하므로 서명 계산은 토큰 수 × 순열 수의
+    min 연산만 수행합니다.
+    """
+
+    def __init__(self, num_perm: int = 32, seed: int = 1) -> None:
+        self.num_perm = num_perm
+        rng = _SplitMix64(seed)
+        self._params = [
+            (rng.next() % (_MERSENNE_PRIME - 1) + 1, rng.next() % _MERSENNE_PRIME)
+            for _ in range(num_perm)
+        ]
+        self._token_cache: dict[str, tuple[int, ...]] = {}
+
+    def _token_hashes(self, token: str) -> tuple[int, ...]:
+        cached = self._token_cache.get(token)
+        if cached is None:
+            h = int.from_bytes(
+                hashlib.blake2b(token.encode("utf-8"), digest_size=8).digest(), "big"
+            )
+            cached = tuple((a * h + b) % _MERSENNE_PRIME for a, b in self._params)
+            self._token_cache[token] = cached
+        return cached
+
+    def signature(self, tokens: Iterable[str]) -> Optional[tuple[int, ...]]:
+        """토큰 집합의 MinHash 서명 (토큰이 없으면 None)."""
+        vectors = [self._token_hashes(t) for t in set(tokens)]
+        if not vectors:
+            return None
+        if len(vectors) == 1:
+            return vectors[0]
+        return tuple(map(min, zip(*vectors)))
+
+
+class _SplitMix64:
+    """재현 가능한 MinHash 파라미터용 난수 (프로세스 간 동일)."""
+
+    def __init__(self, seed: int) -> None:
+        self._state = seed & 0xFFFFFFFFFFFFFFFF
+
+    def next(self) -> int:
+        self._state = (self._state + 0x9E3779B97F4A7C15) & 0xFFFFFFFFFFFFFFFF
+        z = self._state
+        z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & 0xFFFFFFFFFFFFFFFF
+        z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & 0xFFFFFFFFFFFFFFFF
+        return z ^ (z >> 31)
+
+
+class TitleIndex(Generic[T]):
+    """제목 유사도 검색 인덱스.
+
+    - 역색인: 토큰 → 문서 목록
+    - 후보 생성: MinHash LSH 버킷 (near-duplicate) + 질의의 희소 토큰 postings
+    - 점수: 후보에 대해서만 L2 정규화 TF-IDF 벡터의 코사인 유사도 계산
+
+    후보 postings 길이가 max_postings로 제한되므로 질의당 비용은 문서 수와 무관합니다.
+
+    Usage:
+        index = TitleIndex()
+        index.add(video.id, video.file_name)
+        index.build()
+        index.query("WSOP 2024 Main Event Day 1", k=3, min_score=0.6)
+    """
+
+    def __init__(
+        self,
+        *,
+        num_perm: int = 32,
+        bands: int = 8,
+        rare_tokens: int = 3,
+        max_postings: int = 500,
+    ) -> None:
+        """
+        Args:
+            num_perm: MinHash 순열 수
+            bands: LSH 밴드 수 (num_perm의 약수, 밴드당 행 = num_perm / bands)
+            rare_tokens: postings 후보에 사용할 질의 희소 토큰 수
+            max_postings: 이보다 많은 문서에 나오는 토큰은 postings 후보 생성에서 제외
+        """
+        if num_perm % bands:
+            raise ValueError("num_perm must be divisible by bands")
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.rare_tokens = rare_tokens
+        self.max_postings = max_postings
+        self._hasher = MinHasher(num_perm)
+
+        self._keys: list[T] = []
+        self._texts: list[str] = []
+        self._token_counts: list[Counter[str]] = []
+        self._df: Counter[str] = Counter()
+
+        self._idf: dict[str, float] = {}
+        self._doc_weights: list[dict[str, float]] = []
+        self._postings: dict[str, list[int]] = {}
+        self._buckets: list[dict[tuple[int, ...], list[int]]] = []
+        self._built = False
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def add(self, key: T, text: Optional[str]) -> bool:
+        """문서 추가 (토큰이 없으면 무시).
+
+        Returns:
+            추가 여부
+        """
+        counts = Counter(tokenize(text))
+        if not counts:
+            return False
+        self._keys.append(key)
+        self._texts.append(text or "")
+        self._token_counts.append(counts)
+        self._df.update(counts.keys())
+        self._built = False
+        return True
+
+    def build(self) -> None:
+        """IDF 계산 후 역색인과 LSH 버킷 구축."""
+        n_docs = len(self._keys)
+        self._idf = {
+            token: math.log((1 + n_docs) / (1 + df)) + 1.0
+            for token, df in self._df.items()
+        }
+        self._postings = defaultdict(list)
+        self._buckets = [defaultdict(list) for _ in range(self.bands)]
+        self._doc_weights = []
+
+        for doc, counts in enumerate(self._token_counts):
+            self._doc_weights.append(self._weights(counts))
+            for token in counts:
+                if self._df[token] <= self.max_postings:
+                    self._postings[token].append(doc)
+            signature = self._hasher.signature(counts.keys())
+            for band, key in enumerate(self._band_keys(signature)):
+                self._buckets[band][key].append(doc)
+
+        self._built = True
+
+    def _weights(self, counts: Counter[str]) -> dict[str, float]:
+        """L2 정규화 TF-IDF 가중치 (미등록 토큰은 최대 IDF)."""
+        default_idf = math.log(1 + len(self._keys)) + 1.0
+        weights = {
+            token: (1 + math.log(tf)) * self._idf.get(token, default_idf)
+            for token, tf in counts.items()
+        }
+        norm = math.sqrt(sum(w * w for w in weights.values())) or 1.0
+        return {token: w / norm for token, w in weights.items()}
+
+    def _band_keys(self, signature: Sequence[int]) -> list[tuple[int, ...]]:
+        rows = self.rows
+        return [
+            tuple(signature[band * rows:(band + 1) * rows])
+            for band in range(self.bands)
+        ]
+
+    def _candidates(self, counts: Counter[str]) -> set[int]:
+        candidates: set[int] = set()
+
+        # MinHash LSH: 같은 밴드 버킷의 문서
+        signature = self._hasher.signature(counts.keys())
+        for band, key in enumerate(self._band_keys(signature)):
+            candidates.update(self._buckets[band].get(key, ()))
+
+        # 역색인: 질의에서 가장 희소한 토큰의 postings
+        rare = sorted(
+            (t for t in counts if 0 < self._df.get(t, 0) <= self.max_postings),
+            key=lambda t: self._df[t],
+        )[: self.rare_tokens]
+        for token in rare:
+            candidates.update(self._postings[token])
+
+        return candidates
+
+    def query(
+        self,
+        text: Optional[str],
+        *,
+        k: int = 3,
+        min_score: float = 0.0,
+    ) -> list[TitleMatch[T]]:
+        """제목과 가장 유사한 문서 top-k.
+
+        Args:
+            text: 질의 제목
+            k: 최대 결과 수
+            min_score: 최소 코사인 유사도
+
+        Returns:
+            점수 내림차순 결과
+        """
+        if not self._built:
+            self.build()
+
+        counts = Counter(tokenize(text))
+        if not counts or not self._keys:
+            return []
+
+        candidates = self._candidates(counts)
+        if not candidates:
+            return []
+
+        query_weights = self._weights(counts)
+        scored = []
+        for doc in candidates:
+            doc_weights = self._doc_weights[doc]
+            score = sum(
+                weight * doc_weights.get(token, 0.0)
+                for token, weight in query_weights.items()
+            )
+            if score > 0 and score >= min_score:
+                scored.append((score, doc))
+
+        top = heapq.nlargest(k, scored)
+        return [
+            TitleMatch(self._keys[doc], self._texts[doc], min(score, 1.0))
+            for score, doc in top
+        ]
+
+    def query_batch(
+        self,
+        texts: Iterable[Optional[str]],
+        *,
+        k: int = 3,
+        min_score: float = 0.0,
+    ) -> list[list[TitleMatch[T]]]:
+        """여러 제목을 한 번에 검색."""
+        return [self.query(text, k=k, min_score=min_score) for text in texts]
@@ -0,0 +1,199 @@
+"""Title Linker - 제목/파일명 기반 HandClip ↔ VideoFile 연결.
+
+경로 매칭으로 연결되지 않은 HandClip을 TitleIndex로 검색하여
+sheet_file_name → VideoFile.file_name, title → VideoFile.display_title 순으로 연결합니다.
+"""
+
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Optional
+from uuid import UUID
+
+from sqlalchemy import or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ...config import get_settings
+from ...models.hand_clip import HandClip
+from ...models.video_file import VideoFile
+from .title_index import TitleIndex, TitleMatch
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class TitleLinkStats:
+    """제목 연결 통계."""
+
+    video_files_indexed: int = 0
+    total_clips: int = 0
+    linked_by_file_name: int = 0
+    linked_by_title: int = 0
+    unmatched: int = 0
+    samples: list[dict[str, Any]] = field(default_factory=list)
+
+    @property
+    def linked(self) -> int:
+        return self.linked_by_file_name + self.linked_by_title
+
+
+class TitleLinker:
+    """HandClip.title / sheet_file_name → VideoFile 연결 서비스."""
+
+    MAX_SAMPLES = 20
+
+    def __init__(
+        self,
+        session: AsyncSession,
+        *,
+        file_name_threshold: Optional[float] = None,
+        title_threshold: Optional[float] = None,
+        top_k: Optional[int] = None,
+        batch_size: int = 1000,
+    ) -> None:
+        settings = get_settings().matching
+        self.session = session
+        self.file_name_threshold = (
+            settings.title_file_name_threshold
+            if file_name_threshold is None
+            else file_name_threshold
+        )
+        self.title_threshold = (
+            settings.title_threshold if title_threshold is None else title_threshold
+        )
+        self.top_k = top_k or settings.title_top_k
+        self.batch_size = batch_size
+        self._file_name_index: TitleIndex[UUID] = TitleIndex()
+        self._title_index: TitleIndex[UUID] = TitleIndex()
+
+    async def build_index(self) -> int:
+        """VideoFile 파일명/표시 제목 인덱스 구축.
+
+        Returns:
+            인덱싱된 VideoFile 수
+        """
+        self._file_name_index = TitleIndex()
+        self._title_index = TitleIndex()
+
+        query = select(
+            VideoFile.id, VideoFile.file_name, VideoFile.display_title
+        ).execution_options(yield_per=5000)
+
+        count = 0
+        result = await self.session.stream(query)
+        async for partition in result.partitions():
+            for row in partition:
+                count += 1
+                self._file_name_index.add(row.id, row.file_name)
+                self._title_index.add(row.id, row.display_title)
+
+        self._file_name_index.build()
+        self._title_index.build()
+        return count
+
+    def match_clip(
+        self,
+        title: Optional[str],
+        sheet_file_name: Optional[str],
+    ) -> Optional[tuple[str, TitleMatch[UUID]]]:
+        """HandClip 하나의 최적 VideoFile.
+
+        Returns:
+            (매칭 유형 "file_name" | "title", 결과) 또는 None
+        """
+        if sheet_file_name:
+            matches = self._file_name_index.query(
+                sheet_file_name, k=self.top_k, min_score=self.file_name_threshold
+            )
+            if matches:
+                return "file_name", matches[0]
+        if title:
+            matches = self._title_index.query(
+                title, k=self.top_k, min_score=self.title_threshold
+            )
+            if matches:
+                return "title", matches[0]
+        return None
+
+    async def link_clips(
+        self,
+        *,
+        limit: Optional[int] = None,
+        dry_run: bool = False,
+    ) -> TitleLinkStats:
+        """video_file_id가 없는 HandClip을 제목으로 연결.
+
+        keyset 페이지네이션으로 배치 단위 조회 → bulk UPDATE → 커밋합니다.
+
+        Args:
+            limit: 처리할 최대 클립 수 (None이면 전체)
+            dry_run: True면 DB를 변경하지 않고 통계만 계산
+
+        Returns:
+            연결 통계
+        """
+        stats = TitleLinkStats()
+        stats.video_files_indexed = await self.build_index()
+
+        last_id: Optional[UUID] = None
+        while limit is None or stats.total_clips < limit:
+            batch_size = self.batch_size
+            if limit is not None:
+                batch_size = min(batch_size, limit - stats.total_clips)
+
+            query = (
+                select(HandClip.id, HandClip.title, HandClip.sheet_file_name)
+                .where(HandClip.video_file_id == None)  # noqa: E711
+                .where(
+                    or_(
+                        HandClip.title != None,  # noqa: E711
+                        HandClip.sheet_file_name != None,  # noqa: E711
+                    )
+                )
+                .order_by(HandClip.id)
+                .limit(batch_size)
+            )
+            if last_id is not None:
+                query = query.where(HandClip.id > last_id)
+
+            rows = (await self.session.execute(query)).all()
+            if not rows:
+                break
+            last_id = rows[-1].id
+
+            updates: list[dict[str, Any]] = []
+            for row in rows:
+                stats.total_clips += 1
+                found = self.match_clip(row.title, row.sheet_file_name)
+                if found is None:
+                    stats.unmatched += 1
+                    continue
+
+                match_type, match = found
+                if match_type == "file_name":
+                    stats.linked_by_file_name += 1
+                else:
+                    stats.linked_by_title += 1
+                updates.append({"id": row.id, "video_file_id": match.key})
+
+                if len(stats.samples) < self.MAX_SAMPLES:
+                    stats.samples.append(
+                        {
+                            "hand_clip_id": str(row.id),
+                            "query": row.sheet_file_name
+                            if match_type == "file_name"
+                            else row.title,
+                            "matched": match.text,
+                            "match_type": match_type,
+                            "score": round(match.score, 3),
+                        }
+                    )
+
+            if updates and not dry_run:
+                await self.session.execute(update(HandClip), updates)
+                await self.session.commit()
+
+        logger.info(
+            f"Title linking: {stats.linked}/{stats.total_clips} clips linked "
+            f"({stats.linked_by_file_name} by file name, {stats.linked_by_title} by title)"
+        )
+        return stats
@@ -3,12 +3,22 @@
 NAS 폴더 및 파일 인벤토리 관리 서비스.
 """
 
+from .exclusion_rules import (
+    DEFAULT_EXCLUSION_RULES,
+    ExclusionMatcher,
+    ExclusionRule,
+    get_exclusion_matcher,
+)
 from .folder_service import NASFolderService
 from .file_service import NASFileService
 from .smb_scanner import SMBScanner, ScanResult
 from .sync_service import NASSyncService, SyncStats, quick_scan
 
 __all__ = [
+    "DEFAULT_EXCLUSION_RULES",
+    "ExclusionMatcher",
+    "ExclusionRule",
+    "get_exclusion_matcher",
     "NASFolderService",
     "NASFileService",
     "SMBScanner",
@@ -0,0 +1,278 @@
+"""Exclusion Rules - NAS 스캔/카탈로그 제외 규칙 엔진.
+
+경로 glob, 이름 패턴, 프로젝트별 규칙을 한 번 컴파일하여
+스캔 시점에 제외 폴더 하위를 탐색하지 않도록(prune) 합니다.
+"""
+
+import re
+from collections import Counter
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Iterable, Optional, Sequence
+
+
+class RuleKind:
+    PATH_GLOB = "path_glob"  # 전체 경로 glob (** 지원)
+    NAME_PATTERN = "name_pattern"  # 파일/폴더 이름 glob
+
+
+class RuleTarget:
+    ANY = "any"
+    FILE = "file"
+    DIRECTORY = "directory"
+
+
+@dataclass(frozen=True)
+class ExclusionRule:
+    """제외 규칙.
+
+    패턴은 대소문자를 구분하지 않으며, 경로 구분자는 '/'로 정규화됩니다.
+    """
+
+    name: str
+    pattern: str
+    reason: str
+    kind: str = RuleKind.NAME_PATTERN
+    applies_to: str = RuleTarget.ANY
+    project_code: Optional[str] = None  # None이면 전체 프로젝트 공통
+
+
+# 기본 제외 규칙 (카탈로그 비대상 폴더 + OS 시스템 파일)
+DEFAULT_EXCLUSION_RULES: tuple[ExclusionRule, ...] = (
+    ExclusionRule(
+        name="clips_folder",
+        pattern="clips",
+        reason="clips_folder",
+        applies_to=RuleTarget.DIRECTORY,
+    ),
+    ExclusionRule(
+        name="player_emotion_folder",
+        pattern="player emotion*",
+        reason="player_emotion_folder",
+        applies_to=RuleTarget.DIRECTORY,
+    ),
+    ExclusionRule(
+        name="macos_metadata",
+        pattern="._*",
+        reason="macos_metadata",
+        applies_to=RuleTarget.FILE,
+    ),
+    ExclusionRule(
+        name="macos_system",
+        pattern=".ds_store",
+        reason="macos_system",
+        applies_to=RuleTarget.FILE,
+    ),
+    ExclusionRule(
+        name="windows_thumbnail",
+        pattern="thumbs.db",
+        reason="windows_thumbnail",
+        applies_to=RuleTarget.FILE,
+    ),
+    ExclusionRule(
+        name="windows_desktop_ini",
+        pattern="desktop.ini",
+        reason="windows_system",
+        applies_to=RuleTarget.FILE,
+    ),
+)
+
+
+def _glob_to_regex(pattern: str, *, path_mode: bool) -> str:
+    """glob 패턴을 정규식으로 변환 (캡처 그룹 없음).
+
+    path_mode에서 '**'는 임의 깊이, '*'와 '?'는 한 세그먼트 안에서만 매칭합니다.
+    """
+    pattern = pattern.lower().replace("\\", "/")
+    segment_any = "[^/]" if path_mode else "."
+    out: list[str] = []
+    i = 0
+    while i < len(pattern):
+        c = pattern[i]
+        if c == "*":
+            if path_mode and pattern.startswith("**", i):
+                if pattern.startswith("**/", i):
+                    out.append("(?:.*/)?")
+                    i += 3
+                else:
+                    out.append(".*")
+                    i += 2
+                continue
+            out.append(f"{segment_any}*")
+        elif c == "?":
+            out.append(segment_any)
+        else:
+            out.append(re.escape(c))
+        i += 1
+    return "".join(out)
+
+
+def _compile_alternation(
+    indexed: Sequence[tuple[int, str]],
+) -> Optional[re.Pattern]:
+    """규칙별 정규식을 named group 하나의 alternation으로 결합."""
+    if not indexed:
+        return None
+    return re.compile(
+        "|".join(f"(?P<r{idx}>{regex})" for idx, regex in indexed),
+        re.DOTALL,
+    )
+
+
+@lru_cache(maxsize=64)
+def _compile_rules(
+    rules: tuple[ExclusionRule, ...],
+) -> tuple[Optional[re.Pattern], ...]:
+    """규칙 목록을 (폴더 이름, 폴더 경로, 파일 이름, 파일 경로) 정규식으로 컴파일.
+
+    같은 규칙 목록은 한 번만 컴파일됩니다.
+    """
+    dir_names: list[tuple[int, str]] = []
+    dir_paths: list[tuple[int, str]] = []
+    file_names: list[tuple[int, str]] = []
+    file_paths: list[tuple[int, str]] = []
+
+    for idx, rule in enumerate(rules):
+        is_path = rule.kind == RuleKind.PATH_GLOB
+        regex = _glob_to_regex(rule.pattern, path_mode=is_path)
+        if rule.applies_to in (RuleTarget.ANY, RuleTarget.DIRECTORY):
+            (dir_paths if is_path else dir_names).append((idx, regex))
+        if rule.applies_to in (RuleTarget.ANY, RuleTarget.FILE):
+            (file_paths if is_path else file_names).append((idx, regex))
+
+    return (
+        _compile_alternation(dir_names),
+        _compile_alternation(dir_paths),
+        _compile_alternation(file_names),
+        _compile_alternation(file_paths),
+    )
+
+
+class ExclusionMatcher:
+    """컴파일된 제외 규칙 매처.
+
+    규칙 종류별로 하나의 정규식으로 결합되어 있어 규칙 수와 무관하게
+    항목당 정규식 1~3회 평가로 판정합니다. 먼저 선언된 규칙이 우선합니다.
+
+    Usage:
+        matcher = get_exclusion_matcher("WSOP")
+        rule = matcher.match("WSOP/2024/Clips", is_directory=True)
+        if rule:
+            ...  # 하위 탐색 생략
+    """
+
+    def __init__(
+        self,
+        rules: Iterable[ExclusionRule] = DEFAULT_EXCLUSION_RULES,
+        *,
+        project_code: Optional[str] = None,
+    ) -> None:
+        self.project_code = project_code
+        self.rules: tuple[ExclusionRule, ...] = tuple(
+            r
+            for r in rules
+            if r.project_code is None or r.project_code == project_code
+        )
+        self.hits: Counter[str] = Counter()
+        # 적중을 기록한 폴더/파일 경로 (스캔과 저장 파일 판정에서 같은 항목을 두 번 세지 않음)
+        self._hit_paths: set[str] = set()
+        (
+            self._dir_name_re,
+            self._dir_path_re,
+            self._file_name_re,
+            self._file_path_re,
+        ) = _compile_rules(self.rules)
+
+    @staticmethod
+    def _normalize(path: str) -> str:
+        return path.replace("\\", "/").lower().rstrip("/")
+
+    def _lookup(self, regex: Optional[re.Pattern], text: str) -> Optional[ExclusionRule]:
+        if regex is None:
+            return None
+        m = regex.fullmatch(text)
+        if m is None:
+            return None
+        return self.rules[int(m.lastgroup[1:])]
+
+    def _record(
+        self, rule: Optional[ExclusionRule], record: bool, path: str
+    ) -> Optional[ExclusionRule]:
+        if rule is not None and record and path not in self._hit_paths:
+            self._hit_paths.add(path)
+            self.hits[rule.name] += 1
+        return rule
+
+    def _match_normalized(self, path: str, is_directory: bool) -> Optional[ExclusionRule]:
+        name = path.rsplit("/", 1)[-1]
+        if is_directory:
+            return self._lookup(self._dir_name_re, name) or self._lookup(
+                self._dir_path_re, path
+            )
+        return self._lookup(self._file_name_re, name) or self._lookup(
+            self._file_path_re, path
+        )
+
+    def match(
+        self,
+        path: str,
+        *,
+        is_directory: bool = False,
+        record: bool = True,
+    ) -> Optional[ExclusionRule]:
+        """단일 항목 판정 (상위 폴더는 이미 통과했다고 가정, 스캔용).
+
+        Args:
+            path: 항목 전체 경로
+            is_directory: 폴더 여부
+            record: 적중 횟수 기록 여부
+
+        Returns:
+            적중한 규칙 또는 None
+        """
+        normalized = self._normalize(path)
+        rule = self._match_normalized(normalized, is_directory)
+        return self._record(rule, record, normalized)
+
+    def match_path(self, file_path: str, *, record: bool = True) -> Optional[ExclusionRule]:
+        """저장된 파일 경로 판정 (상위 폴더 규칙 포함, O(경로 깊이)).
+
+        Args:
+            file_path: 파일 전체 경로
+            record: 적중 횟수 기록 여부
+
+        Returns:
+            적중한 규칙 또는 None
+        """
+        if not file_path:
+            return None
+        normalized = self._normalize(file_path)
+        segments = normalized.split("/")
+
+        prefix = ""
+        for segment in segments[:-1]:
+            prefix = f"{prefix}/{segment}" if prefix else segment
+            rule = self._match_normalized(prefix, True)
+            if rule is not None:
+                # 스캔에서 이 폴더를 이미 셌으면 그 아래 파일은 다시 세지 않음
+                return self._record(rule, record and prefix not in self._hit_paths, normalized)
+
+        return self._record(self._match_normalized(normalized, False), record, normalized)
+
+    def is_excluded(self, file_path: str) -> bool:
+        """파일 경로 제외 여부 (적중 횟수 기록 안 함)."""
+        return self.match_path(file_path, record=False) is not None
+
+    def hit_counts(self) -> dict[str, int]:
+        """규칙별 적중 횟수 (같은 경로는 한 번, 스캔에서 센 폴더 아래 파일은 제외)."""
+        return dict(self.hits)
+
+    def reset_hits(self) -> None:
+        """적중 횟수 초기화."""
+        self.hits.clear()
+        self._hit_paths.clear()
+
+
+def get_exclusion_matcher(project_code: Optional[str] = None) -> ExclusionMatcher:
+    """기본 규칙 매처 반환 (컴파일 결과는 캐시, 적중 횟수는 매처별)."""
+    return ExclusionMatcher(DEFAULT_EXCLUSION_RULES, project_code=project_code)
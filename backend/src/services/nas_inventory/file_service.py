@@ -7,12 +7,13 @@ from datetime import datetime
 from typing import Optional, Sequence
 from uuid import UUID
 
-from sqlalchemy import select, desc, func
+from sqlalchemy import select, desc, func, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from ..catalog.base_service import BaseService
 from ...models.nas_file import NASFile, FileCategory
+from .exclusion_rules import ExclusionMatcher
 
 
 class NASFileService(BaseService[NASFile]):
@@ -438,18 +439,72 @@ class NASFileService(BaseService[NASFile]):
         Returns:
             Number of files marked as excluded
         """
-        # Get files matching pattern
         result = await self.session.execute(
-            select(NASFile)
+            update(NASFile)
             .where(NASFile.file_path.ilike(f"%{pattern}%"))
             .where(NASFile.is_excluded == False)  # noqa: E712
+            .values(is_excluded=True, exclude_reason=reason)
+            .execution_options(synchronize_session=False)
         )
-        files = result.scalars().all()
+        return result.rowcount or 0
+
+    async def apply_exclusion_rules(
+        self,
+        matcher: ExclusionMatcher,
+        *,
+        path_prefix: Optional[str] = None,
+        batch_size: int = 5000,
+    ) -> dict[str, int]:
+        """제외 규칙을 기존 파일에 일괄 적용.
+
+        제외되지 않은 파일의 (id, file_path)만 keyset으로 스트리밍하여 판정하고,
+        exclude_reason별로 묶어 bulk UPDATE 합니다.
 
-        # Mark each as excluded
-        for file in files:
-            file.is_excluded = True
-            file.exclude_reason = reason
+        Args:
+            matcher: 컴파일된 제외 규칙 매처
+            path_prefix: 지정하면 이 폴더 아래 파일만 판정 (프로젝트 전용 규칙용)
+            batch_size: 배치당 조회 행 수
+
+        Returns:
+            규칙 이름별 새로 제외된 파일 수
+        """
+        marked: dict[str, int] = {}
+        last_id: Optional[UUID] = None
+
+        while True:
+            query = (
+                select(NASFile.id, NASFile.file_path)
+                .where(NASFile.is_excluded == False)  # noqa: E712
+                .order_by(NASFile.id)
+                .limit(batch_size)
+            )
+            if path_prefix is not None:
+                query = query.where(
+                    NASFile.file_path.startswith(path_prefix.rstrip("/") + "/", autoescape=True)
+                )
+            if last_id is not None:
+                query = query.where(NASFile.id > last_id)
+
+            rows = (await self.session.execute(query)).all()
+            if not rows:
+                break
+            last_id = rows[-1].id
+
+            by_reason: dict[str, list[UUID]] = {}
+            for row in rows:
+                rule = matcher.match_path(row.file_path)
+                if rule is None:
+                    continue
+                by_reason.setdefault(rule.reason, []).append(row.id)
+                marked[rule.name] = marked.get(rule.name, 0) + 1
+
+            for reason, ids in by_reason.items():
+                await self.session.execute(
+                    update(NASFile)
+                    .where(NASFile.id.in_(ids))
+                    .values(is_excluded=True, exclude_reason=reason)
+                    .execution_options(synchronize_session=False)
+                )
 
         await self.session.flush()
-        return len(files)
+        return marked
@@ -17,6 +17,7 @@ from smbprotocol.open import Open, FilePipePrinterAccessMask, CreateDisposition,
 from smbprotocol.file_info import FileDirectoryInformation, FileInformationClass
 
 from ...config import NASConfig, get_settings
+from .exclusion_rules import ExclusionMatcher
 
 logger = logging.getLogger(__name__)
 
@@ -43,9 +44,19 @@ class SMBScanner:
             print(item.name, item.is_directory)
     """
 
-    def __init__(self, config: Optional[NASConfig] = None) -> None:
-        """Initialize scanner with config."""
+    def __init__(
+        self,
+        config: Optional[NASConfig] = None,
+        exclusion: Optional[ExclusionMatcher] = None,
+    ) -> None:
+        """Initialize scanner with config.
+
+        Args:
+            config: NAS 접속 설정
+            exclusion: 제외 규칙 매처 (적중한 폴더는 하위 탐색 생략)
+        """
         self.config = config or get_settings().nas
+        self.exclusion = exclusion
         self._connection: Optional[Connection] = None
         self._session: Optional[Session] = None
         self._tree: Optional[TreeConnect] = None
@@ -123,6 +134,7 @@ class SMBScanner:
         path: str = "",
         recursive: bool = False,
         max_depth: int = 10,
+        exclusion: Optional[ExclusionMatcher] = None,
     ) -> AsyncGenerator[ScanResult, None]:
         """Scan a directory and yield results.
 
@@ -130,6 +142,7 @@ class SMBScanner:
             path: Relative path from base (e.g., "/WSOP/2024")
             recursive: Whether to scan subdirectories
             max_depth: Maximum recursion depth
+            exclusion: 제외 규칙 매처 (없으면 생성 시 지정한 매처 사용)
 
         Yields:
             ScanResult objects for each file/folder found
@@ -138,12 +151,15 @@ class SMBScanner:
             await self.connect()
 
         # Normalize path
-        full_path = self._build_path(path)
+        full_path = self.build_path(path)
 
-        async for result in self._scan_path(full_path, recursive, 0, max_depth):
+        exclusion = exclusion or self.exclusion
+        async for result in self._scan_path(
+            full_path, recursive, 0, max_depth, exclusion
+        ):
             yield result
 
-    def _build_path(self, relative_path: str) -> str:
+    def build_path(self, relative_path: str) -> str:
         """Build full path from relative path."""
         # Remove leading slashes and combine with base path
         relative_path = relative_path.lstrip("/\\")
@@ -157,8 +173,12 @@ class SMBScanner:
         recursive: bool,
         current_depth: int,
         max_depth: int,
+        exclusion: Optional[ExclusionMatcher] = None,
     ) -> AsyncGenerator[ScanResult, None]:
-        """Internal scan implementation."""
+        """Internal scan implementation.
+
+        제외 규칙에 적중한 항목은 반환하지 않으며, 폴더인 경우 하위로 내려가지 않습니다.
+        """
         if current_depth > max_depth:
             return
 
@@ -168,13 +188,18 @@ class SMBScanner:
             )
 
             for item in items:
+                if exclusion is not None and exclusion.match(
+                    item.path, is_directory=item.is_directory
+                ):
+                    continue
+
                 yield item
 
                 # Recurse into directories if needed
                 if recursive and item.is_directory:
                     sub_path = f"{path}\\{item.name}"
                     async for sub_item in self._scan_path(
-                        sub_path, recursive, current_depth + 1, max_depth
+                        sub_path, recursive, current_depth + 1, max_depth, exclusion
                     ):
                         yield sub_item
 
@@ -277,7 +302,7 @@ class SMBScanner:
         if not self._connected:
             await self.connect()
 
-        full_path = self._build_path(path)
+        full_path = self.build_path(path)
 
         try:
             info = await asyncio.get_event_loop().run_in_executor(
@@ -4,19 +4,23 @@ SMB Scanner를 사용하여 NAS를 스캔하고 결과를 DB에 저장합니다.
 """
 
 import logging
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import PurePosixPath
 from typing import Optional
 from uuid import UUID
 
+from sqlalchemy import delete, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from .exclusion_rules import ExclusionMatcher, get_exclusion_matcher
 from .smb_scanner import SMBScanner, ScanResult
 from .folder_service import NASFolderService
 from .file_service import NASFileService
-from ...models.nas_file import FileCategory
+from ...models.nas_file import FileCategory, NASFile
 from ...models.project import ProjectCode
+from ...orchestrator.event_bus import EventBus, get_event_bus
+from ...orchestrator.events import Event, EventType
 
 logger = logging.getLogger(__name__)
 
@@ -30,6 +34,9 @@ METADATA_EXTENSIONS = {".json", ".xml", ".srt", ".vtt", ".nfo", ".txt"}
 # Archive extensions
 ARCHIVE_EXTENSIONS = {".zip", ".rar", ".7z", ".tar", ".gz"}
 
+# NAS_FILE_* 이벤트 하나에 담는 최대 파일 수
+EVENT_BATCH_SIZE = 500
+
 
 @dataclass
 class SyncStats:
@@ -40,9 +47,12 @@ class SyncStats:
     files_created: int = 0
     files_updated: int = 0
     files_skipped: int = 0
+    files_excluded: int = 0  # 제외 규칙으로 새로 is_excluded 처리된 기존 파일
+    files_removed: int = 0  # 스캔한 폴더에서 사라진 파일 (DB에서 삭제)
     errors: int = 0
     total_size_bytes: int = 0
     duration_seconds: float = 0.0
+    exclusion_hits: dict[str, int] = field(default_factory=dict)  # 규칙별 적중 수
 
 
 class NASSyncService:
@@ -54,12 +64,24 @@ class NASSyncService:
             print(f"Created {stats.folders_created} folders")
     """
 
-    def __init__(self, session: AsyncSession) -> None:
+    def __init__(
+        self, session: AsyncSession, event_bus: Optional[EventBus] = None
+    ) -> None:
         """Initialize sync service."""
         self.session = session
         self.folder_service = NASFolderService(session)
         self.file_service = NASFileService(session)
         self.scanner: Optional[SMBScanner] = None
+        self.event_bus = event_bus or get_event_bus()
+        self._reset_changes()
+
+    def _reset_changes(self) -> None:
+        """스캔 중 수집하는 변경 내역 초기화."""
+        self._added: list[UUID] = []
+        self._changed: list[UUID] = []
+        self._removed: list[dict] = []  # {"nas_file_id", "video_file_id"}
+        self._seen_paths: set[str] = set()
+        self._listed_folders: set[str] = set()
 
     async def __aenter__(self) -> "NASSyncService":
         """Start scanner connection."""
@@ -80,23 +102,23 @@ class NASSyncService:
         logger.info("Starting full NAS sync...")
         start_time = datetime.now()
         stats = SyncStats()
+        exclusion = get_exclusion_matcher()
 
         try:
-            async for result in self.scanner.scan_directory(
-                path="",
-                recursive=True,
-                max_depth=max_depth,
-            ):
-                await self._process_scan_result(result, stats)
-
+            await self._scan(
+                "", max_depth=max_depth, exclusion=exclusion, stats=stats
+            )
+            await self._apply_exclusions(exclusion, stats)
             await self.session.commit()
 
         except Exception as e:
             logger.error(f"Sync error: {e}")
             stats.errors += 1
             await self.session.rollback()
+            self._reset_changes()
             raise
 
+        await self._publish_changes()
         stats.duration_seconds = (datetime.now() - start_time).total_seconds()
         logger.info(
             f"NAS sync complete: {stats.folders_created} folders, "
@@ -126,23 +148,24 @@ class NASSyncService:
         logger.info(f"Syncing project {project_code} from {nas_path}...")
         start_time = datetime.now()
         stats = SyncStats()
+        exclusion = get_exclusion_matcher(project_code)
 
         try:
-            async for result in self.scanner.scan_directory(
-                path=nas_path,
-                recursive=True,
-                max_depth=max_depth,
-            ):
-                await self._process_scan_result(result, stats)
-
+            root = await self._scan(
+                nas_path, max_depth=max_depth, exclusion=exclusion, stats=stats
+            )
+            # 프로젝트 전용 규칙은 해당 프로젝트 폴더 아래 파일에만 적용
+            await self._apply_exclusions(exclusion, stats, path_prefix=root)
             await self.session.commit()
 
         except Exception as e:
             logger.error(f"Sync error for {project_code}: {e}")
             stats.errors += 1
             await self.session.rollback()
+            self._reset_changes()
             raise
 
+        await self._publish_changes()
         stats.duration_seconds = (datetime.now() - start_time).total_seconds()
         logger.info(
             f"Project {project_code} sync complete: "
@@ -150,6 +173,113 @@ class NASSyncService:
         )
         return stats
 
+    async def _scan(
+        self,
+        path: str,
+        *,
+        max_depth: int,
+        exclusion: ExclusionMatcher,
+        stats: SyncStats,
+    ) -> str:
+        """스캔 결과를 DB에 반영하고 스캔한 폴더에서 사라진 파일을 삭제 → 정규화한 루트 경로."""
+        self._reset_changes()
+        root = self._normalize_path(self.scanner.build_path(path))
+        self._listed_folders.add(root)
+        root_depth = root.count("/")
+
+        async for result in self.scanner.scan_directory(
+            path=path,
+            recursive=True,
+            max_depth=max_depth,
+            exclusion=exclusion,
+        ):
+            if result.is_directory:
+                folder_path = self._normalize_path(result.path)
+                # 스캐너는 루트 기준 깊이 max_depth까지의 폴더만 나열
+                if folder_path.count("/") - root_depth <= max_depth:
+                    self._listed_folders.add(folder_path)
+            else:
+                self._seen_paths.add(self._normalize_path(result.path))
+            await self._process_scan_result(result, stats)
+
+        await self._remove_missing_files(root, exclusion, stats)
+        return root
+
+    async def _remove_missing_files(
+        self, root: str, exclusion: ExclusionMatcher, stats: SyncStats
+    ) -> None:
+        """나열한 폴더에 있었지만 이번 스캔에서 보이지 않은 파일 삭제.
+
+        제외 규칙에 적중한 파일은 스캐너가 반환하지 않으므로 삭제하지 않습니다
+        (_apply_exclusions에서 is_excluded 처리).
+        """
+        rows = await self.session.execute(
+            select(NASFile.id, NASFile.file_path, NASFile.video_file_id).where(
+                NASFile.file_path.startswith(root + "/", autoescape=True)
+            )
+        )
+        for row in rows:
+            if row.file_path in self._seen_paths:
+                continue
+            if self._get_parent_path(row.file_path) not in self._listed_folders:
+                continue
+            if exclusion.match_path(row.file_path):
+                continue
+            self._removed.append(
+                {"nas_file_id": row.id, "video_file_id": row.video_file_id}
+            )
+
+        removed_ids = [item["nas_file_id"] for item in self._removed]
+        for start in range(0, len(removed_ids), EVENT_BATCH_SIZE):
+            await self.session.execute(
+                delete(NASFile)
+                .where(NASFile.id.in_(removed_ids[start:start + EVENT_BATCH_SIZE]))
+                .execution_options(synchronize_session=False)
+            )
+        stats.files_removed += len(removed_ids)
+
+    async def _publish_changes(self) -> None:
+        """커밋된 변경 내역을 NAS_FILE_* 이벤트로 배치 발행."""
+        batches = (
+            (EventType.NAS_FILE_ADDED, [{"nas_file_id": i} for i in self._added]),
+            (EventType.NAS_FILE_CHANGED, [{"nas_file_id": i} for i in self._changed]),
+            (EventType.NAS_FILE_REMOVED, self._removed),
+        )
+        for event_type, items in batches:
+            for start in range(0, len(items), EVENT_BATCH_SIZE):
+                chunk = items[start:start + EVENT_BATCH_SIZE]
+                payload = {"nas_file_ids": [str(item["nas_file_id"]) for item in chunk]}
+                if event_type == EventType.NAS_FILE_REMOVED:
+                    payload["video_file_ids"] = [
+                        str(item["video_file_id"])
+                        for item in chunk
+                        if item["video_file_id"] is not None
+                    ]
+                await self.event_bus.emit(
+                    Event(type=event_type, payload=payload, source_block="A")
+                )
+        self._reset_changes()
+
+    async def _apply_exclusions(
+        self,
+        exclusion: ExclusionMatcher,
+        stats: SyncStats,
+        *,
+        path_prefix: Optional[str] = None,
+    ) -> None:
+        """이전 스캔에서 저장된 파일에 제외 규칙을 일괄 반영하고 적중 수 기록.
+
+        스캔 중 적중한 폴더/파일은 매처가 경로별로 한 번만 세므로
+        저장 파일 판정에서 다시 적중해도 exclusion_hits가 중복되지 않습니다.
+        """
+        marked = await self.file_service.apply_exclusion_rules(
+            exclusion, path_prefix=path_prefix
+        )
+        stats.files_excluded += sum(marked.values())
+        stats.exclusion_hits = exclusion.hit_counts()
+        if stats.exclusion_hits:
+            logger.info(f"Exclusion rule hits: {stats.exclusion_hits}")
+
     def _get_project_nas_path(self, project_code: str) -> Optional[str]:
         """Get NAS path for project code."""
         # Map project codes to NAS paths
@@ -235,6 +365,7 @@ class NASSyncService:
             )
 
         if created:
+            self._added.append(file.id)
             stats.files_created += 1
             stats.total_size_bytes += result.size_bytes
             logger.debug(f"Created file: {result.name}")
@@ -253,6 +384,7 @@ class NASSyncService:
                     file_size_bytes=result.size_bytes,
                     file_mtime=result.modified_time,
                 )
+                self._changed.append(file.id)
                 stats.files_updated += 1
             else:
                 stats.files_skipped += 1
@@ -4,13 +4,20 @@ Google Sheets synchronization services.
 """
 
 from .sheets_client import SheetsClient
+from .async_sheets_client import AsyncSheetsClient
 from .sync_service import SheetsSyncService
 from .row_mapper import RowMapper, MappedHandClip
 from .data_mapper import SheetsDataMapper, TagClassifier, PlayerMatcher, SyncResult
 from .sync_engine import SheetsSyncEngine, EngineSyncResult
+from .bulk_ingestor import HandClipBulkIngestor
+from .resolution_cache import PlayerTagCache, get_player_tag_cache
+from .quota import QuotaClass, QuotaManager, TokenBucket, get_quota_manager
+from .parallel_sync import ParallelSheetsSync
+from .clip_dedup import ClipDeduplicator, ClipRecord, DedupStats, HandClipDeduplicator
 
 __all__ = [
     "SheetsClient",
+    "AsyncSheetsClient",
     "SheetsSyncService",
     "RowMapper",
     "MappedHandClip",
@@ -20,4 +27,16 @@ __all__ = [
     "SyncResult",
     "SheetsSyncEngine",
     "EngineSyncResult",
+    "HandClipBulkIngestor",
+    "PlayerTagCache",
+    "get_player_tag_cache",
+    "QuotaClass",
+    "QuotaManager",
+    "TokenBucket",
+    "get_quota_manager",
+    "ParallelSheetsSync",
+    "ClipDeduplicator",
+    "ClipRecord",
+    "DedupStats",
+    "HandClipDeduplicator",
 ]
@@ -0,0 +1,329 @@
+"""Async Google Sheets Client - Block D (Sheets Sync Agent).
+
+httpx 기반 비동기 Sheets API v4 클라이언트.
+
+- 이벤트 루프를 막지 않음 (토큰 갱신만 스레드에서 실행)
+- values:batchGet 한 번에 여러 행 범위 조회
+- fields 마스크로 응답 크기 축소
+- 여러 탭 동시 조회 (read_tabs)
+- 공유 QuotaManager로 쿼터 대기 및 429/5xx 재시도
+"""
+
+import asyncio
+import os
+from typing import Any, Optional, Sequence
+
+import httpx
+
+from .quota import QuotaClass, QuotaManager, get_quota_manager
+from .sheets_client import SheetRange
+
+DEFAULT_BASE_URL = "https://sheets.googleapis.com/v4"
+
+# 응답 fields 마스크
+VALUES_FIELDS = "valueRanges(range,values)"
+METADATA_FIELDS = (
+    "properties(title),"
+    "sheets(properties(sheetId,title,gridProperties(rowCount,columnCount)))"
+)
+
+
+def _http_status(error: Exception) -> Optional[int]:
+    """httpx 상태 오류의 HTTP 상태 (그 외 예외는 None)."""
+    if isinstance(error, httpx.HTTPStatusError):
+        return error.response.status_code
+    return None
+
+
+def row_range(sheet_name: str, start_row: int, end_row: int) -> str:
+    """행 범위 A1 표기 ('Sheet'!A{start}:ZZ{end})."""
+    return f"'{sheet_name}'!A{start_row}:ZZ{end_row}"
+
+
+class AsyncSheetsClient:
+    """비동기 Google Sheets API 클라이언트.
+
+    SheetsClient와 같은 메서드를 코루틴으로 제공합니다.
+    base_url을 바꾸면 (로컬 fake 서버 등) 자격 증명 없이 호출할 수 있습니다.
+    """
+
+    SCOPES = ["https://www.googleapis.com/auth/spreadsheets.readonly"]
+
+    def __init__(
+        self,
+        credentials_path: Optional[str] = None,
+        *,
+        base_url: str = DEFAULT_BASE_URL,
+        max_concurrency: int = 4,
+        pages_per_request: int = 10,
+        timeout: float = 30.0,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        quota: Optional[QuotaManager] = None,
+    ) -> None:
+        """Initialize async sheets client.
+
+        Args:
+            credentials_path: Path to service account JSON file.
+                             Defaults to GOOGLE_APPLICATION_CREDENTIALS env var.
+            base_url: Sheets API base URL.
+            max_concurrency: 동시에 진행할 API 요청 수.
+            pages_per_request: read_all_rows가 batchGet 한 번에 요청할 페이지 수.
+            timeout: 요청 타임아웃 (초).
+            transport: httpx transport (테스트용).
+            quota: 요청 스케줄러 (기본값: 프로세스 공유 QuotaManager).
+        """
+        self.credentials_path = credentials_path or os.getenv(
+            "GOOGLE_APPLICATION_CREDENTIALS"
+        )
+        self.base_url = base_url.rstrip("/")
+        self.pages_per_request = max(1, pages_per_request)
+        self.quota = quota or get_quota_manager()
+        self._semaphore = asyncio.Semaphore(max(1, max_concurrency))
+        self._client = httpx.AsyncClient(
+            base_url=self.base_url, timeout=timeout, transport=transport
+        )
+        self._credentials = None
+        self._credentials_lock = asyncio.Lock()
+
+    async def __aenter__(self) -> "AsyncSheetsClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """HTTP 연결 종료."""
+        await self._client.aclose()
+
+    async def _auth_headers(self) -> dict[str, str]:
+        """Authorization 헤더 (만료 시 토큰 갱신은 스레드에서 실행)."""
+        if self.credentials_path is None:
+            if self.base_url == DEFAULT_BASE_URL:
+                raise ValueError(
+                    "No credentials path provided. "
+                    "Set GOOGLE_APPLICATION_CREDENTIALS env var."
+                )
+            return {}
+
+        async with self._credentials_lock:
+            if self._credentials is None:
+                from google.oauth2.service_account import Credentials
+
+                self._credentials = await asyncio.to_thread(
+                    Credentials.from_service_account_file,
+                    self.credentials_path,
+                    scopes=self.SCOPES,
+                )
+            if not self._credentials.valid:
+                from google.auth.transport.requests import Request
+
+                await asyncio.to_thread(self._credentials.refresh, Request())
+        return {"Authorization": f"Bearer {self._credentials.token}"}
+
+    async def _get(self, path: str, params: list[tuple[str, str]]) -> dict[str, Any]:
+        headers = await self._auth_headers()
+
+        async def request() -> dict[str, Any]:
+            async with self._semaphore:
+                response = await self._client.get(path, params=params, headers=headers)
+            response.raise_for_status()
+            return response.json()
+
+        return await self.quota.call_async(QuotaClass.READ, request, _http_status)
+
+    async def batch_get(
+        self,
+        spreadsheet_id: str,
+        ranges: Sequence[str],
+    ) -> list[list[list[Any]]]:
+        """여러 범위를 values:batchGet 한 번으로 조회.
+
+        Args:
+            spreadsheet_id: The spreadsheet ID.
+            ranges: A1 notation ranges.
+
+        Returns:
+            범위 순서대로 각 범위의 행 목록 (빈 범위는 []).
+        """
+        if not ranges:
+            return []
+        params = [("ranges", r) for r in ranges]
+        params += [("majorDimension", "ROWS"), ("fields", VALUES_FIELDS)]
+        result = await self._get(
+            f"/spreadsheets/{spreadsheet_id}/values:batchGet", params
+        )
+        value_ranges = result.get("valueRanges", [])
+        return [
+            value_ranges[i].get("values", []) if i < len(value_ranges) else []
+            for i in range(len(ranges))
+        ]
+
+    async def read_range(
+        self,
+        spreadsheet_id: str,
+        range_name: str,
+    ) -> list[list[Any]]:
+        """Read a range from a spreadsheet.
+
+        Args:
+            spreadsheet_id: The spreadsheet ID.
+            range_name: A1 notation range (e.g., "Sheet1!A1:Z100").
+
+        Returns:
+            List of rows, each row is a list of cell values.
+        """
+        (values,) = await self.batch_get(spreadsheet_id, [range_name])
+        return values
+
+    async def read_all_rows(
+        self,
+        spreadsheet_id: str,
+        sheet_name: str,
+        *,
+        start_row: int = 1,
+        batch_size: int = 1000,
+    ) -> SheetRange:
+        """Read all rows from a sheet.
+
+        요청마다 batch_size 행 페이지 pages_per_request개를 batchGet으로 묶어 조회합니다.
+
+        Args:
+            spreadsheet_id: The spreadsheet ID.
+            sheet_name: Name of the sheet tab.
+            start_row: Row to start from (1-indexed).
+            batch_size: Number of rows per page.
+
+        Returns:
+            SheetRange with all data.
+        """
+        all_values: list[list[Any]] = []
+        current_row = start_row
+
+        while True:
+            ranges = [
+                row_range(
+                    sheet_name,
+                    current_row + i * batch_size,
+                    current_row + (i + 1) * batch_size - 1,
+                )
+                for i in range(self.pages_per_request)
+            ]
+            pages = await self.batch_get(spreadsheet_id, ranges)
+
+            exhausted = False
+            for values in pages:
+                all_values.extend(values)
+                if len(values) < batch_size:
+                    # 페이지 안의 뒤쪽 빈 행은 API가 잘라내므로 여기서 끝
+                    exhausted = True
+                    break
+            if exhausted:
+                break
+            current_row += batch_size * self.pages_per_request
+
+        return SheetRange(
+            sheet_name=sheet_name,
+            start_row=start_row,
+            end_row=start_row + len(all_values) - 1,
+            values=all_values,
+        )
+
+    async def read_rows_from(
+        self,
+        spreadsheet_id: str,
+        sheet_name: str,
+        start_row: int,
+        limit: int = 100,
+    ) -> SheetRange:
+        """Read specific rows from a sheet.
+
+        Args:
+            spreadsheet_id: The spreadsheet ID.
+            sheet_name: Name of the sheet tab.
+            start_row: Row to start from (1-indexed).
+            limit: Maximum number of rows to fetch.
+
+        Returns:
+            SheetRange with requested data.
+        """
+        values = await self.read_range(
+            spreadsheet_id, row_range(sheet_name, start_row, start_row + limit - 1)
+        )
+        return SheetRange(
+            sheet_name=sheet_name,
+            start_row=start_row,
+            end_row=start_row + len(values) - 1 if values else start_row,
+            values=values,
+        )
+
+    async def read_tabs(
+        self,
+        spreadsheet_id: str,
+        sheet_names: Sequence[str],
+        *,
+        start_row: int = 1,
+        batch_size: int = 1000,
+    ) -> dict[str, SheetRange]:
+        """여러 탭의 전체 행을 동시에 조회.
+
+        Args:
+            spreadsheet_id: The spreadsheet ID.
+            sheet_names: 조회할 탭 이름.
+            start_row: Row to start from (1-indexed).
+            batch_size: Number of rows per page.
+
+        Returns:
+            탭 이름 → SheetRange.
+        """
+        ranges = await asyncio.gather(
+            *(
+                self.read_all_rows(
+                    spreadsheet_id, name, start_row=start_row, batch_size=batch_size
+                )
+                for name in sheet_names
+            )
+        )
+        return dict(zip(sheet_names, ranges))
+
+    async def get_sheet_metadata(
+        self,
+        spreadsheet_id: str,
+    ) -> dict[str, Any]:
+        """Get spreadsheet metadata including sheet names.
+
+        Args:
+            spreadsheet_id: The spreadsheet ID.
+
+        Returns:
+            Spreadsheet metadata dict.
+        """
+        result = await self._get(
+            f"/spreadsheets/{spreadsheet_id}", [("fields", METADATA_FIELDS)]
+        )
+        return {
+            "title": result.get("properties", {}).get("title"),
+            "sheets": [
+                {
+                    "id": sheet["properties"]["sheetId"],
+                    "title": sheet["properties"]["title"],
+                    "row_count": sheet["properties"]["gridProperties"]["rowCount"],
+                    "column_count": sheet["properties"]["gridProperties"]["columnCount"],
+                }
+                for sheet in result.get("sheets", [])
+            ],
+        }
+
+    async def get_sheet_names(
+        self,
+        spreadsheet_id: str,
+    ) -> list[str]:
+        """Get list of sheet names in a spreadsheet.
+
+        Args:
+            spreadsheet_id: The spreadsheet ID.
+
+        Returns:
+            List of sheet names.
+        """
+        metadata = await self.get_sheet_metadata(spreadsheet_id)
+        return [sheet["title"] for sheet in metadata["sheets"]]
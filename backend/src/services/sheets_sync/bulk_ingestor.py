@@ -0,0 +1,345 @@
+"""Bulk Ingestor - Block D (Sheets Sync Agent).
+
+RowMapper로 매핑한 시트 행 배치를 한 번에 저장합니다.
+
+- hand_clips: (sheet_source, sheet_row_number) 기준 UPSERT (시트별 갱신 컬럼, 시트당 한 문장)
+- players/tags: 이름 일괄 조회 후 누락분만 INSERT ... ON CONFLICT DO NOTHING
+  (resolution_cache가 있으면 공유 PlayerTagCache로 해석)
+- hand_clip_players/hand_clip_tags: INSERT ... ON CONFLICT DO NOTHING
+- 기존 행은 sheet_row_hash가 같으면 건너뛰고, 바뀐 행만 UPSERT 후 연결을 교체
+
+ORM 인스턴스를 거치지 않으므로 HandClip의 @validates가 실행되지 않습니다.
+normalized_folder_link와 path_match_status는 여기서 직접 계산합니다.
+"""
+
+from collections import defaultdict
+from typing import TYPE_CHECKING, Any, Iterable, Optional, Sequence
+from uuid import UUID, uuid4
+
+from sqlalchemy import case, delete, func, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ...models.hand_clip import (
+    HandClip,
+    PathMatchStatus,
+    hand_clip_players,
+    hand_clip_tags,
+)
+from ...models.player import Player
+from ...models.tag import Tag
+from ..matching.path_matcher import PathNormalizer
+from .data_mapper import PlayerMatcher, SyncResult, TagClassifier
+from .row_mapper import MappedHandClip, RowMapper
+
+if TYPE_CHECKING:
+    from .resolution_cache import PlayerTagCache
+
+# 시트에서 오는 컬럼 (UPSERT 시 갱신 대상)
+SHEET_COLUMNS = (
+    "title",
+    "timecode",
+    "timecode_end",
+    "timecode_seconds",
+    "timecode_end_seconds",
+    "duration_seconds",
+    "notes",
+    "hand_grade",
+    "pot_size",
+    "winner_hand",
+    "hands_involved",
+    "nas_folder_link",
+    "normalized_folder_link",
+    "sheet_file_name",
+    "sheet_row_hash",
+)
+
+# ICONIK_METADATA 행이 채우는 컬럼 (행별 저장 _save_iconik_row와 같은 범위).
+# 나머지 컬럼은 ICONIK 시트에 없으므로 기존 값을 NULL로 덮어쓰지 않음
+ICONIK_COLUMNS = (
+    "title",
+    "timecode",
+    "timecode_seconds",
+    "duration_seconds",
+    "notes",
+    "sheet_row_hash",
+)
+
+# sheet_source → UPSERT 시 갱신할 컬럼 (없으면 SHEET_COLUMNS)
+COLUMNS_BY_SOURCE = {"ICONIK_METADATA": ICONIK_COLUMNS}
+
+
+def dialect_insert(session: AsyncSession, table):
+    """세션 dialect의 INSERT (on_conflict_do_nothing/do_update 지원)."""
+    dialect = session.get_bind().dialect.name
+    if dialect == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    elif dialect == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert
+    else:
+        raise NotImplementedError(f"Upsert is not supported for dialect: {dialect}")
+    return insert(table)
+
+
+class HandClipBulkIngestor:
+    """매핑된 시트 행 배치를 bulk UPSERT로 저장하는 서비스."""
+
+    # IN 목록 청크 크기
+    CHUNK_SIZE = 1000
+
+    def __init__(
+        self,
+        session: AsyncSession,
+        resolution_cache: Optional["PlayerTagCache"] = None,
+    ) -> None:
+        self.session = session
+        # 있으면 선수/태그 해석을 공유 캐시에 맡김
+        self.resolution_cache = resolution_cache
+        # 이 인스턴스가 새로 INSERT한 선수 이름 / (카테고리, 태그 이름)
+        self.created_players: set[str] = set()
+        self.created_tags: set[tuple[str, str]] = set()
+
+    def _chunks(self, values: Iterable[Any]) -> Iterable[list[Any]]:
+        items = list(values)
+        for start in range(0, len(items), self.CHUNK_SIZE):
+            yield items[start:start + self.CHUNK_SIZE]
+
+    @staticmethod
+    def to_row(clip: MappedHandClip) -> dict[str, Any]:
+        """MappedHandClip → hand_clips 행 (validates 대신 정규화 링크/타임코드 초 계산)."""
+        return {
+            "sheet_source": clip.sheet_source,
+            "sheet_row_number": clip.row_number,
+            "title": clip.title,
+            "timecode": clip.timecode,
+            "timecode_end": clip.timecode_end,
+            "timecode_seconds": RowMapper.timecode_seconds(clip.timecode),
+            "timecode_end_seconds": RowMapper.timecode_seconds(clip.timecode_end),
+            "duration_seconds": clip.duration_seconds,
+            "notes": clip.notes,
+            "hand_grade": clip.hand_grade,
+            "pot_size": clip.pot_size,
+            "winner_hand": clip.winner_hand,
+            "hands_involved": clip.hands_involved,
+            "nas_folder_link": clip.nas_folder_link,
+            "sheet_file_name": clip.sheet_file_name,
+            "sheet_row_hash": clip.content_hash,
+            "normalized_folder_link": (
+                PathNormalizer.normalize(clip.nas_folder_link)
+                if clip.nas_folder_link
+                else None
+            ),
+        }
+
+    async def ingest(self, clips: Sequence[MappedHandClip]) -> SyncResult:
+        """배치 저장.
+
+        Args:
+            clips: RowMapper 매핑 결과 (None 제외)
+
+        Returns:
+            SyncResult (created/updated/unchanged 수)
+        """
+        result = SyncResult()
+        # 같은 행이 배치에 두 번 있으면 마지막 값 사용 (ON CONFLICT는 한 행을 두 번 갱신 불가)
+        by_key = {(c.sheet_source, c.row_number): c for c in clips}
+        if not by_key:
+            return result
+
+        existing = await self._existing_hashes(by_key.keys())
+        changed = {
+            key: clip
+            for key, clip in by_key.items()
+            if key not in existing
+            or clip.content_hash is None
+            or existing[key] != clip.content_hash
+        }
+        result.unchanged = len(by_key) - len(changed)
+        if not changed:
+            return result
+
+        clip_ids = await self._upsert_clips([self.to_row(c) for c in changed.values()])
+        result.created = sum(1 for key in clip_ids if key not in existing)
+        result.updated = len(clip_ids) - result.created
+
+        # 갱신된 클립은 시트에서 빠진 선수/태그도 반영되도록 연결을 다시 만듦
+        updated_ids = [clip_ids[key] for key in clip_ids if key in existing]
+        await self._unlink(hand_clip_players, updated_ids)
+        await self._unlink(hand_clip_tags, updated_ids)
+
+        player_ids = await self.resolve_players(
+            name for c in changed.values() for name in c.player_names
+        )
+        tag_ids = await self.resolve_tags(
+            name for c in changed.values() for name in c.tag_names
+        )
+
+        player_links: set[tuple[UUID, UUID]] = set()
+        tag_links: set[tuple[UUID, UUID]] = set()
+        for key, clip in changed.items():
+            clip_id = clip_ids[key]
+            for name in clip.player_names:
+                player_links.add((clip_id, player_ids[PlayerMatcher.normalize_name(name)]))
+            for name in clip.tag_names:
+                tag_links.add((clip_id, tag_ids[name]))
+
+        await self._link(hand_clip_players, "player_id", player_links)
+        await self._link(hand_clip_tags, "tag_id", tag_links)
+        return result
+
+    async def _existing_hashes(
+        self, keys: Iterable[tuple[str, int]]
+    ) -> dict[tuple[str, int], Optional[str]]:
+        """이미 저장된 (sheet_source, sheet_row_number) → sheet_row_hash."""
+        by_source: dict[str, list[int]] = defaultdict(list)
+        for source, row_number in keys:
+            by_source[source].append(row_number)
+
+        existing: dict[tuple[str, int], Optional[str]] = {}
+        for source, row_numbers in by_source.items():
+            for chunk in self._chunks(row_numbers):
+                rows = await self.session.execute(
+                    select(HandClip.sheet_row_number, HandClip.sheet_row_hash)
+                    .where(HandClip.sheet_source == source)
+                    .where(HandClip.sheet_row_number.in_(chunk))
+                )
+                existing.update(
+                    {(source, row.sheet_row_number): row.sheet_row_hash for row in rows}
+                )
+        return existing
+
+    async def _upsert_clips(
+        self, rows: list[dict[str, Any]]
+    ) -> dict[tuple[str, int], UUID]:
+        """hand_clips UPSERT → (sheet_source, sheet_row_number) → id.
+
+        시트마다 채우는 컬럼이 다르므로 sheet_source별로 한 문장씩 실행합니다.
+        """
+        by_source: dict[str, list[dict[str, Any]]] = defaultdict(list)
+        for row in rows:
+            row["id"] = uuid4()
+            row["path_match_status"] = PathMatchStatus.PENDING
+            by_source[row["sheet_source"]].append(row)
+
+        clip_ids: dict[tuple[str, int], UUID] = {}
+        for source, source_rows in by_source.items():
+            columns = COLUMNS_BY_SOURCE.get(source, SHEET_COLUMNS)
+            result = await self.session.execute(self._upsert_stmt(columns), source_rows)
+            clip_ids.update({(r.sheet_source, r.sheet_row_number): r.id for r in result})
+        return clip_ids
+
+    def _upsert_stmt(self, columns: Sequence[str]):
+        """충돌 시 columns만 갱신하는 hand_clips INSERT ... ON CONFLICT DO UPDATE."""
+        table = HandClip.__table__
+        stmt = dialect_insert(self.session, table)
+        excluded = stmt.excluded
+        set_ = {name: excluded[name] for name in columns}
+        if "normalized_folder_link" in columns:
+            # 링크가 바뀐 클립만 다음 증분 경로 매칭에서 다시 매칭
+            set_["path_match_status"] = case(
+                (
+                    table.c.normalized_folder_link.is_distinct_from(
+                        excluded.normalized_folder_link
+                    ),
+                    PathMatchStatus.PENDING,
+                ),
+                else_=table.c.path_match_status,
+            )
+        set_["updated_at"] = func.now()
+        return stmt.on_conflict_do_update(
+            index_elements=[table.c.sheet_source, table.c.sheet_row_number],
+            set_=set_,
+        ).returning(table.c.id, table.c.sheet_source, table.c.sheet_row_number)
+
+    async def resolve_players(self, names: Iterable[str]) -> dict[str, UUID]:
+        """정규화한 선수 이름 → Player.id (누락 선수는 일괄 생성)."""
+        if self.resolution_cache is not None:
+            return await self.resolution_cache.resolve_players(self.session, names)
+        normalized = {PlayerMatcher.normalize_name(name) for name in names}
+        normalized.discard("")
+        ids = await self._player_ids(normalized)
+
+        missing = normalized - ids.keys()
+        if missing:
+            table = Player.__table__
+            stmt = (
+                dialect_insert(self.session, table)
+                .on_conflict_do_nothing(index_elements=["name"])
+                .returning(table.c.name)
+            )
+            created = await self.session.execute(
+                stmt,
+                [{"id": uuid4(), "name": n, "name_display": n} for n in sorted(missing)],
+            )
+            self.created_players.update(created.scalars())
+            # 동시 동기화가 먼저 만든 선수 포함
+            ids.update(await self._player_ids(missing))
+        return ids
+
+    async def _player_ids(self, names: set[str]) -> dict[str, UUID]:
+        ids: dict[str, UUID] = {}
+        for chunk in self._chunks(names):
+            rows = await self.session.execute(
+                select(Player.name, Player.id).where(Player.name.in_(chunk))
+            )
+            ids.update({row.name: row.id for row in rows})
+        return ids
+
+    async def resolve_tags(self, names: Iterable[str]) -> dict[str, UUID]:
+        """태그 이름 → Tag.id (카테고리는 TagClassifier, 누락 태그는 일괄 생성)."""
+        if self.resolution_cache is not None:
+            return await self.resolution_cache.resolve_tags(self.session, names)
+        keys = {(TagClassifier.classify(name), name) for name in names}
+        ids = await self._tag_ids(keys)
+
+        missing = keys - ids.keys()
+        if missing:
+            table = Tag.__table__
+            stmt = (
+                dialect_insert(self.session, table)
+                .on_conflict_do_nothing(index_elements=["category", "name"])
+                .returning(table.c.category, table.c.name)
+            )
+            created = await self.session.execute(
+                stmt,
+                [
+                    {"id": uuid4(), "category": category, "name": name, "name_display": name}
+                    for category, name in sorted(missing)
+                ],
+            )
+            self.created_tags.update((row.category, row.name) for row in created)
+            ids.update(await self._tag_ids(missing))
+        return {name: tag_id for (_, name), tag_id in ids.items()}
+
+    async def _tag_ids(self, keys: set[tuple[str, str]]) -> dict[tuple[str, str], UUID]:
+        ids: dict[tuple[str, str], UUID] = {}
+        for chunk in self._chunks(keys):
+            rows = await self.session.execute(
+                select(Tag.category, Tag.name, Tag.id).where(
+                    tuple_(Tag.category, Tag.name).in_(chunk)
+                )
+            )
+            ids.update({(row.category, row.name): row.id for row in rows})
+        return ids
+
+    async def _link(
+        self,
+        table,
+        target_column: str,
+        links: set[tuple[UUID, UUID]],
+    ) -> None:
+        """연결 테이블 INSERT ... ON CONFLICT DO NOTHING."""
+        if not links:
+            return
+        stmt = dialect_insert(self.session, table).on_conflict_do_nothing()
+        for chunk in self._chunks(sorted(links)):
+            await self.session.execute(
+                stmt,
+                [{"hand_clip_id": clip_id, target_column: target} for clip_id, target in chunk],
+            )
+
+    async def _unlink(self, table, clip_ids: list[UUID]) -> None:
+        """클립들의 연결 테이블 행 삭제."""
+        for chunk in self._chunks(clip_ids):
+            await self.session.execute(
+                delete(table).where(table.c.hand_clip_id.in_(chunk))
+            )
@@ -0,0 +1,470 @@
+"""Clip Deduplicator - Block D (Sheets Sync Agent).
+
+같은 핸드가 METADATA_ARCHIVE와 ICONIK_METADATA에 함께 있으면
+(sheet_source, sheet_row_number) 키로는 구분되지 않아 HandClip이 중복됩니다.
+동기화 후 단계로 시트 간 중복을 찾아 대표 클립에 연결합니다.
+
+1. 블로킹: 정규화 제목 / (연결 영상, 타임코드 구간) / (선수 집합, 타임코드 구간)
+   - 타임코드 구간은 폭 2×허용 오차 격자 두 개(반 칸 어긋남)를 사용
+     → 허용 오차 이내의 두 클립은 항상 한 구간을 공유
+   - max_block_size보다 큰 블록(흔한 제목 등)은 건너뜀
+2. 같은 블록 안의 쌍만 점수 계산 (기본: 서로 다른 시트끼리)
+   - 제목 토큰 Jaccard, 타임코드 근접도, 선수 Jaccard, 영상 일치의 가중 평균
+   - 두 클립 모두 영상이 연결돼 있는데 서로 다르면 중복 아님
+3. 임계값 이상 쌍을 점수 높은 순으로 union-find로 묶고 그룹별 대표 선정 (ARCHIVE 우선)
+   - 그룹마다 연결 영상은 하나만 허용: 다른 영상이 연결된 그룹끼리는 합치지 않음
+     (A~B, B~C라도 A와 C의 영상이 다르면 한 그룹이 되지 않음)
+4. 나머지 클립은 duplicate_of_id로 대표에 연결하고, 선수/태그 연결과
+   비어 있는 영상/에피소드를 대표 클립으로 합침
+"""
+
+import logging
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+from itertools import combinations
+from typing import Any, Iterable, Optional, Sequence
+from uuid import UUID
+
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ...config import get_settings
+from ...models.hand_clip import HandClip, hand_clip_players, hand_clip_tags
+from ..matching.title_index import tokenize
+from .bulk_ingestor import dialect_insert
+from .row_mapper import RowMapper
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class ClipRecord:
+    """중복 판정에 쓰는 HandClip 요약."""
+
+    id: UUID
+    sheet_source: Optional[str]
+    sheet_row_number: Optional[int]
+    title_tokens: frozenset[str]
+    timecode_seconds: Optional[int]
+    video_file_id: Optional[UUID]
+    player_ids: frozenset[UUID]
+
+    @classmethod
+    def create(
+        cls,
+        id: UUID,
+        sheet_source: Optional[str],
+        sheet_row_number: Optional[int],
+        title: Optional[str],
+        timecode: Optional[str],
+        video_file_id: Optional[UUID],
+        player_ids: Iterable[UUID] = (),
+    ) -> "ClipRecord":
+        return cls(
+            id=id,
+            sheet_source=sheet_source,
+            sheet_row_number=sheet_row_number,
+            title_tokens=frozenset(tokenize(title)),
+            timecode_seconds=RowMapper.timecode_seconds(timecode),
+            video_file_id=video_file_id,
+            player_ids=frozenset(player_ids),
+        )
+
+
+@dataclass
+class DuplicateGroup:
+    """중복 그룹."""
+
+    canonical_id: UUID
+    # 중복 클립 id → 그룹 안에서 받은 최고 쌍 점수
+    duplicates: dict[UUID, float]
+
+
+@dataclass
+class DedupStats:
+    """중복 제거 통계."""
+
+    total_clips: int = 0
+    blocks: int = 0
+    oversized_blocks: int = 0
+    candidate_pairs: int = 0
+    duplicate_pairs: int = 0
+    # 그룹의 연결 영상이 달라 합치지 않은 쌍
+    video_conflicts: int = 0
+    groups: int = 0
+    duplicates: int = 0
+    # 이번 실행에서 duplicate_of_id가 새로 설정/해제된 클립
+    linked: int = 0
+    unlinked: int = 0
+    # 대표는 같고 duplicate_score만 다시 계산돼 갱신된 클립
+    rescored: int = 0
+    elapsed_seconds: float = 0.0
+    samples: list[dict[str, Any]] = field(default_factory=list)
+
+    @property
+    def clips_per_second(self) -> float:
+        return self.total_clips / self.elapsed_seconds if self.elapsed_seconds else 0.0
+
+
+class ClipDeduplicator:
+    """블로킹 키 + 쌍 점수 기반 HandClip 중복 판정 (DB 없이 메모리에서 계산)."""
+
+    WEIGHTS = {"title": 0.35, "timecode": 0.35, "players": 0.2, "video": 0.1}
+    # 대표 클립 우선순위 (등급/팟/NAS 링크가 있는 ARCHIVE 우선)
+    SOURCE_PRIORITY = {"METADATA_ARCHIVE": 0, "ICONIK_METADATA": 1}
+
+    def __init__(
+        self,
+        *,
+        threshold: float = 0.8,
+        timecode_tolerance: int = 5,
+        max_block_size: int = 200,
+        cross_source_only: bool = True,
+    ) -> None:
+        self.threshold = threshold
+        self.timecode_tolerance = max(1, timecode_tolerance)
+        self.max_block_size = max_block_size
+        self.cross_source_only = cross_source_only
+
+    def blocking_keys(self, clip: ClipRecord) -> list[tuple]:
+        """클립이 속하는 블록 키."""
+        keys: list[tuple] = []
+        if clip.title_tokens:
+            keys.append(("title", " ".join(sorted(clip.title_tokens))))
+        if clip.timecode_seconds is not None:
+            width = 2 * self.timecode_tolerance
+            for offset in (0, self.timecode_tolerance):
+                cell = (clip.timecode_seconds + offset) // width
+                if clip.video_file_id is not None:
+                    keys.append(("video", clip.video_file_id, offset, cell))
+                if clip.player_ids:
+                    keys.append(("players", clip.player_ids, offset, cell))
+        return keys
+
+    def candidate_pairs(
+        self,
+        clips: Sequence[ClipRecord],
+        stats: Optional[DedupStats] = None,
+    ) -> set[tuple[int, int]]:
+        """같은 블록을 공유하는 (i, j) 인덱스 쌍 (i < j)."""
+        stats = stats or DedupStats()
+        blocks: dict[tuple, list[int]] = defaultdict(list)
+        for index, clip in enumerate(clips):
+            for key in self.blocking_keys(clip):
+                blocks[key].append(index)
+
+        pairs: set[tuple[int, int]] = set()
+        for members in blocks.values():
+            if len(members) < 2:
+                continue
+            stats.blocks += 1
+            if len(members) > self.max_block_size:
+                stats.oversized_blocks += 1
+                continue
+            for a, b in combinations(members, 2):
+                if self.cross_source_only and clips[a].sheet_source == clips[b].sheet_source:
+                    continue
+                pairs.add((a, b))
+        stats.candidate_pairs += len(pairs)
+        return pairs
+
+    def score(self, a: ClipRecord, b: ClipRecord) -> float:
+        """두 클립이 같은 핸드일 점수 (0.0 ~ 1.0).
+
+        양쪽 모두 값이 있는 특징만 가중 평균하며, 그런 특징이 2개 미만이면 0.
+        """
+        if a.video_file_id and b.video_file_id and a.video_file_id != b.video_file_id:
+            return 0.0
+
+        total = 0.0
+        weight = 0.0
+        features = 0
+        if a.title_tokens and b.title_tokens:
+            common = len(a.title_tokens & b.title_tokens)
+            jaccard = common / (len(a.title_tokens) + len(b.title_tokens) - common)
+            total += self.WEIGHTS["title"] * jaccard
+            weight += self.WEIGHTS["title"]
+            features += 1
+        if a.timecode_seconds is not None and b.timecode_seconds is not None:
+            diff = abs(a.timecode_seconds - b.timecode_seconds)
+            # 허용 오차 이내면 1, 2×허용 오차에서 0까지 선형 감소
+            closeness = min(1.0, max(0.0, 2.0 - diff / self.timecode_tolerance))
+            total += self.WEIGHTS["timecode"] * closeness
+            weight += self.WEIGHTS["timecode"]
+            features += 1
+        if a.player_ids and b.player_ids:
+            common = len(a.player_ids & b.player_ids)
+            jaccard = common / (len(a.player_ids) + len(b.player_ids) - common)
+            total += self.WEIGHTS["players"] * jaccard
+            weight += self.WEIGHTS["players"]
+            features += 1
+        if a.video_file_id and b.video_file_id:
+            total += self.WEIGHTS["video"]
+            weight += self.WEIGHTS["video"]
+            features += 1
+
+        if features < 2:
+            return 0.0
+        return total / weight
+
+    def _canonical_key(self, clip: ClipRecord) -> tuple:
+        return (
+            self.SOURCE_PRIORITY.get(clip.sheet_source, len(self.SOURCE_PRIORITY)),
+            clip.sheet_row_number if clip.sheet_row_number is not None else float("inf"),
+            str(clip.id),
+        )
+
+    def find_duplicates(
+        self,
+        clips: Sequence[ClipRecord],
+        stats: Optional[DedupStats] = None,
+    ) -> list[DuplicateGroup]:
+        """중복 그룹 (대표 클립 + 중복 클립) 목록."""
+        stats = stats or DedupStats()
+        stats.total_clips += len(clips)
+
+        parent = list(range(len(clips)))
+        # root → 그룹의 연결 영상 (없으면 None)
+        group_video = [clip.video_file_id for clip in clips]
+
+        def find(i: int) -> int:
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]
+                i = parent[i]
+            return i
+
+        scored = []
+        for a, b in self.candidate_pairs(clips, stats):
+            score = self.score(clips[a], clips[b])
+            if score >= self.threshold:
+                scored.append((score, a, b))
+        # 영상 충돌 시 점수가 높은 연결을 먼저 반영
+        scored.sort(key=lambda item: (-item[0], item[1], item[2]))
+
+        best: dict[int, float] = {}
+        for score, a, b in scored:
+            stats.duplicate_pairs += 1
+            root_a, root_b = find(a), find(b)
+            if root_a != root_b:
+                video_a, video_b = group_video[root_a], group_video[root_b]
+                if video_a and video_b and video_a != video_b:
+                    stats.video_conflicts += 1
+                    continue
+                parent[root_b] = root_a
+                group_video[root_a] = video_a or video_b
+            best[a] = max(best.get(a, 0.0), score)
+            best[b] = max(best.get(b, 0.0), score)
+
+        members_by_root: dict[int, list[int]] = defaultdict(list)
+        for index in best:
+            members_by_root[find(index)].append(index)
+
+        groups = []
+        for members in members_by_root.values():
+            canonical = min(members, key=lambda i: self._canonical_key(clips[i]))
+            groups.append(
+                DuplicateGroup(
+                    canonical_id=clips[canonical].id,
+                    duplicates={
+                        clips[i].id: round(best[i], 4) for i in members if i != canonical
+                    },
+                )
+            )
+        stats.groups += len(groups)
+        stats.duplicates += sum(len(g.duplicates) for g in groups)
+        return groups
+
+
+class HandClipDeduplicator:
+    """HandClip 시트 간 중복 제거 서비스 (duplicate_of_id 연결 + 연결 정보 병합)."""
+
+    MAX_SAMPLES = 20
+    # 조회/갱신 청크 크기
+    CHUNK_SIZE = 1000
+
+    def __init__(
+        self,
+        session: AsyncSession,
+        *,
+        threshold: Optional[float] = None,
+        timecode_tolerance: Optional[int] = None,
+        max_block_size: Optional[int] = None,
+        cross_source_only: bool = True,
+    ) -> None:
+        settings = get_settings().dedup
+        self.session = session
+        self.deduplicator = ClipDeduplicator(
+            threshold=settings.threshold if threshold is None else threshold,
+            timecode_tolerance=(
+                settings.timecode_tolerance_seconds
+                if timecode_tolerance is None
+                else timecode_tolerance
+            ),
+            max_block_size=max_block_size or settings.max_block_size,
+            cross_source_only=cross_source_only,
+        )
+
+    async def _links(self, table, target_column: str) -> dict[UUID, set[UUID]]:
+        """연결 테이블 → hand_clip_id → 대상 id 집합."""
+        links: dict[UUID, set[UUID]] = defaultdict(set)
+        query = select(table.c.hand_clip_id, table.c[target_column]).execution_options(
+            yield_per=10000
+        )
+        result = await self.session.stream(query)
+        async for partition in result.partitions():
+            for clip_id, target_id in partition:
+                links[clip_id].add(target_id)
+        return links
+
+    async def run(self, *, dry_run: bool = False) -> DedupStats:
+        """전체 HandClip 중복 판정 → duplicate_of_id 갱신 → 연결 병합 → 커밋.
+
+        Args:
+            dry_run: True면 DB를 변경하지 않고 통계만 계산
+
+        Returns:
+            중복 제거 통계
+        """
+        start = time.perf_counter()
+        stats = DedupStats()
+
+        player_links = await self._links(hand_clip_players, "player_id")
+        clips: list[ClipRecord] = []
+        # hand_clip_id → (duplicate_of_id, duplicate_score, video_file_id, episode_id)
+        current: dict[UUID, tuple[Optional[UUID], Optional[float], Optional[UUID], Optional[UUID]]] = {}
+        query = select(
+            HandClip.id,
+            HandClip.sheet_source,
+            HandClip.sheet_row_number,
+            HandClip.title,
+            HandClip.timecode,
+            HandClip.video_file_id,
+            HandClip.episode_id,
+            HandClip.duplicate_of_id,
+            HandClip.duplicate_score,
+        ).execution_options(yield_per=10000)
+        result = await self.session.stream(query)
+        async for partition in result.partitions():
+            for row in partition:
+                clips.append(
+                    ClipRecord.create(
+                        row.id,
+                        row.sheet_source,
+                        row.sheet_row_number,
+                        row.title,
+                        row.timecode,
+                        row.video_file_id,
+                        player_links.get(row.id, ()),
+                    )
+                )
+                current[row.id] = (
+                    row.duplicate_of_id,
+                    row.duplicate_score,
+                    row.video_file_id,
+                    row.episode_id,
+                )
+
+        groups = self.deduplicator.find_duplicates(clips, stats)
+
+        desired: dict[UUID, tuple[UUID, float]] = {}
+        for group in groups:
+            for clip_id, score in group.duplicates.items():
+                desired[clip_id] = (group.canonical_id, score)
+                if len(stats.samples) < self.MAX_SAMPLES:
+                    stats.samples.append(
+                        {
+                            "hand_clip_id": str(clip_id),
+                            "duplicate_of_id": str(group.canonical_id),
+                            "score": score,
+                        }
+                    )
+
+        updates: list[dict[str, Any]] = []
+        for clip_id, (duplicate_of_id, duplicate_score, _, _) in current.items():
+            target = desired.get(clip_id)
+            if target is not None and target != (duplicate_of_id, duplicate_score):
+                if target[0] != duplicate_of_id:
+                    stats.linked += 1
+                else:
+                    stats.rescored += 1
+                updates.append(
+                    {"id": clip_id, "duplicate_of_id": target[0], "duplicate_score": target[1]}
+                )
+            elif target is None and duplicate_of_id is not None:
+                stats.unlinked += 1
+                updates.append({"id": clip_id, "duplicate_of_id": None, "duplicate_score": None})
+
+        if not dry_run:
+            for offset in range(0, len(updates), self.CHUNK_SIZE):
+                await self.session.execute(
+                    update(HandClip), updates[offset:offset + self.CHUNK_SIZE]
+                )
+            await self._merge_into_canonical(groups, current, player_links)
+            await self.session.commit()
+
+        stats.elapsed_seconds = time.perf_counter() - start
+        logger.info(
+            f"Clip dedup: {stats.duplicates} duplicates in {stats.groups} groups "
+            f"from {stats.total_clips} clips ({stats.candidate_pairs} candidate pairs, "
+            f"{stats.clips_per_second:,.0f} clips/s)"
+        )
+        return stats
+
+    async def _merge_into_canonical(
+        self,
+        groups: list[DuplicateGroup],
+        current: dict[UUID, tuple[Optional[UUID], Optional[float], Optional[UUID], Optional[UUID]]],
+        player_links: dict[UUID, set[UUID]],
+    ) -> None:
+        """중복 클립의 선수/태그 연결과 비어 있는 영상/에피소드를 대표 클립으로 병합.
+
+        영상/에피소드는 중복 클립들의 값이 하나로 일치할 때만 채웁니다.
+        """
+        tag_links = await self._links(hand_clip_tags, "tag_id")
+
+        new_players: set[tuple[UUID, UUID]] = set()
+        new_tags: set[tuple[UUID, UUID]] = set()
+        fills: list[dict[str, Any]] = []
+        for group in groups:
+            canonical = group.canonical_id
+            _, _, video_file_id, episode_id = current[canonical]
+            dup_videos = {current[clip_id][2] for clip_id in group.duplicates} - {None}
+            dup_episodes = {current[clip_id][3] for clip_id in group.duplicates} - {None}
+            fill = False
+            if video_file_id is None and len(dup_videos) == 1:
+                video_file_id, fill = dup_videos.pop(), True
+            if episode_id is None and len(dup_episodes) == 1:
+                episode_id, fill = dup_episodes.pop(), True
+            for clip_id in group.duplicates:
+                new_players.update(
+                    (canonical, player_id)
+                    for player_id in player_links.get(clip_id, ())
+                    if player_id not in player_links.get(canonical, ())
+                )
+                new_tags.update(
+                    (canonical, tag_id)
+                    for tag_id in tag_links.get(clip_id, ())
+                    if tag_id not in tag_links.get(canonical, ())
+                )
+            if fill:
+                fills.append({"id": canonical, "video_file_id": video_file_id, "episode_id": episode_id})
+
+        for offset in range(0, len(fills), self.CHUNK_SIZE):
+            await self.session.execute(update(HandClip), fills[offset:offset + self.CHUNK_SIZE])
+        for table, column, links in (
+            (hand_clip_players, "player_id", new_players),
+            (hand_clip_tags, "tag_id", new_tags),
+        ):
+            if not links:
+                continue
+            stmt = dialect_insert(self.session, table).on_conflict_do_nothing()
+            ordered = sorted(links)
+            for offset in range(0, len(ordered), self.CHUNK_SIZE):
+                await self.session.execute(
+                    stmt,
+                    [
+                        {"hand_clip_id": clip_id, column: target}
+                        for clip_id, target in ordered[offset:offset + self.CHUNK_SIZE]
+                    ],
+                )
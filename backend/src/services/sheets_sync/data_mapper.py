@@ -4,9 +4,10 @@ Maps sheet rows to database entities and persists them.
 """
 
 from dataclasses import dataclass
-from typing import Optional, Sequence
+from typing import TYPE_CHECKING, ClassVar, Optional, Sequence
 from uuid import UUID
 
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ...models.hand_clip import HandClip
@@ -15,6 +16,9 @@ from ...models.tag import Tag, TagCategory
 from ..hand_analysis import HandClipService, PlayerService, TagService
 from .row_mapper import MappedHandClip, RowMapper
 
+if TYPE_CHECKING:
+    from .resolution_cache import PlayerTagCache
+
 
 @dataclass
 class SyncResult:
@@ -23,14 +27,31 @@ class SyncResult:
     total_rows: int = 0
     created: int = 0
     updated: int = 0
+    # 내용 해시가 같아 건너뛴 기존 행
+    unchanged: int = 0
     skipped: int = 0
     errors: int = 0
     error_messages: list[str] = None
 
+    # 누적 시 보관할 최대 오류 메시지 수
+    MAX_ERROR_MESSAGES: ClassVar[int] = 100
+
     def __post_init__(self):
         if self.error_messages is None:
             self.error_messages = []
 
+    def merge(self, other: "SyncResult") -> None:
+        """다른 배치 결과를 누적."""
+        self.total_rows += other.total_rows
+        self.created += other.created
+        self.updated += other.updated
+        self.unchanged += other.unchanged
+        self.skipped += other.skipped
+        self.errors += other.errors
+        room = self.MAX_ERROR_MESSAGES - len(self.error_messages)
+        if room > 0:
+            self.error_messages.extend(other.error_messages[:room])
+
 
 class TagClassifier:
     """Classify tag names into categories."""
@@ -155,13 +176,16 @@ class SheetsDataMapper:
         hand_clip_service: Optional[HandClipService] = None,
         player_service: Optional[PlayerService] = None,
         tag_service: Optional[TagService] = None,
+        resolution_cache: Optional["PlayerTagCache"] = None,
     ):
         self.session = session
         self.hand_clip_service = hand_clip_service or HandClipService(session)
         self.player_service = player_service or PlayerService(session)
         self.tag_service = tag_service or TagService(session)
+        # 공유 선수/태그 id 캐시 (있으면 배치 단위로 한 번에 해석)
+        self.resolution_cache = resolution_cache
 
-        # Caches for performance
+        # Caches for performance (이 세션의 ORM 객체)
         self._player_cache: dict[str, Player] = {}
         self._tag_cache: dict[tuple[str, str], Tag] = {}
 
@@ -204,49 +228,10 @@ class SheetsDataMapper:
             episode_id: Optional episode ID to link.
 
         Returns:
-            Created HandClip or None if skipped.
+            Created or updated HandClip, or None if skipped.
         """
-        # Map row to data class
-        mapped = RowMapper.map_archive_row(row, row_number)
-        if mapped is None:
-            return None
-
-        # Check for existing clip by row number
-        existing = await self.hand_clip_service.get_by_sheet_row(
-            mapped.sheet_source, row_number
-        )
-        if existing:
-            return existing  # Skip duplicates
-
-        # Create hand clip
-        clip = await self.hand_clip_service.create(
-            title=mapped.title,
-            sheet_source=mapped.sheet_source,
-            sheet_row_number=row_number,
-            timecode=mapped.timecode,
-            timecode_end=mapped.timecode_end,
-            duration_seconds=mapped.duration_seconds,
-            hand_grade=mapped.hand_grade,
-            pot_size=mapped.pot_size,
-            winner_hand=mapped.winner_hand,
-            hands_involved=mapped.hands_involved,
-            notes=mapped.notes,
-            video_file_id=video_file_id,
-            episode_id=episode_id,
-            nas_folder_link=mapped.nas_folder_link,  # PRD 15.3: NAS 매칭용
-        )
-
-        # Add players
-        for player_name in mapped.player_names:
-            player = await self.get_or_create_player(player_name)
-            await self.hand_clip_service.add_player(clip.id, player.id)
-
-        # Add tags
-        for tag_name in mapped.tag_names:
-            tag = await self.get_or_create_tag(tag_name)
-            await self.hand_clip_service.add_tag(clip.id, tag.id)
-
-        return clip
+        saved = await self._save_archive_row(row, row_number, video_file_id, episode_id)
+        return saved[0] if saved else None
 
     async def map_and_save_iconik_row(
         self,
@@ -264,43 +249,106 @@ class SheetsDataMapper:
             episode_id: Optional episode ID to link.
 
         Returns:
-            Created HandClip or None if skipped.
+            Created or updated HandClip, or None if skipped.
         """
-        # Map row to data class
+        saved = await self._save_iconik_row(row, row_number, video_file_id, episode_id)
+        return saved[0] if saved else None
+
+    async def _save_archive_row(
+        self,
+        row: list,
+        row_number: int,
+        video_file_id: Optional[UUID] = None,
+        episode_id: Optional[UUID] = None,
+    ) -> Optional[tuple[HandClip, str]]:
+        mapped = RowMapper.map_archive_row(row, row_number)
+        if mapped is None:
+            return None
+        fields = {
+            "title": mapped.title,
+            "timecode": mapped.timecode,
+            "timecode_end": mapped.timecode_end,
+            "duration_seconds": mapped.duration_seconds,
+            "hand_grade": mapped.hand_grade,
+            "pot_size": mapped.pot_size,
+            "winner_hand": mapped.winner_hand,
+            "hands_involved": mapped.hands_involved,
+            "notes": mapped.notes,
+            "nas_folder_link": mapped.nas_folder_link,  # PRD 15.3: NAS 매칭용
+            "sheet_file_name": mapped.sheet_file_name,
+        }
+        return await self._save_mapped(mapped, fields, video_file_id, episode_id)
+
+    async def _save_iconik_row(
+        self,
+        row: list,
+        row_number: int,
+        video_file_id: Optional[UUID] = None,
+        episode_id: Optional[UUID] = None,
+    ) -> Optional[tuple[HandClip, str]]:
         mapped = RowMapper.map_iconik_row(row, row_number)
         if mapped is None:
             return None
-
-        # Check for existing clip by row number
+        fields = {
+            "title": mapped.title,
+            "timecode": mapped.timecode,
+            "duration_seconds": mapped.duration_seconds,
+            "notes": mapped.notes,
+        }
+        return await self._save_mapped(mapped, fields, video_file_id, episode_id)
+
+    async def _save_mapped(
+        self,
+        mapped: MappedHandClip,
+        fields: dict,
+        video_file_id: Optional[UUID],
+        episode_id: Optional[UUID],
+    ) -> tuple[HandClip, str]:
+        """행 저장 → (clip, "created" | "updated" | "unchanged").
+
+        기존 행은 내용 해시가 같으면 그대로 두고, 다르면 컬럼과 선수/태그 연결을 갱신합니다.
+        """
         existing = await self.hand_clip_service.get_by_sheet_row(
-            mapped.sheet_source, row_number
+            mapped.sheet_source, mapped.row_number
         )
-        if existing:
-            return existing  # Skip duplicates
-
-        # Create hand clip
-        clip = await self.hand_clip_service.create(
-            title=mapped.title,
-            sheet_source=mapped.sheet_source,
-            sheet_row_number=row_number,
-            timecode=mapped.timecode,
-            duration_seconds=mapped.duration_seconds,
-            notes=mapped.notes,
-            video_file_id=video_file_id,
-            episode_id=episode_id,
-        )
-
-        # Add players
+        if existing is None:
+            clip = await self.hand_clip_service.create(
+                sheet_source=mapped.sheet_source,
+                sheet_row_number=mapped.row_number,
+                sheet_row_hash=mapped.content_hash,
+                video_file_id=video_file_id,
+                episode_id=episode_id,
+                **fields,
+            )
+            for player_name in mapped.player_names:
+                player = await self.get_or_create_player(player_name)
+                await self.hand_clip_service.add_player(clip.id, player.id)
+            for tag_name in mapped.tag_names:
+                tag = await self.get_or_create_tag(tag_name)
+                await self.hand_clip_service.add_tag(clip.id, tag.id)
+            return clip, "created"
+
+        if existing.sheet_row_hash == mapped.content_hash:
+            return existing, "unchanged"
+
+        clip = await self.hand_clip_service.get_with_relationships(existing.id)
+        for name, value in fields.items():
+            setattr(clip, name, value)
+        clip.sheet_row_hash = mapped.content_hash
+
+        players = {}
         for player_name in mapped.player_names:
             player = await self.get_or_create_player(player_name)
-            await self.hand_clip_service.add_player(clip.id, player.id)
-
-        # Add tags
+            players[player.id] = player
+        tags = {}
         for tag_name in mapped.tag_names:
             tag = await self.get_or_create_tag(tag_name)
-            await self.hand_clip_service.add_tag(clip.id, tag.id)
+            tags[tag.id] = tag
+        clip.players = list(players.values())
+        clip.tags = list(tags.values())
 
-        return clip
+        await self.session.flush()
+        return clip, "updated"
 
     async def sync_archive_rows(
         self,
@@ -316,59 +364,148 @@ class SheetsDataMapper:
         Returns:
             SyncResult with statistics.
         """
+        return await self._sync_rows(
+            rows, start_row, self._save_archive_row, RowMapper.map_archive_row
+        )
+
+    async def sync_iconik_rows(
+        self,
+        rows: list[list],
+        start_row: int = 1,
+    ) -> SyncResult:
+        """Sync multiple ICONIK_METADATA rows.
+
+        Args:
+            rows: List of row data.
+            start_row: Starting row number.
+
+        Returns:
+            SyncResult with statistics.
+        """
+        return await self._sync_rows(
+            rows, start_row, self._save_iconik_row, RowMapper.map_iconik_row
+        )
+
+    async def _sync_rows(
+        self, rows: list[list], start_row: int, save_row, map_row
+    ) -> SyncResult:
         result = SyncResult(total_rows=len(rows))
+        if self.resolution_cache is not None:
+            await self._prefetch_entities(rows, start_row, map_row)
 
         for i, row in enumerate(rows):
             row_number = start_row + i
             try:
-                clip = await self.map_and_save_archive_row(row, row_number)
-                if clip:
-                    if clip.sheet_row_number == row_number:
-                        result.created += 1
-                    else:
-                        result.skipped += 1  # Duplicate
-                else:
+                saved = await save_row(row, row_number)
+                if saved is None:
                     result.skipped += 1  # Invalid row
+                else:
+                    outcome = saved[1]
+                    setattr(result, outcome, getattr(result, outcome) + 1)
             except Exception as e:
                 result.errors += 1
                 result.error_messages.append(f"Row {row_number}: {str(e)}")
 
         return result
 
-    async def sync_iconik_rows(
+    async def _prefetch_entities(self, rows: list[list], start_row: int, map_row) -> None:
+        """배치의 선수/태그를 공유 캐시로 한 번에 해석하고 ORM 객체를 한 번에 적재.
+
+        이후 행별 get_or_create_player/get_or_create_tag는 인스턴스 캐시에서 끝납니다.
+        매핑 오류는 행 저장 단계에서 기록되므로 여기서는 무시합니다.
+        """
+        player_names: set[str] = set()
+        tag_names: set[str] = set()
+        for i, row in enumerate(rows):
+            try:
+                mapped = map_row(row, start_row + i)
+            except Exception:
+                continue
+            if mapped is not None:
+                player_names.update(mapped.player_names)
+                tag_names.update(mapped.tag_names)
+
+        player_ids = await self.resolution_cache.resolve_players(
+            self.session,
+            (
+                name
+                for name in player_names
+                if PlayerMatcher.normalize_name(name) not in self._player_cache
+            ),
+        )
+        if player_ids:
+            loaded = await self.session.execute(
+                select(Player).where(Player.id.in_(set(player_ids.values())))
+            )
+            by_id = {player.id: player for player in loaded.scalars()}
+            for name, player_id in player_ids.items():
+                if player_id in by_id:
+                    self._player_cache[name] = by_id[player_id]
+
+        tag_ids = await self.resolution_cache.resolve_tags(
+            self.session,
+            (
+                name
+                for name in tag_names
+                if (TagClassifier.classify(name), name) not in self._tag_cache
+            ),
+        )
+        if tag_ids:
+            loaded = await self.session.execute(
+                select(Tag).where(Tag.id.in_(set(tag_ids.values())))
+            )
+            by_id = {tag.id: tag for tag in loaded.scalars()}
+            for name, tag_id in tag_ids.items():
+                if tag_id in by_id:
+                    self._tag_cache[(TagClassifier.classify(name), name)] = by_id[tag_id]
+
+    async def sync_rows_bulk(
         self,
         rows: list[list],
         start_row: int = 1,
+        *,
+        archive: bool = True,
     ) -> SyncResult:
-        """Sync multiple ICONIK_METADATA rows.
+        """Sync a batch of rows with one upsert (HandClipBulkIngestor).
+
+        Existing clips whose row hash changed are updated; the rest count as unchanged.
 
         Args:
             rows: List of row data.
             start_row: Starting row number.
+            archive: True for METADATA_ARCHIVE rows, False for ICONIK_METADATA.
 
         Returns:
             SyncResult with statistics.
         """
+        from .bulk_ingestor import HandClipBulkIngestor
+
         result = SyncResult(total_rows=len(rows))
+        map_row = RowMapper.map_archive_row if archive else RowMapper.map_iconik_row
 
+        mapped: list[MappedHandClip] = []
         for i, row in enumerate(rows):
             row_number = start_row + i
             try:
-                clip = await self.map_and_save_iconik_row(row, row_number)
-                if clip:
-                    if clip.sheet_row_number == row_number:
-                        result.created += 1
-                    else:
-                        result.skipped += 1  # Duplicate
-                else:
-                    result.skipped += 1  # Invalid row
+                clip = map_row(row, row_number)
             except Exception as e:
                 result.errors += 1
                 result.error_messages.append(f"Row {row_number}: {str(e)}")
-
+                continue
+            if clip is None:
+                result.skipped += 1  # Invalid row
+            else:
+                mapped.append(clip)
+
+        ingested = await HandClipBulkIngestor(
+            self.session, resolution_cache=self.resolution_cache
+        ).ingest(mapped)
+        result.created = ingested.created
+        result.updated = ingested.updated
+        result.unchanged = ingested.unchanged
         return result
 
     def clear_cache(self):
-        """Clear internal caches."""
+        """Clear internal caches (공유 resolution_cache는 유지)."""
         self._player_cache.clear()
         self._tag_cache.clear()
@@ -0,0 +1,138 @@
+"""Parallel Sheets Sync - 여러 스프레드시트/탭 동시 동기화.
+
+탭마다 별도 세션(커넥션)과 SheetsSyncEngine을 사용하므로 선수/태그 조회 캐시와
+트랜잭션이 탭별로 분리됩니다. 저장은 항상 bulk 경로를 사용합니다:
+
+- players/tags: 이름 정렬 순서로 INSERT ... ON CONFLICT DO NOTHING 후 재조회
+  → 동시에 같은 이름을 만들어도 중복 행이 생기지 않고, 잠금 순서가 같아 교착이 없음
+- 행별 경로(get_or_create)는 조회 후 INSERT라 동시 세션에서 유니크 충돌이 나므로 사용하지 않음
+"""
+
+import asyncio
+import logging
+import time
+from collections import defaultdict
+from typing import Callable, Optional, Sequence, Union
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from .async_sheets_client import AsyncSheetsClient
+from .sheets_client import SheetsClient
+from .sync_engine import EngineSyncResult, SheetsSyncEngine
+
+logger = logging.getLogger(__name__)
+
+
+class ParallelSheetsSync:
+    """스프레드시트 탭을 세션별로 동시에 동기화.
+
+    Usage:
+        sync = ParallelSheetsSync(async_session_factory, AsyncSheetsClient())
+        results = await sync.sync_spreadsheets([SheetId.METADATA_ARCHIVE, SheetId.ICONIK_METADATA])
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], AsyncSession],
+        sheets_client: Optional[Union[SheetsClient, AsyncSheetsClient]] = None,
+        *,
+        max_concurrency: int = 4,
+        per_spreadsheet_concurrency: int = 2,
+    ) -> None:
+        self.session_factory = session_factory
+        self.sheets_client = sheets_client or SheetsClient()
+        self.max_concurrency = max(1, max_concurrency)
+        self.per_spreadsheet_concurrency = max(1, per_spreadsheet_concurrency)
+
+    async def sync_spreadsheets(
+        self,
+        spreadsheet_ids: Sequence[str],
+        *,
+        batch_size: Optional[int] = None,
+        full_sync: bool = False,
+        page_size: Optional[int] = None,
+        probe: bool = False,
+    ) -> list[EngineSyncResult]:
+        """스프레드시트들의 동기화 대상 탭을 모두 동시에 동기화.
+
+        Args:
+            spreadsheet_ids: Google Spreadsheet IDs.
+            batch_size: Number of rows per batch (incremental sync, None = adaptive).
+            full_sync: If True, sync all rows; otherwise incremental.
+            page_size: Number of rows per committed page (full sync, None = adaptive).
+            probe: If True, skip incremental syncs of unchanged tabs.
+
+        Returns:
+            탭별 EngineSyncResult (duration_seconds 포함, 입력 순서).
+        """
+        names = await asyncio.gather(
+            *(self._sheet_names(spreadsheet_id) for spreadsheet_id in spreadsheet_ids)
+        )
+        targets = [
+            (spreadsheet_id, sheet_name, entity_type)
+            for spreadsheet_id, sheet_names in zip(spreadsheet_ids, names)
+            for sheet_name, entity_type in SheetsSyncEngine.syncable_tabs(sheet_names)
+        ]
+        return await self.sync_tabs(
+            targets,
+            batch_size=batch_size,
+            full_sync=full_sync,
+            page_size=page_size,
+            probe=probe,
+        )
+
+    async def sync_tabs(
+        self,
+        targets: Sequence[tuple[str, str, str]],
+        *,
+        batch_size: Optional[int] = None,
+        full_sync: bool = False,
+        page_size: Optional[int] = None,
+        probe: bool = False,
+    ) -> list[EngineSyncResult]:
+        """(spreadsheet_id, sheet_name, entity_type) 탭들을 동시에 동기화.
+
+        전체 동시 실행 수는 max_concurrency, 스프레드시트당 동시 실행 수는
+        per_spreadsheet_concurrency로 제한합니다.
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        per_sheet: dict[str, asyncio.Semaphore] = defaultdict(
+            lambda: asyncio.Semaphore(self.per_spreadsheet_concurrency)
+        )
+
+        async def sync_tab(spreadsheet_id: str, sheet_name: str, entity_type: str):
+            async with per_sheet[spreadsheet_id], semaphore:
+                async with self.session_factory() as session:
+                    engine = SheetsSyncEngine(session, self.sheets_client)
+                    result = await engine.sync_sheet(
+                        spreadsheet_id,
+                        sheet_name,
+                        entity_type,
+                        batch_size=batch_size,
+                        full_sync=full_sync,
+                        bulk=True,
+                        page_size=page_size,
+                        probe=probe,
+                    )
+            logger.info(
+                f"Sheet sync {spreadsheet_id}/{sheet_name}: {result.status} "
+                f"(last row {result.last_row_synced}) in {result.duration_seconds:.1f}s"
+            )
+            return result
+
+        start = time.perf_counter()
+        results = await asyncio.gather(*(sync_tab(*target) for target in targets))
+        logger.info(
+            f"Synced {len(results)} tabs in {time.perf_counter() - start:.1f}s"
+        )
+        return list(results)
+
+    async def _sheet_names(self, spreadsheet_id: str) -> list[str]:
+        """탭 이름 (조회 실패 시 기본 탭 이름)."""
+        try:
+            method = self.sheets_client.get_sheet_names
+            if asyncio.iscoroutinefunction(method):
+                return await method(spreadsheet_id)
+            return await asyncio.to_thread(method, spreadsheet_id)
+        except Exception:
+            return list(SheetsSyncEngine.DEFAULT_SHEETS.keys())
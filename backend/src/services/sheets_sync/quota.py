@@ -0,0 +1,341 @@
+"""Sheets API Quota Manager - Block D (Sheets Sync Agent).
+
+모든 SheetsClient / AsyncSheetsClient 인스턴스가 공유하는 요청 스케줄러.
+
+- 쿼터 클래스(read/write)별 토큰 버킷: 분당 한도에 닿기 전에 호출 측에서 대기
+- 429/5xx 응답은 지터를 준 지수 백오프(full jitter)로 재시도
+- 페이지 크기 배율 자동 조정 (page_size/batch_size를 지정하지 않은 동기화)
+  · 응답 지연(EWMA)이 목표보다 길거나 5xx → 페이지 축소
+  · 지연은 괜찮은데 쿼터 여유가 적거나 429 → 페이지 확대 (요청 수 감소)
+- metrics(): 쿼터 사용량, 대기, 재시도 통계
+"""
+
+import asyncio
+import logging
+import random
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Optional, TypeVar
+
+from ...config import get_settings
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# 재시도 대상 HTTP 상태
+RETRYABLE_STATUS = frozenset({429, 500, 502, 503, 504})
+
+
+class QuotaClass:
+    """Sheets API 쿼터 클래스."""
+
+    READ = "read"
+    WRITE = "write"
+
+
+class TokenBucket:
+    """스레드 안전 토큰 버킷.
+
+    reserve는 토큰을 먼저 차감하고 부족분만큼의 대기 시간을 돌려주므로
+    동시에 호출해도 예약 순서대로 한도 안에서 진행됩니다.
+    """
+
+    def __init__(
+        self,
+        capacity: float,
+        refill_per_second: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.capacity = capacity
+        self.refill_per_second = refill_per_second
+        self._clock = clock
+        self._tokens = capacity
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        now = self._clock()
+        self._tokens = min(
+            self.capacity, self._tokens + (now - self._updated) * self.refill_per_second
+        )
+        self._updated = now
+
+    def reserve(self, tokens: float = 1.0) -> float:
+        """토큰 예약 → 대기해야 할 시간 (초)."""
+        with self._lock:
+            self._refill()
+            self._tokens -= tokens
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.refill_per_second
+
+    @property
+    def available(self) -> float:
+        """남은 토큰 (대기 중인 예약이 있으면 음수)."""
+        with self._lock:
+            self._refill()
+            return self._tokens
+
+
+@dataclass
+class QuotaStats:
+    """쿼터 클래스별 통계."""
+
+    requests: int = 0
+    # 토큰이 부족해 대기한 요청 수 / 총 대기 시간
+    throttled: int = 0
+    wait_seconds: float = 0.0
+    retries: int = 0
+    # 재시도를 포기하거나 재시도 대상이 아닌 오류
+    failures: int = 0
+    latency_ewma_seconds: Optional[float] = None
+    status_counts: Counter = field(default_factory=Counter)
+
+
+class QuotaManager:
+    """쿼터 클래스별 토큰 버킷 + 재시도 + 페이지 크기 조정.
+
+    Usage:
+        quota = get_quota_manager()
+        result = quota.call(QuotaClass.READ, request.execute, status_of)
+        page_size = quota.page_size(1000)
+    """
+
+    # 페이지 배율 범위와 조정 비율 (하한은 기본 크기 기준이라 작은 배치도 축소됨)
+    MIN_SCALE = 0.1
+    MAX_SCALE = 10.0
+    SHRINK = 0.7
+    GROW = 1.5
+    # 쿼터 여유가 이 비율보다 적으면 페이지를 키움
+    LOW_HEADROOM = 0.25
+    # 지연 EWMA 가중치
+    LATENCY_ALPHA = 0.3
+
+    def __init__(
+        self,
+        limits_per_minute: Optional[dict[str, int]] = None,
+        *,
+        max_retries: int = 5,
+        backoff_base_seconds: float = 1.0,
+        backoff_max_seconds: float = 32.0,
+        target_latency_seconds: float = 2.0,
+        max_page_size: int = 5000,
+        clock: Callable[[], float] = time.monotonic,
+        rng: Callable[[], float] = random.random,
+    ) -> None:
+        self.limits_per_minute = limits_per_minute or {
+            QuotaClass.READ: 60,
+            QuotaClass.WRITE: 60,
+        }
+        self.max_retries = max_retries
+        self.backoff_base_seconds = backoff_base_seconds
+        self.backoff_max_seconds = backoff_max_seconds
+        self.target_latency_seconds = target_latency_seconds
+        self.max_page_size = max_page_size
+        self._clock = clock
+        self._rng = rng
+        self._lock = threading.Lock()
+        self.reset()
+
+    @classmethod
+    def from_settings(cls) -> "QuotaManager":
+        config = get_settings().sheets
+        return cls(
+            {
+                QuotaClass.READ: config.read_requests_per_minute,
+                QuotaClass.WRITE: config.write_requests_per_minute,
+            },
+            max_retries=config.max_retries,
+            backoff_base_seconds=config.backoff_base_seconds,
+            backoff_max_seconds=config.backoff_max_seconds,
+            target_latency_seconds=config.target_latency_seconds,
+            max_page_size=config.max_page_size,
+        )
+
+    def reset(self) -> None:
+        """버킷을 가득 채우고 통계와 페이지 배율 초기화."""
+        with self._lock:
+            self._buckets = {
+                quota_class: TokenBucket(limit, limit / 60.0, self._clock)
+                for quota_class, limit in self.limits_per_minute.items()
+            }
+            self._stats = {quota_class: QuotaStats() for quota_class in self._buckets}
+            self._page_scale = 1.0
+
+    # --------------------------------------------------------------------------
+    # 토큰 / 백오프
+    # --------------------------------------------------------------------------
+
+    def reserve(self, quota_class: str) -> float:
+        """요청 1회분 토큰 예약 → 대기 시간 (초)."""
+        wait = self._buckets[quota_class].reserve()
+        with self._lock:
+            stats = self._stats[quota_class]
+            stats.requests += 1
+            if wait > 0:
+                stats.throttled += 1
+                stats.wait_seconds += wait
+        return wait
+
+    def headroom(self, quota_class: str) -> float:
+        """남은 쿼터 비율 (0~1)."""
+        bucket = self._buckets[quota_class]
+        return max(0.0, bucket.available) / bucket.capacity
+
+    def backoff_delay(self, attempt: int) -> float:
+        """attempt번째(0부터) 재시도 전 대기 시간 (full jitter)."""
+        ceiling = min(self.backoff_max_seconds, self.backoff_base_seconds * 2 ** attempt)
+        return self._rng() * ceiling
+
+    # --------------------------------------------------------------------------
+    # 호출 래퍼
+    # --------------------------------------------------------------------------
+
+    def call(
+        self,
+        quota_class: str,
+        request: Callable[[], T],
+        status_of: Callable[[Exception], Optional[int]],
+    ) -> T:
+        """토큰 대기 → 요청 → 429/5xx면 백오프 후 재시도 (동기 클라이언트용)."""
+        attempt = 0
+        while True:
+            wait = self.reserve(quota_class)
+            if wait > 0:
+                time.sleep(wait)
+            start = time.perf_counter()
+            try:
+                value = request()
+            except Exception as e:
+                if not self._should_retry(quota_class, status_of(e), attempt):
+                    raise
+                time.sleep(self.backoff_delay(attempt))
+                attempt += 1
+                continue
+            self._record_success(quota_class, time.perf_counter() - start)
+            return value
+
+    async def call_async(
+        self,
+        quota_class: str,
+        request: Callable[[], Awaitable[T]],
+        status_of: Callable[[Exception], Optional[int]],
+    ) -> T:
+        """call의 비동기 버전 (대기 중 이벤트 루프를 막지 않음)."""
+        attempt = 0
+        while True:
+            wait = self.reserve(quota_class)
+            if wait > 0:
+                await asyncio.sleep(wait)
+            start = time.perf_counter()
+            try:
+                value = await request()
+            except Exception as e:
+                if not self._should_retry(quota_class, status_of(e), attempt):
+                    raise
+                await asyncio.sleep(self.backoff_delay(attempt))
+                attempt += 1
+                continue
+            self._record_success(quota_class, time.perf_counter() - start)
+            return value
+
+    def _should_retry(self, quota_class: str, status: Optional[int], attempt: int) -> bool:
+        with self._lock:
+            stats = self._stats[quota_class]
+            if status is not None:
+                stats.status_counts[status] += 1
+            retry = status in RETRYABLE_STATUS and attempt < self.max_retries
+            if retry:
+                stats.retries += 1
+            else:
+                stats.failures += 1
+            if quota_class == QuotaClass.READ and status in RETRYABLE_STATUS:
+                # 429: 쿼터 소진 → 요청 수를 줄이도록 확대 / 5xx: 응답이 무거움 → 축소
+                self._scale_page(self.GROW if status == 429 else self.SHRINK)
+        if retry:
+            logger.warning(f"Sheets API {status}, retry {attempt + 1}/{self.max_retries}")
+        return retry
+
+    def _record_success(self, quota_class: str, latency: float) -> None:
+        headroom = self.headroom(quota_class)
+        with self._lock:
+            stats = self._stats[quota_class]
+            stats.status_counts[200] += 1
+            if stats.latency_ewma_seconds is None:
+                stats.latency_ewma_seconds = latency
+            else:
+                stats.latency_ewma_seconds += self.LATENCY_ALPHA * (
+                    latency - stats.latency_ewma_seconds
+                )
+            if quota_class != QuotaClass.READ:
+                return
+            if stats.latency_ewma_seconds > self.target_latency_seconds:
+                self._scale_page(self.SHRINK)
+            elif headroom < self.LOW_HEADROOM:
+                self._scale_page(self.GROW)
+
+    # --------------------------------------------------------------------------
+    # 페이지 크기
+    # --------------------------------------------------------------------------
+
+    def _scale_page(self, factor: float) -> None:
+        self._page_scale = min(self.MAX_SCALE, max(self.MIN_SCALE, self._page_scale * factor))
+
+    def page_size(self, base: int) -> int:
+        """기본 페이지 크기 × 현재 배율.
+
+        하한은 base × MIN_SCALE(최소 1)이므로 증분 배치(100)와 전체 페이지(1000)가
+        각자 기준에서 줄어들고, 상한은 max_page_size입니다.
+        """
+        with self._lock:
+            size = round(base * self._page_scale)
+        return max(1, round(base * self.MIN_SCALE), min(self.max_page_size, size))
+
+    # --------------------------------------------------------------------------
+    # 메트릭
+    # --------------------------------------------------------------------------
+
+    def metrics(self) -> dict[str, Any]:
+        """쿼터 클래스별 사용량/대기/재시도 통계와 현재 페이지 배율."""
+        classes = {}
+        for quota_class, bucket in self._buckets.items():
+            available = bucket.available
+            with self._lock:
+                stats = self._stats[quota_class]
+                classes[quota_class] = {
+                    "limit_per_minute": self.limits_per_minute[quota_class],
+                    "available": round(max(0.0, available), 2),
+                    "headroom": round(max(0.0, available) / bucket.capacity, 3),
+                    "queued": round(max(0.0, -available), 2),
+                    "requests": stats.requests,
+                    "throttled": stats.throttled,
+                    "wait_seconds": round(stats.wait_seconds, 3),
+                    "retries": stats.retries,
+                    "failures": stats.failures,
+                    "latency_ewma_seconds": (
+                        round(stats.latency_ewma_seconds, 4)
+                        if stats.latency_ewma_seconds is not None
+                        else None
+                    ),
+                    "status_counts": {
+                        str(status): count for status, count in sorted(stats.status_counts.items())
+                    },
+                }
+        with self._lock:
+            page_scale = self._page_scale
+        return {"page_scale": round(page_scale, 3), "classes": classes}
+
+
+# 싱글톤 인스턴스
+_quota_manager: Optional[QuotaManager] = None
+
+
+def get_quota_manager() -> QuotaManager:
+    """QuotaManager 싱글톤 (SheetsConfig 설정)."""
+    global _quota_manager
+    if _quota_manager is None:
+        _quota_manager = QuotaManager.from_settings()
+    return _quota_manager
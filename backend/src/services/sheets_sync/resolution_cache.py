@@ -0,0 +1,246 @@
+"""Player/Tag Resolution Cache - Block D (Sheets Sync Agent).
+
+프로세스 전역 선수/태그 이름 → id 캐시.
+
+- warmup: players, tags를 테이블당 한 번의 조회로 전부 적재
+- 캐시에 없는 이름은 HandClipBulkIngestor로 일괄 조회/생성 (INSERT ... ON CONFLICT DO NOTHING)
+- PLAYER_CHANGED / TAG_CHANGED 이벤트로 무효화
+- 세션이 새로 만든 행은 그 세션이 커밋한 뒤에만 공유 캐시에 반영하고 롤백되면 버림
+  → 동시 동기화가 다른 세션의 커밋되지 않은 id를 참조하지 않음
+"""
+
+import asyncio
+import logging
+from typing import Iterable, Optional
+from uuid import UUID
+
+from sqlalchemy import event as orm_event
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ...models.player import Player
+from ...models.tag import Tag
+from ...orchestrator.event_bus import EventBus, get_event_bus
+from ...orchestrator.events import Event, EventType
+from .bulk_ingestor import HandClipBulkIngestor
+from .data_mapper import PlayerMatcher, TagClassifier
+
+logger = logging.getLogger(__name__)
+
+
+class _PendingEntities:
+    """세션이 새로 만든 (아직 커밋 전) 선수/태그."""
+
+    def __init__(self) -> None:
+        self.players: dict[str, UUID] = {}
+        self.tags: dict[tuple[str, str], UUID] = {}
+
+    def clear(self) -> None:
+        self.players.clear()
+        self.tags.clear()
+
+
+class PlayerTagCache:
+    """선수/태그 id 공유 캐시.
+
+    ORM 객체가 아닌 id만 보관하므로 여러 세션이 함께 사용할 수 있습니다.
+
+    Usage:
+        cache = get_player_tag_cache()
+        player_ids = await cache.resolve_players(session, ["Phil Ivey", "Tom Dwan"])
+    """
+
+    EVENT_TYPES = (EventType.PLAYER_CHANGED, EventType.TAG_CHANGED)
+
+    def __init__(self) -> None:
+        self._players: dict[str, UUID] = {}
+        self._tags: dict[tuple[str, str], UUID] = {}
+        self._warm = False
+        self._warmup_lock = asyncio.Lock()
+        # 무효화마다 증가 (무효화 전에 시작한 조회 결과를 캐시에 넣지 않기 위함)
+        self._generation = 0
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def is_warm(self) -> bool:
+        return self._warm
+
+    def stats(self) -> dict[str, int]:
+        """캐시 크기와 적중/누락 수."""
+        return {
+            "players": len(self._players),
+            "tags": len(self._tags),
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+    # --------------------------------------------------------------------------
+    # 적재 / 조회
+    # --------------------------------------------------------------------------
+
+    async def warmup(self, session: AsyncSession, *, force: bool = False) -> None:
+        """전체 선수/태그를 테이블당 한 번의 조회로 적재."""
+        async with self._warmup_lock:
+            if self._warm and not force:
+                return
+            generation = self._generation
+            players = await session.execute(select(Player.name, Player.id))
+            tags = await session.execute(select(Tag.category, Tag.name, Tag.id))
+            if generation != self._generation:
+                return  # 적재 중 무효화됨 → 다음 호출에서 다시 적재
+            self._players = {row.name: row.id for row in players}
+            self._tags = {(row.category, row.name): row.id for row in tags}
+            self._warm = True
+        logger.info(
+            f"Player/tag cache warmed: {len(self._players)} players, {len(self._tags)} tags"
+        )
+
+    async def resolve_players(
+        self, session: AsyncSession, names: Iterable[str]
+    ) -> dict[str, UUID]:
+        """정규화한 선수 이름 → Player.id (누락분은 일괄 조회/생성)."""
+        normalized = {PlayerMatcher.normalize_name(name) for name in names}
+        normalized.discard("")
+        if not normalized:
+            return {}
+        if not self._warm:
+            await self.warmup(session)
+
+        pending = self._pending(session)
+        ids: dict[str, UUID] = {}
+        missing: set[str] = set()
+        for name in normalized:
+            player_id = self._players.get(name) or pending.players.get(name)
+            if player_id is None:
+                missing.add(name)
+            else:
+                ids[name] = player_id
+        self.hits += len(ids)
+        self.misses += len(missing)
+
+        if missing:
+            generation = self._generation
+            ingestor = HandClipBulkIngestor(session)
+            resolved = await ingestor.resolve_players(missing)
+            for name, player_id in resolved.items():
+                if name in ingestor.created_players:
+                    pending.players[name] = player_id
+                elif generation == self._generation:
+                    self._players[name] = player_id
+            ids.update(resolved)
+        return ids
+
+    async def resolve_tags(
+        self, session: AsyncSession, names: Iterable[str]
+    ) -> dict[str, UUID]:
+        """태그 이름 → Tag.id (카테고리는 TagClassifier, 누락분은 일괄 조회/생성)."""
+        keys = {(TagClassifier.classify(name), name) for name in names}
+        if not keys:
+            return {}
+        if not self._warm:
+            await self.warmup(session)
+
+        pending = self._pending(session)
+        ids: dict[str, UUID] = {}
+        missing: set[tuple[str, str]] = set()
+        for key in keys:
+            tag_id = self._tags.get(key) or pending.tags.get(key)
+            if tag_id is None:
+                missing.add(key)
+            else:
+                ids[key[1]] = tag_id
+        self.hits += len(ids)
+        self.misses += len(missing)
+
+        if missing:
+            generation = self._generation
+            ingestor = HandClipBulkIngestor(session)
+            resolved = await ingestor.resolve_tags(name for _, name in missing)
+            for key in missing:
+                tag_id = resolved[key[1]]
+                if key in ingestor.created_tags:
+                    pending.tags[key] = tag_id
+                elif generation == self._generation:
+                    self._tags[key] = tag_id
+            ids.update(resolved)
+        return ids
+
+    def _pending(self, session: AsyncSession) -> _PendingEntities:
+        """세션별 미커밋 항목 (커밋 시 공유 캐시로 옮기고 롤백 시 버림)."""
+        key = ("player_tag_cache", id(self))
+        pending = session.info.get(key)
+        if pending is None:
+            pending = session.info[key] = _PendingEntities()
+            sync_session = session.sync_session
+
+            def publish(_session) -> None:
+                self._players.update(pending.players)
+                self._tags.update(pending.tags)
+                pending.clear()
+
+            def discard(_session) -> None:
+                pending.clear()
+
+            orm_event.listen(sync_session, "after_commit", publish)
+            orm_event.listen(sync_session, "after_rollback", discard)
+        return pending
+
+    # --------------------------------------------------------------------------
+    # 무효화
+    # --------------------------------------------------------------------------
+
+    def invalidate_players(self, player_ids: Optional[Iterable[UUID]] = None) -> None:
+        """선수 항목 무효화 (player_ids가 없으면 전체 → 다음 조회 시 다시 적재)."""
+        self._generation += 1
+        if player_ids is None:
+            self._players.clear()
+            self._warm = False
+            return
+        stale = set(player_ids)
+        self._players = {n: i for n, i in self._players.items() if i not in stale}
+
+    def invalidate_tags(self, tag_ids: Optional[Iterable[UUID]] = None) -> None:
+        """태그 항목 무효화 (tag_ids가 없으면 전체 → 다음 조회 시 다시 적재)."""
+        self._generation += 1
+        if tag_ids is None:
+            self._tags.clear()
+            self._warm = False
+            return
+        stale = set(tag_ids)
+        self._tags = {k: i for k, i in self._tags.items() if i not in stale}
+
+    def clear(self) -> None:
+        """전체 무효화."""
+        self.invalidate_players()
+        self.invalidate_tags()
+
+    async def handle_event(self, event: Event) -> None:
+        """PLAYER_CHANGED / TAG_CHANGED 처리 (payload의 id만, 없으면 전체 무효화)."""
+        if event.type == EventType.PLAYER_CHANGED:
+            player_id = event.payload.get("player_id")
+            self.invalidate_players([UUID(str(player_id))] if player_id else None)
+        elif event.type == EventType.TAG_CHANGED:
+            tag_id = event.payload.get("tag_id")
+            self.invalidate_tags([UUID(str(tag_id))] if tag_id else None)
+
+    def subscribe(self, event_bus: EventBus) -> None:
+        for event_type in self.EVENT_TYPES:
+            event_bus.subscribe(event_type, self.handle_event)
+
+    def unsubscribe(self, event_bus: EventBus) -> None:
+        for event_type in self.EVENT_TYPES:
+            event_bus.unsubscribe(event_type, self.handle_event)
+
+
+# 싱글톤 인스턴스
+_player_tag_cache: Optional[PlayerTagCache] = None
+
+
+def get_player_tag_cache() -> PlayerTagCache:
+    """PlayerTagCache 싱글톤 (전역 EventBus에 구독)."""
+    global _player_tag_cache
+    if _player_tag_cache is None:
+        _player_tag_cache = PlayerTagCache()
+        _player_tag_cache.subscribe(get_event_bus())
+    return _player_tag_cache
@@ -3,11 +3,17 @@
 Map sheet rows to database entities.
 """
 
+import hashlib
+import json
+import re
 from dataclasses import dataclass
 from datetime import datetime
 from decimal import Decimal
 from typing import Any, Optional
 
+# 타임코드 구성 요소 (정수 또는 소수 초)
+_TIMECODE_PART = re.compile(r"^\d+(?:\.\d+)?$")
+
 
 @dataclass
 class MappedHandClip:
@@ -38,6 +44,9 @@ class MappedHandClip:
     nas_folder_link: Optional[str] = None
     sheet_file_name: Optional[str] = None
 
+    # 원본 행 내용 해시 (RowMapper.row_hash)
+    content_hash: Optional[str] = None
+
     def __post_init__(self):
         if self.player_names is None:
             self.player_names = []
@@ -131,6 +140,7 @@ class RowMapper:
 
         # NAS folder link 추출 (PRD 15.3)
         nas_folder_link = get_cell(cls.ARCHIVE_COLUMNS["nas_folder_link"])
+        video_filename = get_cell(cls.ARCHIVE_COLUMNS["video_filename"])
 
         return MappedHandClip(
             row_number=row_number,
@@ -142,11 +152,14 @@ class RowMapper:
             player_names=player_names,
             tag_names=tag_names,
             notes=get_cell(cls.ARCHIVE_COLUMNS["notes"]),
-            video_filename=get_cell(cls.ARCHIVE_COLUMNS["video_filename"]),
+            video_filename=video_filename,
             pot_size=pot_size,
             winner_hand=get_cell(cls.ARCHIVE_COLUMNS["winner_hand"]),
             hands_involved=get_cell(cls.ARCHIVE_COLUMNS["hands_involved"]),
             nas_folder_link=nas_folder_link,
+            # 파일명 컬럼 → FileNameLinker 연결 후보
+            sheet_file_name=video_filename,
+            content_hash=cls.row_hash(row),
         )
 
     @classmethod
@@ -207,8 +220,37 @@ class RowMapper:
             player_names=player_names,
             tag_names=tag_names,
             notes=get_cell(cls.ICONIK_COLUMNS["notes"]),
+            content_hash=cls.row_hash(row),
         )
 
+    @staticmethod
+    def row_hash(row: list[Any]) -> str:
+        """원본 행 내용 해시 (셀 앞뒤 공백과 뒤쪽 빈 셀은 무시)."""
+        cells = ["" if cell is None else str(cell).strip() for cell in row]
+        while cells and not cells[-1]:
+            cells.pop()
+        payload = json.dumps(cells, ensure_ascii=False, separators=(",", ":"))
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def timecode_seconds(timecode_str: Optional[str]) -> Optional[int]:
+        """타임코드 → 초.
+
+        "HH:MM:SS", "MM:SS", "SS" 및 프레임이 붙은 "HH:MM:SS:FF" / "HH:MM:SS;FF"
+        (프레임은 버림)를 지원하고, 소수 초는 내림합니다. 해석할 수 없으면 None.
+        """
+        if not timecode_str:
+            return None
+        parts = timecode_str.strip().replace(";", ":").split(":")
+        if len(parts) == 4:
+            parts = parts[:3]
+        if len(parts) > 3 or not all(_TIMECODE_PART.match(p) for p in parts):
+            return None
+        seconds = 0.0
+        for part in parts:
+            seconds = seconds * 60 + float(part)
+        return int(seconds)
+
     @staticmethod
     def _parse_duration(duration_str: str) -> Optional[int]:
         """Parse duration string to seconds.
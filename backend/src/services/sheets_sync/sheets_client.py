@@ -1,6 +1,7 @@
 """Google Sheets Client - Block D (Sheets Sync Agent).
 
 Client for reading data from Google Sheets.
+모든 요청은 공유 QuotaManager를 거칩니다 (토큰 버킷 대기, 429/5xx 재시도).
 """
 
 import os
@@ -9,6 +10,9 @@ from typing import Any, Optional
 
 from google.oauth2.service_account import Credentials
 from googleapiclient.discovery import build
+from googleapiclient.errors import HttpError
+
+from .quota import QuotaClass, QuotaManager, get_quota_manager
 
 
 @dataclass
@@ -26,6 +30,13 @@ class SheetRange:
         return len(self.values)
 
 
+def _http_status(error: Exception) -> Optional[int]:
+    """HttpError의 HTTP 상태 (그 외 예외는 None)."""
+    if isinstance(error, HttpError):
+        return int(error.resp.status)
+    return None
+
+
 class SheetsClient:
     """Google Sheets API client."""
 
@@ -34,16 +45,20 @@ class SheetsClient:
     def __init__(
         self,
         credentials_path: Optional[str] = None,
+        *,
+        quota: Optional[QuotaManager] = None,
     ) -> None:
         """Initialize sheets client.
 
         Args:
             credentials_path: Path to service account JSON file.
                              Defaults to GOOGLE_APPLICATION_CREDENTIALS env var.
+            quota: Request scheduler. Defaults to the process-wide QuotaManager.
         """
         self.credentials_path = credentials_path or os.getenv(
             "GOOGLE_APPLICATION_CREDENTIALS"
         )
+        self.quota = quota or get_quota_manager()
         self._service = None
 
     def _get_service(self):
@@ -60,6 +75,10 @@ class SheetsClient:
             self._service = build("sheets", "v4", credentials=credentials)
         return self._service
 
+    def _execute(self, request, quota_class: str = QuotaClass.READ) -> dict[str, Any]:
+        """쿼터 대기 후 요청 실행 (429/5xx는 백오프 후 재시도)."""
+        return self.quota.call(quota_class, request.execute, _http_status)
+
     def read_range(
         self,
         spreadsheet_id: str,
@@ -75,14 +94,46 @@ class SheetsClient:
             List of rows, each row is a list of cell values.
         """
         service = self._get_service()
-        result = (
+        result = self._execute(
             service.spreadsheets()
             .values()
             .get(spreadsheetId=spreadsheet_id, range=range_name)
-            .execute()
         )
         return result.get("values", [])
 
+    def batch_get(
+        self,
+        spreadsheet_id: str,
+        ranges: list[str],
+    ) -> list[list[list[Any]]]:
+        """Read several ranges with one values.batchGet request.
+
+        Args:
+            spreadsheet_id: The spreadsheet ID.
+            ranges: A1 notation ranges.
+
+        Returns:
+            Rows of each range, in request order (empty ranges are []).
+        """
+        if not ranges:
+            return []
+        service = self._get_service()
+        result = self._execute(
+            service.spreadsheets()
+            .values()
+            .batchGet(
+                spreadsheetId=spreadsheet_id,
+                ranges=ranges,
+                majorDimension="ROWS",
+                fields="valueRanges(range,values)",
+            )
+        )
+        value_ranges = result.get("valueRanges", [])
+        return [
+            value_ranges[i].get("values", []) if i < len(value_ranges) else []
+            for i in range(len(ranges))
+        ]
+
     def read_all_rows(
         self,
         spreadsheet_id: str,
@@ -169,11 +220,7 @@ class SheetsClient:
             Spreadsheet metadata dict.
         """
         service = self._get_service()
-        result = (
-            service.spreadsheets()
-            .get(spreadsheetId=spreadsheet_id)
-            .execute()
-        )
+        result = self._execute(service.spreadsheets().get(spreadsheetId=spreadsheet_id))
         return {
             "title": result.get("properties", {}).get("title"),
             "sheets": [
@@ -3,15 +3,23 @@
 Engine for syncing Google Sheets data to database.
 """
 
+import asyncio
+import hashlib
+import inspect
+import time
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Any, Optional
+from typing import Any, Optional, Union
 from uuid import UUID
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ...models.google_sheet_sync import SyncStatus
+from .async_sheets_client import AsyncSheetsClient, row_range
 from .data_mapper import SheetsDataMapper, SyncResult
+from .quota import QuotaManager
+from .resolution_cache import PlayerTagCache, get_player_tag_cache
+from .row_mapper import RowMapper
 from .sheets_client import SheetsClient
 from .sync_service import SheetsSyncService
 
@@ -29,6 +37,30 @@ class EngineSyncResult:
     sync_result: Optional[SyncResult] = None
     last_row_synced: int = 0
     error_message: Optional[str] = None
+    # 탭 동기화 소요 시간 (초)
+    duration_seconds: float = 0.0
+    # 변경 probe 결과 (SheetProbe.outcome, probe 미사용 시 None)
+    probe_outcome: Optional[str] = None
+
+
+@dataclass
+class SheetProbe:
+    """탭 변경 probe 결과."""
+
+    row_count: Optional[int]
+    tail_hash: Optional[str]
+    # 마지막 동기화 행 이후에 행이 있거나 그리드 행 수가 바뀜
+    rows_changed: bool
+    # 마지막 N행 내용이 바뀜 (기준값이 없어도 True)
+    tail_changed: bool
+
+    @property
+    def outcome(self) -> str:
+        if self.tail_changed:
+            return "tail"
+        if self.rows_changed:
+            return "incremental"
+        return "unchanged"
 
 
 class SheetsSyncEngine:
@@ -41,6 +73,13 @@ class SheetsSyncEngine:
     4. Update sync record status
     """
 
+    # 변경 probe가 해시하는 마지막 행 수
+    PROBE_TAIL_ROWS = 50
+
+    # batch_size/page_size를 지정하지 않았을 때의 기준값 (QuotaManager가 배율 조정)
+    DEFAULT_BATCH_SIZE = 100
+    DEFAULT_PAGE_SIZE = 1000
+
     # Default sheet configurations
     DEFAULT_SHEETS = {
         "METADATA_ARCHIVE": {
@@ -56,12 +95,44 @@ class SheetsSyncEngine:
     def __init__(
         self,
         session: AsyncSession,
-        sheets_client: Optional[SheetsClient] = None,
+        sheets_client: Optional[Union[SheetsClient, AsyncSheetsClient]] = None,
+        resolution_cache: Optional[PlayerTagCache] = None,
     ):
         self.session = session
         self.sheets_client = sheets_client or SheetsClient()
         self.sync_service = SheetsSyncService(session, self.sheets_client)
-        self.data_mapper = SheetsDataMapper(session)
+        self.data_mapper = SheetsDataMapper(
+            session, resolution_cache=resolution_cache or get_player_tag_cache()
+        )
+
+    @classmethod
+    def syncable_tabs(cls, sheet_names: list[str]) -> list[tuple[str, str]]:
+        """동기화 대상 탭 → [(sheet_name, entity_type)]."""
+        tabs = []
+        for sheet_name in sheet_names:
+            if sheet_name.upper() in ("METADATA_ARCHIVE", "ARCHIVE", "ICONIK_METADATA"):
+                config = cls.DEFAULT_SHEETS.get(
+                    sheet_name.upper(),
+                    cls.DEFAULT_SHEETS.get("METADATA_ARCHIVE"),
+                )
+                tabs.append((sheet_name, config["entity_type"]))
+        return tabs
+
+    def _rows_per_request(self, requested: Optional[int], default: int) -> int:
+        """요청당 행 수 (지정하지 않으면 클라이언트 QuotaManager가 조정한 값)."""
+        if requested is not None:
+            return requested
+        quota = getattr(self.sheets_client, "quota", None)
+        if isinstance(quota, QuotaManager):
+            return quota.page_size(default)
+        return default
+
+    async def _call_client(self, method_name: str, *args, **kwargs) -> Any:
+        """시트 클라이언트 호출 (동기 클라이언트는 스레드에서 실행해 루프를 막지 않음)."""
+        method = getattr(self.sheets_client, method_name)
+        if inspect.iscoroutinefunction(method):
+            return await method(*args, **kwargs)
+        return await asyncio.to_thread(method, *args, **kwargs)
 
     async def sync_sheet(
         self,
@@ -69,17 +140,35 @@ class SheetsSyncEngine:
         sheet_name: str,
         entity_type: str = "hand_clip",
         *,
-        batch_size: int = 100,
+        batch_size: Optional[int] = None,
         full_sync: bool = False,
+        bulk: bool = False,
+        page_size: Optional[int] = None,
+        probe: bool = False,
     ) -> EngineSyncResult:
         """Sync a single sheet.
 
+        Full syncs stream the sheet page by page: each page is mapped, saved and
+        committed together with last_row_synced, so a failure only loses the
+        current page.
+
+        With probe, an incremental sync first compares the grid row count and the
+        hash of the last PROBE_TAIL_ROWS rows with the values stored on the sync
+        record. Nothing changed → return without touching the DB; otherwise the
+        sync re-reads from the tail window so edited tail rows are applied too.
+
+        When batch_size/page_size are not given, the client's QuotaManager scales
+        DEFAULT_BATCH_SIZE/DEFAULT_PAGE_SIZE by observed latency and quota headroom.
+
         Args:
             spreadsheet_id: Google Spreadsheet ID.
             sheet_name: Name of the sheet tab.
             entity_type: Type of entity being synced.
-            batch_size: Number of rows per batch.
+            batch_size: Number of rows per batch (incremental sync, None = adaptive).
             full_sync: If True, sync all rows; otherwise incremental.
+            bulk: If True, upsert the batch in bulk (existing rows are updated).
+            page_size: Number of rows per committed page (full sync, None = adaptive).
+            probe: If True, skip incremental syncs when the tab is unchanged.
 
         Returns:
             EngineSyncResult with full statistics.
@@ -92,69 +181,43 @@ class SheetsSyncEngine:
             status=SyncStatus.SYNCING,
             started_at=started_at,
         )
+        is_archive = sheet_name.upper() in ("METADATA_ARCHIVE", "ARCHIVE")
+        start = time.perf_counter()
 
         try:
-            # Start sync record
+            sheet_probe = None
+            if probe and not full_sync:
+                record = await self.sync_service.get_by_sheet_and_entity(
+                    spreadsheet_id, entity_type, sheet_name
+                )
+                sheet_probe = await self.probe_sheet(spreadsheet_id, sheet_name, record)
+                result.probe_outcome = sheet_probe.outcome
+                if record is not None and sheet_probe.outcome == "unchanged":
+                    result.status = SyncStatus.COMPLETED
+                    result.last_row_synced = record.last_row_synced
+                    result.sync_result = SyncResult(total_rows=0)
+                    result.completed_at = datetime.now(timezone.utc)
+                    return result
+
+            # Start sync record (탭 단위)
             sync_record = await self.sync_service.start_sync(
-                spreadsheet_id, entity_type
+                spreadsheet_id, entity_type, sheet_name
             )
             result.last_row_synced = sync_record.last_row_synced
 
-            # Determine start row
-            start_row = 1 if full_sync else sync_record.last_row_synced + 1
-
-            # Fetch rows
             if full_sync:
-                sheet_range = self.sheets_client.read_all_rows(
-                    spreadsheet_id, sheet_name
-                )
-            else:
-                sheet_range = self.sheets_client.read_rows_from(
-                    spreadsheet_id, sheet_name, start_row, batch_size
-                )
-
-            rows = sheet_range.values if sheet_range.values else []
-
-            if not rows:
-                # No new rows
-                await self.sync_service.complete_sync(
-                    sync_record.id, sync_record.last_row_synced
-                )
-                result.status = SyncStatus.COMPLETED
-                result.completed_at = datetime.now(timezone.utc)
-                result.sync_result = SyncResult(total_rows=0)
-                return result
-
-            # Map and save rows
-            if sheet_name.upper() in ("METADATA_ARCHIVE", "ARCHIVE"):
-                sync_result = await self.data_mapper.sync_archive_rows(
-                    rows, start_row
+                await self._stream_full_sync(
+                    result, sync_record.id, is_archive, bulk=bulk, page_size=page_size
                 )
             else:
-                sync_result = await self.data_mapper.sync_iconik_rows(
-                    rows, start_row
-                )
-
-            result.sync_result = sync_result
-
-            # Calculate last row synced
-            last_row = start_row + len(rows) - 1
-
-            # Update sync record
-            if sync_result.errors > 0 and sync_result.errors == len(rows):
-                # All rows failed
-                await self.sync_service.fail_sync(
-                    sync_record.id,
-                    "; ".join(sync_result.error_messages[:5]),  # First 5 errors
+                await self._sync_increment(
+                    result,
+                    sync_record,
+                    is_archive,
+                    bulk=bulk,
+                    batch_size=batch_size,
+                    sheet_probe=sheet_probe,
                 )
-                result.status = SyncStatus.FAILED
-                result.error_message = f"All {len(rows)} rows failed"
-            else:
-                # At least some rows succeeded
-                await self.sync_service.complete_sync(sync_record.id, last_row)
-                result.status = SyncStatus.COMPLETED
-                result.last_row_synced = last_row
-
             result.completed_at = datetime.now(timezone.utc)
 
             # Commit transaction
@@ -165,39 +228,257 @@ class SheetsSyncEngine:
             result.error_message = str(e)
             result.completed_at = datetime.now(timezone.utc)
 
+            # 실패한 페이지만 버림 (이전 페이지는 이미 커밋됨)
+            await self.session.rollback()
+
             # Try to update sync record with error
             try:
                 sync_record = await self.sync_service.get_by_sheet_and_entity(
-                    spreadsheet_id, entity_type
+                    spreadsheet_id, entity_type, sheet_name
                 )
                 if sync_record:
                     await self.sync_service.fail_sync(sync_record.id, str(e))
                     await self.session.commit()
             except Exception:
-                pass
-
-            # Rollback main transaction
-            await self.session.rollback()
+                await self.session.rollback()
 
         finally:
             # Clear caches
             self.data_mapper.clear_cache()
+            result.duration_seconds = time.perf_counter() - start
 
         return result
 
+    async def _sync_rows(
+        self,
+        rows: list[list],
+        start_row: int,
+        is_archive: bool,
+        *,
+        bulk: bool,
+    ) -> SyncResult:
+        """행 배치 매핑 및 저장."""
+        if bulk:
+            return await self.data_mapper.sync_rows_bulk(
+                rows, start_row, archive=is_archive
+            )
+        if is_archive:
+            return await self.data_mapper.sync_archive_rows(rows, start_row)
+        return await self.data_mapper.sync_iconik_rows(rows, start_row)
+
+    async def _sync_increment(
+        self,
+        result: EngineSyncResult,
+        sync_record,
+        is_archive: bool,
+        *,
+        bulk: bool,
+        batch_size: Optional[int],
+        sheet_probe: Optional[SheetProbe] = None,
+    ) -> None:
+        """last_row_synced 다음부터 batch_size 행 동기화.
+
+        probe 사용 시 마지막 PROBE_TAIL_ROWS행부터 다시 읽고, 새 기준값을 레코드에 저장합니다.
+        """
+        batch_size = self._rows_per_request(batch_size, self.DEFAULT_BATCH_SIZE)
+        previous_last_row = sync_record.last_row_synced
+        start_row = previous_last_row + 1
+        limit = batch_size
+        if sheet_probe is not None:
+            start_row = max(1, previous_last_row - self.PROBE_TAIL_ROWS + 1)
+            limit = previous_last_row - start_row + 1 + batch_size
+
+        sheet_range = await self._call_client(
+            "read_rows_from", result.sheet_id, result.sheet_name, start_row, limit
+        )
+        rows = sheet_range.values if sheet_range.values else []
+
+        if not rows:
+            # No new rows
+            if sheet_probe is not None:
+                self._store_probe(sync_record, sheet_probe, [])
+            await self.sync_service.complete_sync(sync_record.id, previous_last_row)
+            result.status = SyncStatus.COMPLETED
+            result.sync_result = SyncResult(total_rows=0)
+            return
+
+        sync_result = await self._sync_rows(rows, start_row, is_archive, bulk=bulk)
+        result.sync_result = sync_result
+
+        # Calculate last row synced (tail 재조회 범위가 줄어도 뒤로 가지 않음)
+        last_row = max(start_row + len(rows) - 1, previous_last_row)
+
+        # Update sync record
+        if sync_result.errors > 0 and sync_result.errors == len(rows):
+            # All rows failed
+            await self.sync_service.fail_sync(
+                sync_record.id,
+                "; ".join(sync_result.error_messages[:5]),  # First 5 errors
+            )
+            result.status = SyncStatus.FAILED
+            result.error_message = f"All {len(rows)} rows failed"
+        else:
+            # At least some rows succeeded
+            if sheet_probe is not None:
+                tail_start = max(start_row, last_row - self.PROBE_TAIL_ROWS + 1)
+                self._store_probe(
+                    sync_record, sheet_probe, rows[tail_start - start_row:]
+                )
+            await self.sync_service.complete_sync(sync_record.id, last_row)
+            result.status = SyncStatus.COMPLETED
+            result.last_row_synced = last_row
+
+    @staticmethod
+    def tail_hash(rows: list[list]) -> str:
+        """행 목록 해시 (뒤쪽 빈 행은 API가 잘라내므로 무시)."""
+        rows = list(rows)
+        while rows and not rows[-1]:
+            rows.pop()
+        digest = hashlib.sha256()
+        for row in rows:
+            digest.update(RowMapper.row_hash(row).encode("ascii"))
+        return digest.hexdigest()
+
+    async def probe_sheet(
+        self,
+        spreadsheet_id: str,
+        sheet_name: str,
+        sync_record=None,
+    ) -> SheetProbe:
+        """탭 변경 여부를 메타데이터 1회 + batchGet 1회로 확인.
+
+        Args:
+            spreadsheet_id: Google Spreadsheet ID.
+            sheet_name: Name of the sheet tab.
+            sync_record: 탭의 GoogleSheetSync (없으면 변경으로 간주).
+
+        Returns:
+            SheetProbe (현재 그리드 행 수와 마지막 N행 해시 포함).
+        """
+        metadata = await self._call_client("get_sheet_metadata", spreadsheet_id)
+        row_count = next(
+            (
+                sheet["row_count"]
+                for sheet in metadata["sheets"]
+                if sheet["title"] == sheet_name
+            ),
+            None,
+        )
+        last_row = sync_record.last_row_synced if sync_record is not None else 0
+        if last_row <= 0:
+            return SheetProbe(row_count, None, rows_changed=True, tail_changed=False)
+
+        tail_start = max(1, last_row - self.PROBE_TAIL_ROWS + 1)
+        tail, after = await self._call_client(
+            "batch_get",
+            spreadsheet_id,
+            [
+                row_range(sheet_name, tail_start, last_row),
+                row_range(sheet_name, last_row + 1, last_row + 1),
+            ],
+        )
+        tail_hash = self.tail_hash(tail)
+        return SheetProbe(
+            row_count,
+            tail_hash,
+            rows_changed=bool(after) or row_count != sync_record.probe_row_count,
+            tail_changed=tail_hash != sync_record.probe_tail_hash,
+        )
+
+    def _store_probe(
+        self, sync_record, sheet_probe: SheetProbe, tail_rows: list[list]
+    ) -> None:
+        """동기화한 행으로 다음 probe 기준값 저장 (complete_sync에서 flush)."""
+        sync_record.probe_row_count = sheet_probe.row_count
+        sync_record.probe_tail_hash = self.tail_hash(tail_rows)
+
+    async def _stream_full_sync(
+        self,
+        result: EngineSyncResult,
+        record_id: UUID,
+        is_archive: bool,
+        *,
+        bulk: bool,
+        page_size: Optional[int],
+    ) -> None:
+        """1행부터 페이지 단위로 조회 → 저장 → 커밋 (last_row_synced 전진).
+
+        다음 페이지 조회는 현재 페이지 저장과 겹쳐 실행하며, 메모리에는 최대 두 페이지만 둡니다.
+        page_size가 None이면 페이지마다 QuotaManager가 조정한 크기를 사용합니다.
+        """
+        total = SyncResult()
+        result.sync_result = total
+        current_row = 1
+        limit = self._rows_per_request(page_size, self.DEFAULT_PAGE_SIZE)
+        next_page = asyncio.create_task(
+            self._call_client(
+                "read_rows_from", result.sheet_id, result.sheet_name, current_row, limit
+            )
+        )
+        try:
+            while next_page is not None:
+                sheet_range = await next_page
+                next_page = None
+                rows = sheet_range.values if sheet_range.values else []
+                if not rows:
+                    break
+
+                last_row = current_row + len(rows) - 1
+                if len(rows) >= limit:
+                    limit = self._rows_per_request(page_size, self.DEFAULT_PAGE_SIZE)
+                    next_page = asyncio.create_task(
+                        self._call_client(
+                            "read_rows_from",
+                            result.sheet_id,
+                            result.sheet_name,
+                            last_row + 1,
+                            limit,
+                        )
+                    )
+
+                page_result = await self._sync_rows(
+                    rows, current_row, is_archive, bulk=bulk
+                )
+                total.merge(page_result)
+                if page_result.errors > 0 and page_result.errors == len(rows):
+                    raise RuntimeError(
+                        f"All {len(rows)} rows failed from row {current_row}: "
+                        + "; ".join(page_result.error_messages[:5])
+                    )
+
+                await self.sync_service.update_sync_status(
+                    record_id, SyncStatus.SYNCING, last_row=last_row
+                )
+                await self.session.commit()
+                result.last_row_synced = last_row
+                current_row = last_row + 1
+        finally:
+            if next_page is not None:
+                next_page.cancel()
+
+        await self.sync_service.complete_sync(record_id, current_row - 1)
+        result.status = SyncStatus.COMPLETED
+        result.last_row_synced = current_row - 1
+
     async def sync_all_sheets(
         self,
         spreadsheet_id: str,
         *,
-        batch_size: int = 100,
+        batch_size: Optional[int] = None,
         full_sync: bool = False,
+        bulk: bool = False,
+        page_size: Optional[int] = None,
+        probe: bool = False,
     ) -> list[EngineSyncResult]:
         """Sync all configured sheets.
 
         Args:
             spreadsheet_id: Google Spreadsheet ID.
-            batch_size: Number of rows per batch.
+            batch_size: Number of rows per batch (None = adaptive).
             full_sync: If True, sync all rows; otherwise incremental.
+            bulk: If True, upsert each batch in bulk.
+            page_size: Number of rows per committed page (full sync, None = adaptive).
+            probe: If True, skip incremental syncs of unchanged tabs.
 
         Returns:
             List of EngineSyncResult for each sheet.
@@ -206,24 +487,22 @@ class SheetsSyncEngine:
 
         # Get available sheets
         try:
-            sheet_names = self.sheets_client.get_sheet_names(spreadsheet_id)
+            sheet_names = await self._call_client("get_sheet_names", spreadsheet_id)
         except Exception:
             sheet_names = list(self.DEFAULT_SHEETS.keys())
 
-        for sheet_name in sheet_names:
-            if sheet_name.upper() in ("METADATA_ARCHIVE", "ARCHIVE", "ICONIK_METADATA"):
-                config = self.DEFAULT_SHEETS.get(
-                    sheet_name.upper(),
-                    self.DEFAULT_SHEETS.get("METADATA_ARCHIVE"),
-                )
-                result = await self.sync_sheet(
-                    spreadsheet_id,
-                    sheet_name,
-                    config["entity_type"],
-                    batch_size=batch_size,
-                    full_sync=full_sync,
-                )
-                results.append(result)
+        for sheet_name, entity_type in self.syncable_tabs(sheet_names):
+            result = await self.sync_sheet(
+                spreadsheet_id,
+                sheet_name,
+                entity_type,
+                batch_size=batch_size,
+                full_sync=full_sync,
+                bulk=bulk,
+                page_size=page_size,
+                probe=probe,
+            )
+            results.append(result)
 
         return results
 
@@ -231,18 +510,20 @@ class SheetsSyncEngine:
         self,
         spreadsheet_id: str,
         entity_type: str = "hand_clip",
+        sheet_name: Optional[str] = None,
     ) -> dict[str, Any]:
         """Get current sync status for a sheet.
 
         Args:
             spreadsheet_id: Google Spreadsheet ID.
             entity_type: Type of entity.
+            sheet_name: Tab name (None = record without a tab).
 
         Returns:
             Dict with status information.
         """
         record = await self.sync_service.get_by_sheet_and_entity(
-            spreadsheet_id, entity_type
+            spreadsheet_id, entity_type, sheet_name
         )
 
         if record is None:
@@ -269,18 +550,20 @@ class SheetsSyncEngine:
         self,
         spreadsheet_id: str,
         entity_type: str = "hand_clip",
+        sheet_name: Optional[str] = None,
     ) -> bool:
         """Reset sync status to start fresh.
 
         Args:
             spreadsheet_id: Google Spreadsheet ID.
             entity_type: Type of entity.
+            sheet_name: Tab name (None = record without a tab).
 
         Returns:
             True if reset successful.
         """
         record = await self.sync_service.get_by_sheet_and_entity(
-            spreadsheet_id, entity_type
+            spreadsheet_id, entity_type, sheet_name
         )
 
         if record is None:
@@ -7,7 +7,7 @@ from datetime import datetime, timezone
 from typing import Any, Optional, Sequence
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ...models.google_sheet_sync import GoogleSheetSync, SheetId, SyncStatus
@@ -30,12 +30,18 @@ class SheetsSyncService(BaseService[GoogleSheetSync]):
         self,
         sheet_id: str,
         entity_type: str,
+        sheet_name: Optional[str] = None,
     ) -> Optional[GoogleSheetSync]:
-        """Get sync record by sheet ID and entity type."""
+        """Get sync record by sheet ID, entity type and tab (None = legacy record)."""
         result = await self.session.execute(
             select(GoogleSheetSync).where(
                 GoogleSheetSync.sheet_id == sheet_id,
                 GoogleSheetSync.entity_type == entity_type,
+                (
+                    GoogleSheetSync.sheet_name.is_(None)
+                    if sheet_name is None
+                    else GoogleSheetSync.sheet_name == sheet_name
+                ),
             )
         )
         return result.scalar_one_or_none()
@@ -44,13 +50,34 @@ class SheetsSyncService(BaseService[GoogleSheetSync]):
         self,
         sheet_id: str,
         entity_type: str,
+        sheet_name: Optional[str] = None,
     ) -> GoogleSheetSync:
-        """Get or create a sync record."""
-        record = await self.get_by_sheet_and_entity(sheet_id, entity_type)
+        """Get or create a sync record.
+
+        탭 레코드가 없으면 탭 구분 없는 기존 레코드를 한 탭이 이어받습니다
+        (동시 동기화 중 한 탭만 조건부 UPDATE에 성공).
+        """
+        record = await self.get_by_sheet_and_entity(sheet_id, entity_type, sheet_name)
+        if record is None and sheet_name is not None:
+            legacy = await self.get_by_sheet_and_entity(sheet_id, entity_type)
+            if legacy is not None:
+                adopted = await self.session.execute(
+                    update(GoogleSheetSync)
+                    .where(
+                        GoogleSheetSync.id == legacy.id,
+                        GoogleSheetSync.sheet_name.is_(None),
+                    )
+                    .values(sheet_name=sheet_name)
+                    .execution_options(synchronize_session=False)
+                )
+                if adopted.rowcount == 1:
+                    await self.session.refresh(legacy)
+                    record = legacy
         if record is None:
             record = await self.create(
                 sheet_id=sheet_id,
                 entity_type=entity_type,
+                sheet_name=sheet_name,
                 last_row_synced=0,
                 sync_status=SyncStatus.IDLE,
             )
@@ -96,9 +123,10 @@ class SheetsSyncService(BaseService[GoogleSheetSync]):
         self,
         sheet_id: str,
         entity_type: str,
+        sheet_name: Optional[str] = None,
     ) -> GoogleSheetSync:
         """Start a sync operation."""
-        record = await self.get_or_create_sync_record(sheet_id, entity_type)
+        record = await self.get_or_create_sync_record(sheet_id, entity_type, sheet_name)
         record.sync_status = SyncStatus.SYNCING
         record.error_message = None
         await self.session.flush()
@@ -12,6 +12,8 @@ from sqlalchemy.orm import Session, sessionmaker
 from sqlalchemy.pool import StaticPool
 
 from src.models.base import Base
+from src.services.sheets_sync import get_player_tag_cache, get_quota_manager
+from tests.fake_sheets import FakeSheetsServer
 
 
 # Test database URL (in-memory SQLite)
@@ -89,6 +91,28 @@ def sync_session(sync_engine) -> Generator[Session, None, None]:
     session.close()
 
 
+@pytest.fixture
+def fake_sheets_server() -> Generator[FakeSheetsServer, None, None]:
+    """Local fake Google Sheets API server (offline)."""
+    server = FakeSheetsServer().start()
+    yield server
+    server.stop()
+
+
+@pytest.fixture(autouse=True)
+def clear_player_tag_cache() -> Generator[None, None, None]:
+    """Process-wide player/tag id cache must not leak ids between test databases."""
+    yield
+    get_player_tag_cache().clear()
+
+
+@pytest.fixture(autouse=True)
+def reset_quota_manager() -> Generator[None, None, None]:
+    """Each test starts with full Sheets API token buckets and default page scale."""
+    yield
+    get_quota_manager().reset()
+
+
 # Test data fixtures
 @pytest.fixture
 def sample_project_data():
@@ -0,0 +1,168 @@
+"""로컬 fake Google Sheets API v4 서버 (오프라인 테스트용).
+
+지원 엔드포인트:
+- GET /v4/spreadsheets/{id}
+- GET /v4/spreadsheets/{id}/values/{range}
+- GET /v4/spreadsheets/{id}/values:batchGet
+
+실제 API처럼 범위 끝의 빈 행은 잘라내고, 빈 범위는 values 키를 생략합니다.
+"""
+
+import json
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+from urllib.parse import parse_qs, unquote, urlparse
+
+_A1_RE = re.compile(
+    r"^(?:'(?P<quoted>(?:[^']|'')+)'|(?P<plain>[^!]+))"
+    r"(?:!(?:[A-Z]*(?P<start>\d*))(?::[A-Z]*(?P<end>\d*))?)?$"
+)
+
+
+class FakeSheetsServer:
+    """스레드 HTTP 서버로 동작하는 Sheets API fake.
+
+    spreadsheets: {spreadsheet_id: {탭 이름: 행 목록}}
+    grid_row_counts: {(spreadsheet_id, 탭 이름): 그리드 행 수} (없으면 max(행 수, 1000))
+    requests: 처리한 요청 (path, query) 기록
+    fail_statuses: 다음 요청들에 차례로 돌려줄 오류 상태 (예: [429, 503])
+    """
+
+    def __init__(self, *, delay: float = 0.0) -> None:
+        self.spreadsheets: dict[str, dict[str, list[list[Any]]]] = {}
+        self.grid_row_counts: dict[tuple[str, str], int] = {}
+        self.requests: list[tuple[str, dict[str, list[str]]]] = []
+        self.delay = delay
+        self.fail_statuses: list[int] = []
+        self.max_in_flight = 0
+        self._in_flight = 0
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/v4"
+
+    def start(self) -> "FakeSheetsServer":
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def add_sheet(self, spreadsheet_id: str, sheet_name: str, rows: list[list[Any]]) -> None:
+        self.spreadsheets.setdefault(spreadsheet_id, {})[sheet_name] = rows
+
+    def requests_to(self, suffix: str) -> list[dict[str, list[str]]]:
+        """경로가 suffix로 끝나는 요청의 query 목록."""
+        return [query for path, query in self.requests if path.endswith(suffix)]
+
+    # --------------------------------------------------------------------------
+    # 응답 생성
+    # --------------------------------------------------------------------------
+
+    def _value_range(self, spreadsheet_id: str, range_name: str) -> dict[str, Any]:
+        match = _A1_RE.match(range_name)
+        if match is None:
+            raise KeyError(range_name)
+        sheet_name = match["quoted"].replace("''", "'") if match["quoted"] else match["plain"]
+        rows = self.spreadsheets[spreadsheet_id][sheet_name]
+        start = int(match["start"] or 1)
+        end = int(match["end"] or len(rows))
+        values = rows[start - 1:end]
+        while values and not values[-1]:
+            values = values[:-1]
+        value_range: dict[str, Any] = {"range": range_name, "majorDimension": "ROWS"}
+        if values:
+            value_range["values"] = values
+        return value_range
+
+    def _metadata(self, spreadsheet_id: str) -> dict[str, Any]:
+        return {
+            "spreadsheetId": spreadsheet_id,
+            "properties": {"title": spreadsheet_id},
+            "sheets": [
+                {
+                    "properties": {
+                        "sheetId": index,
+                        "title": name,
+                        "gridProperties": {
+                            "rowCount": self.grid_row_counts.get(
+                                (spreadsheet_id, name), max(len(rows), 1000)
+                            ),
+                            "columnCount": 26,
+                        },
+                    }
+                }
+                for index, (name, rows) in enumerate(
+                    self.spreadsheets[spreadsheet_id].items()
+                )
+            ],
+        }
+
+    def _respond(self, path: str, query: dict[str, list[str]]) -> dict[str, Any]:
+        parts = path.split("/")
+        # ["", "v4", "spreadsheets", id, ...]
+        if len(parts) < 4 or parts[1:3] != ["v4", "spreadsheets"]:
+            raise KeyError(path)
+        spreadsheet_id = parts[3]
+        if len(parts) == 5 and parts[4] == "values:batchGet":
+            return {
+                "spreadsheetId": spreadsheet_id,
+                "valueRanges": [
+                    self._value_range(spreadsheet_id, r) for r in query.get("ranges", [])
+                ],
+            }
+        if len(parts) == 6 and parts[4] == "values":
+            return self._value_range(spreadsheet_id, parts[5])
+        if len(parts) == 4:
+            return self._metadata(spreadsheet_id)
+        raise KeyError(path)
+
+    def _handler_class(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:  # noqa: N802
+                parsed = urlparse(self.path)
+                path = unquote(parsed.path)
+                query = parse_qs(parsed.query)
+                with server._lock:
+                    server.requests.append((path, query))
+                    server._in_flight += 1
+                    server.max_in_flight = max(server.max_in_flight, server._in_flight)
+                try:
+                    if server.delay:
+                        time.sleep(server.delay)
+                    with server._lock:
+                        failure = server.fail_statuses.pop(0) if server.fail_statuses else None
+                    try:
+                        if failure is not None:
+                            error = {"code": failure, "message": "injected failure"}
+                            body, status = {"error": error}, failure
+                        else:
+                            body, status = server._respond(path, query), 200
+                    except KeyError as e:
+                        body, status = {"error": {"code": 404, "message": str(e)}}, 404
+                finally:
+                    with server._lock:
+                        server._in_flight -= 1
+
+                payload = json.dumps(body).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, format: str, *args: Any) -> None:
+                pass
+
+        return Handler
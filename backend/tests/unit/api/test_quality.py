@@ -188,3 +188,19 @@ class TestBulkLink:
         for source, target in invalid_combinations:
             is_valid = source in ["nas_file", "hand_clip", "video_file"]
             assert not is_valid or target not in ["video_file", "episode"]
+
+
+
+class TestPathMatchRoutes:
+    """경로 매칭 엔드포인트 메서드 테스트."""
+
+    def test_incremental_matching_is_post_only(self):
+        """GET은 읽기 전용, 상태를 저장하는 증분 매칭은 POST."""
+        from src.api.v1.quality import router
+
+        routes = {route.path: route for route in router.routes}
+        get_route = routes["/quality/validate/path-match"]
+
+        assert get_route.methods == {"GET"}
+        assert "incremental" not in {p.name for p in get_route.dependant.query_params}
+        assert routes["/quality/validate/path-match/incremental"].methods == {"POST"}
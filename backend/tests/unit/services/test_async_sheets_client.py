@@ -0,0 +1,130 @@
+"""AsyncSheetsClient 단위 테스트 (로컬 fake Sheets 서버)."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.models.google_sheet_sync import SyncStatus
+from src.services.sheets_sync import AsyncSheetsClient, SheetsSyncEngine
+from src.services.sheets_sync.async_sheets_client import METADATA_FIELDS, VALUES_FIELDS
+
+SHEET_ID = "sheet123"
+
+
+def _rows(count: int, prefix: str = "r") -> list[list[str]]:
+    return [[f"{prefix}{i}", "x"] for i in range(1, count + 1)]
+
+
+@pytest.fixture
+async def client(fake_sheets_server):
+    async with AsyncSheetsClient(
+        base_url=fake_sheets_server.base_url, pages_per_request=3
+    ) as client:
+        yield client
+
+
+class TestAsyncSheetsClient:
+    """batchGet / fields 마스크 / 동시 탭 조회 테스트."""
+
+    async def test_batch_get_keeps_range_order_and_empty_ranges(
+        self, client, fake_sheets_server
+    ):
+        fake_sheets_server.add_sheet(SHEET_ID, "My Tab", _rows(5))
+
+        pages = await client.batch_get(
+            SHEET_ID, ["'My Tab'!A4:ZZ5", "'My Tab'!A10:ZZ20", "'My Tab'!A1:ZZ2"]
+        )
+
+        assert pages == [_rows(5)[3:5], [], _rows(5)[:2]]
+        (query,) = fake_sheets_server.requests_to("values:batchGet")
+        assert query["fields"] == [VALUES_FIELDS]
+        assert query["majorDimension"] == ["ROWS"]
+
+    async def test_read_all_rows_fetches_several_pages_per_request(
+        self, client, fake_sheets_server
+    ):
+        fake_sheets_server.add_sheet(SHEET_ID, "ARCHIVE", _rows(25))
+
+        sheet_range = await client.read_all_rows(SHEET_ID, "ARCHIVE", batch_size=4)
+
+        assert sheet_range.values == _rows(25)
+        assert (sheet_range.start_row, sheet_range.end_row) == (1, 25)
+        # 7페이지 = batchGet 3회 (요청당 3페이지)
+        requests = fake_sheets_server.requests_to("values:batchGet")
+        assert len(requests) == 3
+        assert requests[1]["ranges"][0] == "'ARCHIVE'!A13:ZZ16"
+
+    async def test_read_all_rows_exact_multiple_and_start_row(
+        self, client, fake_sheets_server
+    ):
+        fake_sheets_server.add_sheet(SHEET_ID, "ARCHIVE", _rows(12))
+
+        sheet_range = await client.read_all_rows(
+            SHEET_ID, "ARCHIVE", start_row=3, batch_size=5
+        )
+
+        assert sheet_range.values == _rows(12)[2:]
+        assert sheet_range.end_row == 12
+
+    async def test_read_rows_from(self, client, fake_sheets_server):
+        fake_sheets_server.add_sheet(SHEET_ID, "ARCHIVE", _rows(10))
+
+        sheet_range = await client.read_rows_from(SHEET_ID, "ARCHIVE", 9, limit=5)
+        empty = await client.read_rows_from(SHEET_ID, "ARCHIVE", 50, limit=5)
+
+        assert sheet_range.values == _rows(10)[8:]
+        assert sheet_range.end_row == 10
+        assert empty.values == [] and empty.end_row == 50
+
+    async def test_metadata_uses_fields_mask(self, client, fake_sheets_server):
+        fake_sheets_server.add_sheet(SHEET_ID, "METADATA_ARCHIVE", _rows(2))
+        fake_sheets_server.add_sheet(SHEET_ID, "ICONIK_METADATA", _rows(2))
+
+        names = await client.get_sheet_names(SHEET_ID)
+
+        assert names == ["METADATA_ARCHIVE", "ICONIK_METADATA"]
+        (query,) = fake_sheets_server.requests_to(f"spreadsheets/{SHEET_ID}")
+        assert query["fields"] == [METADATA_FIELDS]
+
+    async def test_read_tabs_concurrently(self, fake_sheets_server):
+        fake_sheets_server.delay = 0.2
+        for name in ("A", "B", "C"):
+            fake_sheets_server.add_sheet(SHEET_ID, name, _rows(3, prefix=name))
+
+        async with AsyncSheetsClient(base_url=fake_sheets_server.base_url) as client:
+            tabs = await client.read_tabs(SHEET_ID, ["A", "B", "C"])
+
+        assert {name: r.values for name, r in tabs.items()} == {
+            name: _rows(3, prefix=name) for name in ("A", "B", "C")
+        }
+        assert fake_sheets_server.max_in_flight == 3
+
+    async def test_http_error_raises(self, client):
+        with pytest.raises(Exception):
+            await client.read_range("missing", "'ARCHIVE'!A1:ZZ10")
+
+    async def test_default_base_url_requires_credentials(self, monkeypatch):
+        monkeypatch.delenv("GOOGLE_APPLICATION_CREDENTIALS", raising=False)
+        async with AsyncSheetsClient() as client:
+            with pytest.raises(ValueError):
+                await client.get_sheet_names(SHEET_ID)
+
+
+class TestSheetsSyncEngineWithAsyncClient:
+    """SheetsSyncEngine이 비동기 클라이언트를 await 하는지 확인."""
+
+    async def test_sync_sheet_full_sync(self, client, fake_sheets_server):
+        fake_sheets_server.add_sheet(SHEET_ID, "METADATA_ARCHIVE", _rows(4))
+        session = AsyncMock()
+        engine = SheetsSyncEngine(session, client)
+        engine.sync_service = AsyncMock()
+        engine.sync_service.start_sync.return_value = MagicMock(last_row_synced=0)
+        engine.data_mapper = AsyncMock()
+        engine.data_mapper.clear_cache = MagicMock()
+        engine.data_mapper.sync_archive_rows.return_value = MagicMock(errors=0)
+
+        result = await engine.sync_sheet(SHEET_ID, "METADATA_ARCHIVE", full_sync=True)
+
+        assert result.status == SyncStatus.COMPLETED
+        assert result.last_row_synced == 4
+        engine.data_mapper.sync_archive_rows.assert_awaited_once_with(_rows(4), 1)
@@ -0,0 +1,171 @@
+"""HandClipBulkIngestor 단위 테스트."""
+
+from sqlalchemy import func, select
+
+from src.models.hand_clip import HandClip, PathMatchStatus, hand_clip_players, hand_clip_tags
+from src.models.player import Player
+from src.models.tag import Tag
+from src.services.matching.path_matcher import PathNormalizer
+from src.services.sheets_sync import HandClipBulkIngestor, RowMapper, SheetsDataMapper
+
+
+def _row(timecode: str, title: str, link: str, players: str, tags: str) -> list:
+    return [timecode, "", title, link, "A", players, tags]
+
+
+async def _count(session, table) -> int:
+    return (await session.execute(select(func.count()).select_from(table))).scalar_one()
+
+
+class TestHandClipBulkIngestor:
+    """bulk UPSERT 테스트."""
+
+    async def test_upserts_clips_players_and_tags(self, async_session):
+        async_session.add(Player(name="Phil Ivey"))
+        await async_session.commit()
+
+        mapper = SheetsDataMapper(async_session)
+        rows = [
+            _row("01:00:00", "Hand 1", "\\\\nas\\ARCHIVE\\WSOP", "phil ivey, Tom Dwan", "bluff"),
+            _row("01:05:00", "Hand 2", "", "Tom Dwan", "bluff, cooler"),
+            [],
+        ]
+        result = await mapper.sync_rows_bulk(rows, start_row=2)
+        await async_session.commit()
+
+        assert (result.created, result.updated, result.skipped) == (2, 0, 1)
+        assert await _count(async_session, HandClip) == 2
+        assert await _count(async_session, Player) == 2  # Phil Ivey 재사용
+        assert await _count(async_session, Tag) == 2
+        assert await _count(async_session, hand_clip_players) == 3
+        assert await _count(async_session, hand_clip_tags) == 3
+
+        clip = (
+            await async_session.execute(
+                select(HandClip).where(HandClip.sheet_row_number == 2)
+            )
+        ).scalar_one()
+        assert clip.normalized_folder_link == PathNormalizer.normalize(rows[0][3])
+        assert clip.timecode_seconds == 3600
+        assert clip.path_match_status == PathMatchStatus.PENDING
+
+        # 매칭 완료 후 같은 행 재동기화: 링크가 같으면 매칭 상태 유지
+        await async_session.execute(
+            HandClip.__table__.update().values(path_match_status=PathMatchStatus.EXACT)
+        )
+        await async_session.commit()
+
+        rows[0][2] = "Hand 1 (edited)"
+        rows[1][3] = "\\\\nas\\ARCHIVE\\HCL"
+        result = await mapper.sync_rows_bulk(rows, start_row=2)
+        await async_session.commit()
+
+        assert (result.created, result.updated) == (0, 2)
+        assert await _count(async_session, HandClip) == 2
+        assert await _count(async_session, hand_clip_players) == 3  # ON CONFLICT DO NOTHING
+
+        status = dict(
+            (
+                await async_session.execute(
+                    select(HandClip.sheet_row_number, HandClip.path_match_status)
+                )
+            ).all()
+        )
+        assert status == {2: PathMatchStatus.EXACT, 3: PathMatchStatus.PENDING}
+        titles = (await async_session.execute(select(HandClip.title))).scalars().all()
+        assert "Hand 1 (edited)" in titles
+
+    async def test_duplicate_rows_in_batch_use_last(self, async_session):
+        clips = [
+            RowMapper.map_archive_row(["01:00:00", "", "First"], 5),
+            RowMapper.map_archive_row(["01:00:00", "", "Second"], 5),
+        ]
+        result = await HandClipBulkIngestor(async_session).ingest(clips)
+
+        assert result.created == 1
+        title = (await async_session.execute(select(HandClip.title))).scalar_one()
+        assert title == "Second"
+
+    async def test_iconik_upsert_keeps_archive_only_columns(self, async_session):
+        """ICONIK 행 갱신은 ICONIK 시트에 있는 컬럼만 덮어씀."""
+        async_session.add(
+            HandClip(
+                sheet_source="ICONIK_METADATA", sheet_row_number=4, title="Old",
+                timecode="00:01:00", timecode_end="00:02:00", hand_grade="A",
+                pot_size=5000, nas_folder_link="\\\\nas\\ARCHIVE",
+            )
+        )
+        await async_session.commit()
+
+        clip = RowMapper.map_iconik_row(["New", "00:01:30"], 4)
+        result = await HandClipBulkIngestor(async_session).ingest([clip])
+        await async_session.commit()
+
+        assert result.updated == 1
+        row = (await async_session.execute(select(HandClip))).scalar_one()
+        await async_session.refresh(row)
+        assert (row.title, row.timecode, row.timecode_seconds) == ("New", "00:01:30", 90)
+        assert (row.timecode_end, row.timecode_end_seconds) == ("00:02:00", 120)
+        assert (row.hand_grade, row.pot_size) == ("A", 5000)
+        assert row.nas_folder_link == "\\\\nas\\ARCHIVE"
+
+
+class TestRowHashSync:
+    """행 내용 해시 기반 변경 감지 테스트."""
+
+    async def _player_names(self, session, row_number: int) -> set[str]:
+        rows = await session.execute(
+            select(Player.name)
+            .join(hand_clip_players, hand_clip_players.c.player_id == Player.id)
+            .join(HandClip, HandClip.id == hand_clip_players.c.hand_clip_id)
+            .where(HandClip.sheet_row_number == row_number)
+        )
+        return set(rows.scalars())
+
+    async def test_bulk_skips_unchanged_and_replaces_links(self, async_session):
+        mapper = SheetsDataMapper(async_session)
+        rows = [
+            _row("01:00:00", "Hand 1", "", "Phil Ivey, Tom Dwan", "bluff"),
+            _row("01:05:00", "Hand 2", "", "Tom Dwan", "cooler"),
+        ]
+        await mapper.sync_rows_bulk(rows, start_row=2)
+        await async_session.commit()
+
+        # 공백만 다른 셀은 같은 내용
+        rows[1][2] = " Hand 2 "
+        result = await mapper.sync_rows_bulk(rows, start_row=2)
+        assert (result.created, result.updated, result.unchanged) == (0, 0, 2)
+
+        rows[0][5] = "Phil Ivey"
+        result = await mapper.sync_rows_bulk(rows, start_row=2)
+        await async_session.commit()
+
+        assert (result.created, result.updated, result.unchanged) == (0, 1, 1)
+        assert await self._player_names(async_session, 2) == {"Phil Ivey"}
+        assert await self._player_names(async_session, 3) == {"Tom Dwan"}
+
+    async def test_per_row_sync_updates_edited_rows(self, async_session):
+        mapper = SheetsDataMapper(async_session)
+        rows = [
+            ["01:00:00", "", "Hand 1", "", "A", "Phil Ivey", "bluff"],
+            ["01:05:00", "", "Hand 2", "", "B", "Tom Dwan", "cooler"],
+        ]
+        result = await mapper.sync_archive_rows(rows, start_row=2)
+        await async_session.commit()
+        assert result.created == 2
+
+        rows[0][2] = "Hand 1 (edited)"
+        rows[0][5] = "Tom Dwan"
+        result = await mapper.sync_archive_rows(rows, start_row=2)
+        await async_session.commit()
+
+        assert (result.created, result.updated, result.unchanged) == (0, 1, 1)
+        clip = (
+            await async_session.execute(
+                select(HandClip).where(HandClip.sheet_row_number == 2)
+            )
+        ).scalar_one()
+        assert clip.title == "Hand 1 (edited)"
+        assert clip.sheet_row_hash == RowMapper.row_hash(rows[0])
+        assert await self._player_names(async_session, 2) == {"Tom Dwan"}
+        assert await _count(async_session, Player) == 2
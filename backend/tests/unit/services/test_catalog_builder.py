@@ -0,0 +1,325 @@
+"""CatalogBuilderService 단위 테스트."""
+
+from datetime import datetime, timezone
+from uuid import uuid4
+
+import pytest
+
+from sqlalchemy import delete, func, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.models.catalog_build_run import BuildRunStatus, CatalogBuildRun
+from src.models.catalog_item import CatalogItem
+from src.models.episode import Episode
+from src.models.event import Event
+from src.models.nas_file import FileCategory, NASFile, ParseStatus
+from src.models.project import Project
+from src.models.season import Season
+from src.models.video_file import VideoFile
+from src.orchestrator import Event as BusEvent
+from src.orchestrator import EventBus, EventType
+from src.services.catalog import CatalogAgent, CatalogBuilderService
+from src.services.catalog.catalog_builder_service import BuildStats
+
+ARCHIVE = "\\\\10.10.100.122\\docker\\GGPNAs\\ARCHIVE\\WSOP\\WSOP Bracelet Event\\2024"
+
+
+def _nas_file(folder: str, name: str) -> NASFile:
+    return NASFile(
+        file_path=f"{folder}\\{name}",
+        file_name=name,
+        file_extension=".mp4",
+        file_category=FileCategory.VIDEO,
+    )
+
+
+async def _count(session, model) -> int:
+    return (await session.execute(select(func.count()).select_from(model))).scalar_one()
+
+
+class TestCatalogBuilderService:
+    """CatalogBuilderService 테스트 클래스."""
+
+    async def test_builds_hierarchy_and_links(self, async_session):
+        """계층 생성, 기존 엔티티 재사용, NASFile 연결."""
+        async_session.add(Project(code="WSOP", name="World Series of Poker"))
+        files = [
+            _nas_file(ARCHIVE, "10-wsop-2024-be-ev-21-25k-nlh-hr-ft-schutten.mp4"),
+            _nas_file(ARCHIVE, "11-wsop-2024-be-ev-21-25k-nlh-hr-ft-day2.mp4"),
+            _nas_file(ARCHIVE, "05-wsop-2024-be-ev-15-50k-nlh-ft-final-showdown.mp4"),
+            _nas_file("\\\\nas\\share\\misc", "random_video.mp4"),
+            _nas_file(ARCHIVE, "._10-wsop-2024-be-ev-21-25k-nlh-hr-ft.mp4"),
+        ]
+        async_session.add_all(files)
+        existing = VideoFile(file_path=files[2].file_path, file_name=files[2].file_name)
+        async_session.add(existing)
+        await async_session.commit()
+
+        stats = await CatalogBuilderService(async_session).build_catalog_from_nas()
+
+        assert stats.nas_files_processed == 5
+        assert stats.projects_created == 0
+        assert stats.seasons_created == 1
+        assert stats.events_created == 2
+        assert stats.video_files_created == 2
+        assert stats.catalog_items_created == 3
+        assert stats.links_created == 3
+        assert (stats.skipped, stats.excluded, stats.errors) == (1, 1, 0)
+
+        assert await _count(async_session, Project) == 1
+        assert await _count(async_session, Season) == 1
+        assert await _count(async_session, Event) == 2
+        assert stats.episodes_created == 2
+        assert await _count(async_session, Episode) == 2
+        assert await _count(async_session, VideoFile) == 3
+        assert await _count(async_session, CatalogItem) == 3
+
+        rows = {
+            r.file_name: r
+            for r in (
+                await async_session.execute(
+                    select(
+                        NASFile.file_name,
+                        NASFile.video_file_id,
+                        NASFile.parse_status,
+                        NASFile.is_excluded,
+                    )
+                )
+            ).all()
+        }
+        assert rows[files[2].file_name].video_file_id == existing.id
+        assert rows[files[2].file_name].parse_status == ParseStatus.MATCHED
+        assert rows[files[0].file_name].parse_status == ParseStatus.PARSED
+        assert rows[files[0].file_name].video_file_id is not None
+        assert rows[files[4].file_name].is_excluded
+
+        # 재실행: 연결된 파일은 건너뛰고 새 엔티티 없음
+        again = await CatalogBuilderService(async_session).build_catalog_from_nas()
+        assert again.nas_files_processed == 1
+        assert again.video_files_created == 0
+        assert await _count(async_session, Season) == 1
+
+    async def test_chunked_build_resumes_from_cursor(self, async_session):
+        """청크마다 커서 저장, limit 도달 후 resume으로 이어서 빌드."""
+        names = [
+            f"{i:02d}-wsop-2024-be-ev-{i}-25k-nlh-hr-ft-day{i}.mp4" for i in range(1, 6)
+        ]
+        async_session.add_all(_nas_file(ARCHIVE, name) for name in names)
+        await async_session.commit()
+
+        service = CatalogBuilderService(async_session)
+        first = await service.build_catalog_from_nas(limit=3, chunk_size=2)
+        assert first.nas_files_processed == 3
+        assert first.chunks_committed == 2
+
+        run = await async_session.get(CatalogBuildRun, first.run_id)
+        await async_session.refresh(run)
+        assert run.status == BuildRunStatus.PAUSED
+        assert run.last_nas_file_id is not None
+        assert run.stats["nas_files_processed"] == 3
+
+        second = await service.build_catalog_from_nas(chunk_size=2, resume=True)
+        assert second.run_id == first.run_id
+        assert second.resumed
+        assert second.nas_files_processed == 5
+        assert second.events_created == 5
+
+        await async_session.refresh(run)
+        assert run.status == BuildRunStatus.COMPLETED
+        assert run.completed_at is not None
+        assert await _count(async_session, VideoFile) == 5
+        assert await _count(async_session, Event) == 5
+
+    async def test_resume_skips_runs_older_than_latest(self, async_session):
+        """더 최근 실행이 완료됐으면 이전 미완료 실행은 재개하지 않고 닫음."""
+        stale = CatalogBuildRun(
+            status=BuildRunStatus.PAUSED, created_at=datetime(2026, 1, 1, tzinfo=timezone.utc)
+        )
+        done = CatalogBuildRun(
+            status=BuildRunStatus.COMPLETED,
+            created_at=datetime(2026, 1, 2, tzinfo=timezone.utc),
+        )
+        async_session.add_all([stale, done])
+        await async_session.commit()
+
+        stats = await CatalogBuilderService(async_session).build_catalog_from_nas(resume=True)
+
+        assert not stats.resumed
+        assert stats.run_id not in (stale.id, done.id)
+        await async_session.refresh(stale)
+        assert stale.status == BuildRunStatus.SUPERSEDED
+
+    def test_error_messages_are_bounded(self):
+        """오류 메시지는 상한까지만 보관, 카운트는 정확."""
+        stats = BuildStats()
+        chunk = BuildStats()
+        for i in range(BuildStats.MAX_ERROR_MESSAGES + 10):
+            chunk.add_error(f"file {i}")
+        stats.merge(chunk)
+        stats.merge(chunk)
+
+        assert stats.errors == 2 * (BuildStats.MAX_ERROR_MESSAGES + 10)
+        assert len(stats.error_messages) == BuildStats.MAX_ERROR_MESSAGES
+        assert stats.error_messages[-1] == f"file {BuildStats.MAX_ERROR_MESSAGES + 9}"
+
+    async def test_apply_nas_changes(self, async_session):
+        """변경 파일만 빌드/갱신, 삭제 파일은 비공개, 재등장 시 재공개."""
+        name = "10-wsop-2024-be-ev-21-25k-nlh-hr-ft-schutten.mp4"
+        nas_file = _nas_file(ARCHIVE, name)
+        async_session.add(nas_file)
+        await async_session.commit()
+
+        service = CatalogBuilderService(async_session)
+        stats = await service.apply_nas_changes(nas_file_ids=[nas_file.id])
+        assert stats.video_files_created == 1
+        await async_session.refresh(nas_file)
+        video_id = nas_file.video_file_id
+
+        # 변경: 연결된 VideoFile 크기만 갱신
+        nas_file.file_size_bytes = 1234
+        await async_session.commit()
+        stats = await service.apply_nas_changes(nas_file_ids=[nas_file.id])
+        assert (stats.video_files_created, stats.video_files_updated) == (0, 1)
+        video = await async_session.get(VideoFile, video_id)
+        await async_session.refresh(video)
+        assert video.file_size_bytes == 1234
+
+        # 삭제 → 비공개
+        await async_session.execute(delete(NASFile).where(NASFile.id == nas_file.id))
+        await async_session.commit()
+        stats = await service.apply_nas_changes(removed_video_file_ids=[video_id])
+        assert stats.video_files_unpublished == 1
+        item = (
+            await async_session.execute(
+                select(CatalogItem).where(CatalogItem.video_file_id == video_id)
+            )
+        ).scalar_one()
+        await async_session.refresh(video)
+        assert video.is_hidden and not item.is_published
+
+        # 같은 경로로 다시 추가 → 기존 VideoFile 재연결 및 재공개
+        readded = _nas_file(ARCHIVE, name)
+        async_session.add(readded)
+        await async_session.commit()
+        stats = await service.apply_nas_changes(nas_file_ids=[readded.id])
+        assert (stats.video_files_created, stats.video_files_republished) == (0, 1)
+        await async_session.refresh(video)
+        await async_session.refresh(item)
+        assert not video.is_hidden and item.is_published
+        assert await _count(async_session, VideoFile) == 1
+
+
+    async def test_apply_nas_changes_falls_back_per_file(self, async_session, monkeypatch):
+        """청크 빌드 실패 시 파일 단위 재시도, 실패 파일만 오류로 기록."""
+        good = _nas_file(ARCHIVE, "01-wsop-2024-be-ev-1-25k-nlh-hr-ft-day1.mp4")
+        bad = _nas_file(ARCHIVE, "02-wsop-2024-be-ev-2-25k-nlh-hr-ft-day2.mp4")
+        async_session.add_all([good, bad])
+        await async_session.commit()
+        good_id, bad_id, bad_name = good.id, bad.id, bad.file_name
+
+        service = CatalogBuilderService(async_session)
+        build_chunk = service._build_chunk
+
+        async def failing_build(nas_files, stats):
+            await build_chunk(nas_files, stats)
+            if any(f.id == bad_id for f in nas_files):
+                raise RuntimeError("duplicate key")
+
+        monkeypatch.setattr(service, "_build_chunk", failing_build)
+        stats = await service.apply_nas_changes(nas_file_ids=[good_id, bad_id])
+
+        assert (stats.video_files_created, stats.errors) == (1, 1)
+        assert bad_name in stats.error_messages[0]
+        assert await _count(async_session, VideoFile) == 1
+
+    async def test_republish_keeps_manually_unpublished_items(self, async_session):
+        """NAS 재등장 시 삭제 전에 이미 비공개였던 아이템은 그대로 둠."""
+        name = "10-wsop-2024-be-ev-21-25k-nlh-hr-ft-schutten.mp4"
+        nas_file = _nas_file(ARCHIVE, name)
+        async_session.add(nas_file)
+        await async_session.commit()
+        service = CatalogBuilderService(async_session)
+        await service.apply_nas_changes(nas_file_ids=[nas_file.id])
+        await async_session.refresh(nas_file)
+        video_id = nas_file.video_file_id
+
+        item = (
+            await async_session.execute(
+                select(CatalogItem).where(CatalogItem.video_file_id == video_id)
+            )
+        ).scalar_one()
+        item.is_published = False
+        await async_session.execute(delete(NASFile).where(NASFile.id == nas_file.id))
+        await async_session.commit()
+        await service.apply_nas_changes(removed_video_file_ids=[video_id])
+
+        readded = _nas_file(ARCHIVE, name)
+        async_session.add(readded)
+        await async_session.commit()
+        stats = await service.apply_nas_changes(nas_file_ids=[readded.id])
+
+        assert stats.video_files_republished == 1
+        await async_session.refresh(item)
+        assert not item.is_published and item.unpublished_reason is None
+
+
+class TestCatalogAgent:
+    """CatalogAgent 이벤트 병합 테스트."""
+
+    async def test_coalesces_events_into_one_build(self, async_engine, async_session):
+        files = [
+            _nas_file(ARCHIVE, f"{i:02d}-wsop-2024-be-ev-{i}-25k-nlh-hr-ft-day{i}.mp4")
+            for i in range(1, 4)
+        ]
+        async_session.add_all(files)
+        await async_session.commit()
+
+        bus = EventBus()
+        updates = []
+
+        async def collect(event):
+            updates.append(event)
+
+        bus.subscribe(EventType.CATALOG_UPDATED, collect)
+        session_factory = async_sessionmaker(
+            async_engine, class_=AsyncSession, expire_on_commit=False
+        )
+        agent = CatalogAgent(session_factory, bus, window_seconds=0.05)
+
+        for nas_file in files:
+            await bus.emit(
+                BusEvent(
+                    type=EventType.NAS_FILE_ADDED,
+                    payload={"nas_file_ids": [str(nas_file.id)]},
+                )
+            )
+        assert agent.pending_count == 3
+
+        await agent._flush_task
+        assert len(updates) == 1
+        assert updates[0].payload["video_files_created"] == 3
+        assert agent.pending_count == 0
+        assert await agent.health_check()
+        assert await _count(async_session, VideoFile) == 3
+
+        await agent.close()
+        assert bus.get_handlers_count(EventType.NAS_FILE_ADDED) == 0
+
+    async def test_gives_up_after_max_attempts(self):
+        def broken_session():
+            raise RuntimeError("database unavailable")
+
+        agent = CatalogAgent(broken_session, EventBus(), window_seconds=60)
+        nas_file_id = uuid4()
+        await agent.handle_nas_event(
+            BusEvent(type=EventType.NAS_FILE_ADDED, payload={"nas_file_ids": [str(nas_file_id)]})
+        )
+        agent._flush_task.cancel()
+
+        for _ in range(CatalogAgent.MAX_ATTEMPTS):
+            with pytest.raises(RuntimeError):
+                await agent.flush()
+
+        assert agent.pending_count == 0
+        assert agent.failed_ids == {nas_file_id}
+        assert await agent.flush() is None
@@ -0,0 +1,172 @@
+"""ClipDeduplicator / HandClipDeduplicator 테스트."""
+
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import select
+
+from src.models.hand_clip import HandClip, hand_clip_players, hand_clip_tags
+from src.models.player import Player
+from src.models.tag import Tag, TagCategory
+from src.services.sheets_sync import (
+    ClipDeduplicator,
+    ClipRecord,
+    DedupStats,
+    HandClipDeduplicator,
+    RowMapper,
+)
+
+VIDEO = uuid4()
+IVEY, DWAN = uuid4(), uuid4()
+
+
+def _clip(source, row, title, timecode, video=None, players=()):
+    return ClipRecord.create(uuid4(), source, row, title, timecode, video, players)
+
+
+class TestTimecodeSeconds:
+    def test_formats(self):
+        assert RowMapper.timecode_seconds("01:02:03") == 3723
+        assert RowMapper.timecode_seconds("02:03") == 123
+        assert RowMapper.timecode_seconds("45") == 45
+        assert RowMapper.timecode_seconds("00:00:10:15") == 10  # 프레임 버림
+        assert RowMapper.timecode_seconds("00:00:10.9") == 10
+        assert RowMapper.timecode_seconds(None) is None
+        assert RowMapper.timecode_seconds("1:xx") is None
+
+
+class TestClipDeduplicator:
+    def test_timecode_blocks_catch_pairs_across_cell_boundary(self):
+        dedup = ClipDeduplicator(timecode_tolerance=5)
+        a = _clip("METADATA_ARCHIVE", 1, "Ivey bluff", "00:00:09", VIDEO)
+        b = _clip("ICONIK_METADATA", 1, "Ivey hero call", "00:00:11", VIDEO)
+        far = _clip("ICONIK_METADATA", 2, "Other hand", "00:01:00", VIDEO)
+
+        assert set(dedup.blocking_keys(a)) & set(dedup.blocking_keys(b))
+        assert dedup.candidate_pairs([a, b, far]) == {(0, 1)}
+
+    def test_same_source_and_oversized_blocks_skipped(self):
+        dedup = ClipDeduplicator(max_block_size=3)
+        clips = [_clip("METADATA_ARCHIVE", i, "Hand", None) for i in range(2)]
+        assert dedup.candidate_pairs(clips) == set()
+
+        stats = DedupStats()
+        clips = [_clip(source, i, "Hand", None) for i in range(2)
+                 for source in ("METADATA_ARCHIVE", "ICONIK_METADATA")]
+        assert dedup.candidate_pairs(clips, stats) == set()
+        assert stats.oversized_blocks == 1
+
+    def test_score(self):
+        dedup = ClipDeduplicator(timecode_tolerance=5)
+        a = _clip("METADATA_ARCHIVE", 1, "Ivey Bluff", "00:10:00", VIDEO, [IVEY, DWAN])
+        b = _clip("ICONIK_METADATA", 7, "ivey bluff", "00:10:02", VIDEO, [IVEY, DWAN])
+        assert dedup.score(a, b) == pytest.approx(1.0)
+        # 허용 오차 밖 (7초) → 타임코드 근접도 0.6
+        b = _clip("ICONIK_METADATA", 7, "ivey bluff", "00:10:07", VIDEO, [IVEY, DWAN])
+        assert dedup.score(a, b) == pytest.approx(0.35 * 0.6 + 0.65)
+
+        # 다른 영상 → 중복 아님
+        c = _clip("ICONIK_METADATA", 8, "ivey bluff", "00:10:00", uuid4(), [IVEY, DWAN])
+        assert dedup.score(a, c) == 0.0
+        # 공통 특징이 제목 하나뿐
+        assert dedup.score(_clip("A", 1, "bluff", None), _clip("B", 1, "bluff", None)) == 0.0
+
+    def test_find_duplicates_prefers_archive_as_canonical(self):
+        dedup = ClipDeduplicator()
+        archive = _clip("METADATA_ARCHIVE", 3, "Dwan river", "01:00:00", VIDEO, [DWAN])
+        iconik = _clip("ICONIK_METADATA", 1, "Dwan river", "01:00:01", None, [DWAN])
+        other = _clip("ICONIK_METADATA", 2, "Ivey river", "02:00:00", VIDEO, [IVEY])
+        stats = DedupStats()
+
+        groups = dedup.find_duplicates([iconik, other, archive], stats)
+
+        assert len(groups) == 1
+        assert groups[0].canonical_id == archive.id
+        assert list(groups[0].duplicates) == [iconik.id]
+        assert (stats.total_clips, stats.duplicate_pairs, stats.duplicates) == (3, 1, 1)
+
+    def test_groups_never_mix_linked_videos(self):
+        """A~B, B~C라도 A와 C의 영상이 다르면 한 그룹으로 묶지 않음."""
+        dedup = ClipDeduplicator()
+        a = _clip("METADATA_ARCHIVE", 1, "Ivey bluff", "00:20:00", VIDEO, [IVEY])
+        b = _clip("ICONIK_METADATA", 1, "Ivey bluff", "00:20:01", None, [IVEY])
+        c = _clip("METADATA_ARCHIVE", 2, "Ivey bluff river", "00:20:02", uuid4(), [IVEY])
+        stats = DedupStats()
+
+        groups = dedup.find_duplicates([a, b, c], stats)
+
+        assert [(g.canonical_id, list(g.duplicates)) for g in groups] == [(a.id, [b.id])]
+        assert (stats.duplicate_pairs, stats.video_conflicts) == (2, 1)
+
+
+class TestHandClipDeduplicator:
+    async def test_links_duplicates_and_merges_links(self, async_session):
+        ivey = Player(name="Phil Ivey")
+        bluff = Tag(category=TagCategory.POKER_PLAY, name="bluff")
+        archive = HandClip(
+            sheet_source="METADATA_ARCHIVE", sheet_row_number=2,
+            title="Ivey bluff", timecode="00:15:30", players=[ivey],
+        )
+        iconik = HandClip(
+            sheet_source="ICONIK_METADATA", sheet_row_number=9,
+            title="Ivey bluff", timecode="00:15:32", players=[ivey], tags=[bluff],
+        )
+        unrelated = HandClip(
+            sheet_source="ICONIK_METADATA", sheet_row_number=10,
+            title="Ivey bluff", timecode="01:15:30",
+        )
+        async_session.add_all([archive, iconik, unrelated])
+        await async_session.commit()
+
+        stats = await HandClipDeduplicator(async_session).run()
+
+        assert (stats.groups, stats.duplicates, stats.linked) == (1, 1, 1)
+        rows = await async_session.execute(
+            select(HandClip.id, HandClip.duplicate_of_id, HandClip.duplicate_score)
+        )
+        linked = {row.id: (row.duplicate_of_id, row.duplicate_score) for row in rows}
+        assert linked[iconik.id][0] == archive.id and linked[iconik.id][1] >= 0.8
+        assert linked[archive.id] == linked[unrelated.id] == (None, None)
+        tags = await async_session.execute(
+            select(hand_clip_tags.c.tag_id).where(hand_clip_tags.c.hand_clip_id == archive.id)
+        )
+        assert tags.scalars().all() == [bluff.id]
+        players = await async_session.execute(
+            select(hand_clip_players.c.player_id).where(
+                hand_clip_players.c.hand_clip_id == archive.id
+            )
+        )
+        assert players.scalars().all() == [ivey.id]
+
+        # 재실행 → 변경 없음
+        again = await HandClipDeduplicator(async_session).run()
+        assert (again.duplicates, again.linked, again.unlinked, again.rescored) == (1, 0, 0, 0)
+
+        # 대표는 같고 저장된 점수만 다르면 점수 갱신
+        score = linked[iconik.id][1]
+        iconik.duplicate_score = 0.5
+        await async_session.commit()
+        again = await HandClipDeduplicator(async_session).run()
+        assert (again.linked, again.rescored) == (0, 1)
+        await async_session.refresh(iconik)
+        assert iconik.duplicate_score == score
+
+    async def test_dry_run_and_stale_links_cleared(self, async_session):
+        canonical = HandClip(sheet_source="METADATA_ARCHIVE", sheet_row_number=1, title="A")
+        async_session.add(canonical)
+        await async_session.flush()
+        stale = HandClip(
+            sheet_source="ICONIK_METADATA", sheet_row_number=1, title="Different",
+            duplicate_of_id=canonical.id, duplicate_score=0.9,
+        )
+        async_session.add(stale)
+        await async_session.commit()
+
+        stats = await HandClipDeduplicator(async_session).run(dry_run=True)
+        assert stats.unlinked == 1
+        await async_session.refresh(stale)
+        assert stale.duplicate_of_id == canonical.id
+
+        await HandClipDeduplicator(async_session).run()
+        await async_session.refresh(stale)
+        assert (stale.duplicate_of_id, stale.duplicate_score) == (None, None)
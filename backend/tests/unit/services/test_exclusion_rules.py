@@ -0,0 +1,219 @@
+"""Tests for NAS exclusion rules - 제외 규칙 엔진."""
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import select
+
+from src.config import get_settings
+from src.models.nas_file import NASFile
+from src.services.nas_inventory import (
+    ExclusionMatcher,
+    ExclusionRule,
+    NASFileService,
+    SMBScanner,
+    ScanResult,
+    get_exclusion_matcher,
+)
+from src.services.nas_inventory.exclusion_rules import RuleKind, RuleTarget
+
+
+class TestExclusionMatcher:
+    """Test cases for ExclusionMatcher."""
+
+    @pytest.fixture
+    def matcher(self):
+        return get_exclusion_matcher()
+
+    def test_excluded_folders_match_as_directories(self, matcher):
+        """Clips / Player Emotion folders are matched case-insensitively."""
+        assert matcher.match("\\\\nas\\WSOP\\2024\\Clips", is_directory=True).name == (
+            "clips_folder"
+        )
+        assert matcher.match("WSOP/2024/PLAYER EMOTION 2", is_directory=True).name == (
+            "player_emotion_folder"
+        )
+        assert matcher.match("WSOP/2024/Clips Archive", is_directory=True) is None
+
+    def test_directory_rules_do_not_apply_to_files(self, matcher):
+        """A file named like an excluded folder is kept."""
+        assert matcher.match("WSOP/2024/clips", is_directory=False) is None
+
+    def test_system_files(self, matcher):
+        """OS metadata files are matched by name."""
+        assert matcher.match("WSOP/._video.mp4").reason == "macos_metadata"
+        assert matcher.match("WSOP/Thumbs.db").reason == "windows_thumbnail"
+        assert matcher.match("WSOP/video.mp4") is None
+
+    def test_match_path_checks_ancestor_folders(self, matcher):
+        """Stored file paths are excluded when any ancestor folder matches."""
+        rule = matcher.match_path("/nas/WSOP/2024/Clips/day1/hand_001.mp4")
+
+        assert rule.name == "clips_folder"
+        assert not matcher.is_excluded("/nas/WSOP/2024/Main Event/day1.mp4")
+
+    def test_hit_counts(self, matcher):
+        """Hits are counted per rule; is_excluded does not record."""
+        matcher.match_path("/nas/Clips/a.mp4")
+        matcher.match_path("/nas/Clips/b.mp4")
+        matcher.is_excluded("/nas/Clips/c.mp4")
+
+        assert matcher.hit_counts() == {"clips_folder": 2}
+        assert get_exclusion_matcher().hit_counts() == {}
+
+    def test_path_glob_and_project_rules(self):
+        """Path globs support '**'; project rules apply only to their project."""
+        rules = [
+            ExclusionRule(
+                name="wsop_raw",
+                pattern="**/wsop/*/raw/**",
+                reason="raw_footage",
+                kind=RuleKind.PATH_GLOB,
+                project_code="WSOP",
+            ),
+            ExclusionRule(
+                name="temp_dir",
+                pattern="tmp*",
+                reason="temp",
+                applies_to=RuleTarget.DIRECTORY,
+            ),
+        ]
+        wsop = ExclusionMatcher(rules, project_code="WSOP")
+        hcl = ExclusionMatcher(rules, project_code="HCL")
+
+        assert wsop.match_path("/nas/WSOP/2024/RAW/cam1/a.mp4").name == "wsop_raw"
+        assert wsop.match_path("/nas/WSOP/2024/a.mp4") is None
+        assert hcl.match_path("/nas/WSOP/2024/RAW/cam1/a.mp4") is None
+        assert hcl.match_path("/nas/HCL/tmp_upload/a.mp4").name == "temp_dir"
+
+    def test_first_declared_rule_wins(self):
+        """Overlapping rules resolve to the earliest declared rule."""
+        matcher = ExclusionMatcher(
+            [
+                ExclusionRule(name="first", pattern="*.tmp", reason="a"),
+                ExclusionRule(name="second", pattern="x*", reason="b"),
+            ]
+        )
+
+        assert matcher.match("dir/x.tmp").name == "first"
+
+
+class TestScannerPruning:
+    """SMBScanner must not descend into excluded folders."""
+
+    async def test_excluded_folders_are_not_listed(self, monkeypatch):
+        tree = {
+            "base": [("WSOP", True)],
+            "base\\WSOP": [("Clips", True), ("Main", True), ("._a.mp4", False)],
+            "base\\WSOP\\Main": [("day1.mp4", False)],
+            "base\\WSOP\\Clips": [("hand.mp4", False)],
+        }
+        listed: list[str] = []
+
+        def fake_list(path):
+            listed.append(path)
+            return [
+                ScanResult(path=f"{path}\\{name}", name=name, is_directory=is_dir)
+                for name, is_dir in tree.get(path, [])
+            ]
+
+        matcher = get_exclusion_matcher()
+        config = get_settings().nas.model_copy(update={"nas_base_path": "base"})
+        scanner = SMBScanner(config, exclusion=matcher)
+        scanner._connected = True
+        monkeypatch.setattr(scanner, "_sync_list_directory", fake_list)
+
+        names = [r.name async for r in scanner.scan_directory(recursive=True)]
+
+        assert names == ["WSOP", "Main", "day1.mp4"]
+        assert "base\\WSOP\\Clips" not in listed
+        assert matcher.hit_counts() == {"clips_folder": 1, "macos_metadata": 1}
+
+
+class TestApplyExclusionRules:
+    """Bulk is_excluded / exclude_reason marking."""
+
+    @pytest_asyncio.fixture
+    async def service(self, async_session):
+        return NASFileService(async_session)
+
+    async def test_marks_matching_files_in_bulk(self, service, async_session):
+        for path in (
+            "/nas/WSOP/2024/Clips/hand_001.mp4",
+            "/nas/WSOP/2024/Clips/hand_002.mp4",
+            "/nas/WSOP/2024/Player Emotion/cry.mp4",
+            "/nas/WSOP/2024/day1.mp4",
+        ):
+            await service.create_file(file_path=path, file_name=path.rsplit("/", 1)[-1])
+
+        marked = await service.apply_exclusion_rules(get_exclusion_matcher(), batch_size=2)
+
+        assert marked == {"clips_folder": 2, "player_emotion_folder": 1}
+        assert await service.count_excluded() == 3
+
+        rows = (
+            await async_session.execute(
+                select(NASFile.file_name, NASFile.is_excluded, NASFile.exclude_reason)
+                .order_by(NASFile.file_name)
+            )
+        ).all()
+        reasons = {r.file_name: (r.is_excluded, r.exclude_reason) for r in rows}
+        assert reasons["cry.mp4"] == (True, "player_emotion_folder")
+        assert reasons["day1.mp4"][0] is False
+
+        # 이미 제외된 파일은 다시 판정하지 않음
+        assert await service.apply_exclusion_rules(get_exclusion_matcher()) == {}
+
+    async def test_path_prefix_limits_project_rules(self, service, async_session):
+        """프로젝트 전용 규칙은 해당 프로젝트 폴더 아래 파일에만 적용."""
+        for path in ("GGPNAs/WSOP/raw/a.mp4", "GGPNAs/HCL/raw/b.mp4"):
+            await service.create_file(file_path=path, file_name=path.rsplit("/", 1)[-1])
+        matcher = ExclusionMatcher(
+            [ExclusionRule(name="wsop_raw", pattern="raw", reason="raw",
+                           applies_to=RuleTarget.DIRECTORY, project_code="WSOP")],
+            project_code="WSOP",
+        )
+
+        marked = await service.apply_exclusion_rules(matcher, path_prefix="GGPNAs/WSOP")
+
+        assert marked == {"wsop_raw": 1}
+        hcl = await service.get_by_path("GGPNAs/HCL/raw/b.mp4")
+        assert hcl.is_excluded is False
+
+
+class _ExcludingScanner:
+    """스캔 시 실제 스캐너처럼 제외 규칙을 적용하는 가짜 스캐너."""
+
+    def __init__(self, results):
+        self.results = results
+
+    def build_path(self, relative_path: str) -> str:
+        return f"GGPNAs\\{relative_path}" if relative_path else "GGPNAs"
+
+    async def scan_directory(self, path="", recursive=False, max_depth=10, exclusion=None):
+        for result in self.results:
+            if exclusion and exclusion.match(result.path, is_directory=result.is_directory):
+                continue
+            yield result
+
+
+class TestSyncExclusionHits:
+    async def test_hits_counted_once_per_entry(self, async_session):
+        """스캔에서 건너뛴 폴더 아래의 기존 파일은 적중 수를 다시 늘리지 않음."""
+        from src.services.nas_inventory import NASSyncService
+
+        service = NASFileService(async_session)
+        for name in ("a.mp4", "b.mp4"):
+            await service.create_file(
+                file_path=f"GGPNAs/WSOP/Clips/{name}", file_name=name
+            )
+        await async_session.commit()
+
+        sync = NASSyncService(async_session)
+        sync.scanner = _ExcludingScanner([
+            ScanResult(path="GGPNAs\\WSOP\\Clips", name="Clips", is_directory=True),
+            ScanResult(path="GGPNAs\\WSOP\\._a.mp4", name="._a.mp4", is_directory=False),
+        ])
+        stats = await sync.sync_project("WSOP")
+
+        assert stats.files_excluded == 2
+        assert stats.exclusion_hits == {"clips_folder": 1, "macos_metadata": 1}
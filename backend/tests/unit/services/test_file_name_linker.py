@@ -0,0 +1,79 @@
+"""FileNameLinker 단위 테스트."""
+
+from sqlalchemy import select
+
+from src.models.hand_clip import HandClip
+from src.models.video_file import VideoFile
+from src.services.matching import FileNameLinker
+from src.services.sheets_sync import SheetsDataMapper
+
+
+def _video(path: str) -> VideoFile:
+    return VideoFile(file_path=path, file_name=path.rsplit("/", 1)[-1])
+
+
+class TestFileNameLinker:
+    """FileNameLinker 테스트 클래스."""
+
+    def test_lookup_keys(self):
+        """원래 이름, 확장자 없는 이름, 확장자 변형."""
+        keys = FileNameLinker.lookup_keys(" WSOP_Day1.MP4 ")
+
+        assert {"wsop_day1.mp4", "wsop_day1", "wsop_day1.mov"} <= keys
+
+    async def test_link_stages(self, async_session):
+        """정확 → 대소문자 무시 → 확장자 무시 → 폴더 링크로 동명 구분."""
+        exact = _video("/nas/a/Exact.mp4")
+        upper = _video("/nas/a/UPPER.mp4")
+        mov = _video("/nas/a/ext.mov")
+        dup_2023 = _video("/nas/WSOP/2023/dup.mp4")
+        dup_2024 = _video("/nas/WSOP/2024/dup.mp4")
+        same_a = _video("/nas/x/same.mp4")
+        same_b = _video("/nas/y/same.mp4")
+        async_session.add_all([exact, upper, mov, dup_2023, dup_2024, same_a, same_b])
+        await async_session.flush()
+
+        clips = {
+            "exact": HandClip(sheet_file_name="Exact.mp4"),
+            "case": HandClip(sheet_file_name="upper.MP4"),
+            "ext": HandClip(sheet_file_name="ext.mp4"),
+            "folder": HandClip(sheet_file_name="dup.mp4", nas_folder_link="/nas/WSOP/2024"),
+            "ambiguous": HandClip(sheet_file_name="same.mp4"),
+            "none": HandClip(sheet_file_name="missing.mp4"),
+        }
+        async_session.add_all(clips.values())
+        await async_session.commit()
+
+        stats = await FileNameLinker(async_session, batch_size=4).link_clips()
+
+        assert stats.total_clips == 6
+        assert (stats.linked_exact, stats.linked_case_insensitive) == (1, 1)
+        assert (stats.linked_extension_insensitive, stats.linked_by_folder_link) == (1, 1)
+        assert (stats.ambiguous, stats.unmatched) == (1, 1)
+
+        rows = dict(
+            (await async_session.execute(select(HandClip.id, HandClip.video_file_id))).all()
+        )
+        assert rows[clips["exact"].id] == exact.id
+        assert rows[clips["case"].id] == upper.id
+        assert rows[clips["ext"].id] == mov.id
+        assert rows[clips["folder"].id] == dup_2024.id
+        assert rows[clips["ambiguous"].id] is None
+
+    async def test_links_ingested_archive_rows(self, async_session):
+        """시트 파일명 컬럼(8)이 행별/bulk 저장 모두 sheet_file_name으로 남아 연결됨."""
+        video = _video("/nas/WSOP/2024/WSOP_Day1.mp4")
+        async_session.add(video)
+        await async_session.commit()
+
+        row = ["01:00:00", "", "Hand 1", "", "A", "", "", "", "wsop_day1.MP4"]
+        mapper = SheetsDataMapper(async_session)
+        await mapper.sync_archive_rows([row], start_row=2)
+        await mapper.sync_rows_bulk([row], start_row=3)
+        await async_session.commit()
+
+        stats = await FileNameLinker(async_session).link_clips()
+
+        assert (stats.total_clips, stats.linked_case_insensitive) == (2, 2)
+        rows = await async_session.execute(select(HandClip.sheet_file_name, HandClip.video_file_id))
+        assert set(rows.all()) == {("wsop_day1.MP4", video.id)}
@@ -122,6 +122,41 @@ class TestHandClipService:
 
         assert len(bluff_clips) == 2
 
+    @pytest.mark.asyncio
+    async def test_get_timeline_orders_by_parsed_timecode(self, service):
+        """Test timeline ordering uses seconds, not timecode strings."""
+        video_file_id = uuid4()
+        await service.create_hand_clip(
+            title="Late", timecode="1:05:00", video_file_id=video_file_id
+        )
+        await service.create_hand_clip(
+            title="Early", timecode="00:59:00", video_file_id=video_file_id
+        )
+        await service.create_hand_clip(
+            title="Unknown", timecode="TBD", video_file_id=video_file_id
+        )
+        await service.create_hand_clip(title="Other Video", timecode="00:10:00")
+
+        timeline = await service.get_timeline(video_file_id)
+
+        assert [c.title for c in timeline] == ["Early", "Late", "Unknown"]
+        assert [c.timecode_seconds for c in timeline] == [3540, 3900, None]
+
+    @pytest.mark.asyncio
+    async def test_get_timeline_range(self, service):
+        """Test range query includes both bounds."""
+        video_file_id = uuid4()
+        for timecode in ("01:09:59", "01:10:00", "01:20:00", "01:30:00", "01:30:01"):
+            await service.create_hand_clip(
+                title=timecode, timecode=timecode, video_file_id=video_file_id
+            )
+
+        clips = await service.get_timeline(
+            video_file_id, start_seconds=4200, end_seconds=5400
+        )
+
+        assert [c.title for c in clips] == ["01:10:00", "01:20:00", "01:30:00"]
+
     # ==================== UPDATE ====================
 
     @pytest.mark.asyncio
@@ -129,10 +164,13 @@ class TestHandClipService:
         """Test updating a hand clip."""
         created = await service.create_hand_clip(**sample_hand_clip_data)
 
-        updated = await service.update(created.id, title="Updated Title")
+        updated = await service.update(
+            created.id, title="Updated Title", timecode_end="00:17:00"
+        )
 
         assert updated is not None
         assert updated.title == "Updated Title"
+        assert (updated.timecode_seconds, updated.timecode_end_seconds) == (930, 1020)
 
     @pytest.mark.asyncio
     async def test_update_hand_clip_not_found(self, service):
@@ -635,3 +635,68 @@ class TestNASFileService:
         total = await service.total_size_bytes()
 
         assert total == 3_000_000
+
+
+class _FakeScanner:
+    """scan_directory 결과를 고정 목록으로 반환하는 스캐너."""
+
+    def __init__(self, results):
+        self.results = results
+
+    def build_path(self, relative_path: str) -> str:
+        return f"GGPNAs\\{relative_path}" if relative_path else "GGPNAs"
+
+    async def scan_directory(self, path="", recursive=False, max_depth=10, exclusion=None):
+        for result in self.results:
+            yield result
+
+
+class TestNASSyncServiceEvents:
+    """NAS 동기화 변경 이벤트 발행 테스트."""
+
+    async def test_publishes_added_changed_removed(self, async_session):
+        from src.orchestrator import EventBus, EventType
+        from src.services.nas_inventory import NASSyncService, ScanResult
+
+        bus = EventBus()
+        received = []
+
+        async def collect(event):
+            received.append(event)
+
+        for event_type in (
+            EventType.NAS_FILE_ADDED,
+            EventType.NAS_FILE_CHANGED,
+            EventType.NAS_FILE_REMOVED,
+        ):
+            bus.subscribe(event_type, collect)
+
+        sub = ScanResult(path="GGPNAs\\WSOP\\sub", name="sub", is_directory=True)
+        a = ScanResult(path="GGPNAs\\WSOP\\a.mp4", name="a.mp4", is_directory=False, size_bytes=1)
+        b = ScanResult(path="GGPNAs\\WSOP\\b.mp4", name="b.mp4", is_directory=False, size_bytes=1)
+        c = ScanResult(path="GGPNAs\\WSOP\\sub\\c.mp4", name="c.mp4", is_directory=False)
+
+        sync = NASSyncService(async_session, event_bus=bus)
+        sync.scanner = _FakeScanner([sub, a, b, c])
+        stats = await sync.sync_project("WSOP")
+
+        assert stats.files_created == 3
+        assert [e.type for e in received] == [EventType.NAS_FILE_ADDED]
+        assert len(received[0].payload["nas_file_ids"]) == 3
+
+        # a 변경, b 삭제, c는 max_depth 밖이라 스캔되지 않음 (삭제 아님)
+        received.clear()
+        a_changed = ScanResult(
+            path=a.path, name=a.name, is_directory=False, size_bytes=2
+        )
+        sync.scanner = _FakeScanner([sub, a_changed])
+        stats = await sync.sync_project("WSOP", max_depth=0)
+
+        assert (stats.files_updated, stats.files_removed) == (1, 1)
+        by_type = {e.type: e.payload for e in received}
+        assert len(by_type[EventType.NAS_FILE_CHANGED]["nas_file_ids"]) == 1
+        assert len(by_type[EventType.NAS_FILE_REMOVED]["nas_file_ids"]) == 1
+
+        service = NASFileService(async_session)
+        assert await service.get_by_path("GGPNAs/WSOP/b.mp4") is None
+        assert await service.get_by_path("GGPNAs/WSOP/sub/c.mp4") is not None
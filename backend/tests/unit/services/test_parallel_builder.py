@@ -0,0 +1,78 @@
+"""ParallelCatalogBuilder 단위 테스트."""
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from src.models.base import Base
+from src.models.nas_file import FileCategory, NASFile
+from src.models.project import Project
+from src.models.video_file import VideoFile
+from src.services.catalog import CatalogBuilderService, ParallelCatalogBuilder
+
+WSOP = "\\\\10.10.100.122\\docker\\GGPNAs\\ARCHIVE\\WSOP\\WSOP Bracelet Event\\2024"
+GOG = "\\\\10.10.100.122\\docker\\GGPNAs\\ARCHIVE\\GOG 최종"
+
+
+def _nas_file(folder: str, name: str) -> NASFile:
+    return NASFile(
+        file_path=f"{folder}\\{name}",
+        file_name=name,
+        file_extension=".mp4",
+        file_category=FileCategory.VIDEO,
+    )
+
+
+class TestParallelCatalogBuilder:
+    """project_code 파티션 동시 빌드 테스트."""
+
+    async def test_builds_partitions_concurrently(self, async_engine, tmp_path):
+        # 파티션마다 별도 커넥션을 쓰도록 파일 DB 사용 (async_engine은 스키마 제거용)
+        engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'catalog.db'}")
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        session_factory = async_sessionmaker(
+            engine, class_=AsyncSession, expire_on_commit=False
+        )
+
+        async with session_factory() as session:
+            session.add_all(
+                [
+                    _nas_file(WSOP, "10-wsop-2024-be-ev-21-25k-nlh-hr-ft-schutten.mp4"),
+                    _nas_file(WSOP, "05-wsop-2024-be-ev-15-50k-nlh-ft-final-showdown.mp4"),
+                    _nas_file(GOG, "E01_GOG_final_edit_231106.mp4"),
+                    _nas_file(GOG, "E02_GOG_final_edit_231113.mp4"),
+                    _nas_file("\\\\nas\\share\\misc", "random_video.mp4"),
+                ]
+            )
+            await session.commit()
+
+        builder = ParallelCatalogBuilder(session_factory, max_concurrency=2, chunk_size=1)
+        partitions = await builder.partition()
+        assert {code: len(ids) for code, ids in partitions.items()} == {
+            "WSOP": 2,
+            "GOG": 2,
+            "": 1,
+        }
+
+        stats = await builder.build()
+        assert stats.nas_files_processed == 5
+        assert stats.projects_created == 2
+        assert stats.video_files_created == 4
+        assert stats.skipped == 1
+        assert stats.errors == 0
+        assert stats.partitions["WSOP"]["video_files_created"] == 2
+        assert stats.partitions["GOG"]["video_files_created"] == 2
+
+        # 순차 빌드와 같은 결과: 재실행 시 새 엔티티 없음
+        async with session_factory() as session:
+            again = await CatalogBuilderService(session).build_catalog_from_nas()
+            assert again.video_files_created == 0
+            counts = [
+                (
+                    await session.execute(select(func.count()).select_from(model))
+                ).scalar_one()
+                for model in (Project, VideoFile)
+            ]
+        assert counts == [2, 4]
+
+        await engine.dispose()
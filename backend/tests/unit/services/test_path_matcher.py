@@ -1,8 +1,25 @@
 """PathMatcher 단위 테스트."""
 
-import pytest
+from uuid import uuid4
 
-from src.services.matching import PathNormalizer, TitleMatcher
+import pytest
+import pytest_asyncio
+from sqlalchemy import select
+
+from src.models.hand_clip import HandClip, PathMatchStatus
+from src.models.nas_file import NASFile
+from src.models.video_file import VideoFile
+from src.services.matching import (
+    DatabasePathMatcher,
+    IndexedFile,
+    MatchResult,
+    PathMatcher,
+    PathNormalizer,
+    PathTrie,
+    ShardedPathMatcher,
+    SuffixIndex,
+    TitleMatcher,
+)
 
 
 class TestPathNormalizer:
@@ -152,3 +169,393 @@ class TestTitleMatcher:
         )
 
         assert similarity == 1.0  # Same normalized words
+
+
+class TestPathTrie:
+    """PathTrie 테스트 클래스."""
+
+    @pytest.fixture
+    def trie(self):
+        trie = PathTrie()
+        trie.insert("wsop/2024/day1/a.mp4", "a")
+        trie.insert("wsop/2024/day1", "a")
+        trie.insert("wsop/2024/day2/b.mp4", "b")
+        trie.insert("wsop/2024/day2", "b")
+        return trie
+
+    def test_get_exact(self, trie):
+        """정확한 경로 조회 테스트."""
+        assert trie.get("wsop/2024/day2") == "b"
+        assert trie.get("wsop/2024") is None
+        assert len(trie) == 4
+
+    def test_first_descendant(self, trie):
+        """폴더 하위 첫 항목 조회 테스트."""
+        assert trie.first_descendant("wsop/2024") == "a"
+        assert trie.first_descendant("wsop/2024/day2") == "b"
+        assert trie.first_descendant("wsop/2025") is None
+
+    def test_segment_boundary(self, trie):
+        """세그먼트 중간 문자열은 접두사로 보지 않음."""
+        assert trie.first_descendant("wsop/20") is None
+
+    def test_longest_prefix(self, trie):
+        """가장 깊은 상위 경로 조회 테스트."""
+        assert trie.longest_prefix("wsop/2024/day2/sub/c.mp4") == ("b", 3)
+        assert trie.longest_prefix("hcl/2024") == (None, 0)
+
+
+class TestSuffixIndex:
+    """SuffixIndex 테스트 클래스."""
+
+    @pytest.fixture
+    def index(self):
+        index = SuffixIndex()
+        index.insert("nas/wsop/2024/day1/a.mp4", "a")
+        index.insert("nas/wsop/2024/day1", "a")
+        index.insert("nas/hcl/2024/day1", "h")
+        return index
+
+    def test_ranked_by_matched_segments(self, index):
+        """일치 세그먼트 수가 많은 후보가 먼저."""
+        candidates = index.lookup("backup/wsop/2024/day1")
+
+        assert [(c.path, c.matched_segments) for c in candidates] == [
+            ("nas/wsop/2024/day1", 3),
+            ("nas/hcl/2024/day1", 2),
+        ]
+
+    def test_min_segments(self, index):
+        """최소 일치 세그먼트 미만 후보 제외."""
+        assert index.lookup("x/2024/day1", min_segments=3) == []
+        assert len(index.lookup("x/2024/day1", min_segments=2)) == 2
+
+
+class TestPathMatcherPartial:
+    """PathMatcher 부분 일치 단계 테스트."""
+
+    @pytest_asyncio.fixture
+    async def matcher(self, async_session):
+        for path in (
+            "\\\\10.10.100.122\\docker\\WSOP\\2024\\Day1\\a.mp4",
+            "\\\\10.10.100.122\\docker\\WSOP\\2024\\Day2\\b.mp4",
+        ):
+            async_session.add(NASFile(file_path=path, file_name=path.rsplit("\\", 1)[-1]))
+        await async_session.flush()
+
+        matcher = PathMatcher(async_session)
+        await matcher.build_nas_index()
+        return matcher
+
+    async def test_index_stores_column_tuples(self, matcher):
+        """인덱스는 ORM 인스턴스가 아닌 컬럼 튜플을 보관."""
+        result = matcher.match_path("WSOP/2024/Day1/a.mp4")
+        entry = matcher._nas_cache["wsop/2024/day1/a.mp4"]
+
+        assert isinstance(entry, IndexedFile)
+        assert entry.id == result.matched_nas_file_id
+
+    async def test_exact_folder_match(self, matcher):
+        """폴더 링크 정확히 일치."""
+        result = matcher.match_path("WSOP/2024/Day2")
+
+        assert result.match_type == "exact"
+        assert result.matched_file_path.endswith("b.mp4")
+
+    async def test_partial_descendant(self, matcher):
+        """상위 폴더 링크는 하위 첫 파일과 부분 일치."""
+        result = matcher.match_path("\\\\nas\\share\\WSOP\\2024")
+
+        assert result.match_type == "partial"
+        assert result.matched_file_path.endswith("a.mp4")
+
+    async def test_partial_ancestor(self, matcher):
+        """인덱스에 없는 하위 경로는 가장 깊은 상위 경로와 부분 일치."""
+        result = matcher.match_path("WSOP/2024/Day2/extra/clip.mp4")
+
+        assert result.match_type == "partial"
+        assert result.matched_file_path.endswith("b.mp4")
+
+    async def test_no_match(self, matcher):
+        """관련 없는 경로는 매칭 실패."""
+        result = matcher.match_path("HCL/Season 1/x.mp4")
+
+        assert result.match_type == "none"
+
+
+class TestPathMatcherFuzzy:
+    """PathMatcher 퍼지 단계 및 진단 테스트."""
+
+    @pytest_asyncio.fixture
+    async def matcher(self, async_session):
+        async_session.add(
+            NASFile(
+                file_path="/nas/WSOP/2024/Main Event/Day1/a.mp4",
+                file_name="a.mp4",
+            )
+        )
+        await async_session.flush()
+
+        matcher = PathMatcher(async_session)
+        await matcher.build_nas_index()
+        return matcher
+
+    async def test_fuzzy_matches_trailing_segments(self, matcher):
+        """다른 루트 아래 같은 뒤쪽 3개 세그먼트는 퍼지 일치."""
+        result = matcher.match_path("Archive/WSOP/2024/Main Event")
+
+        assert result.match_type == "fuzzy"
+        assert result.matched_file_path.endswith("a.mp4")
+
+    async def test_unmatched_lists_nearest_candidates(self, matcher):
+        """매칭 실패 시 근접 후보 제공."""
+        result = matcher.match_path("Archive/HCL/2025/Main Event")
+
+        assert result.match_type == "none"
+        assert result.nearest_candidates == [("/nas/wsop/2024/main event", 1)]
+
+    def test_many_same_named_files_stay_reachable(self):
+        """동명 파일이 많아도 마지막에 등록된 파일까지 퍼지 후보가 됨."""
+        matcher = PathMatcher(session=None)
+        files = [
+            IndexedFile(uuid4(), f"/nas/p{i}/clip.mp4", None) for i in range(5)
+        ] + [IndexedFile(uuid4(), "/nas/wsop/day1/clip.mp4", None)]
+        matcher.add_to_index(files)
+
+        result = matcher.match_path("/elsewhere/wsop/day1/clip.mp4")
+
+        assert result.match_type == "fuzzy"
+        assert result.matched_nas_file_id == files[-1].id
+        assert matcher.nearest_candidates("elsewhere/wsop/day1/clip.mp4")[0] == (
+            "/nas/wsop/day1/clip.mp4", 3
+        )
+
+
+class TestDatabasePathMatcher:
+    """normalized 컬럼 기반 DB 매칭 테스트."""
+
+    @pytest_asyncio.fixture
+    async def files(self, async_session):
+        for path in (
+            "\\\\10.10.100.122\\docker\\WSOP\\2024\\Day1\\a.mp4",
+            "\\\\10.10.100.122\\docker\\WSOP\\2024\\Day2\\b.mp4",
+            "\\\\10.10.100.122\\docker\\WSOP\\2024-extra\\c.mp4",
+        ):
+            async_session.add(NASFile(file_path=path, file_name=path.rsplit("\\", 1)[-1]))
+        await async_session.flush()
+
+    async def test_validators_populate_normalized_columns(self, async_session):
+        """file_path / nas_folder_link 설정 시 정규화 컬럼 동기화."""
+        nas_file = NASFile(file_path="\\\\nas\\share\\WSOP\\A.mp4", file_name="A.mp4")
+        clip = HandClip(nas_folder_link="smb://nas/share/WSOP/")
+
+        assert nas_file.normalized_path == "wsop/a.mp4"
+        assert clip.normalized_folder_link == "wsop"
+
+        clip.nas_folder_link = None
+        assert clip.normalized_folder_link is None
+
+    async def test_exact_partial_and_unmatched(self, async_session, files):
+        """파일/직속 폴더는 exact, 상위 폴더는 partial, 나머지는 none."""
+        by_file = HandClip(nas_folder_link="WSOP/2024/Day1/a.mp4")
+        by_folder = HandClip(nas_folder_link="WSOP/2024/Day2")
+        by_parent = HandClip(nas_folder_link="\\\\nas\\share\\WSOP\\2024")
+        unmatched = HandClip(nas_folder_link="HCL/Season 1")
+        async_session.add_all([by_file, by_folder, by_parent, unmatched, HandClip()])
+        await async_session.flush()
+
+        results, stats = await DatabasePathMatcher(async_session).match_all_clips()
+        by_id = {r.hand_clip_id: r for r in results}
+
+        assert stats.total_clips == 4
+        assert (stats.exact_matches, stats.partial_matches, stats.unmatched) == (2, 1, 1)
+        assert by_id[by_file.id].matched_file_path.endswith("a.mp4")
+        assert by_id[by_folder.id].matched_file_path.endswith("b.mp4")
+        # "wsop/2024-extra"는 "wsop/2024" 하위가 아님
+        assert by_id[by_parent.id].match_type == "partial"
+        assert by_id[by_parent.id].matched_file_path.endswith("a.mp4")
+        assert by_id[unmatched.id].match_type == "none"
+
+
+class TestPathMatcherIncremental:
+    """증분 매칭 테스트."""
+
+    @staticmethod
+    def _add_file(session, path):
+        session.add(NASFile(file_path=path, file_name=path.rsplit("/", 1)[-1]))
+
+    async def test_only_changed_clips_are_processed(self, async_session):
+        """매칭된 클립은 건너뛰고, 실패 클립은 신규 파일로만 재시도."""
+        self._add_file(async_session, "/nas/WSOP/2024/Day1/a.mp4")
+        matched = HandClip(nas_folder_link="/nas/WSOP/2024/Day1")
+        waiting = HandClip(nas_folder_link="/nas/HCL/S1")
+        async_session.add_all([matched, waiting])
+        await async_session.commit()
+
+        results, stats = await PathMatcher(async_session).match_incremental()
+
+        assert stats.total_clips == 2
+        assert (stats.matched, stats.unmatched) == (1, 1)
+        assert stats.inventory_generation == 1
+        await async_session.refresh(matched)
+        assert matched.path_match_status == PathMatchStatus.EXACT
+        assert matched.path_match_nas_file_id is not None
+        assert matched.path_match_generation == 1
+
+        # 변경 없음: 아무 클립도 처리하지 않음
+        results, stats = await PathMatcher(async_session).match_incremental()
+        assert results == []
+        assert stats.skipped == 2
+        assert stats.inventory_generation == 1
+
+        # 신규 파일: 실패 클립만 재시도
+        self._add_file(async_session, "/nas/HCL/S1/b.mp4")
+        await async_session.commit()
+
+        results, stats = await PathMatcher(async_session).match_incremental()
+        assert [r.hand_clip_id for r in results] == [waiting.id]
+        assert results[0].match_type == "exact"
+        assert stats.inventory_generation == 2
+        assert stats.skipped == 1
+
+    async def test_limit_reports_remaining_not_skipped(self, async_session):
+        """limit에 걸린 클립은 skipped가 아닌 remaining으로 집계."""
+        self._add_file(async_session, "/nas/WSOP/2024/Day1/a.mp4")
+        async_session.add_all(
+            [HandClip(nas_folder_link=f"/nas/WSOP/2024/Day{i}") for i in range(1, 4)]
+        )
+        await async_session.commit()
+
+        results, stats = await PathMatcher(async_session).match_incremental(limit=2)
+        assert (len(results), stats.skipped, stats.remaining) == (2, 0, 1)
+
+        results, stats = await PathMatcher(async_session).match_incremental(limit=2)
+        assert (len(results), stats.skipped, stats.remaining) == (1, 2, 0)
+
+    async def test_changed_link_is_rematched(self, async_session):
+        """nas_folder_link 변경 시 pending으로 되돌아가 다시 매칭."""
+        self._add_file(async_session, "/nas/WSOP/2024/Day1/a.mp4")
+        self._add_file(async_session, "/nas/WSOP/2024/Day2/b.mp4")
+        clip = HandClip(nas_folder_link="/nas/WSOP/2024/Day1")
+        async_session.add(clip)
+        await async_session.commit()
+        await PathMatcher(async_session).match_incremental()
+
+        clip.nas_folder_link = "/nas/WSOP/2024/Day2"
+        assert clip.path_match_status == PathMatchStatus.PENDING
+        await async_session.commit()
+
+        results, _ = await PathMatcher(async_session).match_incremental()
+
+        assert len(results) == 1
+        assert results[0].matched_file_path.endswith("b.mp4")
+
+
+class TestPathMatcherApply:
+    """apply_matches 일괄 적용 테스트."""
+
+    async def test_bulk_apply_respects_confidence_and_existing_links(
+        self, async_session
+    ):
+        """신뢰도 미만/기존 연결/video_file 없는 매칭은 건너뜀."""
+        videos = [
+            VideoFile(file_path=f"/v/{i}.mp4", file_name=f"{i}.mp4") for i in range(3)
+        ]
+        async_session.add_all(videos)
+        await async_session.flush()
+
+        files = [
+            NASFile(file_path=f"/nas/{i}.mp4", file_name=f"{i}.mp4", video_file_id=v.id)
+            for i, v in enumerate(videos)
+        ]
+        orphan = NASFile(file_path="/nas/orphan.mp4", file_name="orphan.mp4")
+        async_session.add_all([*files, orphan])
+        clips = [HandClip() for _ in range(5)]
+        clips[3].video_file_id = videos[2].id  # 기존 연결
+        async_session.add_all(clips)
+        await async_session.flush()
+
+        def result(clip, nas_file, match_type, confidence):
+            return MatchResult(
+                hand_clip_id=clip.id,
+                nas_folder_link="x",
+                matched_nas_file_id=nas_file.id,
+                match_type=match_type,
+                confidence=confidence,
+            )
+
+        applied = await PathMatcher(async_session).apply_matches(
+            [
+                result(clips[0], files[0], "exact", 1.0),
+                result(clips[1], files[1], "partial", 0.8),
+                result(clips[2], files[2], "fuzzy", 0.5),  # 신뢰도 미만
+                result(clips[3], files[0], "exact", 1.0),  # 덮어쓰지 않음
+                result(clips[4], orphan, "exact", 1.0),  # video_file 없음
+            ],
+            min_confidence=0.8,
+        )
+
+        assert applied == {"exact": 1, "partial": 1, "fuzzy": 0}
+        rows = dict(
+            (await async_session.execute(select(HandClip.id, HandClip.video_file_id))).all()
+        )
+        assert rows[clips[0].id] == videos[0].id
+        assert rows[clips[1].id] == videos[1].id
+        assert rows[clips[2].id] is None
+        assert rows[clips[3].id] == videos[2].id
+        assert rows[clips[4].id] is None
+
+
+class TestShardedPathMatcher:
+    """프로세스 풀 샤드 매칭 테스트."""
+
+    @pytest.fixture
+    def matcher(self):
+        matcher = PathMatcher(session=None)
+        matcher.add_to_index(
+            IndexedFile(uuid4(), path, None)
+            for path in (
+                "/nas/WSOP/2024/Day1/a.mp4",
+                "/nas/WSOP/2024/Day2/b.mp4",
+                "/nas/HCL/S1/c.mp4",
+            )
+        )
+        return matcher
+
+    def test_dump_and_load_index(self, matcher, tmp_path):
+        """직렬화한 인덱스로 같은 매칭 결과."""
+        path = str(tmp_path / "index.pkl")
+        matcher.dump_index(path)
+        loaded = PathMatcher.load_index(path)
+
+        assert loaded.indexed_paths == matcher.indexed_paths > 0
+        for link in ("/nas/WSOP/2024/Day2", "/nas/WSOP", "Archive/WSOP/2024/Day1"):
+            assert loaded.match_path(link) == matcher.match_path(link)
+
+    async def test_sharded_results_match_single_process(self, matcher):
+        """샤드 결과를 병합해도 단일 프로세스와 동일."""
+        links = [
+            (uuid4(), link)
+            for link in (
+                "/nas/WSOP/2024/Day1",
+                "/nas/WSOP",
+                "Archive/nas/HCL/S1",
+                "/nas/MPP/2025",
+                "/nas/HCL/S1/c.mp4",
+            )
+        ]
+
+        results, stats = await ShardedPathMatcher(
+            matcher, workers=2, shard_size=2
+        ).match_links(links)
+
+        assert [r.hand_clip_id for r in results] == [clip_id for clip_id, _ in links]
+        for (_, link), result in zip(links, results):
+            expected = matcher.match_path(link)
+            assert (result.match_type, result.matched_nas_file_id) == (
+                expected.match_type,
+                expected.matched_nas_file_id,
+            )
+        assert stats.total_clips == 5
+        assert (stats.exact_matches, stats.partial_matches) == (2, 1)
+        assert (stats.fuzzy_matches, stats.unmatched) == (1, 1)
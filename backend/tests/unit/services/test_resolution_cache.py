@@ -0,0 +1,120 @@
+"""PlayerTagCache 테스트 (SQLite)."""
+
+from contextlib import contextmanager
+
+from sqlalchemy import event, func, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.models.player import Player
+from src.models.tag import Tag, TagCategory
+from src.orchestrator.event_bus import EventBus
+from src.orchestrator.events import Event, EventType
+from src.services.sheets_sync import HandClipBulkIngestor, PlayerTagCache
+
+
+@contextmanager
+def count_statements(async_engine):
+    statements: list[str] = []
+
+    def before_cursor_execute(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(async_engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(async_engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+
+
+class TestPlayerTagCache:
+    """공유 선수/태그 id 캐시 테스트."""
+
+    async def test_warmup_then_hits_without_queries(self, async_engine, async_session):
+        ivey = Player(name="Phil Ivey")
+        bluff = Tag(category=TagCategory.POKER_PLAY, name="bluff")
+        async_session.add_all([ivey, bluff])
+        await async_session.commit()
+        cache = PlayerTagCache()
+
+        with count_statements(async_engine) as statements:
+            await cache.warmup(async_session)
+        assert len(statements) == 2  # 테이블당 한 번
+
+        with count_statements(async_engine) as statements:
+            players = await cache.resolve_players(async_session, ["phil ivey", "PHIL IVEY"])
+            tags = await cache.resolve_tags(async_session, ["bluff"])
+        assert statements == []
+        assert players == {"Phil Ivey": ivey.id}
+        assert tags == {"bluff": bluff.id}
+        assert cache.stats()["hits"] == 2
+
+    async def test_misses_resolved_in_one_batch_and_published_on_commit(
+        self, async_engine, async_session
+    ):
+        cache = PlayerTagCache()
+        await cache.warmup(async_session)
+
+        with count_statements(async_engine) as statements:
+            ids = await cache.resolve_players(async_session, ["Tom Dwan", "Daniel Negreanu"])
+        # 조회 + INSERT ... ON CONFLICT + 재조회
+        assert len(statements) == 3
+        assert set(ids) == {"Tom Dwan", "Daniel Negreanu"}
+
+        # 커밋 전에는 같은 세션에서만 보임
+        assert cache.stats()["players"] == 0
+        assert await cache.resolve_players(async_session, ["Tom Dwan"]) == {
+            "Tom Dwan": ids["Tom Dwan"]
+        }
+
+        await async_session.commit()
+        assert cache.stats()["players"] == 2
+
+    async def test_rollback_discards_created_ids(self, async_session):
+        cache = PlayerTagCache()
+        await cache.resolve_tags(async_session, ["bluff"])
+        await async_session.rollback()
+
+        assert cache.stats()["tags"] == 0
+        ids = await cache.resolve_tags(async_session, ["bluff"])
+        await async_session.commit()
+        count = await async_session.execute(select(func.count()).select_from(Tag))
+        assert count.scalar_one() == 1
+        assert cache.stats()["tags"] == 1 and ids["bluff"] is not None
+
+    async def test_event_bus_invalidation(self, async_session):
+        ivey, dwan = Player(name="Phil Ivey"), Player(name="Tom Dwan")
+        async_session.add_all([ivey, dwan])
+        await async_session.commit()
+        cache = PlayerTagCache()
+        event_bus = EventBus()
+        cache.subscribe(event_bus)
+        await cache.warmup(async_session)
+
+        await event_bus.emit(
+            Event(type=EventType.PLAYER_CHANGED, payload={"player_id": str(ivey.id)})
+        )
+        assert cache.stats()["players"] == 1 and cache.is_warm
+
+        await event_bus.emit(Event(type=EventType.TAG_CHANGED))
+        assert not cache.is_warm
+
+        cache.unsubscribe(event_bus)
+        assert event_bus.get_handlers_count(EventType.PLAYER_CHANGED) == 0
+
+    async def test_concurrent_sessions_share_committed_ids(self, async_engine):
+        session_factory = async_sessionmaker(
+            async_engine, class_=AsyncSession, expire_on_commit=False
+        )
+        cache = PlayerTagCache()
+
+        async with session_factory() as first:
+            created = await HandClipBulkIngestor(first, cache).resolve_players(["Phil Ivey"])
+            await first.commit()
+        async with session_factory() as second:
+            with count_statements(async_engine) as statements:
+                resolved = await HandClipBulkIngestor(second, cache).resolve_players(
+                    ["phil ivey"]
+                )
+
+        assert resolved == created
+        assert statements == []
@@ -0,0 +1,163 @@
+"""QuotaManager / TokenBucket 테스트."""
+
+import pytest
+
+from src.models.google_sheet_sync import SyncStatus
+from src.services.sheets_sync import (
+    AsyncSheetsClient,
+    QuotaClass,
+    QuotaManager,
+    SheetsSyncEngine,
+    TokenBucket,
+)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class StatusError(Exception):
+    def __init__(self, status: int) -> None:
+        super().__init__(f"HTTP {status}")
+        self.status = status
+
+
+def _status_of(error: Exception):
+    return getattr(error, "status", None)
+
+
+def _failing(*statuses: int):
+    """statuses 순서대로 실패한 뒤 "ok"를 돌려주는 요청."""
+    remaining = list(statuses)
+
+    def request():
+        if remaining:
+            raise StatusError(remaining.pop(0))
+        return "ok"
+
+    return request
+
+
+class TestTokenBucket:
+    def test_reserve_waits_for_refill_in_order(self):
+        clock = FakeClock()
+        bucket = TokenBucket(capacity=2, refill_per_second=1.0, clock=clock)
+
+        assert [bucket.reserve() for _ in range(4)] == [0.0, 0.0, 1.0, 2.0]
+        assert bucket.available == -2
+
+        clock.now = 10.0
+        assert bucket.available == 2  # capacity까지만 채움
+
+
+class TestQuotaManager:
+    def test_backoff_is_jittered_and_capped(self):
+        quota = QuotaManager(backoff_base_seconds=1.0, backoff_max_seconds=8.0, rng=lambda: 1.0)
+        assert [quota.backoff_delay(n) for n in range(5)] == [1.0, 2.0, 4.0, 8.0, 8.0]
+
+        quota = QuotaManager(backoff_base_seconds=1.0, rng=lambda: 0.5)
+        assert quota.backoff_delay(2) == 2.0
+
+    def test_call_retries_retryable_statuses(self):
+        quota = QuotaManager(backoff_base_seconds=0)
+
+        assert quota.call(QuotaClass.READ, _failing(429, 503), _status_of) == "ok"
+
+        metrics = quota.metrics()["classes"]["read"]
+        assert (metrics["requests"], metrics["retries"], metrics["failures"]) == (3, 2, 0)
+        assert metrics["status_counts"] == {"200": 1, "429": 1, "503": 1}
+
+    def test_call_gives_up(self):
+        quota = QuotaManager(backoff_base_seconds=0, max_retries=2)
+
+        with pytest.raises(StatusError):
+            quota.call(QuotaClass.READ, _failing(404), _status_of)
+        with pytest.raises(StatusError):
+            quota.call(QuotaClass.READ, _failing(500, 500, 500), _status_of)
+
+        metrics = quota.metrics()["classes"]["read"]
+        assert (metrics["retries"], metrics["failures"]) == (2, 2)
+
+    def test_throttles_when_bucket_is_empty(self):
+        clock = FakeClock()
+        quota = QuotaManager({QuotaClass.READ: 60}, clock=clock)
+        for _ in range(60):
+            assert quota.reserve(QuotaClass.READ) == 0.0
+
+        assert quota.reserve(QuotaClass.READ) == pytest.approx(1.0)
+        metrics = quota.metrics()["classes"]["read"]
+        assert (metrics["throttled"], metrics["headroom"], metrics["queued"]) == (1, 0.0, 1.0)
+
+    def test_page_size_follows_latency_and_headroom(self):
+        clock = FakeClock()
+        quota = QuotaManager({QuotaClass.READ: 10}, clock=clock, target_latency_seconds=1.0)
+
+        # 느린 응답 → 축소
+        quota._record_success(QuotaClass.READ, 3.0)
+        assert quota.page_size(1000) == 700
+
+        # 지연 정상 + 쿼터 여유 없음 → 확대
+        quota = QuotaManager({QuotaClass.READ: 10}, clock=clock, target_latency_seconds=1.0)
+        for _ in range(9):
+            quota.reserve(QuotaClass.READ)
+        quota._record_success(QuotaClass.READ, 0.1)
+        assert quota.page_size(1000) == 1500
+
+        # 429 → 확대, 5xx → 축소, 범위 제한
+        quota = QuotaManager(backoff_base_seconds=0, max_page_size=1200)
+        quota.call(QuotaClass.READ, _failing(429), _status_of)
+        assert quota.page_size(1000) == 1200
+        quota.reset()
+        quota.call(QuotaClass.READ, _failing(503), _status_of)
+        assert quota.page_size(1000) == 700
+
+    def test_small_base_shrinks_relative_to_itself(self):
+        """증분 배치(기본 100)도 5xx/지연에 따라 줄어들고, 하한은 기본 크기 × MIN_SCALE."""
+        quota = QuotaManager(backoff_base_seconds=0)
+        quota.call(QuotaClass.READ, _failing(503), _status_of)
+        assert (quota.page_size(100), quota.page_size(1000)) == (70, 700)
+
+        for _ in range(20):
+            quota._scale_page(QuotaManager.SHRINK)
+        assert (quota.page_size(100), quota.page_size(1000), quota.page_size(5)) == (10, 100, 1)
+
+
+class TestClientsUseQuota:
+    async def test_async_client_retries_through_fake_server(self, fake_sheets_server):
+        fake_sheets_server.add_sheet("s1", "ARCHIVE", [["a"], ["b"]])
+        fake_sheets_server.fail_statuses = [429, 503]
+        quota = QuotaManager(backoff_base_seconds=0.01)
+
+        async with AsyncSheetsClient(base_url=fake_sheets_server.base_url, quota=quota) as client:
+            values = await client.read_range("s1", "'ARCHIVE'!A1:ZZ2")
+
+        assert values == [["a"], ["b"]]
+        assert len(fake_sheets_server.requests) == 3
+        assert quota.metrics()["classes"]["read"]["retries"] == 2
+
+    async def test_engine_adapts_page_size_when_not_given(
+        self, async_session, fake_sheets_server
+    ):
+        rows = [[f"01:00:{i:02d}", "", f"Hand {i}"] for i in range(1, 26)]
+        fake_sheets_server.add_sheet("s1", "METADATA_ARCHIVE", rows)
+        # 모든 응답이 목표 지연보다 느림 → 페이지마다 0.7배
+        quota = QuotaManager(target_latency_seconds=0.0)
+
+        async with AsyncSheetsClient(base_url=fake_sheets_server.base_url, quota=quota) as client:
+            engine = SheetsSyncEngine(async_session, client)
+            engine.DEFAULT_PAGE_SIZE = 10
+            result = await engine.sync_sheet("s1", "METADATA_ARCHIVE", full_sync=True, bulk=True)
+
+        assert (result.status, result.last_row_synced) == (SyncStatus.COMPLETED, 25)
+        ranges = [q["ranges"][0] for q in fake_sheets_server.requests_to("values:batchGet")]
+        assert ranges == [
+            "'METADATA_ARCHIVE'!A1:ZZ10",
+            "'METADATA_ARCHIVE'!A11:ZZ17",
+            "'METADATA_ARCHIVE'!A18:ZZ22",
+            "'METADATA_ARCHIVE'!A23:ZZ25",
+            "'METADATA_ARCHIVE'!A26:ZZ27",
+        ]
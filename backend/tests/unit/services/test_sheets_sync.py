@@ -375,19 +375,36 @@ class TestSheetsDataMapper:
         assert result.errors == 0
 
     @pytest.mark.asyncio
-    async def test_sync_archive_rows_skip_duplicates(self, data_mapper, mock_services):
-        """Test that duplicate rows are skipped."""
-        # Return existing clip with different row number to trigger skip
-        existing_clip = MagicMock(id=uuid4(), sheet_row_number=99)  # Different from row 1
-        mock_services["hand_clip_service"].get_by_sheet_row.return_value = existing_clip
-
+    async def test_sync_archive_rows_unchanged(self, data_mapper, mock_services):
+        """Test that existing rows with the same content hash are left alone."""
         rows = [["01:00:00", "", "Hand 1"]]
+        existing_clip = MagicMock(
+            id=uuid4(), sheet_row_number=1, sheet_row_hash=RowMapper.row_hash(rows[0])
+        )
+        mock_services["hand_clip_service"].get_by_sheet_row.return_value = existing_clip
 
         result = await data_mapper.sync_archive_rows(rows, start_row=1)
 
         assert result.total_rows == 1
-        assert result.skipped == 1
+        assert result.unchanged == 1
         assert result.created == 0
+        mock_services["hand_clip_service"].get_with_relationships.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_sync_archive_rows_updates_edited_row(self, data_mapper, mock_services):
+        """Test that an edited row updates the existing clip."""
+        existing_clip = MagicMock(id=uuid4(), sheet_row_number=1, sheet_row_hash="old")
+        mock_services["hand_clip_service"].get_by_sheet_row.return_value = existing_clip
+        loaded_clip = MagicMock(id=existing_clip.id)
+        mock_services["hand_clip_service"].get_with_relationships.return_value = loaded_clip
+
+        rows = [["01:00:00", "", "Hand 1 (edited)"]]
+
+        result = await data_mapper.sync_archive_rows(rows, start_row=1)
+
+        assert result.updated == 1
+        assert loaded_clip.title == "Hand 1 (edited)"
+        assert loaded_clip.sheet_row_hash == RowMapper.row_hash(rows[0])
 
     @pytest.mark.asyncio
     async def test_sync_iconik_rows_success(self, data_mapper, mock_services):
@@ -540,7 +557,7 @@ class TestSheetsSyncEngine:
 
         mock_range = MagicMock()
         mock_range.values = [["01:00:00", "", "Hand 1"]]
-        mock_sheets_client.read_all_rows.return_value = mock_range
+        mock_sheets_client.read_rows_from.return_value = mock_range
 
         mock_sync_result = SyncResult(total_rows=1, created=1)
         engine.data_mapper.sync_archive_rows.return_value = mock_sync_result
@@ -552,9 +569,16 @@ class TestSheetsSyncEngine:
             full_sync=True,
         )
 
-        # Should use read_all_rows instead of read_rows_from
-        mock_sheets_client.read_all_rows.assert_called_once()
+        # Full sync streams pages from row 1 instead of reading the whole sheet
+        mock_sheets_client.read_all_rows.assert_not_called()
+        mock_sheets_client.read_rows_from.assert_called_once_with(
+            "spreadsheet123", "METADATA_ARCHIVE", 1, 1000
+        )
+        engine.sync_service.update_sync_status.assert_awaited_once_with(
+            mock_record.id, SyncStatus.SYNCING, last_row=1
+        )
         assert result.status == SyncStatus.COMPLETED
+        assert result.last_row_synced == 1
 
     @pytest.mark.asyncio
     async def test_sync_sheet_all_errors(self, engine, mock_sheets_client):
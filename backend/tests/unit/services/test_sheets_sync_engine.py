@@ -0,0 +1,236 @@
+"""SheetsSyncEngine 통합 테스트 (SQLite + 로컬 fake Sheets 서버)."""
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from src.models.base import Base
+from src.models.google_sheet_sync import GoogleSheetSync, SyncStatus
+from src.models.hand_clip import HandClip
+from src.models.player import Player
+from src.services.sheets_sync import (
+    AsyncSheetsClient,
+    ParallelSheetsSync,
+    SheetsSyncEngine,
+    SheetsSyncService,
+)
+
+SHEET_ID = "archive-sheet"
+TAB = "METADATA_ARCHIVE"
+
+
+def _archive_rows(count: int) -> list[list[str]]:
+    return [
+        [f"01:{i // 60:02d}:{i % 60:02d}", "", f"Hand {i}", "", "A", "Phil Ivey", "bluff"]
+        for i in range(1, count + 1)
+    ]
+
+
+def _iconik_rows(count: int) -> list[list[str]]:
+    return [
+        [f"Iconik {i}", f"00:00:{i:02d}", "1:30", "bluff", "Phil Ivey, Tom Dwan", ""]
+        for i in range(1, count + 1)
+    ]
+
+
+@pytest.fixture
+async def sheets_client(fake_sheets_server):
+    async with AsyncSheetsClient(base_url=fake_sheets_server.base_url) as client:
+        yield client
+
+
+async def _clip_count(session) -> int:
+    return (await session.execute(select(func.count()).select_from(HandClip))).scalar_one()
+
+
+async def _record(session) -> GoogleSheetSync:
+    return (
+        await session.execute(
+            select(GoogleSheetSync).where(GoogleSheetSync.sheet_id == SHEET_ID)
+        )
+    ).scalar_one()
+
+
+class TestStreamingFullSync:
+    """페이지 단위 full sync 테스트."""
+
+    @pytest.mark.parametrize("bulk", [False, True])
+    async def test_streams_pages_and_advances_last_row(
+        self, async_session, fake_sheets_server, sheets_client, bulk
+    ):
+        fake_sheets_server.add_sheet(SHEET_ID, TAB, _archive_rows(25))
+        engine = SheetsSyncEngine(async_session, sheets_client)
+
+        result = await engine.sync_sheet(
+            SHEET_ID, TAB, full_sync=True, bulk=bulk, page_size=10
+        )
+
+        assert result.status == SyncStatus.COMPLETED
+        assert result.last_row_synced == 25
+        assert (result.sync_result.total_rows, result.sync_result.created) == (25, 25)
+        assert await _clip_count(async_session) == 25
+        # 10 + 10 + 5행 (마지막 페이지가 짧으면 추가 조회 없음)
+        ranges = [q["ranges"][0] for q in fake_sheets_server.requests_to("values:batchGet")]
+        assert ranges == [
+            "'METADATA_ARCHIVE'!A1:ZZ10",
+            "'METADATA_ARCHIVE'!A11:ZZ20",
+            "'METADATA_ARCHIVE'!A21:ZZ30",
+        ]
+        record = await _record(async_session)
+        assert (record.sync_status, record.last_row_synced) == (SyncStatus.COMPLETED, 25)
+
+    async def test_failure_mid_sheet_keeps_committed_pages(
+        self, async_session, fake_sheets_server, sheets_client
+    ):
+        fake_sheets_server.add_sheet(SHEET_ID, TAB, _archive_rows(30))
+        engine = SheetsSyncEngine(async_session, sheets_client)
+        sync_rows_bulk = engine.data_mapper.sync_rows_bulk
+
+        async def fail_on_third_page(rows, start_row, **kwargs):
+            result = await sync_rows_bulk(rows, start_row, **kwargs)
+            if start_row == 21:
+                raise RuntimeError("boom")
+            return result
+
+        engine.data_mapper.sync_rows_bulk = fail_on_third_page
+
+        result = await engine.sync_sheet(
+            SHEET_ID, TAB, full_sync=True, bulk=True, page_size=10
+        )
+
+        assert result.status == SyncStatus.FAILED
+        assert result.last_row_synced == 20
+        assert await _clip_count(async_session) == 20  # 세 번째 페이지만 롤백
+        record = await _record(async_session)
+        assert (record.sync_status, record.last_row_synced) == (SyncStatus.FAILED, 20)
+        assert record.error_message == "boom"
+
+        # 다음 증분 동기화는 실패한 페이지부터 이어감
+        engine.data_mapper.sync_rows_bulk = sync_rows_bulk
+        result = await engine.sync_sheet(SHEET_ID, TAB, bulk=True, batch_size=100)
+
+        assert result.status == SyncStatus.COMPLETED
+        assert result.sync_result.created == 10
+        assert result.last_row_synced == 30
+        assert await _clip_count(async_session) == 30
+
+
+class TestPerTabSyncRecords:
+    """탭 단위 GoogleSheetSync 레코드 테스트."""
+
+    async def test_tabs_get_separate_records_and_adopt_legacy(self, async_session):
+        service = SheetsSyncService(async_session, sheets_client=object())
+        legacy = await service.create(
+            sheet_id=SHEET_ID, entity_type="hand_clip", last_row_synced=42
+        )
+
+        archive = await service.start_sync(SHEET_ID, "hand_clip", "METADATA_ARCHIVE")
+        iconik = await service.start_sync(SHEET_ID, "hand_clip", "ICONIK_METADATA")
+
+        assert archive.id == legacy.id and archive.last_row_synced == 42
+        assert iconik.id != legacy.id and iconik.last_row_synced == 0
+        assert await service.get_by_sheet_and_entity(SHEET_ID, "hand_clip") is None
+
+
+class TestParallelSheetsSync:
+    """여러 스프레드시트/탭 동시 동기화 테스트."""
+
+    async def test_syncs_tabs_concurrently_without_duplicate_players(
+        self, async_engine, tmp_path, fake_sheets_server
+    ):
+        # 탭마다 별도 커넥션을 쓰도록 파일 DB 사용 (async_engine은 스키마 제거용)
+        engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'sheets.db'}")
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        session_factory = async_sessionmaker(
+            engine, class_=AsyncSession, expire_on_commit=False
+        )
+
+        fake_sheets_server.delay = 0.05
+        fake_sheets_server.add_sheet("s1", "METADATA_ARCHIVE", _archive_rows(30))
+        fake_sheets_server.add_sheet("s2", "ICONIK_METADATA", _iconik_rows(30))
+        fake_sheets_server.add_sheet("s2", "Notes", [["ignored"]])
+
+        async with AsyncSheetsClient(base_url=fake_sheets_server.base_url) as client:
+            sync = ParallelSheetsSync(session_factory, client, max_concurrency=2)
+            results = await sync.sync_spreadsheets(
+                ["s1", "s2"], full_sync=True, page_size=10
+            )
+
+        assert [(r.sheet_id, r.sheet_name, r.status) for r in results] == [
+            ("s1", "METADATA_ARCHIVE", SyncStatus.COMPLETED),
+            ("s2", "ICONIK_METADATA", SyncStatus.COMPLETED),
+        ]
+        assert all(r.duration_seconds > 0 for r in results)
+        assert fake_sheets_server.max_in_flight >= 2
+
+        async with session_factory() as session:
+            assert await _clip_count(session) == 60
+            players = (await session.execute(select(Player.name))).scalars().all()
+            assert sorted(players) == ["Phil Ivey", "Tom Dwan"]
+            records = (
+                await session.execute(
+                    select(
+                        GoogleSheetSync.sheet_id,
+                        GoogleSheetSync.sheet_name,
+                        GoogleSheetSync.last_row_synced,
+                    )
+                )
+            ).all()
+            assert sorted(records) == [
+                ("s1", "METADATA_ARCHIVE", 30),
+                ("s2", "ICONIK_METADATA", 30),
+            ]
+        await engine.dispose()
+
+
+class TestChangeProbe:
+    """탭 변경 probe 테스트."""
+
+    async def _sync(self, engine):
+        return await engine.sync_sheet(
+            SHEET_ID, TAB, bulk=True, batch_size=100, probe=True
+        )
+
+    async def test_probe_skips_unchanged_and_resyncs_changes(
+        self, async_session, fake_sheets_server, sheets_client
+    ):
+        rows = _archive_rows(80)
+        fake_sheets_server.add_sheet(SHEET_ID, TAB, rows)
+        engine = SheetsSyncEngine(async_session, sheets_client)
+
+        # 기준값 없음 → 증분 동기화 후 기준값 저장
+        result = await self._sync(engine)
+        assert (result.probe_outcome, result.sync_result.created) == ("incremental", 80)
+        record = await _record(async_session)
+        assert record.probe_row_count == 1000
+        assert record.probe_tail_hash == SheetsSyncEngine.tail_hash(rows[30:])
+
+        # 변경 없음 → 행 조회 없이 종료
+        fake_sheets_server.requests.clear()
+        result = await self._sync(engine)
+        assert (result.probe_outcome, result.status) == ("unchanged", SyncStatus.COMPLETED)
+        assert result.last_row_synced == 80
+        # 메타데이터 1회 + probe batchGet 1회
+        assert len(fake_sheets_server.requests) == 2
+
+        # 마지막 N행 안의 편집 → tail 재동기화
+        rows[70][2] = "Hand 71 (edited)"
+        result = await self._sync(engine)
+        assert result.probe_outcome == "tail"
+        assert (result.sync_result.updated, result.sync_result.unchanged) == (1, 49)
+        assert (await self._sync(engine)).probe_outcome == "unchanged"
+
+        # 행 추가 → 증분
+        rows.extend(_archive_rows(85)[80:])
+        result = await self._sync(engine)
+        assert result.probe_outcome == "incremental"
+        assert (result.sync_result.created, result.last_row_synced) == (5, 85)
+        assert await _clip_count(async_session) == 85
+
+        # 그리드 행 수만 변경 → 증분 (새 행 없음)
+        fake_sheets_server.grid_row_counts[(SHEET_ID, TAB)] = 2000
+        result = await self._sync(engine)
+        assert result.probe_outcome == "incremental"
+        assert result.sync_result.created == 0
+        assert (await self._sync(engine)).probe_outcome == "unchanged"
@@ -0,0 +1,158 @@
+"""TitleIndex / TitleLinker 단위 테스트."""
+
+import pytest
+from sqlalchemy import select
+
+from src.models.hand_clip import HandClip
+from src.models.video_file import VideoFile
+from src.services.matching import (
+    MinHasher,
+    TitleIndex,
+    TitleLinker,
+    TitleMatcher,
+    tokenize,
+)
+
+
+class TestTokenize:
+    """tokenize 테스트 클래스."""
+
+    def test_file_name_separators_and_extension(self):
+        """구분자 분리 및 확장자 제거."""
+        assert tokenize("01-WSOP_2024.Main-Event.mp4") == [
+            "01", "wsop", "2024", "main", "event",
+        ]
+
+    def test_korean_tokens(self):
+        """한글 토큰 유지."""
+        assert tokenize("GOG 최종 에피소드 3") == ["gog", "최종", "에피소드", "3"]
+
+    def test_empty(self):
+        """빈 입력."""
+        assert tokenize(None) == []
+        assert tokenize("  --  ") == []
+
+
+class TestMinHasher:
+    """MinHasher 테스트 클래스."""
+
+    def test_signature_is_order_independent(self):
+        """토큰 순서와 무관한 서명."""
+        hasher = MinHasher(num_perm=16)
+
+        assert hasher.signature(["a", "b", "c"]) == hasher.signature(["c", "a", "b"])
+        assert len(hasher.signature(["a"])) == 16
+        assert hasher.signature([]) is None
+
+    def test_signature_is_deterministic_across_instances(self):
+        """같은 seed면 인스턴스가 달라도 같은 서명."""
+        assert MinHasher(seed=7).signature(["wsop"]) == MinHasher(seed=7).signature(
+            ["wsop"]
+        )
+
+
+class TestTitleIndex:
+    """TitleIndex 테스트 클래스."""
+
+    @pytest.fixture
+    def index(self):
+        return TitleMatcher.build_index(
+            [
+                (1, "WSOP 2024 Main Event Day 1"),
+                (2, "WSOP 2024 Main Event Day 2"),
+                (3, "WSOP 2023 Main Event Final Table"),
+                (4, "HCL Season 12 Episode 5"),
+                (5, None),
+            ]
+        )
+
+    def test_exact_title_ranks_first(self, index):
+        """동일 제목이 최고 점수."""
+        matches = index.query("WSOP 2024 Main Event Day 2", k=2)
+
+        assert matches[0].key == 2
+        assert matches[0].score == pytest.approx(1.0)
+        assert matches[1].score < matches[0].score
+
+    def test_near_duplicate(self, index):
+        """표기 차이가 있어도 근사 중복을 찾음."""
+        matches = index.query("wsop-2024-main-event-day-1.mp4", k=1)
+
+        assert matches[0].key == 1
+
+    def test_min_score_and_no_match(self, index):
+        """임계값 미만 결과 제외."""
+        assert index.query("HCL Season 12 Episode 5", min_score=0.99)[0].key == 4
+        assert index.query("completely unrelated words") == []
+
+    def test_empty_titles_are_skipped(self, index):
+        """토큰이 없는 문서는 색인하지 않음."""
+        assert len(index) == 4
+
+    def test_query_batch(self, index):
+        """배치 검색은 질의 순서대로 결과 반환."""
+        results = index.query_batch(["HCL Season 12", "WSOP 2023 Final Table"], k=1)
+
+        assert [r[0].key for r in results] == [4, 3]
+
+
+class TestTitleLinker:
+    """TitleLinker 테스트 클래스."""
+
+    async def test_links_by_file_name_then_title(self, async_session):
+        """sheet_file_name 우선, 없으면 title로 연결."""
+        day1 = VideoFile(
+            file_path="/nas/wsop/wsop-2024-me-day1.mp4",
+            file_name="wsop-2024-me-day1.mp4",
+            display_title="WSOP 2024 Main Event Day 1",
+        )
+        hcl = VideoFile(
+            file_path="/nas/hcl/hcl-s12-e05.mp4",
+            file_name="hcl-s12-e05.mp4",
+            display_title="Hustler Casino Live Season 12 Episode 5",
+        )
+        async_session.add_all([day1, hcl])
+        await async_session.flush()
+
+        by_file = HandClip(sheet_file_name="WSOP_2024_ME_Day1.mp4", title="x")
+        by_title = HandClip(title="Hustler Casino Live S12 Episode 5")
+        unmatched = HandClip(title="Random cash game")
+        async_session.add_all([by_file, by_title, unmatched])
+        await async_session.commit()
+
+        linker = TitleLinker(
+            async_session, file_name_threshold=0.8, title_threshold=0.5, batch_size=2
+        )
+        stats = await linker.link_clips()
+
+        assert stats.video_files_indexed == 2
+        assert stats.total_clips == 3
+        assert stats.linked_by_file_name == 1
+        assert stats.linked_by_title == 1
+        assert stats.unmatched == 1
+
+        rows = dict(
+            (await async_session.execute(select(HandClip.id, HandClip.video_file_id))).all()
+        )
+        assert rows[by_file.id] == day1.id
+        assert rows[by_title.id] == hcl.id
+        assert rows[unmatched.id] is None
+
+    async def test_dry_run_does_not_write(self, async_session):
+        """dry_run은 DB를 변경하지 않음."""
+        async_session.add(
+            VideoFile(file_path="/nas/a.mp4", file_name="a-b-c.mp4", display_title="A B C")
+        )
+        clip = HandClip(sheet_file_name="a_b_c.mp4")
+        async_session.add(clip)
+        await async_session.commit()
+
+        stats = await TitleLinker(async_session).link_clips(dry_run=True)
+
+        assert stats.linked == 1
+        video_file_id = (
+            await async_session.execute(
+                select(HandClip.video_file_id).where(HandClip.id == clip.id)
+            )
+        ).scalar_one()
+        assert video_file_id is None
@@ -0,0 +1,110 @@
+"""Tests for TitleRegenerationService - 제목 증분 재생성."""
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import select
+
+from src.models.catalog_item import CatalogItem
+from src.models.video_file import VideoFile
+from src.services.catalog import TitleRegenerationService
+from src.services.catalog.title_regeneration_service import JobStatus
+from src.services.file_parser import ParserFactory, TitleGenerator
+
+
+WSOP_FILE = "01-wsop-2024-be-ev-01-10k-nlhe-ft-day1.mp4"
+
+
+class TestTitleRegenerationService:
+    """Test cases for TitleRegenerationService."""
+
+    @pytest_asyncio.fixture
+    async def service(self, async_session):
+        """Create service with a small chunk size to exercise keyset paging."""
+        return TitleRegenerationService(async_session, chunk_size=2)
+
+    async def _add_video(self, session, name, **kwargs) -> VideoFile:
+        video = VideoFile(file_path=f"/nas/wsop/{name}", file_name=name, **kwargs)
+        session.add(video)
+        await session.flush()
+        return video
+
+    async def test_regenerates_stale_titles_and_mirrors_catalog(
+        self, service, async_session
+    ):
+        """Stale VideoFiles get new titles, mirrored to CatalogItem."""
+        video = await self._add_video(async_session, WSOP_FILE, display_title="old")
+        async_session.add(
+            CatalogItem(
+                video_file_id=video.id,
+                display_title="old",
+                project_code="WSOP",
+            )
+        )
+        await async_session.commit()
+
+        progress = await service.run()
+
+        assert progress.status == JobStatus.COMPLETED
+        assert progress.total_candidates == 1
+        assert progress.updated == 1
+        assert progress.catalog_items_updated == 1
+
+        refreshed = await async_session.get(VideoFile, video.id)
+        await async_session.refresh(refreshed)
+        assert refreshed.display_title != "old"
+        assert refreshed.parser_version == ParserFactory.PARSER_VERSION
+        assert refreshed.title_template_version == TitleGenerator.TEMPLATE_VERSION
+
+        item = (await async_session.execute(select(CatalogItem))).scalar_one()
+        await async_session.refresh(item)
+        assert item.display_title == refreshed.display_title
+
+    async def test_skips_rows_with_current_versions(self, service, async_session):
+        """Rows already at the current versions are not touched."""
+        await self._add_video(
+            async_session,
+            WSOP_FILE,
+            display_title="kept",
+            parser_version=ParserFactory.PARSER_VERSION,
+            title_template_version=TitleGenerator.TEMPLATE_VERSION,
+        )
+        await async_session.commit()
+
+        progress = await service.run()
+
+        assert progress.total_candidates == 0
+        assert progress.processed == 0
+        video = (await async_session.execute(select(VideoFile))).scalar_one()
+        assert video.display_title == "kept"
+
+    async def test_commits_per_chunk_and_second_run_is_noop(
+        self, service, async_session
+    ):
+        """Keyset paging covers every row; a rerun finds nothing to do."""
+        for i in range(5):
+            await self._add_video(async_session, f"random_video_{i}.mp4")
+        await async_session.commit()
+
+        progress = await service.run()
+
+        assert progress.processed == 5
+        assert progress.chunks_committed == 3
+        assert progress.progress_percent == 100.0
+
+        rerun = await service.run()
+        assert rerun.processed == 0
+
+    async def test_force_reprocesses_current_rows(self, service, async_session):
+        """force=True ignores stored versions."""
+        await self._add_video(
+            async_session,
+            WSOP_FILE,
+            parser_version=ParserFactory.PARSER_VERSION,
+            title_template_version=TitleGenerator.TEMPLATE_VERSION,
+        )
+        await async_session.commit()
+
+        progress = await service.run(force=True)
+
+        assert progress.processed == 1
+        assert progress.updated == 1